@@ -5,23 +5,26 @@ This module provides a factory function that creates an ``LlmAgent`` with
 the RAG tool (``consult_knowledge_base``) already attached.
 """
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from google.adk.agents import LlmAgent
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+    from google.adk.models import BaseLlm
+
 
 def create_knowledge_agent(
-    tools: list[Callable], model: str, current_time_str: str | None = None
-) -> LlmAgent:
+    tools: list[Callable], model: "str | BaseLlm", current_time_str: str | None = None
+) -> "LlmAgent":
     """
     Create the Knowledge sub-agent.
 
     Args:
         tools: Pre-bound tool functions for RAG
                (``consult_knowledge_base``).
-        model: The Gemini model name (e.g. ``gemini-2.5-flash``).
+        model: The Gemini model name (e.g. ``gemini-2.5-flash``) or model instance.
         current_time_str: Optional current date/time context.
 
     Returns:
@@ -46,6 +49,8 @@ def create_knowledge_agent(
     if current_time_str:
         instruction = f"Current Date and Time: {current_time_str}.\n{instruction}"
 
+    from google.adk.agents import LlmAgent
+
     return LlmAgent(
         name="KnowledgeAgent",
         model=model,
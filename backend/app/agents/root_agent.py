@@ -7,17 +7,19 @@ one should handle the current request.  For general conversation that doesn't
 need any tools, the root agent responds directly.
 """
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from google.adk.agents import LlmAgent
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+    from google.adk.models import BaseLlm
 
 
 def create_root_agent(
-    sub_agents: list[LlmAgent],
+    sub_agents: list["LlmAgent"],
     system_instruction: str,
-    model: str,
+    model: "str | BaseLlm",
     tools: list[Callable] | None = None,
-) -> LlmAgent:
+) -> "LlmAgent":
     """
     Create the Vesta root dispatcher agent.
 
@@ -27,13 +29,15 @@ def create_root_agent(
         system_instruction: The dynamic system prompt (includes current time,
                             location defaults, conversation summary, and
                             delegation guidelines).
-        model: The Gemini model name (e.g. ``gemini-2.5-flash``).
+        model: The Gemini model name (e.g. ``gemini-2.5-flash``) or model instance.
         tools: Optional list of tools for the root agent itself (e.g. memory tools).
 
     Returns:
         A configured ``LlmAgent`` that acts as the entry-point for all
         user interactions.
     """
+    from google.adk.agents import LlmAgent
+
     return LlmAgent(
         name="VestaRootAgent",
         model=model,
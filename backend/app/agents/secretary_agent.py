@@ -2,16 +2,19 @@
 Secretary sub-agent — handles scheduling, calendar, and email/inbox queries.
 """
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from google.adk.agents import LlmAgent
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+    from google.adk.models import BaseLlm
+
 
 def create_secretary_agent(
-    tools: list[Callable], model: str, current_time_str: str | None = None
-) -> LlmAgent:
+    tools: list[Callable], model: "str | BaseLlm", current_time_str: str | None = None
+) -> "LlmAgent":
     """Create the Secretary sub-agent."""
 
     instruction = (
@@ -21,10 +24,11 @@ def create_secretary_agent(
         "2. Schedule new calendar events using the schedule_event_tool.\n"
         "3. Update or reschedule existing events using update_calendar_event_tool (if you don't have the event ID, call get_calendar_events first; if multiple events match, ask the user for clarification before modifying).\n"
         "4. Cancel or delete calendar events using delete_calendar_event_tool (if you don't have the event ID, call get_calendar_events first; if multiple events match, ask the user for clarification before deleting).\n"
-        "5. Search, retrieve, and read the user's email messages using the check_emails tool.\n"
+        "5. Search and list the user's email messages using the check_emails tool, then read the full text of a specific email with read_email (use the [ID: ...] from check_emails). Prefer detail_level='metadata' or 'snippet' for listing and triage.\n"
         "6. Extract key points, identify important dates, amounts, and calls to action (Action Items) in the email messages.\n"
         "7. Provide concise, structured, and helpful summaries of user emails.\n"
         "8. For requests about 'today' or 'my day', call get_calendar_events(days=1).\n"
+        "9. When the user asks when they are free or wants to find time for a meeting, call find_free_slots_tool, offer the returned slots, and schedule the chosen one with schedule_event_tool.\n"
         "Always respond in a friendly, professional, and concise manner.\n\n"
         f"{settings.TELEGRAM_HTML_GUIDELINES}"
     )
@@ -36,11 +40,13 @@ def create_secretary_agent(
             f"{instruction}"
         )
 
+    from google.adk.agents import LlmAgent
+
     return LlmAgent(
         name="SecretaryAgent",
         model=model,
         description=(
-            "Handles scheduling, calendar management (view, create, update, delete events), and searching/reading user emails or inbox. "
+            "Handles scheduling, calendar management (view, create, update, delete events, find free time), and searching/reading user emails or inbox. "
             "Delegate to this agent when the user asks about their schedule, wants to see upcoming "
             "events, create, edit, reschedule, or cancel a calendar event, check their email/inbox, or search for messages."
         ),
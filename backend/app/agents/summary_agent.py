@@ -6,19 +6,25 @@ invoked directly by the background task in ``chat_manager.py`` to produce
 concise summaries of recent conversation messages.
 """
 
-from google.adk.agents import LlmAgent
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+    from google.adk.models import BaseLlm
 
-def create_summary_agent(model: str) -> LlmAgent:
+
+def create_summary_agent(model: "str | BaseLlm") -> "LlmAgent":
     """
     Create the Summary agent.
 
     Args:
-        model: The Gemini model name (e.g. ``gemini-2.5-flash``).
+        model: The Gemini model name (e.g. ``gemini-2.5-flash``) or model instance.
 
     Returns:
         A configured ``LlmAgent`` for summarisation tasks.
     """
+    from google.adk.agents import LlmAgent
+
     return LlmAgent(
         name="SummaryAgent",
         model=model,
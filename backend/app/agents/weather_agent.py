@@ -2,16 +2,19 @@
 Weather sub-agent — handles weather and forecast queries.
 """
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from google.adk.agents import LlmAgent
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+    from google.adk.models import BaseLlm
+
 
 def create_weather_agent(
-    tools: list[Callable], model: str, current_time_str: str | None = None
-) -> LlmAgent:
+    tools: list[Callable], model: "str | BaseLlm", current_time_str: str | None = None
+) -> "LlmAgent":
     """Create the Weather sub-agent."""
 
     instruction = (
@@ -31,6 +34,8 @@ def create_weather_agent(
             f"{instruction}"
         )
 
+    from google.adk.agents import LlmAgent
+
     return LlmAgent(
         name="WeatherAgent",
         model=model,
@@ -6,11 +6,11 @@ from fastapi import Depends, Header, HTTPException, Query, Security, status
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from jwt import PyJWTError
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import settings
 from app.crud.crud_user import user as crud_user
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
 from app.models.user import User
 from app.schemas.token import TokenPayload
 from app.services.adk_service import ADKService, adk_service
@@ -28,6 +28,9 @@ from app.services.open_meteo_service import OpenMeteoService, open_meteo_service
 from app.services.weather import WeatherService, weather_service
 
 SessionDep = Annotated[AsyncSession, Depends(get_db)]
+SessionFactoryDep = Annotated[
+    async_sessionmaker[AsyncSession], Depends(get_session_factory)
+]
 WeatherServiceDep = Annotated[WeatherService, Depends(weather_service)]
 OpenMeteoServiceDep = Annotated[OpenMeteoService, Depends(open_meteo_service)]
 ADKServiceDep = Annotated[ADKService, Depends(adk_service)]
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
 
 from fastapi import APIRouter, HTTPException, Query, status
 from google.auth.exceptions import RefreshError
@@ -10,6 +10,7 @@ from app.schemas.calendar import (
     CalendarEventList,
     CalendarEventResponse,
     CalendarEventUpdate,
+    FreeSlotList,
 )
 
 router = APIRouter()
@@ -188,6 +189,120 @@ async def get_events_in_range(
         ) from e
 
 
+@router.get("/free-slots", response_model=FreeSlotList)
+async def get_free_slots(
+    db: SessionDep,
+    calendar_service: CalendarServiceDep,
+    user_id: TargetUserId,
+    duration_minutes: int = Query(
+        60, ge=5, le=480, description="Length of the wanted slot in minutes"
+    ),
+    start: datetime | None = Query(
+        None, description="Start of the search (ISO 8601, default: now)"
+    ),
+    end: datetime | None = Query(
+        None, description="End of the search (ISO 8601, default: start + 7 days)"
+    ),
+    working_hours_start: time = Query(
+        time(9, 0), description="Local start of the working day"
+    ),
+    working_hours_end: time = Query(
+        time(18, 0), description="Local end of the working day"
+    ),
+    buffer_minutes: int = Query(
+        0, ge=0, le=120, description="Free minutes required around the slot"
+    ),
+    limit: int = Query(5, ge=1, le=20, description="Maximum number of slots"),
+) -> FreeSlotList:
+    """
+    Find free slots in the user's calendar.
+
+    Busy time comes from Google Calendar free/busy; the slot search itself
+    runs locally.
+
+    Args:
+        db: Database session
+        calendar_service: Google Calendar service
+        user_id: The ID of the user whose calendar to search
+        duration_minutes: Length of the wanted slot
+        start: Start of the search
+        end: End of the search
+        working_hours_start: Local start of the working day
+        working_hours_end: Local end of the working day
+        buffer_minutes: Free minutes required before and after the slot
+        limit: Maximum number of slots to return
+
+    Returns:
+        FreeSlotList with the earliest matching slots
+
+    Raises:
+        HTTPException: 401 if user not authenticated with Google
+        HTTPException: 403 if refresh token expired/revoked
+        HTTPException: 400 for validation errors (invalid range or hours, or
+            only one of start and end with a UTC offset)
+        HTTPException: 500 for Google API errors
+    """
+    start = start or datetime.now(timezone.utc)
+    end = end or start + timedelta(days=7)
+
+    # Naive values are in the calendar's timezone, so they cannot be
+    # compared with an offset-aware one (such as the default start)
+    if (start.tzinfo is None) != (end.tzinfo is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start and end must both include a UTC offset, or both omit it",
+        )
+
+    # Validate date range
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end datetime must be after start datetime",
+        )
+
+    # Limit range to 31 days
+    if (end - start) > timedelta(days=31):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Date range cannot exceed 31 days",
+        )
+
+    try:
+        slots = await calendar_service.find_free_slots(
+            user_id,
+            db,
+            duration_minutes=duration_minutes,
+            range_start=start,
+            range_end=end,
+            working_hours_start=working_hours_start,
+            working_hours_end=working_hours_end,
+            buffer_minutes=buffer_minutes,
+            max_results=limit,
+        )
+        return FreeSlotList(slots=slots, count=len(slots))
+    except ValueError as e:
+        error_msg = str(e).lower()
+        if "not authorized" in error_msg or "no refresh token" in error_msg:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=str(e),
+            ) from e
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    except RefreshError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Google Calendar access expired. Please re-authorize.",
+        ) from e
+    except HttpError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Google API error: {str(e)}",
+        ) from e
+
+
 @router.post(
     "/events", response_model=CalendarEventResponse, status_code=status.HTTP_201_CREATED
 )
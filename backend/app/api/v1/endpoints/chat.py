@@ -1,38 +1,112 @@
+import asyncio
 import logging
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import ADKServiceDep, CurrentUser, SessionDep, TTSServiceDep
+from app.api.deps import (
+    ADKServiceDep,
+    CurrentUser,
+    SessionDep,
+    SessionFactoryDep,
+    TTSServiceDep,
+)
 from app.crud.crud_chat import chat as crud_chat
+from app.crud.crud_chat_job import chat_job as crud_chat_job
 from app.crud.crud_session import chat_session as crud_session
 from app.crud.crud_user import user as crud_user
+from app.models.chat import ChatSession as ChatSessionModel
+from app.models.user import User
 from app.schemas.chat import (
     ChatHistory,
     ChatHistoryCreate,
+    ChatJob,
+    ChatJobAccepted,
+    ChatJobCreate,
     ChatRequest,
     ChatResponse,
     ChatSessionCreate,
 )
-from app.schemas.enums import ChatRole
-from app.services.chat_manager import (
-    SUMMARY_MESSAGE_WINDOW,
-    update_session_summary_task,
-)
+from app.schemas.enums import ChatDelivery, VoiceDelivery
+from app.services.chat_jobs import enqueue_chat_job
+from app.services.chat_manager import request_session_summary
+from app.services.chat_turn import cancel_pending, run_chat_turn
+from app.services.voice_delivery import await_voice, multipart_chat_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-@router.post("/process", response_model=ChatResponse)
+async def _get_or_create_session(
+    db: AsyncSession, user: User, session_id: int | None
+) -> ChatSessionModel:
+    if not session_id:
+        return await crud_session.create(
+            db,
+            obj_in=ChatSessionCreate(
+                user_id=user.id,
+                title="New Chat",
+            ),
+        )
+
+    session = await crud_session.get(db, id=session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    if session.user_id != user.id:
+        raise HTTPException(status_code=403, detail="Session does not belong to user")
+    return session
+
+
+async def _enqueue_chat_job(
+    db: AsyncSession,
+    chat_request: ChatRequest,
+    user: User,
+    session: ChatSessionModel,
+) -> JSONResponse:
+    chat_id = user.telegram_id
+    if not chat_id:
+        raise HTTPException(
+            status_code=400, detail="No Telegram chat to deliver the reply to"
+        )
+    if chat_request.chat_id is not None and chat_request.chat_id != chat_id:
+        raise HTTPException(
+            status_code=400, detail="Replies can only be delivered to the user's chat"
+        )
+    job = await crud_chat_job.create(
+        db,
+        obj_in=ChatJobCreate(
+            user_id=user.id,
+            session_id=session.id,
+            message=chat_request.message,
+            want_voice=chat_request.want_voice,
+            chat_id=chat_id,
+        ),
+    )
+    await enqueue_chat_job(db, job.id)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=ChatJobAccepted(
+            **ChatJob.model_validate(job).model_dump(), session_title=session.title
+        ).model_dump(mode="json"),
+    )
+
+
+@router.post(
+    "/process",
+    response_model=ChatResponse,
+    responses={status.HTTP_202_ACCEPTED: {"model": ChatJobAccepted}},
+)
 async def process_chat_message(
     *,
     db: SessionDep,
+    session_factory: SessionFactoryDep,
     chat_request: ChatRequest,
     adk_service: ADKServiceDep,
     tts_service: TTSServiceDep,
     current_user: CurrentUser,
-    background_tasks: BackgroundTasks,
 ) -> Any:
     """
     Process a chat message with Gemini AI.
@@ -41,102 +115,73 @@ async def process_chat_message(
     1. Validate user exists
     2. Save user message to database
     3. Fetch last 20 messages for context
-    4. Call Gemini AI with history
-    5. Save assistant response to database
+    4. Call Gemini AI with history, while the not yet summarized messages
+       are measured on a separate DB session for the summary trigger
+    5. Start TTS (if requested) and save the assistant response concurrently
     6. Return response
+
+    With ``want_voice`` and ``voice_delivery=multipart`` the response is a
+    ``multipart/mixed`` stream: the JSON reply is sent as soon as it is ready
+    and the raw Ogg/Opus audio follows as a second part.
+
+    With ``delivery=telegram`` steps 2-5 run on the job queue instead: the
+    endpoint answers 202 with the job and session title (poll
+    ``GET /chat/jobs/{id}``) and the reply, and voice if requested, is sent
+    to the Telegram chat.
     """
     user = await crud_user.get(db, id=chat_request.user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    current_session_id = chat_request.session_id
-
-    if not current_session_id:
-        current_session = await crud_session.create(
-            db,
-            obj_in=ChatSessionCreate(
-                user_id=user.id,
-                title="New Chat",
-            ),
-        )
-        current_session_id = current_session.id
-    else:
-        current_session = await crud_session.get(db, id=current_session_id)
-        if not current_session:
-            raise HTTPException(status_code=404, detail="Session not found")
+    current_session = await _get_or_create_session(db, user, chat_request.session_id)
 
-        if current_session.user_id != user.id:
-            raise HTTPException(
-                status_code=403, detail="Session does not belong to user"
-            )
+    if chat_request.delivery == ChatDelivery.TELEGRAM:
+        return await _enqueue_chat_job(db, chat_request, user, current_session)
 
+    voice_task = None
     try:
-        # Fetch last 20 messages for context (oldest to newest)
-        # We do this before saving the new message to avoid including it in history
-        history_records = await crud_chat.get_recent_by_session_id(
-            db, session_id=current_session_id, limit=20
-        )
-
-        user_message = await crud_chat.create(
+        turn = await run_chat_turn(
             db,
-            obj_in=ChatHistoryCreate(
-                user_id=user.id,
-                session_id=current_session_id,
-                role=ChatRole.USER,
-                content=chat_request.message,
-            ),
-        )
-
-        # Call Gemini AI
-        assistant_response_text = await adk_service.process_chat(
-            user_text=chat_request.message,
-            history_records=history_records,
+            session_factory,
+            adk_service,
+            tts_service if chat_request.want_voice else None,
             user_id=user.id,
-            db=db,
-            session_summary=current_session.summary,
+            session=current_session,
+            message=chat_request.message,
         )
+        voice_task = turn.voice_task
 
-        assistant_message = await crud_chat.create(
-            db,
-            obj_in=ChatHistoryCreate(
-                user_id=user.id,
-                session_id=current_session_id,
-                role=ChatRole.MODEL,
-                content=assistant_response_text,
-            ),
-        )
+        # Queue a rolling summary update; the queue debounces bursts
+        if turn.summary_due:
+            await request_session_summary(db, turn.session_id)
 
-        voice_bytes = None
-        if chat_request.want_voice:
-            try:
-                voice_bytes = await tts_service.synthesize(assistant_response_text)
-            except Exception as tts_error:
-                logger.warning(
-                    "TTS synthesis failed; returning text-only response",
-                    extra={"json_fields": {"error": str(tts_error)}},
-                )
-
-        # Trigger rolling summary every N messages in the background.
-        # We count after saving both messages so the first trigger fires
-        # when there are exactly SUMMARY_MESSAGE_WINDOW messages total.
-        total_messages = await crud_chat.get_count_by_session_id(
-            db, session_id=current_session_id
-        )
-        if total_messages % SUMMARY_MESSAGE_WINDOW == 0:
-            background_tasks.add_task(update_session_summary_task, current_session_id)
+        if voice_task is not None and (
+            chat_request.voice_delivery == VoiceDelivery.MULTIPART
+        ):
+            return multipart_chat_response(
+                ChatResponse(
+                    response=turn.response,
+                    session_id=turn.session_id,
+                    user_message_id=turn.user_message_id,
+                    assistant_message_id=turn.assistant_message_id,
+                ),
+                voice_task,
+            )
 
         return ChatResponse.with_voice(
-            voice_bytes=voice_bytes,
-            response=assistant_response_text,
-            session_id=current_session_id,
-            user_message_id=user_message.id,
-            assistant_message_id=assistant_message.id,
+            voice_bytes=await await_voice(voice_task),
+            response=turn.response,
+            session_id=turn.session_id,
+            user_message_id=turn.user_message_id,
+            assistant_message_id=turn.assistant_message_id,
         )
 
-    except HTTPException:
+    except (HTTPException, asyncio.CancelledError):
+        cancel_pending(voice_task)
         raise
 
     except Exception as e:
+        cancel_pending(voice_task)
         logger.error(f"Error processing chat message: {e}")
         raise HTTPException(
             status_code=500,
@@ -144,6 +189,22 @@ async def process_chat_message(
         )
 
 
+@router.get("/jobs/{job_id}", response_model=ChatJob)
+async def read_chat_job(
+    *,
+    db: SessionDep,
+    job_id: int,
+    current_user: CurrentUser,
+) -> Any:
+    """
+    Get the status of a chat job accepted with ``delivery=telegram``.
+    """
+    job = await crud_chat_job.get(db, id=job_id)
+    if not job or (job.user_id != current_user.id and not current_user.is_superuser):
+        raise HTTPException(status_code=404, detail="Chat job not found")
+    return job
+
+
 @router.get("/", response_model=list[ChatHistory])
 async def read_chat_history(
     db: SessionDep,
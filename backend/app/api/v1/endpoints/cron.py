@@ -2,7 +2,7 @@ import logging
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,12 +10,15 @@ from app.api.deps import SessionDep, verify_cron_secret, KnowledgeServiceDep
 from app.core.config import settings
 from app.models.device import SmartDevice
 from app.models.user import User
+from app.schemas.gmail import EmailDetailLevel
+from app.schemas.knowledge import KnowledgeSyncStatus
 from app.schemas.open_meteo import OpenMeteoResponse
-from app.services.gmail_service import gmail_service_instance
-from app.services.google_calendar import google_calendar_service_instance
+from app.services.gmail_service import gmail_service
+from app.services.google_calendar import google_calendar_service
 from app.services.home import HomeAssistantService
+from app.services.job_queue import enqueue, job_handler, job_worker
 from app.services.llm import LLMService
-from app.services.open_meteo_service import open_meteo_service_instance
+from app.services.open_meteo_service import open_meteo_service
 
 logger = logging.getLogger(__name__)
 
@@ -23,128 +26,150 @@ logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_cron_secret)])
 
 
-async def send_daily_digests(db: AsyncSession) -> int:
+async def send_daily_digest(db: AsyncSession, user: User) -> None:
     """
-    Run daily morning digests for enabled users.
+    Compose and send the morning digest of one user.
+
+    Calendar, weather and email sources that fail are left out of the
+    digest; failing to generate or send it raises, so the job is retried.
 
     Args:
         db: The database session.
-
-    Returns:
-        int: The number of successfully sent digests.
+        user: The recipient.
     """
-    logger.info("🌅 Starting Daily Morning Digest...")
     service = LLMService()
-    sent_count = 0
+    try:
+        calendar = await google_calendar_service.aget()
+        events = await calendar.get_today_events(user.id, db)
+    except Exception as e:
+        logger.warning(f"Failed to fetch calendar events for user {user.id}: {e}")
+        events = []
 
-    stmt = select(User).where(
-        User.is_daily_summary_enabled,
-        User.google_refresh_token.isnot(None),
-        User.telegram_id.isnot(None),
-    )
-    result = await db.execute(stmt)
-    users = result.scalars().all()
+    weather: OpenMeteoResponse | None = None
+    try:
+        open_meteo = await open_meteo_service.aget()
+        weather = await open_meteo.get_weather(city=user.city_name or "Kyiv", days=1)
+    except Exception as e:
+        logger.warning(f"Failed to fetch weather for user {user.id}: {e}")
 
-    for user in users:
-        try:
-            try:
-                events = await google_calendar_service_instance.get_today_events(
-                    user.id, db
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Failed to fetch calendar events for user {user.id}: {e}"
-                )
-                events = []
+    emails = None
+    try:
+        gmail = await gmail_service.aget()
+        emails = await gmail.get_emails(
+            user_id=user.id,
+            db=db,
+            query="newer_than:1d",
+            max_results=5,
+            detail_level=EmailDetailLevel.METADATA,
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to fetch emails for daily digest for user {user.id}: {e}"
+        )
 
-            weather: OpenMeteoResponse | None = None
-            try:
-                weather = await open_meteo_service_instance.get_weather(
-                    city=user.city_name or "Kyiv", days=1
-                )
-            except Exception as e:
-                logger.warning(f"Failed to fetch weather for user {user.id}: {e}")
+    if events:
+        events_text = "\n".join(
+            [
+                f"- {e.start_time.strftime('%H:%M') if e.start_time else 'All day'}: {e.summary}"
+                for e in events
+            ]
+        )
+    else:
+        events_text = "Сьогодні немає запланованих подій у календарі."
 
-            emails = None
-            try:
-                emails = await gmail_service_instance.get_emails(
-                    user_id=user.id, db=db, query="newer_than:1d", max_results=5
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Failed to fetch emails for daily digest for user {user.id}: {e}"
-                )
+    if weather:
+        weather_text = (
+            f"Погода в місті {weather.city_name}: "
+            f"зараз {weather.current_temp}°C, {weather.current_conditions}."
+        )
+        if weather.daily_forecasts:
+            today = weather.daily_forecasts[0]
+            weather_text += (
+                f" Прогноз на сьогодні: макс {today.max_temp}°C, мін {today.min_temp}°C, "
+                f"ймовірність опадів {today.precipitation_prob_max}%."
+            )
+    else:
+        weather_text = "Не вдалося отримати дані про погоду."
 
-            if events:
-                events_text = "\n".join(
-                    [
-                        f"- {e.start_time.strftime('%H:%M') if e.start_time else 'All day'}: {e.summary}"
-                        for e in events
-                    ]
-                )
-            else:
-                events_text = "Сьогодні немає запланованих подій у календарі."
+    if emails is None:
+        emails_text = "Не вдалося перевірити пошту."
+    elif emails:
+        emails_text = "Останні листи за добу:\n" + "\n".join(
+            [f"- від {e.sender}: {e.subject}" for e in emails]
+        )
+    else:
+        emails_text = "За останню добу нових листів не було."
 
-            if weather:
-                weather_text = (
-                    f"Погода в місті {weather.city_name}: "
-                    f"зараз {weather.current_temp}°C, {weather.current_conditions}."
-                )
-                if weather.daily_forecasts:
-                    today = weather.daily_forecasts[0]
-                    weather_text += (
-                        f" Прогноз на сьогодні: макс {today.max_temp}°C, мін {today.min_temp}°C, "
-                        f"ймовірність опадів {today.precipitation_prob_max}%."
-                    )
-            else:
-                weather_text = "Не вдалося отримати дані про погоду."
-
-            if emails is None:
-                emails_text = "Не вдалося перевірити пошту."
-            elif emails:
-                emails_text = "Останні листи за добу:\n" + "\n".join(
-                    [f"- від {e.sender}: {e.subject}" for e in emails]
-                )
-            else:
-                emails_text = "За останню добу нових листів не було."
-
-            prompt = (
-                f"Ось мій розклад на сьогодні:\n{events_text}\n\n"
-                f"{weather_text}\n\n"
-                f"{emails_text}\n\n"
-                "Напиши мені коротке, позитивне ранкове привітання та підсумок мого дня. "
-                "Використовуй емодзі. Звертайся до мене на ім'я (якщо знаєш) або просто друже.\n\n"
-                f"{settings.TELEGRAM_HTML_GUIDELINES}"
-            )
+    prompt = (
+        f"Ось мій розклад на сьогодні:\n{events_text}\n\n"
+        f"{weather_text}\n\n"
+        f"{emails_text}\n\n"
+        "Напиши мені коротке, позитивне ранкове привітання та підсумок мого дня. "
+        "Використовуй емодзі. Звертайся до мене на ім'я (якщо знаєш) або просто друже.\n\n"
+        f"{settings.TELEGRAM_HTML_GUIDELINES}"
+    )
 
-            digest_text = await service.chat(prompt, [], user.id, db)
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage",
-                    data={
-                        "chat_id": user.telegram_id,
-                        "text": digest_text,
-                        "parse_mode": "HTML",
-                    },
-                )
-                response.raise_for_status()
+    digest_text = await service.chat(prompt, [], user.id, db)
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        response = await client.post(
+            f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage",
+            data={
+                "chat_id": user.telegram_id,
+                "text": digest_text,
+                "parse_mode": "HTML",
+            },
+        )
+        response.raise_for_status()
 
-            logger.info(f"Digest sent to user {user.id}")
-            sent_count += 1
+    logger.info(f"Digest sent to user {user.id}")
 
-        except Exception as e:
-            logger.error(f"Failed to send digest to user {user.id}: {e}")
 
-    return sent_count
+@job_handler("daily_digest", max_attempts=3)
+async def _run_daily_digest_job(db: AsyncSession, payload: dict[str, Any]) -> None:
+    user = await db.get(User, payload["user_id"])
+    if user is None:
+        logger.warning(f"User {payload['user_id']} not found for daily digest")
+        return
+    await send_daily_digest(db, user)
+
+
+async def queue_daily_digests(db: AsyncSession) -> int:
+    """
+    Queue daily morning digests for enabled users, one job per user.
+
+    Args:
+        db: The database session.
+
+    Returns:
+        int: The number of queued digests.
+    """
+    logger.info("🌅 Queueing Daily Morning Digests...")
+    stmt = select(User.id).where(
+        User.is_daily_summary_enabled,
+        User.google_refresh_token.isnot(None),
+        User.telegram_id.isnot(None),
+    )
+    result = await db.execute(stmt)
+    user_ids = list(result.scalars().all())
+    for user_id in user_ids:
+        await enqueue(
+            db,
+            "daily_digest",
+            {"user_id": user_id},
+            dedupe_key=f"daily_digest:{user_id}",
+        )
+    return len(user_ids)
 
 
 @router.post("/morning-digest", response_model=dict[str, Any])
 async def post_morning_digest(db: SessionDep) -> dict[str, Any]:
     """
-    Endpoint called to send morning digests.
+    Endpoint called to queue morning digests.
+
+    Each digest is a separate job, retried on its own if it fails.
     """
-    sent_count = await send_daily_digests(db)
-    return {"status": "success", "sent_digests_count": sent_count}
+    queued_count = await queue_daily_digests(db)
+    return {"status": "success", "queued_digests_count": queued_count}
 
 
 @router.post("/check-power-status", response_model=dict[str, Any])
@@ -196,15 +221,44 @@ async def post_check_power_status(db: SessionDep) -> dict[str, Any]:
 
 
 @router.post("/sync-knowledge", response_model=dict[str, Any])
-async def post_sync_knowledge(
-    knowledge_service: KnowledgeServiceDep,
-    background_tasks: BackgroundTasks,
-) -> dict[str, Any]:
+async def post_sync_knowledge(db: SessionDep) -> dict[str, Any]:
     """
     Endpoint called to sync knowledge base with Google Drive in the background.
+
+    The sync is queued as a job; a sync that is already queued is not
+    queued again, and the queue never runs two at once.
     """
-    background_tasks.add_task(knowledge_service.sync_with_drive)
+    _, created = await enqueue(db, "knowledge_sync", {}, dedupe_key="knowledge_sync")
+    if not created:
+        return {
+            "status": "already_queued",
+            "message": "Knowledge base sync is already queued",
+        }
     return {
         "status": "success",
-        "message": "Knowledge base sync started in background",
+        "message": "Knowledge base sync queued",
     }
+
+
+@router.get("/sync-knowledge/status", response_model=KnowledgeSyncStatus)
+async def get_sync_knowledge_status(
+    db: SessionDep,
+    knowledge_service: KnowledgeServiceDep,
+) -> KnowledgeSyncStatus:
+    """
+    Endpoint returning the progress of the latest knowledge base sync.
+    """
+    return await knowledge_service.get_sync_status(db)
+
+
+@router.post("/run-jobs", response_model=dict[str, Any])
+async def post_run_jobs() -> dict[str, Any]:
+    """
+    Endpoint called to run due background jobs.
+
+    For instances that only get CPU while serving requests: runs queued
+    jobs on this instance for up to JOB_DRAIN_MAX_SEC.
+    """
+    worker = await job_worker.aget()
+    started = await worker.drain(timeout=settings.JOB_DRAIN_MAX_SEC)
+    return {"status": "success", "started_jobs_count": started}
@@ -5,7 +5,7 @@ from google.auth.exceptions import RefreshError
 from googleapiclient.errors import HttpError
 
 from app.api.deps import GmailServiceDep, SessionDep, TargetUserId
-from app.schemas.gmail import EmailMessage, EmailMessageList
+from app.schemas.gmail import EmailDetailLevel, EmailMessage, EmailMessageList
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -72,6 +72,10 @@ async def get_emails(
         le=20,
         description="Number of emails to fetch (1-20)",
     ),
+    detail_level: EmailDetailLevel = Query(
+        EmailDetailLevel.FULL,
+        description="metadata/snippet skip body download; use /messages/{id} for bodies",
+    ),
 ) -> EmailMessageList:
     try:
         emails = await gmail_service.get_emails(
@@ -79,6 +83,7 @@ async def get_emails(
             db=db,
             query=query,
             max_results=max_results,
+            detail_level=detail_level,
         )
         return EmailMessageList(emails=emails, count=len(emails))
     except Exception as e:
@@ -2,7 +2,8 @@ from fastapi import APIRouter
 from fastapi.responses import Response
 
 from app.api.deps import CurrentUser, TTSServiceDep
-from app.schemas.tts import TTSSynthesizeRequest
+from app.schemas.tts import TTSCacheStats, TTSSynthesizeRequest
+from app.services.tts_cache import tts_audio_cache
 
 router = APIRouter()
 
@@ -31,3 +32,17 @@ async def synthesize_speech(
         media_type="audio/ogg",
         headers={"Content-Disposition": 'inline; filename="speech.ogg"'},
     )
+
+
+@router.get("/cache/stats", response_model=TTSCacheStats)
+async def get_cache_stats(current_user: CurrentUser) -> TTSCacheStats:
+    """
+    Report hit ratio and bytes saved by the TTS audio cache.
+
+    Args:
+        current_user: Authenticated user (required).
+
+    Returns:
+        Cache counters since the process started.
+    """
+    return TTSCacheStats(**tts_audio_cache.stats.as_dict())
@@ -20,6 +20,8 @@ class Settings(BaseSettings):
 
     # General
     DEBUG: bool = True
+    # Run the full instance warm-up (see app.services.warmup) on startup
+    WARMUP_ON_STARTUP: bool = True
 
     # Superuser
     SUPERUSER_EMAIL: str = "admin@admin.com"
@@ -54,11 +56,64 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_ID: str = ""
     GOOGLE_CLIENT_SECRET: SecretStr = SecretStr("")
     GOOGLE_REDIRECT_URI: str = ""
+    GOOGLE_CLIENT_CACHE_MAX_SIZE: int = 256
+    GOOGLE_CLIENT_CACHE_TTL_SEC: int = 3000
+    GOOGLE_TOKEN_REFRESH_MARGIN_SEC: int = 300
+    CALENDAR_LIST_PAGE_SIZE: int = 250
+    CALENDAR_STORE_ENABLED: bool = True
+    CALENDAR_STORE_PAST_DAYS: int = 30
+    CALENDAR_STORE_FUTURE_DAYS: int = 180
+    CALENDAR_SYNC_INTERVAL_SEC: int = 30
+    CALENDAR_MULTI_ENABLED: bool = True
+    CALENDAR_MAX_CALENDARS: int = 10
+    CALENDAR_LIST_TTL_SEC: int = 900
     GMAIL_BODY_TRUNCATE_LEN: int = 1500
+    GMAIL_BATCH_SIZE: int = 50
+    GMAIL_CACHE_ENABLED: bool = True
+    GMAIL_CACHE_WINDOW_DAYS: int = 7
+    GMAIL_CACHE_MAX_MESSAGES: int = 200
+    GMAIL_CACHE_SYNC_INTERVAL_SEC: int = 60
+    TTS_CACHE_ENABLED: bool = True
+    TTS_CACHE_MEMORY_MAX_BYTES: int = 32 * 1024 * 1024
+    # Disk tier, off by default: on Cloud Run /tmp is an in-memory
+    # filesystem counted against the instance's memory limit, so only point
+    # this at a real disk (or a mounted volume)
+    TTS_CACHE_DIR: str = ""
+    TTS_CACHE_DISK_MAX_BYTES: int = 256 * 1024 * 1024
+    TTS_CHUNK_MAX_BYTES: int = 2000
+    TTS_MAX_CONCURRENT_CHUNKS: int = 4
+    TTS_GRPC_POOL_SIZE: int = 2
+
+    # Chat session summaries: fold new messages into the rolling summary
+    # once they add up to this many (estimated) tokens
+    SUMMARY_TOKEN_THRESHOLD: int = 1500
+    SUMMARY_MAX_BATCH_MESSAGES: int = 50
+    # Summary jobs: run this long after the last request for a session, at
+    # most this many at once per instance
+    SUMMARY_DEBOUNCE_SEC: float = 20.0
+    SUMMARY_MAX_CONCURRENCY: int = 1
+
+    # Background job queue: jobs locked longer than the visibility timeout
+    # (their instance died) are claimed again; failures retry with
+    # exponential backoff. Background kinds (summaries) wait while chat
+    # turns run, for up to JOB_BACKGROUND_MAX_DEFER_SEC
+    JOB_WORKER_ENABLED: bool = True
+    JOB_WORKER_CONCURRENCY: int = 4
+    JOB_POLL_INTERVAL_SEC: float = 2.0
+    JOB_VISIBILITY_TIMEOUT_SEC: float = 300.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_DELAY_SEC: float = 10.0
+    JOB_RETRY_MAX_DELAY_SEC: float = 900.0
+    JOB_BACKGROUND_MAX_DEFER_SEC: float = 30.0
+    # POST /cron/run-jobs stops starting jobs after this long
+    JOB_DRAIN_MAX_SEC: float = 240.0
 
     # RAG / Knowledge Base
     GOOGLE_DRIVE_FOLDER_ID: str = ""
     FILE_SEARCH_STORE_DISPLAY_NAME: str = "vesta-knowledge-base"
+    KNOWLEDGE_SYNC_DRIVE_WORKERS: int = 2
+    KNOWLEDGE_SYNC_POLL_INTERVAL_SEC: float = 3.0
+    KNOWLEDGE_SYNC_UPLOAD_TIMEOUT_SEC: float = 300.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,12 +1,6 @@
 import logging
 import sys
 
-from google.cloud import logging as google_logging
-from google.cloud.logging.handlers import CloudLoggingHandler
-from google.cloud.logging.handlers import setup_logging as setup_google_logging
-from google.cloud.logging_v2.handlers.transports import BackgroundThreadTransport
-from google.oauth2 import service_account
-
 from app.core.config import settings
 
 
@@ -32,6 +26,17 @@ def setup_logging() -> None:
         logger.info("Logging configured for LOCAL/DEBUG environment.")
     else:
         try:
+            # Only production needs the Cloud Logging SDK, which is slow to import
+            from google.cloud import logging as google_logging
+            from google.cloud.logging.handlers import CloudLoggingHandler
+            from google.cloud.logging.handlers import (
+                setup_logging as setup_google_logging,
+            )
+            from google.cloud.logging_v2.handlers.transports import (
+                BackgroundThreadTransport,
+            )
+            from google.oauth2 import service_account
+
             if settings.GOOGLE_APPLICATION_CREDENTIALS:
                 client = google_logging.Client(
                     credentials=service_account.Credentials.from_service_account_file(
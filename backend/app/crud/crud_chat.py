@@ -73,5 +73,61 @@ class CRUDChatHistory(CRUDBase[ChatHistory, ChatHistoryCreate, ChatHistoryUpdate
         )
         return result.scalar_one()
 
+    async def get_after_id(
+        self,
+        db: AsyncSession,
+        *,
+        session_id: int,
+        after_id: int | None,
+        limit: int | None = None,
+    ) -> list[ChatHistory]:
+        """
+        Get a session's messages after ``after_id``, ordered oldest to newest.
+
+        Args:
+            db: Database session
+            session_id: Session ID to fetch messages for
+            after_id: Only return messages with a greater ID; None for all
+            limit: Maximum number of (oldest) messages to return
+
+        Returns:
+            List of ChatHistory records
+        """
+        stmt = select(self.model).where(self.model.session_id == session_id)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        stmt = stmt.order_by(self.model.id).limit(limit)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_content_length_by_session_id(
+        self,
+        db: AsyncSession,
+        *,
+        session_id: int,
+        after_id: int | None = None,
+        up_to_id: int | None = None,
+    ) -> int:
+        """
+        Return the total content length (characters) of a session's messages.
+
+        Args:
+            db: Database session
+            session_id: Session ID to measure
+            after_id: Only include messages with a greater ID
+            up_to_id: Only include messages with an ID up to and including this one
+
+        Returns:
+            Total number of characters
+        """
+        query = select(func.coalesce(func.sum(func.length(self.model.content)), 0))
+        query = query.where(self.model.session_id == session_id)
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        if up_to_id is not None:
+            query = query.where(self.model.id <= up_to_id)
+        result = await db.execute(query)
+        return result.scalar_one()
+
 
 chat = CRUDChatHistory(ChatHistory)
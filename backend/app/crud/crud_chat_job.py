@@ -0,0 +1,32 @@
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.models.chat import ChatJob
+from app.schemas.chat import ChatJobCreate, ChatJobUpdate
+from app.schemas.enums import ChatJobStatus
+
+
+class CRUDChatJob(CRUDBase[ChatJob, ChatJobCreate, ChatJobUpdate]):
+    async def claim(self, db: AsyncSession, *, id: int) -> bool:
+        """Move a queued job to RUNNING; False if someone else already did."""
+        result = await db.execute(
+            update(ChatJob)
+            .where(ChatJob.id == id, ChatJob.status == ChatJobStatus.QUEUED)
+            .values(status=ChatJobStatus.RUNNING)
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    async def fail_running(self, db: AsyncSession, *, id: int, error: str) -> bool:
+        """Mark a running job FAILED; False if it is not running any more."""
+        result = await db.execute(
+            update(ChatJob)
+            .where(ChatJob.id == id, ChatJob.status == ChatJobStatus.RUNNING)
+            .values(status=ChatJobStatus.FAILED, error=error)
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+
+chat_job = CRUDChatJob(ChatJob)
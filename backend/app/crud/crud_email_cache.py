@@ -0,0 +1,171 @@
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.models.email_cache import CachedEmail, GmailSyncState
+from app.schemas.email_cache import (
+    CachedEmailCreate,
+    CachedEmailUpdate,
+    GmailSyncStateCreate,
+    GmailSyncStateUpdate,
+)
+
+
+def encode_labels(label_ids: list[str]) -> str:
+    """Store labels delimited on both sides so ``LIKE '%,INBOX,%'`` is exact."""
+    return f",{','.join(label_ids)}," if label_ids else ""
+
+
+class CRUDCachedEmail(CRUDBase[CachedEmail, CachedEmailCreate, CachedEmailUpdate]):
+    async def get_by_message_ids(
+        self, db: AsyncSession, *, user_id: int, message_ids: list[str]
+    ) -> list[CachedEmail]:
+        if not message_ids:
+            return []
+        result = await db.execute(
+            select(CachedEmail).filter(
+                CachedEmail.user_id == user_id,
+                CachedEmail.message_id.in_(message_ids),
+            )
+        )
+        return list(result.scalars().all())
+
+    async def upsert_many(
+        self, db: AsyncSession, *, user_id: int, objs_in: list[CachedEmailCreate]
+    ) -> None:
+        """
+        Insert or refresh mirrored messages.
+
+        An already loaded body is kept when the incoming data has none.
+        """
+        if not objs_in:
+            return
+        existing = {
+            row.message_id: row
+            for row in await self.get_by_message_ids(
+                db, user_id=user_id, message_ids=[o.message_id for o in objs_in]
+            )
+        }
+        for obj_in in objs_in:
+            labels = encode_labels(obj_in.label_ids)
+            row = existing.get(obj_in.message_id)
+            if row is None:
+                row = CachedEmail(user_id=user_id, message_id=obj_in.message_id)
+                db.add(row)
+            row.sender = obj_in.sender
+            row.subject = obj_in.subject
+            row.date = obj_in.date
+            row.snippet = obj_in.snippet
+            if obj_in.body is not None:
+                row.body = obj_in.body
+            row.label_ids = labels
+            row.is_unread = "UNREAD" in obj_in.label_ids
+            row.internal_date = obj_in.internal_date
+        await db.commit()
+
+    async def update_labels(
+        self, db: AsyncSession, *, user_id: int, labels: dict[str, list[str]]
+    ) -> None:
+        """Replace the label set of already mirrored messages."""
+        rows = await self.get_by_message_ids(
+            db, user_id=user_id, message_ids=list(labels)
+        )
+        for row in rows:
+            label_ids = labels[row.message_id]
+            row.label_ids = encode_labels(label_ids)
+            row.is_unread = "UNREAD" in label_ids
+        await db.commit()
+
+    async def set_bodies(
+        self, db: AsyncSession, *, user_id: int, bodies: dict[str, str]
+    ) -> None:
+        rows = await self.get_by_message_ids(
+            db, user_id=user_id, message_ids=list(bodies)
+        )
+        for row in rows:
+            row.body = bodies[row.message_id]
+        await db.commit()
+
+    async def remove_many(
+        self, db: AsyncSession, *, user_id: int, message_ids: list[str]
+    ) -> None:
+        if not message_ids:
+            return
+        await db.execute(
+            delete(CachedEmail).where(
+                CachedEmail.user_id == user_id,
+                CachedEmail.message_id.in_(message_ids),
+            )
+        )
+        await db.commit()
+
+    async def remove_older_than(
+        self, db: AsyncSession, *, user_id: int, before: datetime
+    ) -> None:
+        await db.execute(
+            delete(CachedEmail).where(
+                CachedEmail.user_id == user_id,
+                CachedEmail.internal_date < before,
+            )
+        )
+        await db.commit()
+
+    async def clear(self, db: AsyncSession, *, user_id: int) -> None:
+        await db.execute(delete(CachedEmail).where(CachedEmail.user_id == user_id))
+        await db.commit()
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        since: datetime,
+        unread_only: bool = False,
+        label_id: str | None = None,
+        limit: int = 5,
+    ) -> list[CachedEmail]:
+        """Return mirrored messages newer than ``since``, newest first."""
+        stmt = select(CachedEmail).filter(
+            CachedEmail.user_id == user_id,
+            CachedEmail.internal_date >= since,
+        )
+        if unread_only:
+            stmt = stmt.filter(CachedEmail.is_unread)
+        if label_id:
+            stmt = stmt.filter(CachedEmail.label_ids.contains(f",{label_id},"))
+        result = await db.execute(
+            stmt.order_by(
+                CachedEmail.internal_date.desc(), CachedEmail.id.desc()
+            ).limit(limit)
+        )
+        return list(result.scalars().all())
+
+
+class CRUDGmailSyncState(
+    CRUDBase[GmailSyncState, GmailSyncStateCreate, GmailSyncStateUpdate]
+):
+    async def get_by_user_id(
+        self, db: AsyncSession, *, user_id: int
+    ) -> GmailSyncState | None:
+        result = await db.execute(
+            select(GmailSyncState).filter(GmailSyncState.user_id == user_id)
+        )
+        return result.scalars().first()
+
+    async def upsert(
+        self, db: AsyncSession, *, obj_in: GmailSyncStateCreate
+    ) -> GmailSyncState:
+        state = await self.get_by_user_id(db, user_id=obj_in.user_id)
+        if state is None:
+            return await self.create(db, obj_in=obj_in)
+        return await self.update(
+            db,
+            db_obj=state,
+            obj_in=GmailSyncStateUpdate(**obj_in.model_dump(exclude={"user_id"})),
+        )
+
+
+cached_email = CRUDCachedEmail(CachedEmail)
+gmail_sync_state = CRUDGmailSyncState(GmailSyncState)
@@ -0,0 +1,252 @@
+from collections.abc import Collection
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import and_, case, delete, exists, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.job import BackgroundJob
+from app.schemas.enums import JobStatus
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _claimable(now: datetime):
+    """
+    Due queued jobs and running jobs whose lock expired, except those whose
+    dedupe key is held by another running job.
+    """
+    twin = aliased(BackgroundJob)
+    running_twin = exists().where(
+        twin.dedupe_key == BackgroundJob.dedupe_key,
+        twin.id != BackgroundJob.id,
+        twin.status == JobStatus.RUNNING,
+        twin.locked_until >= now,
+    )
+    return and_(
+        or_(
+            and_(
+                BackgroundJob.status == JobStatus.QUEUED,
+                BackgroundJob.run_after <= now,
+            ),
+            and_(
+                BackgroundJob.status == JobStatus.RUNNING,
+                BackgroundJob.locked_until < now,
+            ),
+        ),
+        or_(BackgroundJob.dedupe_key.is_(None), ~running_twin),
+    )
+
+
+class CRUDBackgroundJob:
+    """Queue operations on ``BackgroundJob``; every method commits."""
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        *,
+        kind: str,
+        payload: dict[str, Any],
+        run_after: datetime,
+        priority: int,
+        max_attempts: int,
+        dedupe_key: str | None = None,
+    ) -> tuple[BackgroundJob, bool]:
+        """
+        Add a job, or coalesce it into a queued job with the same
+        ``dedupe_key``: that job takes the new payload and the later of the
+        two ``run_after`` times.
+
+        Returns:
+            The job and whether it was newly created
+        """
+        if dedupe_key is not None:
+            result = await db.execute(
+                update(BackgroundJob)
+                .where(
+                    BackgroundJob.dedupe_key == dedupe_key,
+                    BackgroundJob.status == JobStatus.QUEUED,
+                )
+                .values(
+                    payload=payload,
+                    run_after=case(
+                        (BackgroundJob.run_after < run_after, run_after),
+                        else_=BackgroundJob.run_after,
+                    ),
+                )
+                .returning(BackgroundJob.id)
+                .execution_options(synchronize_session=False)
+            )
+            existing_id = result.scalars().first()
+            if existing_id is not None:
+                await db.commit()
+                return await self.get(db, id=existing_id), False
+
+        job = BackgroundJob(
+            kind=kind,
+            payload=payload,
+            status=JobStatus.QUEUED,
+            priority=priority,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_after=run_after,
+            dedupe_key=dedupe_key,
+        )
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+        return job, True
+
+    async def get(self, db: AsyncSession, *, id: int) -> BackgroundJob | None:
+        result = await db.execute(
+            select(BackgroundJob)
+            .where(BackgroundJob.id == id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().first()
+
+    async def get_by_dedupe_key(
+        self, db: AsyncSession, *, dedupe_key: str
+    ) -> list[BackgroundJob]:
+        """Jobs with ``dedupe_key`` that are still in the queue, oldest first."""
+        result = await db.execute(
+            select(BackgroundJob)
+            .where(BackgroundJob.dedupe_key == dedupe_key)
+            .order_by(BackgroundJob.id)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def claim(
+        self,
+        db: AsyncSession,
+        *,
+        limit: int,
+        lock_for: timedelta,
+        kinds: Collection[str] | None = None,
+    ) -> list[BackgroundJob]:
+        """
+        Lock up to ``limit`` claimable jobs (of ``kinds``, if given) for
+        ``lock_for`` and mark them running, highest priority and oldest first.
+
+        On PostgreSQL candidates are selected ``FOR UPDATE SKIP LOCKED``, so
+        concurrent workers pick disjoint jobs without waiting on each other.
+        Elsewhere (SQLite in tests) each claim is a conditional UPDATE that
+        only one worker can win.
+        """
+        now = _utcnow()
+        stmt = (
+            select(BackgroundJob.id)
+            .where(_claimable(now))
+            .order_by(
+                BackgroundJob.priority.desc(),
+                BackgroundJob.run_after,
+                BackgroundJob.id,
+            )
+            .limit(limit)
+        )
+        if kinds is not None:
+            stmt = stmt.where(BackgroundJob.kind.in_(list(kinds)))
+        if db.bind.dialect.name == "postgresql":
+            stmt = stmt.with_for_update(skip_locked=True, of=BackgroundJob)
+
+        claimed: list[int] = []
+        for job_id in (await db.execute(stmt)).scalars().all():
+            result = await db.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job_id, _claimable(now))
+                .values(
+                    status=JobStatus.RUNNING,
+                    locked_until=now + lock_for,
+                    attempts=BackgroundJob.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 1:
+                claimed.append(job_id)
+        await db.commit()
+
+        if not claimed:
+            return []
+        result = await db.execute(
+            select(BackgroundJob)
+            .where(BackgroundJob.id.in_(claimed))
+            .order_by(BackgroundJob.priority.desc(), BackgroundJob.id)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _owned(job: BackgroundJob):
+        # A job reclaimed after its lock expired has a higher attempt count
+        return and_(
+            BackgroundJob.id == job.id,
+            BackgroundJob.status == JobStatus.RUNNING,
+            BackgroundJob.attempts == job.attempts,
+        )
+
+    async def extend_lock(
+        self, db: AsyncSession, *, job: BackgroundJob, lock_for: timedelta
+    ) -> bool:
+        """Keep a running job locked for another ``lock_for``."""
+        result = await db.execute(
+            update(BackgroundJob)
+            .where(self._owned(job))
+            .values(locked_until=_utcnow() + lock_for)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    async def complete(self, db: AsyncSession, *, job: BackgroundJob) -> None:
+        """Delete a finished job."""
+        await db.execute(
+            delete(BackgroundJob)
+            .where(self._owned(job))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    async def retry_or_fail(
+        self, db: AsyncSession, *, job: BackgroundJob, error: str, delay: timedelta
+    ) -> JobStatus:
+        """
+        Requeue a failed job to run after ``delay``, or mark it FAILED once
+        it is out of attempts.
+        """
+        status = (
+            JobStatus.FAILED if job.attempts >= job.max_attempts else JobStatus.QUEUED
+        )
+        await db.execute(
+            update(BackgroundJob)
+            .where(self._owned(job))
+            .values(
+                status=status,
+                run_after=_utcnow() + delay,
+                locked_until=None,
+                last_error=error,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return status
+
+    async def release(self, db: AsyncSession, *, job: BackgroundJob) -> None:
+        """Requeue an interrupted job without using up an attempt."""
+        await db.execute(
+            update(BackgroundJob)
+            .where(self._owned(job))
+            .values(
+                status=JobStatus.QUEUED,
+                locked_until=None,
+                attempts=BackgroundJob.attempts - 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+
+background_job = CRUDBackgroundJob()
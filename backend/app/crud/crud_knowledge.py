@@ -0,0 +1,34 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.knowledge import KnowledgeSyncRecord
+from app.schemas.knowledge import KnowledgeSyncStatus
+
+
+class CRUDKnowledgeSync:
+    async def get_by_store(
+        self, db: AsyncSession, *, store: str
+    ) -> KnowledgeSyncRecord | None:
+        result = await db.execute(
+            select(KnowledgeSyncRecord)
+            .where(KnowledgeSyncRecord.store == store)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().first()
+
+    async def save(
+        self, db: AsyncSession, *, status: KnowledgeSyncStatus
+    ) -> KnowledgeSyncRecord:
+        """Record ``status`` as the latest sync of its store."""
+        record = await self.get_by_store(db, store=status.store)
+        if record is None:
+            record = KnowledgeSyncRecord(store=status.store)
+            db.add(record)
+        for field, value in status.model_dump(exclude={"store", "attempts"}).items():
+            setattr(record, field, value)
+        await db.commit()
+        await db.refresh(record)
+        return record
+
+
+knowledge_sync = CRUDKnowledgeSync()
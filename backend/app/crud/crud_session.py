@@ -1,4 +1,4 @@
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased, contains_eager
 
@@ -53,5 +53,34 @@ class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate
         result = await db.execute(stmt)
         return list(result.unique().scalars().all())
 
+    async def advance_summary(
+        self,
+        db: AsyncSession,
+        *,
+        id: int,
+        expected_through_id: int | None,
+        through_id: int,
+        summary: str,
+    ) -> bool:
+        """
+        Store ``summary`` as covering messages up to ``through_id``.
+
+        Only applies if the session's cursor is still ``expected_through_id``,
+        so two overlapping summary runs cannot both fold the same messages.
+        Returns whether the summary was stored. Does not commit.
+        """
+        cursor = ChatSession.summarized_through_message_id
+        result = await db.execute(
+            update(ChatSession)
+            .where(
+                ChatSession.id == id,
+                cursor.is_(None)
+                if expected_through_id is None
+                else cursor == expected_through_id,
+            )
+            .values(summary=summary, summarized_through_message_id=through_id)
+        )
+        return result.rowcount == 1
+
 
 chat_session = CRUDChatSession(ChatSession)
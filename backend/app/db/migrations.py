@@ -0,0 +1,117 @@
+"""
+Fast-start schema check against the Alembic migration scripts.
+
+``alembic upgrade head`` imports Alembic, every model and every migration
+module before it can tell that there is nothing to do. This module reads the
+head revision straight from the migration files and compares it with the
+database's ``alembic_version`` in a single query, so an instance whose
+schema is already current can start without touching Alembic.
+
+Usage (from ``backend/``)::
+
+    python -m app.db.migrations check
+
+Exits 0 when the database is at head and 1 when migrations are pending or
+the revision could not be read.
+"""
+
+import asyncio
+import logging
+import re
+import sys
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_DIR = Path(__file__).resolve().parents[2] / "migrations" / "versions"
+
+_REVISION_RE = re.compile(r"^revision\b[^=]*=\s*[\"']([\w-]+)[\"']", re.MULTILINE)
+_DOWN_REVISION_RE = re.compile(r"^down_revision\b[^=]*=\s*(.+)$", re.MULTILINE)
+_QUOTED_RE = re.compile(r"[\"']([\w-]+)[\"']")
+
+
+def head_revisions(versions_dir: Path = VERSIONS_DIR) -> set[str]:
+    """
+    Return the head revisions of the migration graph.
+
+    The ``revision`` and ``down_revision`` assignments are read as text, so
+    the migration modules are never imported. Merge revisions (a tuple of
+    down revisions) are supported.
+    """
+    revisions: set[str] = set()
+    parents: set[str] = set()
+    for path in versions_dir.glob("*.py"):
+        source = path.read_text(encoding="utf-8")
+        revision = _REVISION_RE.search(source)
+        if revision is None:
+            continue
+        revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION_RE.search(source)
+        if down_revision is not None:
+            parents.update(_QUOTED_RE.findall(down_revision.group(1)))
+    return revisions - parents
+
+
+async def current_revisions(connection: AsyncConnection) -> set[str]:
+    """Revisions stored in ``alembic_version``; empty if the table is missing."""
+    try:
+        result = await connection.execute(
+            text("SELECT version_num FROM alembic_version")
+        )
+    except DBAPIError:
+        return set()
+    return {row[0] for row in result}
+
+
+async def schema_is_current(
+    engine: AsyncEngine, versions_dir: Path = VERSIONS_DIR
+) -> bool:
+    """Whether the database is at the head of the migration scripts."""
+    heads = head_revisions(versions_dir)
+    async with engine.connect() as connection:
+        current = await current_revisions(connection)
+
+    if current == heads:
+        return True
+    logger.warning(
+        "Database schema is not at the migration head",
+        extra={
+            "json_fields": {
+                "current_revisions": sorted(current),
+                "head_revisions": sorted(heads),
+            }
+        },
+    )
+    return False
+
+
+async def _check() -> bool:
+    from app.db.session import engine
+
+    try:
+        return await schema_is_current(engine)
+    finally:
+        await engine.dispose()
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO)
+    if sys.argv[1:] != ["check"]:
+        print("usage: python -m app.db.migrations check", file=sys.stderr)
+        return 2
+    try:
+        is_current = asyncio.run(_check())
+    except Exception:
+        logger.exception("Could not read the database schema revision")
+        return 1
+    if is_current:
+        logger.info("Database schema is up to date")
+    return 0 if is_current else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,11 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency for work that needs its own session alongside the request one"""
+    return AsyncSessionLocal
+
+
 async def get_db():
     """Dependency for getting async session"""
     async with AsyncSessionLocal() as session:
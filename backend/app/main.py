@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
 from typing import Annotated
 
-from fastapi import Depends, FastAPI, Request
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -12,10 +13,11 @@ from app.core.config import settings
 from app.core.logger import setup_logging
 from app.initial_data import create_superuser
 from app.models import ChatHistory, NewsSubscription, SmartDevice, User  # noqa: F401
-from app.services.home import HomeAssistantService
-
-# Global service instances
-home_service = HomeAssistantService()
+from app.schemas.warmup import WarmupReport
+from app.services.home import HomeAssistantService, home_service
+from app.services.job_queue import job_worker
+from app.services.registry import service_registry
+from app.services.warmup import instance_warmup
 
 
 @asynccontextmanager
@@ -25,10 +27,20 @@ async def lifespan(app: FastAPI):
     print("Starting up services...")
     print("Create initial superuser...")
     await create_superuser()
+    # Services are built lazily; warm them up without delaying readiness
+    warm_up_task = asyncio.create_task(
+        instance_warmup.run()
+        if settings.WARMUP_ON_STARTUP
+        else service_registry.warm_up()
+    )
+    if settings.JOB_WORKER_ENABLED:
+        job_worker().start()
     yield
     # Shutdown
     print("Shutting down services...")
-    await home_service.close()
+    warm_up_task.cancel()
+    # Closes the job worker too, handing its running jobs back to the queue
+    await service_registry.close_all()
 
 
 app = FastAPI(
@@ -78,18 +90,28 @@ async def log_requests(request: Request, call_next):
         )
 
 
-def get_home_service() -> HomeAssistantService:
-    return home_service
-
-
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/warmup", response_model=WarmupReport)
+async def warmup(response: Response):
+    """
+    Warm up this instance and report per-step timings.
+
+    Meant for the Cloud Run startup probe and for warming a new revision
+    before it takes traffic; responds 503 until the instance is ready.
+    """
+    report = await instance_warmup.run()
+    if not report.ready:
+        response.status_code = 503
+    return report
+
+
 @app.get("/test-home")
 async def test_home(
-    entity_id: str, service: Annotated[HomeAssistantService, Depends(get_home_service)]
+    entity_id: str, service: Annotated[HomeAssistantService, Depends(home_service)]
 ):
     state = await service.get_state(entity_id)
     return {"state": state}
@@ -1,7 +1,21 @@
-from .chat import ChatHistory
+from .chat import ChatHistory, ChatJob
 from .device import SmartDevice
+from .email_cache import CachedEmail, GmailSyncState
+from .job import BackgroundJob
+from .knowledge import KnowledgeSyncRecord
 from .news import NewsSubscription
 from .user import User
 from .user_facts import UserFact
 
-__all__ = ["User", "ChatHistory", "SmartDevice", "NewsSubscription", "UserFact"]
+__all__ = [
+    "User",
+    "ChatHistory",
+    "ChatJob",
+    "SmartDevice",
+    "NewsSubscription",
+    "UserFact",
+    "CachedEmail",
+    "GmailSyncState",
+    "BackgroundJob",
+    "KnowledgeSyncRecord",
+]
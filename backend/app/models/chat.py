@@ -1,10 +1,10 @@
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Enum, ForeignKey, String, Text
+from sqlalchemy import BigInteger, Boolean, Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
-from app.schemas.enums import ChatRole
+from app.schemas.enums import ChatJobStatus, ChatRole
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -32,8 +32,37 @@ class ChatSession(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String, default="New Chat")
     summary: Mapped[Optional[str]] = mapped_column(String, nullable=True, default=None)
+    # Last message folded into ``summary``; later messages are not summarized yet
+    summarized_through_message_id: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, default=None
+    )
 
     user: Mapped["User"] = relationship(back_populates="sessions")
     messages: Mapped[list["ChatHistory"]] = relationship(
         back_populates="session", cascade="all, delete-orphan"
     )
+
+
+class ChatJob(Base):
+    """A chat turn accepted for asynchronous processing and Telegram delivery."""
+
+    __tablename__ = "chat_job"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    session_id: Mapped[int] = mapped_column(
+        ForeignKey("chat_session.id", ondelete="CASCADE")
+    )
+    message: Mapped[str] = mapped_column(Text)
+    want_voice: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Telegram chat the reply is delivered to
+    chat_id: Mapped[int] = mapped_column(BigInteger)
+    status: Mapped[ChatJobStatus] = mapped_column(
+        Enum(ChatJobStatus, values_callable=lambda obj: [e.value for e in obj]),
+        default=ChatJobStatus.QUEUED,
+    )
+    assistant_message_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("chat_history.id", ondelete="SET NULL"), nullable=True
+    )
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
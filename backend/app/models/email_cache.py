@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from app.models.user import User
+
+
+class CachedEmail(Base):
+    """A Gmail message mirrored locally (metadata plus lazily loaded body)."""
+
+    __tablename__ = "cached_emails"
+    __table_args__ = (
+        UniqueConstraint("user_id", "message_id", name="uq_cached_emails_user_message"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    message_id: Mapped[str] = mapped_column(String)
+    sender: Mapped[str] = mapped_column(String)
+    subject: Mapped[str] = mapped_column(String)
+    date: Mapped[str] = mapped_column(String)
+    snippet: Mapped[str] = mapped_column(Text, default="")
+    # None until the body has been fetched with format="full"
+    body: Mapped[Optional[str]] = mapped_column(Text, nullable=True, default=None)
+    # Comma-delimited with leading/trailing commas, e.g. ",INBOX,UNREAD,"
+    label_ids: Mapped[str] = mapped_column(String, default="")
+    is_unread: Mapped[bool] = mapped_column(Boolean, default=False)
+    internal_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+    user: Mapped["User"] = relationship(back_populates="cached_emails")
+
+
+class GmailSyncState(Base):
+    """Per-user cursor for incremental Gmail mirror sync."""
+
+    __tablename__ = "gmail_sync_state"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), unique=True, index=True
+    )
+    history_id: Mapped[str] = mapped_column(String)
+    # The mirror holds every non-spam/trash message received since this time
+    covered_since: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    last_synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    user: Mapped["User"] = relationship(back_populates="gmail_sync_state")
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, DateTime, Enum, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.schemas.enums import JobStatus
+
+
+class BackgroundJob(Base):
+    """A unit of background work in the durable job queue."""
+
+    __tablename__ = "background_job"
+    __table_args__ = (Index("ix_background_job_claim", "status", "run_after"),)
+
+    kind: Mapped[str] = mapped_column(String(64))
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
+    status: Mapped[JobStatus] = mapped_column(
+        Enum(JobStatus, values_callable=lambda obj: [e.value for e in obj]),
+        default=JobStatus.QUEUED,
+    )
+    # Higher runs first
+    priority: Mapped[int] = mapped_column(Integer, default=0)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer)
+    run_after: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # A running job whose lock expired is claimable again
+    locked_until: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Queued jobs with the same key coalesce; running ones never overlap
+    dedupe_key: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
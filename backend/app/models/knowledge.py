@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Enum, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.schemas.knowledge import KnowledgeSyncState
+
+
+class KnowledgeSyncRecord(Base):
+    """Outcome of the latest Drive sync of a File Search Store."""
+
+    __tablename__ = "knowledge_sync_status"
+
+    store: Mapped[str] = mapped_column(String, unique=True, index=True)
+    state: Mapped[KnowledgeSyncState] = mapped_column(
+        Enum(KnowledgeSyncState, values_callable=lambda obj: [e.value for e in obj])
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    uploaded_count: Mapped[int] = mapped_column(Integer, default=0)
+    deleted_count: Mapped[int] = mapped_column(Integer, default=0)
+    failed_count: Mapped[int] = mapped_column(Integer, default=0)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
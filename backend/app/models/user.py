@@ -8,6 +8,7 @@ from app.db.base import Base
 if TYPE_CHECKING:
     from app.models.chat import ChatHistory, ChatSession
     from app.models.device import SmartDevice
+    from app.models.email_cache import CachedEmail, GmailSyncState
     from app.models.news import NewsSubscription
     from app.models.user_facts import UserFact
 
@@ -54,3 +55,9 @@ class User(Base):
     facts: Mapped[list["UserFact"]] = relationship(
         back_populates="user", cascade="all, delete-orphan"
     )
+    cached_emails: Mapped[list["CachedEmail"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan"
+    )
+    gmail_sync_state: Mapped[Optional["GmailSyncState"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan"
+    )
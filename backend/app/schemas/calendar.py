@@ -24,6 +24,16 @@ class CalendarEventList(BaseModel):
     count: int = Field(..., description="Number of events")
 
 
+class FreeSlot(BaseModel):
+    start: datetime = Field(..., description="Slot start")
+    end: datetime = Field(..., description="Slot end")
+
+
+class FreeSlotList(BaseModel):
+    slots: list[FreeSlot] = Field(..., description="Free slots, earliest first")
+    count: int = Field(..., description="Number of slots")
+
+
 class EventsRangeRequest(BaseModel):
     start: datetime = Field(..., description="Start datetime (ISO 8601)")
     end: datetime = Field(..., description="End datetime (ISO 8601)")
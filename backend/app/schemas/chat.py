@@ -3,7 +3,7 @@ import base64
 from pydantic import Field
 
 from app.schemas.base import BaseSchema, BaseSchemaInDB
-from app.schemas.enums import ChatRole
+from app.schemas.enums import ChatDelivery, ChatJobStatus, ChatRole, VoiceDelivery
 
 
 class ChatHistoryBase(BaseSchema):
@@ -33,7 +33,14 @@ class ChatRequest(BaseSchema):
     user_id: int
     message: str
     want_voice: bool = False
+    # MULTIPART streams the JSON reply first and the raw Ogg audio after it
+    voice_delivery: VoiceDelivery = VoiceDelivery.BASE64
     session_id: int | None = None
+    # TELEGRAM answers 202 with a job and sends the reply to the chat itself
+    delivery: ChatDelivery = ChatDelivery.RESPONSE
+    # TELEGRAM delivery always goes to the user's own telegram_id; a chat_id
+    # given here must match it
+    chat_id: int | None = None
 
 
 class ChatResponse(BaseSchema):
@@ -67,9 +74,37 @@ class ChatSessionCreate(ChatSessionBase):
 
 class ChatSession(ChatSessionBase, BaseSchemaInDB):
     user_id: int
+    summarized_through_message_id: int | None = None
     messages: list[ChatHistory] = Field(default_factory=list)
 
 
 class ChatSessionUpdate(BaseSchema):
     title: str | None = None
     summary: str | None = None
+
+
+class ChatJobCreate(BaseSchema):
+    user_id: int
+    session_id: int
+    message: str
+    want_voice: bool = False
+    chat_id: int
+
+
+class ChatJobUpdate(BaseSchema):
+    status: ChatJobStatus | None = None
+    assistant_message_id: int | None = None
+    error: str | None = None
+
+
+class ChatJob(BaseSchemaInDB):
+    session_id: int
+    status: ChatJobStatus
+    assistant_message_id: int | None = None
+    error: str | None = None
+
+
+class ChatJobAccepted(ChatJob):
+    """202 body of ``/chat/process`` with ``delivery=telegram``."""
+
+    session_title: str
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+
+
+class CachedEmailCreate(BaseSchema):
+    message_id: str = Field(..., description="Gmail message ID")
+    sender: str
+    subject: str
+    date: str = Field(..., description="Raw Date header")
+    snippet: str = ""
+    body: str | None = None
+    label_ids: list[str] = Field(default_factory=list)
+    internal_date: datetime = Field(..., description="Gmail internalDate (UTC)")
+
+
+class CachedEmailUpdate(BaseSchema):
+    body: str | None = None
+    label_ids: list[str] | None = None
+
+
+class GmailSyncStateCreate(BaseSchema):
+    user_id: int
+    history_id: str = Field(..., description="Gmail historyId the mirror is synced to")
+    covered_since: datetime = Field(
+        ..., description="The mirror holds every message received since then"
+    )
+    last_synced_at: datetime
+
+
+class GmailSyncStateUpdate(BaseSchema):
+    history_id: str | None = None
+    covered_since: datetime | None = None
+    last_synced_at: datetime | None = None
@@ -4,3 +4,29 @@ from enum import StrEnum
 class ChatRole(StrEnum):
     USER = "user"
     MODEL = "model"
+
+
+class VoiceDelivery(StrEnum):
+    BASE64 = "base64"
+    MULTIPART = "multipart"
+
+
+class ChatDelivery(StrEnum):
+    # Reply in the HTTP response
+    RESPONSE = "response"
+    # Accept with 202 and send the reply to the user's Telegram chat
+    TELEGRAM = "telegram"
+
+
+class ChatJobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    # Out of attempts; finished jobs are deleted
+    FAILED = "failed"
@@ -1,6 +1,19 @@
+from enum import StrEnum
+
 from pydantic import BaseModel, Field
 
 
+class EmailDetailLevel(StrEnum):
+    """How much of each message to download and parse."""
+
+    # Sender, subject and date only
+    METADATA = "metadata"
+    # Metadata plus Gmail's short preview snippet
+    SNIPPET = "snippet"
+    # Full payload with the extracted, truncated body
+    FULL = "full"
+
+
 class EmailMessage(BaseModel):
     """Schema representing a single email message."""
 
@@ -8,11 +21,13 @@ class EmailMessage(BaseModel):
     sender: str = Field(..., description="The sender's name and/or email address")
     subject: str = Field(..., description="The subject line of the email")
     date: str = Field(..., description="The date/time the email was received")
-    snippet: str = Field(
-        ..., description="A short snippet/preview of the email content"
-    )
+    snippet: str = Field("", description="A short snippet/preview of the email content")
     body: str = Field(
-        ..., description="The parsed and truncated body text of the email"
+        "",
+        description=(
+            "The parsed and truncated body text of the email "
+            "(empty unless fetched with the 'full' detail level)"
+        ),
     )
 
 
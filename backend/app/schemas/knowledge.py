@@ -0,0 +1,30 @@
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class KnowledgeSyncState(StrEnum):
+    IDLE = "idle"
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class KnowledgeSyncStatus(BaseModel):
+    """Progress of the most recent Drive -> File Search Store sync."""
+
+    store: str = Field(..., description="Display name of the File Search Store")
+    state: KnowledgeSyncState = Field(
+        KnowledgeSyncState.IDLE, description="Current state of the sync"
+    )
+    started_at: datetime | None = Field(None, description="When the sync started")
+    finished_at: datetime | None = Field(None, description="When the sync finished")
+    uploaded_count: int = Field(0, description="Files uploaded or re-uploaded")
+    deleted_count: int = Field(0, description="Files removed from the store")
+    failed_count: int = Field(0, description="Files that failed to sync")
+    attempts: int = Field(
+        0, description="Attempts made by the queued or running sync job"
+    )
+    error: str | None = Field(None, description="Error message if the sync failed")
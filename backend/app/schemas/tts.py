@@ -7,6 +7,16 @@ class TTSSynthesizeRequest(BaseModel):
     text: str = Field(
         ...,
         min_length=1,
-        max_length=5000,
-        description="Text to convert to speech (max 5000 characters)",
+        max_length=20000,
+        description="Text to convert to speech (max 20000 characters)",
     )
+
+
+class TTSCacheStats(BaseModel):
+    """Counters of the TTS audio cache since process start."""
+
+    memory_hits: int = Field(..., description="Requests served from memory")
+    disk_hits: int = Field(..., description="Requests served from the disk tier")
+    misses: int = Field(..., description="Requests that called Cloud TTS")
+    bytes_saved: int = Field(..., description="Audio bytes served from the cache")
+    hit_ratio: float = Field(..., description="Share of requests served from cache")
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+
+
+class WarmupStep(BaseModel):
+    """Outcome of one instance warm-up step."""
+
+    name: str = Field(..., description="Step name")
+    duration_ms: float = Field(..., description="Wall time of the step")
+    ok: bool = Field(..., description="Whether the step succeeded")
+    skipped: bool = Field(False, description="Step not applicable here")
+    error: str | None = Field(None, description="Failure reason")
+
+
+class WarmupReport(BaseModel):
+    """Result of warming up this instance."""
+
+    ready: bool = Field(..., description="Whether the instance can serve traffic")
+    total_ms: float = Field(..., description="Wall time of the whole warm-up")
+    steps: list[WarmupStep]
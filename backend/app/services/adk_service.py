@@ -18,9 +18,6 @@ import os
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
-from google.adk.events import Event
-from google.adk.runners import InMemoryRunner
-from google.genai import types
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents.knowledge_agent import create_knowledge_agent
@@ -33,8 +30,13 @@ from app.services.gemini_tools import (
     build_personalized_prompt,
     create_tools,
 )
+from app.services.registry import service_registry
 
 if TYPE_CHECKING:
+    from google.adk.models import Gemini
+    from google.adk.runners import InMemoryRunner
+    from google.genai import types
+
     from app.models.chat import ChatHistory
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,23 @@ logger = logging.getLogger(__name__)
 _ADK_APP_NAME = "vesta"
 
 
+def _create_gemini_model() -> "Gemini":
+    if not settings.GOOGLE_API_KEY:
+        raise ValueError("GOOGLE_API_KEY is not set")
+    if not settings.GOOGLE_MODEL_NAME:
+        raise ValueError("GOOGLE_MODEL_NAME is not set")
+    os.environ.setdefault("GOOGLE_API_KEY", settings.GOOGLE_API_KEY)
+    from google.adk.models import Gemini
+
+    return Gemini(model=settings.GOOGLE_MODEL_NAME)
+
+
+# Shared by every agent tree: ADK caches the model's genai client per event
+# loop, so chat turns reuse its connections instead of building a new client
+# (and TLS handshake) for every request
+gemini_model = service_registry.register("gemini_model", _create_gemini_model)
+
+
 class ADKService:
     """Service for interacting with the Vesta multi-agent system via Google ADK."""
 
@@ -64,6 +83,10 @@ class ADKService:
         # Vesta loads it via pydantic Settings, so we bridge the two.
         os.environ.setdefault("GOOGLE_API_KEY", settings.GOOGLE_API_KEY)
 
+        # The summary agent is stateless, so its runner is built once and
+        # reused by every summary this instance generates
+        self._summary_runner: "InMemoryRunner | None" = None
+
     # ------------------------------------------------------------------ #
     # Main chat flow                                                      #
     # ------------------------------------------------------------------ #
@@ -100,6 +123,12 @@ class ADKService:
         Raises:
             Exception: If the agent invocation fails.
         """
+        # The ADK and GenAI SDKs take seconds to import; keep them off the
+        # app's cold start
+        from google.adk.events import Event
+        from google.adk.runners import InMemoryRunner
+        from google.genai import types
+
         try:
             # 1. Create tools bound to this request's context
             tool_groups = create_tools(user_id=user_id, db=db)
@@ -110,22 +139,6 @@ class ADKService:
             current_time_str = now.strftime("%Y-%m-%d %H:%M (%A)")
 
             # 2. Build agent hierarchy
-            weather = create_weather_agent(
-                tools=tool_groups["weather"],
-                model=self.model,
-                current_time_str=current_time_str,
-            )
-            knowledge = create_knowledge_agent(
-                tools=tool_groups["knowledge"],
-                model=self.model,
-                current_time_str=current_time_str,
-            )
-            secretary = create_secretary_agent(
-                tools=tool_groups["calendar"] + tool_groups["email"],
-                model=self.model,
-                current_time_str=current_time_str,
-            )
-
             system_instruction = await build_personalized_prompt(
                 db=db,
                 user_id=user_id,
@@ -133,11 +146,11 @@ class ADKService:
                 current_time_str=current_time_str,
             )
 
-            root_agent = create_root_agent(
-                sub_agents=[weather, knowledge, secretary],
-                system_instruction=system_instruction,
-                model=self.model,
-                tools=tool_groups.get("memory"),
+            root_agent = self._build_agent_tree(
+                await gemini_model.aget(),
+                tool_groups,
+                system_instruction,
+                current_time_str,
             )
 
             # 3. Convert DB history to ADK content
@@ -216,6 +229,51 @@ class ADKService:
             )
             raise
 
+    def _build_agent_tree(
+        self,
+        model: "Gemini",
+        tool_groups: dict[str, list],
+        system_instruction: str,
+        current_time_str: str,
+    ):
+        """Build the root agent with its weather, knowledge and secretary sub-agents."""
+        weather = create_weather_agent(
+            tools=tool_groups["weather"],
+            model=model,
+            current_time_str=current_time_str,
+        )
+        knowledge = create_knowledge_agent(
+            tools=tool_groups["knowledge"],
+            model=model,
+            current_time_str=current_time_str,
+        )
+        secretary = create_secretary_agent(
+            tools=tool_groups["calendar"] + tool_groups["email"],
+            model=model,
+            current_time_str=current_time_str,
+        )
+        return create_root_agent(
+            sub_agents=[weather, knowledge, secretary],
+            system_instruction=system_instruction,
+            model=model,
+            tools=tool_groups.get("memory"),
+        )
+
+    def warm_up(self) -> None:
+        """
+        Import the ADK and GenAI SDKs and build a throwaway agent tree.
+
+        Runs in a worker thread during instance warm-up, so the first chat
+        request does not pay for the SDK imports and agent class setup.
+        """
+        from google.adk.runners import InMemoryRunner
+
+        tool_groups = create_tools(user_id=0, db=None)
+        root_agent = self._build_agent_tree(
+            gemini_model(), tool_groups, settings.SYSTEM_INSTRUCTION, "warm-up"
+        )
+        InMemoryRunner(agent=root_agent, app_name=_ADK_APP_NAME)
+
     # ------------------------------------------------------------------ #
     # Session summary generation                                          #
     # ------------------------------------------------------------------ #
@@ -251,12 +309,10 @@ class ADKService:
             f"Write an updated, concise summary including all important facts and context."
         )
 
+        from google.genai import types
+
         try:
-            summary_agent = create_summary_agent(model=self.model)
-            runner = InMemoryRunner(
-                agent=summary_agent,
-                app_name=_ADK_APP_NAME,
-            )
+            runner = self._get_summary_runner(await gemini_model.aget())
 
             session = await runner.session_service.create_session(
                 app_name=_ADK_APP_NAME,
@@ -283,6 +339,12 @@ class ADKService:
                     if text_parts:
                         final_response = "\n".join(text_parts)
 
+            # Runner sessions live in memory; drop this one-shot session
+            await runner.session_service.delete_session(
+                app_name=_ADK_APP_NAME,
+                user_id="system-summary",
+                session_id=session.id,
+            )
             return final_response or fallback_summary
 
         except Exception:
@@ -296,9 +358,19 @@ class ADKService:
     # Internal helpers                                                    #
     # ------------------------------------------------------------------ #
 
+    def _get_summary_runner(self, model: "Gemini") -> "InMemoryRunner":
+        if self._summary_runner is None:
+            from google.adk.runners import InMemoryRunner
+
+            self._summary_runner = InMemoryRunner(
+                agent=create_summary_agent(model=model),
+                app_name=_ADK_APP_NAME,
+            )
+        return self._summary_runner
+
     def _map_history_to_content(
         self, history_records: list["ChatHistory"]
-    ) -> list[types.Content]:
+    ) -> list["types.Content"]:
         """
         Convert DB chat history to Gemini Content format.
 
@@ -312,6 +384,8 @@ class ADKService:
         Returns:
             List of Gemini Content objects.
         """
+        from google.genai import types
+
         mapped = []
         for record in history_records:
             mapped.append(
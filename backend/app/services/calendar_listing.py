@@ -0,0 +1,91 @@
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+
+# Event attributes read by _format_events and the local event store
+EVENT_FIELDS = "id,status,summary,description,location,start,end"
+EVENT_LIST_FIELDS = f"nextPageToken,nextSyncToken,items({EVENT_FIELDS})"
+CALENDAR_LIST_FIELDS = "nextPageToken,items(id,primary,selected)"
+
+
+@dataclass
+class EventPage:
+    items: list[dict[str, Any]]
+    # Only set on the last page of a listing
+    next_sync_token: str | None = None
+
+
+async def iter_event_pages(
+    service: Any, calendar_id: str = "primary", **params: Any
+) -> AsyncIterator[EventPage]:
+    """
+    Stream ``events.list`` results page by page.
+
+    Each request asks for ``CALENDAR_LIST_PAGE_SIZE`` events and only the
+    ``EVENT_FIELDS`` attributes, and is executed in a worker thread. Pages are
+    yielded as soon as they arrive, so callers can start processing before a
+    large range has been fully downloaded.
+
+    Args:
+        service: Authenticated Calendar service resource
+        calendar_id: Calendar to list
+        **params: Extra ``events.list`` parameters (timeMin, syncToken, ...)
+    """
+    page_token = None
+    while True:
+        request = service.events().list(
+            calendarId=calendar_id,
+            maxResults=settings.CALENDAR_LIST_PAGE_SIZE,
+            fields=EVENT_LIST_FIELDS,
+            pageToken=page_token,
+            **params,
+        )
+        response = await asyncio.to_thread(request.execute)
+        yield EventPage(
+            items=response.get("items", []),
+            next_sync_token=response.get("nextSyncToken"),
+        )
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return
+
+
+async def list_events(
+    service: Any, calendar_id: str = "primary", **params: Any
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Collect every page of a listing; returns items and ``nextSyncToken``."""
+    items: list[dict[str, Any]] = []
+    sync_token = None
+    async for page in iter_event_pages(service, calendar_id, **params):
+        items.extend(page.items)
+        sync_token = page.next_sync_token or sync_token
+    return items, sync_token
+
+
+async def list_calendar_ids(service: Any) -> list[str]:
+    """
+    Return the IDs of the calendars the user shows in Google Calendar.
+
+    The primary calendar comes first and is reported as ``"primary"`` so it
+    shares store entries and write-through with the single-calendar path;
+    hidden and unselected calendars are skipped.
+    """
+    calendar_ids = ["primary"]
+    page_token = None
+    while True:
+        request = service.calendarList().list(
+            minAccessRole="reader",
+            fields=CALENDAR_LIST_FIELDS,
+            pageToken=page_token,
+        )
+        response = await asyncio.to_thread(request.execute)
+        for item in response.get("items", []):
+            if item.get("primary") or not item.get("selected"):
+                continue
+            calendar_ids.append(item["id"])
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return calendar_ids
@@ -0,0 +1,55 @@
+import logging
+import time
+from typing import Any
+
+from app.core.config import settings
+from app.services.calendar_listing import list_calendar_ids
+
+logger = logging.getLogger(__name__)
+
+
+class CalendarSetCache:
+    """
+    Per-user list of calendars that calendar reads fan out to.
+
+    IDs come from ``calendarList`` and are kept for ``CALENDAR_LIST_TTL_SEC``,
+    capped at ``CALENDAR_MAX_CALENDARS`` (the primary calendar is always
+    first). When discovery fails, reads fall back to the primary calendar
+    instead of failing.
+    """
+
+    def __init__(self) -> None:
+        self._calendar_ids: dict[int, tuple[list[str], float]] = {}
+
+    async def get_calendar_ids(self, user_id: int, service: Any) -> list[str]:
+        if not settings.CALENDAR_MULTI_ENABLED:
+            return ["primary"]
+
+        cached = self._calendar_ids.get(user_id)
+        if cached is not None:
+            calendar_ids, fetched_at = cached
+            if time.monotonic() - fetched_at < settings.CALENDAR_LIST_TTL_SEC:
+                return calendar_ids
+
+        try:
+            calendar_ids = await list_calendar_ids(service)
+        except Exception:
+            logger.warning(
+                "Calendar list discovery failed, using the primary calendar",
+                exc_info=True,
+                extra={"json_fields": {"user_id": user_id}},
+            )
+            return ["primary"]
+
+        calendar_ids = calendar_ids[: max(settings.CALENDAR_MAX_CALENDARS, 1)]
+        self._calendar_ids[user_id] = (calendar_ids, time.monotonic())
+        return calendar_ids
+
+    def invalidate(self, user_id: int) -> None:
+        self._calendar_ids.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._calendar_ids.clear()
+
+
+calendar_set_cache = CalendarSetCache()
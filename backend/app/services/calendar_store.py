@@ -0,0 +1,296 @@
+import asyncio
+import bisect
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+import pytz
+from googleapiclient.errors import HttpError
+
+from app.core.config import settings
+from app.services.calendar_listing import list_events
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Static index for interval-overlap queries.
+
+    Intervals are kept sorted by start together with the longest interval
+    length, so a query only scans entries starting in
+    ``[start - max_length, end)`` instead of the whole set.
+    """
+
+    def __init__(self, items: Iterable[tuple[datetime, datetime, T]]) -> None:
+        entries = sorted(items, key=lambda item: (item[0], item[1]))
+        self._starts = [item[0] for item in entries]
+        self._entries = entries
+        self._max_length = max(
+            (item[1] - item[0] for item in entries), default=timedelta(0)
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[T]:
+        """
+        Return values whose interval overlaps ``[start, end)``, ordered by start.
+
+        Zero-length intervals match when they fall inside the range.
+        """
+        lo = bisect.bisect_left(self._starts, start - self._max_length)
+        hi = bisect.bisect_left(self._starts, end)
+        return [
+            value
+            for item_start, item_end, value in self._entries[lo:hi]
+            if item_end > start or item_start >= start
+        ]
+
+
+def event_bounds(
+    event: dict[str, Any], tz: pytz.BaseTzInfo
+) -> tuple[datetime, datetime] | None:
+    """
+    Return the aware ``[start, end)`` of a Calendar event resource.
+
+    All-day events span whole days in ``tz``. Returns None for events
+    without a usable start.
+    """
+
+    def _parse(value: dict[str, Any]) -> datetime | None:
+        if value.get("dateTime"):
+            return datetime.fromisoformat(value["dateTime"].replace("Z", "+00:00"))
+        if value.get("date"):
+            return tz.localize(
+                datetime.combine(date.fromisoformat(value["date"]), datetime.min.time())
+            )
+        return None
+
+    try:
+        start = _parse(event.get("start", {}))
+        end = _parse(event.get("end", {}))
+    except ValueError:
+        return None
+    if start is None:
+        return None
+    return start, max(end or start, start)
+
+
+def merge_by_start(
+    event_lists: Iterable[list[dict[str, Any]]], tz: pytz.BaseTzInfo
+) -> Iterator[dict[str, Any]]:
+    """
+    K-way merge of event lists that are each ordered by start.
+
+    Events found in more than one calendar (e.g. a meeting on both the
+    primary and a shared calendar) are yielded once. Events without a
+    usable start sort first.
+    """
+
+    def _start(event: dict[str, Any]) -> datetime:
+        bounds = event_bounds(event, tz)
+        return bounds[0] if bounds is not None else _EPOCH
+
+    seen: set[str] = set()
+    for event in heapq.merge(*event_lists, key=_start):
+        event_id = event.get("id")
+        if event_id:
+            if event_id in seen:
+                continue
+            seen.add(event_id)
+        yield event
+
+
+def _to_rfc3339(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Naive datetimes are UTC, as in ``GoogleCalendarService``."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+@dataclass
+class _UserCalendar:
+    events: dict[str, dict[str, Any]]
+    sync_token: str | None
+    covered_since: datetime
+    covered_until: datetime
+    synced_at: float
+    index: IntervalIndex[dict[str, Any]] | None = field(default=None)
+
+
+class CalendarEventStore:
+    """
+    Per-user, per-calendar in-process copy of Google Calendar events.
+
+    The first read seeds the store with every event between
+    ``CALENDAR_STORE_PAST_DAYS`` ago and ``CALENDAR_STORE_FUTURE_DAYS`` ahead.
+    Later reads replay changes through the ``nextSyncToken`` returned by the
+    previous sync (at most once per ``CALENDAR_SYNC_INTERVAL_SEC``) and fall
+    back to a full sync when Google answers 410 Gone. Range queries are then
+    served from an ``IntervalIndex``. ``GoogleCalendarService`` writes created,
+    updated and deleted events through so its own changes are visible
+    immediately.
+    """
+
+    def __init__(self) -> None:
+        self._calendars: dict[tuple[int, str], _UserCalendar] = {}
+        self._locks: dict[tuple[int, str], asyncio.Lock] = {}
+
+    def _get_lock(self, key: tuple[int, str]) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def _full_sync(self, key: tuple[int, str], service: Any) -> _UserCalendar:
+        now = datetime.now(timezone.utc)
+        covered_since = now - timedelta(days=settings.CALENDAR_STORE_PAST_DAYS)
+        covered_until = now + timedelta(days=settings.CALENDAR_STORE_FUTURE_DAYS)
+        user_id, calendar_id = key
+        items, sync_token = await list_events(
+            service,
+            calendar_id,
+            singleEvents=True,
+            timeMin=_to_rfc3339(covered_since),
+            timeMax=_to_rfc3339(covered_until),
+        )
+        calendar = _UserCalendar(
+            events={
+                item["id"]: item
+                for item in items
+                if item.get("id") and item.get("status") != "cancelled"
+            },
+            sync_token=sync_token,
+            covered_since=covered_since,
+            covered_until=covered_until,
+            synced_at=time.monotonic(),
+        )
+        self._calendars[key] = calendar
+        logger.info(
+            "Calendar store full sync",
+            extra={
+                "json_fields": {
+                    "user_id": user_id,
+                    "calendar_id": calendar_id,
+                    "events": len(calendar.events),
+                }
+            },
+        )
+        return calendar
+
+    async def _incremental_sync(
+        self, key: tuple[int, str], service: Any, calendar: _UserCalendar
+    ) -> _UserCalendar:
+        user_id, calendar_id = key
+        try:
+            items, sync_token = await list_events(
+                service, calendar_id, singleEvents=True, syncToken=calendar.sync_token
+            )
+        except HttpError as e:
+            if e.resp.status != 410:
+                raise
+            logger.info(
+                "Calendar sync token expired, running full sync",
+                extra={"json_fields": {"user_id": user_id, "calendar_id": calendar_id}},
+            )
+            return await self._full_sync(key, service)
+
+        for item in items:
+            self._apply(calendar, item)
+        calendar.sync_token = sync_token
+        calendar.synced_at = time.monotonic()
+        return calendar
+
+    @staticmethod
+    def _apply(calendar: _UserCalendar, event: dict[str, Any]) -> None:
+        event_id = event.get("id")
+        if not event_id:
+            return
+        if event.get("status") == "cancelled":
+            calendar.events.pop(event_id, None)
+        else:
+            calendar.events[event_id] = event
+        calendar.index = None
+
+    @staticmethod
+    def _needs_full_sync(calendar: _UserCalendar | None) -> bool:
+        if calendar is None or calendar.sync_token is None:
+            return True
+        # Reseed once half of the future window has elapsed
+        remaining = calendar.covered_until - datetime.now(timezone.utc)
+        return remaining < timedelta(days=settings.CALENDAR_STORE_FUTURE_DAYS / 2)
+
+    async def _sync(self, key: tuple[int, str], service: Any) -> _UserCalendar:
+        async with self._get_lock(key):
+            calendar = self._calendars.get(key)
+            if self._needs_full_sync(calendar):
+                return await self._full_sync(key, service)
+            age = time.monotonic() - calendar.synced_at
+            if age >= settings.CALENDAR_SYNC_INTERVAL_SEC:
+                return await self._incremental_sync(key, service, calendar)
+            return calendar
+
+    async def get_events(
+        self,
+        user_id: int,
+        service: Any,
+        time_min: datetime,
+        time_max: datetime,
+        tz_name: str,
+        calendar_id: str = "primary",
+    ) -> list[dict[str, Any]] | None:
+        """
+        Return raw events overlapping ``[time_min, time_max)`` ordered by start.
+
+        Returns None when the range is not fully covered by the store, so the
+        caller queries the API instead. Naive datetimes are treated as UTC.
+        """
+        start, end = _as_utc(time_min), _as_utc(time_max)
+        calendar = await self._sync((user_id, calendar_id), service)
+        if start < calendar.covered_since or end > calendar.covered_until:
+            return None
+
+        if calendar.index is None:
+            tz = pytz.timezone(tz_name)
+            calendar.index = IntervalIndex(
+                (*bounds, event)
+                for event in calendar.events.values()
+                if (bounds := event_bounds(event, tz)) is not None
+            )
+        return calendar.index.overlapping(start, end)
+
+    def upsert(
+        self, user_id: int, event: dict[str, Any], calendar_id: str = "primary"
+    ) -> None:
+        """Write a created or updated event through to the user's store."""
+        calendar = self._calendars.get((user_id, calendar_id))
+        if calendar is not None:
+            self._apply(calendar, event)
+
+    def remove(self, user_id: int, event_id: str, calendar_id: str = "primary") -> None:
+        """Write a deletion through to the user's store."""
+        calendar = self._calendars.get((user_id, calendar_id))
+        if calendar is not None:
+            self._apply(calendar, {"id": event_id, "status": "cancelled"})
+
+    def invalidate(self, user_id: int) -> None:
+        for key in [key for key in self._calendars if key[0] == user_id]:
+            del self._calendars[key]
+
+    def clear(self) -> None:
+        self._calendars.clear()
+
+
+calendar_event_store = CalendarEventStore()
@@ -0,0 +1,154 @@
+"""
+Background worker for chat turns accepted with ``delivery=telegram``.
+
+Each accepted ``ChatJob`` is run by a ``chat_turn`` job on the durable job
+queue (see ``app.services.job_queue``). The request that accepted it has
+already returned 202, so the worker creates its own database session and
+pushes the reply straight to the user's Telegram chat.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.crud_chat_job import chat_job as crud_chat_job
+from app.crud.crud_session import chat_session as crud_session
+from app.db.session import AsyncSessionLocal
+from app.schemas.enums import ChatJobStatus
+from app.services.adk_service import ADKService
+from app.services.chat_manager import request_session_summary
+from app.services.chat_turn import ChatTurn, run_chat_turn
+from app.services.google_tts import google_tts_service
+from app.services.job_queue import enqueue, job_handler
+from app.services.telegram import telegram_client
+from app.services.voice_delivery import await_voice
+
+logger = logging.getLogger(__name__)
+
+FAILURE_MESSAGE = "Something went wrong while answering. Please try again."
+
+
+async def _deliver(chat_id: int, turn: ChatTurn) -> None:
+    telegram = await telegram_client.aget()
+    await telegram.send_message(chat_id, turn.response)
+    if voice_bytes := await await_voice(turn.voice_task):
+        await telegram.send_voice(chat_id, voice_bytes)
+
+
+async def _notify_failure(job_id: int, chat_id: int) -> None:
+    try:
+        telegram = await telegram_client.aget()
+        await telegram.send_message(chat_id, FAILURE_MESSAGE)
+    except Exception:
+        logger.exception(
+            "Failed to notify user about chat job failure",
+            extra={"json_fields": {"event": "chat_job_notify_error", "job_id": job_id}},
+        )
+
+
+async def _fail(db: AsyncSession, job_id: int, chat_id: int, error: str) -> None:
+    """Mark the job FAILED and tell the user, unless it already finished."""
+    await db.rollback()
+    if await crud_chat_job.fail_running(db, id=job_id, error=error):
+        await _notify_failure(job_id, chat_id)
+
+
+async def run_chat_job(job_id: int) -> None:
+    """
+    Run a queued chat job and deliver the reply.
+
+    The job is claimed first, so a finished job is left alone. A job that
+    is still RUNNING was left behind by an instance that died mid-turn.
+    Failures, turns cut short by shutdown and such orphaned turns are
+    recorded on the job and the user is told in Telegram instead of being
+    left waiting.
+
+    Args:
+        job_id: The ID of the ``ChatJob`` to run.
+    """
+    async with AsyncSessionLocal() as db:
+        if not await crud_chat_job.claim(db, id=job_id):
+            job = await crud_chat_job.get(db, id=job_id)
+            if job is not None:
+                await _fail(db, job_id, job.chat_id, "Interrupted")
+            logger.warning(
+                "Chat job is not queued; skipping",
+                extra={"json_fields": {"event": "chat_job_skip", "job_id": job_id}},
+            )
+            return
+        job = await crud_chat_job.get(db, id=job_id)
+        chat_id = job.chat_id
+
+        try:
+            session = await crud_session.get(db, id=job.session_id)
+            if session is None:
+                raise LookupError(f"Session {job.session_id} not found")
+            turn = await run_chat_turn(
+                db,
+                AsyncSessionLocal,
+                ADKService(),
+                await google_tts_service.aget() if job.want_voice else None,
+                user_id=job.user_id,
+                session=session,
+                message=job.message,
+            )
+        except asyncio.CancelledError:
+            # The queue hands the job back on shutdown, but a rerun would
+            # find it RUNNING and skip it, so the turn is failed here
+            await _fail(db, job_id, chat_id, "Interrupted")
+            raise
+        except Exception as e:
+            logger.exception(
+                "Chat job failed",
+                extra={"json_fields": {"event": "chat_job_error", "job_id": job_id}},
+            )
+            await _fail(db, job_id, chat_id, str(e))
+            return
+
+        await crud_chat_job.update(
+            db,
+            db_obj=job,
+            obj_in={
+                "status": ChatJobStatus.DONE,
+                "assistant_message_id": turn.assistant_message_id,
+            },
+        )
+
+        try:
+            await _deliver(chat_id, turn)
+        except Exception as e:
+            logger.exception(
+                "Failed to deliver chat job reply",
+                extra={
+                    "json_fields": {
+                        "event": "chat_job_delivery_error",
+                        "job_id": job_id,
+                    }
+                },
+            )
+            await crud_chat_job.update(
+                db, db_obj=job, obj_in={"error": f"Delivery failed: {e}"}
+            )
+
+        if turn.summary_due:
+            await request_session_summary(db, turn.session_id)
+
+        logger.info(
+            "Chat job done",
+            extra={"json_fields": {"event": "chat_job_done", "job_id": job_id}},
+        )
+
+
+# The ``ChatJob`` claim makes a rerun a no-op, so a turn is never retried:
+# the user has been told about a failure and can ask again. The second
+# attempt is for a job reclaimed from a dead instance, whose turn it fails.
+@job_handler("chat_turn", priority=10, max_attempts=2)
+async def _run_chat_turn_job(db: AsyncSession, payload: dict[str, Any]) -> None:
+    await run_chat_job(payload["chat_job_id"])
+
+
+async def enqueue_chat_job(db: AsyncSession, job_id: int) -> None:
+    """Queue the ``ChatJob`` ``job_id`` to run in the background. Commits ``db``."""
+    await enqueue(db, "chat_turn", {"chat_job_id": job_id})
@@ -1,104 +1,167 @@
 """
-Background task workers for chat session management.
+Rolling chat session summaries.
 
-These functions run outside the request/response cycle and therefore
-MUST create their own database sessions rather than relying on the
-request-scoped session (which will be closed by the time the task runs).
+Summaries run as ``session_summary`` jobs on the durable job queue (see
+``app.services.job_queue``), outside the request/response cycle; the job
+worker provides their database session.
 """
 
+import functools
 import logging
+from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
 from app.crud.crud_chat import chat as crud_chat
 from app.crud.crud_session import chat_session as crud_session
-from app.db.session import AsyncSessionLocal
 from app.services.adk_service import ADKService
+from app.services.job_queue import enqueue, job_handler
 
 logger = logging.getLogger(__name__)
 
-SUMMARY_MESSAGE_WINDOW = 6
+# Rough chars-per-token ratio for estimating Gemini tokens without a call
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(chars: int) -> int:
+    return chars // CHARS_PER_TOKEN
+
+
+def summary_is_due(unsummarized_chars: int) -> bool:
+    """Whether the not yet summarized messages warrant a summary update."""
+    return estimate_tokens(unsummarized_chars) >= settings.SUMMARY_TOKEN_THRESHOLD
+
+
+class SummaryNotGenerated(RuntimeError):
+    """The model produced no new summary; the job is retried."""
 
 
-async def update_session_summary_task(session_id: int) -> None:
+async def summarize_session(db: AsyncSession, session_id: int, adk: ADKService) -> None:
     """
-    Background task: generate and persist a rolling summary for a chat session.
+    Generate and persist a rolling summary for a chat session.
 
-    This function intentionally creates its own DB session because it runs
-    after the request session has already been closed (FastAPI BackgroundTasks
-    execute post-response). Using the request session here would raise
-    ``sqlalchemy.exc.InvalidRequestError`` / ``DetachedInstanceError``.
+    Exactly the messages after the session's ``summarized_through_message_id``
+    cursor are folded into the summary (at most SUMMARY_MAX_BATCH_MESSAGES per
+    run), and the cursor advances to the last of them. If another run moved
+    the cursor in the meantime, this run's summary is discarded.
 
     Args:
+        db: Database session, committed on success.
         session_id: The ID of the ``ChatSession`` to summarise.
+        adk: Service to generate the summary with.
+
+    Raises:
+        SummaryNotGenerated: The model returned no summary or the old one
+            unchanged, so the cursor is left where it was.
     """
     logger.info(
         "Starting session summary update",
         extra={"json_fields": {"event": "summary_start", "session_id": session_id}},
     )
 
-    async with AsyncSessionLocal() as db:
-        try:
-            session = await crud_session.get(db, id=session_id)
-            if not session:
-                logger.warning(
-                    "Session not found for summary update",
-                    extra={
-                        "json_fields": {
-                            "event": "summary_session_missing",
-                            "session_id": session_id,
-                        }
-                    },
-                )
-                return
-
-            recent_messages = await crud_chat.get_recent_by_session_id(
-                db,
-                session_id=session_id,
-                limit=SUMMARY_MESSAGE_WINDOW,
-            )
-
-            if not recent_messages:
-                logger.info(
-                    "No messages to summarise",
-                    extra={
-                        "json_fields": {
-                            "event": "summary_no_messages",
-                            "session_id": session_id,
-                        }
-                    },
-                )
-                return
-
-            adk = ADKService()
-            new_summary = await adk.generate_session_summary(
-                current_summary=session.summary,
-                recent_messages=recent_messages,
-            )
-
-            await crud_session.update(
-                db,
-                db_obj=session,
-                obj_in={"summary": new_summary},
-            )
-            await db.commit()
-
-            logger.info(
-                "Session summary updated successfully",
-                extra={
-                    "json_fields": {
-                        "event": "summary_done",
-                        "session_id": session_id,
-                    }
-                },
-            )
-
-        except Exception:
-            logger.exception(
-                "Failed to update session summary",
-                extra={
-                    "json_fields": {
-                        "event": "summary_error",
-                        "session_id": session_id,
-                    }
-                },
-            )
-            await db.rollback()
+    session = await crud_session.get(db, id=session_id)
+    if not session:
+        logger.warning(
+            "Session not found for summary update",
+            extra={
+                "json_fields": {
+                    "event": "summary_session_missing",
+                    "session_id": session_id,
+                }
+            },
+        )
+        return
+
+    cursor = session.summarized_through_message_id
+    current_summary = session.summary
+    new_messages = await crud_chat.get_after_id(
+        db,
+        session_id=session_id,
+        after_id=cursor,
+        limit=settings.SUMMARY_MAX_BATCH_MESSAGES,
+    )
+
+    if not new_messages:
+        logger.info(
+            "No messages to summarise",
+            extra={
+                "json_fields": {
+                    "event": "summary_no_messages",
+                    "session_id": session_id,
+                }
+            },
+        )
+        return
+
+    new_summary = await adk.generate_session_summary(
+        current_summary=current_summary,
+        recent_messages=new_messages,
+    )
+    # ``generate_session_summary`` falls back to the old summary on errors;
+    # advancing the cursor then would drop these messages from the summary
+    if not new_summary or new_summary == current_summary:
+        raise SummaryNotGenerated(f"No new summary for session {session_id}")
+
+    stored = await crud_session.advance_summary(
+        db,
+        id=session_id,
+        expected_through_id=cursor,
+        through_id=new_messages[-1].id,
+        summary=new_summary,
+    )
+    if not stored:
+        logger.info(
+            "Session summary was updated concurrently; discarding",
+            extra={
+                "json_fields": {
+                    "event": "summary_superseded",
+                    "session_id": session_id,
+                }
+            },
+        )
+        await db.rollback()
+        return
+    await db.commit()
+
+    logger.info(
+        "Session summary updated successfully",
+        extra={
+            "json_fields": {
+                "event": "summary_done",
+                "session_id": session_id,
+            }
+        },
+    )
+
+
+@functools.cache
+def _summary_adk() -> ADKService:
+    # One service (and its cached summary runner) for all summary jobs
+    return ADKService()
+
+
+@job_handler(
+    "session_summary",
+    priority=-10,
+    max_concurrency=settings.SUMMARY_MAX_CONCURRENCY,
+    background=True,
+)
+async def _run_session_summary_job(db: AsyncSession, payload: dict[str, Any]) -> None:
+    await summarize_session(db, payload["session_id"], _summary_adk())
+
+
+async def request_session_summary(db: AsyncSession, session_id: int) -> None:
+    """
+    Queue a summary of ``session_id``.
+
+    The job runs SUMMARY_DEBOUNCE_SEC after the last request for the
+    session, so a burst of messages costs a single run. Commits ``db``.
+    """
+    await enqueue(
+        db,
+        "session_summary",
+        {"session_id": session_id},
+        delay=settings.SUMMARY_DEBOUNCE_SEC,
+        dedupe_key=f"session_summary:{session_id}",
+    )
@@ -0,0 +1,130 @@
+"""One chat turn: persist the user message, run the agent, persist the reply."""
+
+import asyncio
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud.crud_chat import chat as crud_chat
+from app.models.chat import ChatSession
+from app.schemas.chat import ChatHistoryCreate
+from app.schemas.enums import ChatRole
+from app.services.adk_service import ADKService
+from app.services.chat_manager import summary_is_due
+from app.services.google_tts import GoogleTTSService
+from app.services.job_queue import active_turns
+
+
+@dataclass
+class ChatTurn:
+    response: str
+    session_id: int
+    user_message_id: int
+    assistant_message_id: int
+    # Pending TTS synthesis of ``response``, if voice was requested
+    voice_task: asyncio.Task[bytes] | None
+    # The session's unsummarized messages crossed SUMMARY_TOKEN_THRESHOLD
+    summary_due: bool
+
+
+async def _unsummarized_chars(
+    session_factory: async_sessionmaker[AsyncSession],
+    session_id: int,
+    after_id: int | None,
+    up_to_id: int,
+) -> int:
+    async with session_factory() as db:
+        return await crud_chat.get_content_length_by_session_id(
+            db, session_id=session_id, after_id=after_id, up_to_id=up_to_id
+        )
+
+
+def cancel_pending(*tasks: asyncio.Task | None) -> None:
+    for task in tasks:
+        if task is not None and not task.done():
+            task.cancel()
+
+
+async def run_chat_turn(
+    db: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    adk_service: ADKService,
+    tts_service: GoogleTTSService | None,
+    *,
+    user_id: int,
+    session: ChatSession,
+    message: str,
+) -> ChatTurn:
+    """
+    Run one chat turn in ``session``.
+
+    The last 20 messages are fetched as context before the user message is
+    saved. While Gemini runs, the messages not yet folded into the session
+    summary are measured on a separate DB session for the summary trigger;
+    TTS (when ``tts_service`` is given) starts as soon as the reply text
+    exists, concurrently with saving it. The caller owns the returned
+    ``voice_task``.
+    """
+    with active_turns.running():
+        size_task = None
+        voice_task = None
+        try:
+            history_records = await crud_chat.get_recent_by_session_id(
+                db, session_id=session.id, limit=20
+            )
+
+            user_message = await crud_chat.create(
+                db,
+                obj_in=ChatHistoryCreate(
+                    user_id=user_id,
+                    session_id=session.id,
+                    role=ChatRole.USER,
+                    content=message,
+                ),
+            )
+
+            # Measures through the user message just committed, whenever the task
+            # gets to run; ``db`` is busy with the ADK run, so this uses its own
+            size_task = asyncio.create_task(
+                _unsummarized_chars(
+                    session_factory,
+                    session.id,
+                    session.summarized_through_message_id,
+                    user_message.id,
+                )
+            )
+
+            response = await adk_service.process_chat(
+                user_text=message,
+                history_records=history_records,
+                user_id=user_id,
+                db=db,
+                session_summary=session.summary,
+            )
+
+            if tts_service is not None:
+                voice_task = asyncio.create_task(tts_service.synthesize(response))
+
+            assistant_message = await crud_chat.create(
+                db,
+                obj_in=ChatHistoryCreate(
+                    user_id=user_id,
+                    session_id=session.id,
+                    role=ChatRole.MODEL,
+                    content=response,
+                ),
+            )
+
+            unsummarized_chars = await size_task + len(response)
+        except BaseException:
+            cancel_pending(size_task, voice_task)
+            raise
+
+    return ChatTurn(
+        response=response,
+        session_id=session.id,
+        user_message_id=user_message.id,
+        assistant_message_id=assistant_message.id,
+        voice_task=voice_task,
+        summary_due=summary_is_due(unsummarized_chars),
+    )
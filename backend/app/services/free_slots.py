@@ -0,0 +1,74 @@
+import math
+from datetime import datetime, time, timedelta
+
+import pytz
+
+from app.services.calendar_store import IntervalIndex
+
+# Candidate slot starts are aligned to this grid
+SLOT_GRANULARITY = timedelta(minutes=15)
+
+
+def _ceil_to_grid(value: datetime, origin: datetime) -> datetime:
+    steps = math.ceil((value - origin) / SLOT_GRANULARITY)
+    return origin + max(steps, 0) * SLOT_GRANULARITY
+
+
+def find_free_slots(
+    busy: list[tuple[datetime, datetime]],
+    duration: timedelta,
+    range_start: datetime,
+    range_end: datetime,
+    tz: pytz.BaseTzInfo,
+    working_hours_start: time = time(9, 0),
+    working_hours_end: time = time(18, 0),
+    buffer: timedelta = timedelta(0),
+    limit: int = 5,
+) -> list[tuple[datetime, datetime]]:
+    """
+    Find the earliest free slots of ``duration`` between busy intervals.
+
+    Busy intervals go into an ``IntervalIndex``. For each working-hours window
+    (in ``tz``) inside ``[range_start, range_end)`` a candidate start walks the
+    ``SLOT_GRANULARITY`` grid: if ``[start - buffer, start + duration + buffer)``
+    overlaps anything busy, the candidate jumps past the latest conflicting
+    end; otherwise the slot is taken and the search continues after it.
+
+    Args:
+        busy: Aware ``(start, end)`` busy intervals, in any order
+        duration: Length of the wanted slot
+        range_start: Aware lower bound of the search
+        range_end: Aware upper bound of the search
+        tz: Timezone that working hours are expressed in
+        working_hours_start: Local start of the working day
+        working_hours_end: Local end of the working day
+        buffer: Free time required before and after the slot
+        limit: Maximum number of slots to return
+
+    Returns:
+        Up to ``limit`` non-overlapping ``(start, end)`` slots, earliest first
+    """
+    if duration <= timedelta(0) or limit <= 0 or range_end <= range_start:
+        return []
+
+    index = IntervalIndex((start, end, end) for start, end in busy if end > start)
+    slots: list[tuple[datetime, datetime]] = []
+
+    day = range_start.astimezone(tz).date()
+    last_day = range_end.astimezone(tz).date()
+    while day <= last_day and len(slots) < limit:
+        window_start = tz.localize(datetime.combine(day, working_hours_start))
+        window_end = tz.localize(datetime.combine(day, working_hours_end))
+        day += timedelta(days=1)
+
+        start = _ceil_to_grid(max(window_start, range_start), window_start)
+        end_limit = min(window_end, range_end)
+        while start + duration <= end_limit and len(slots) < limit:
+            conflicts = index.overlapping(start - buffer, start + duration + buffer)
+            if conflicts:
+                start = _ceil_to_grid(max(conflicts) + buffer, window_start)
+                continue
+            slots.append((start, start + duration))
+            start = _ceil_to_grid(start + duration, window_start)
+
+    return slots
@@ -23,6 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.crud_facts import user_fact as crud_user_fact
 from app.schemas.calendar import CalendarEventCreate, CalendarEventUpdate
+from app.schemas.gmail import EmailDetailLevel
 from app.schemas.user_facts import FactCreate
 from app.services.gmail_service import GmailService
 from app.services.google_calendar import GoogleCalendarService
@@ -323,16 +324,93 @@ def create_tools(
             )
             return f"Unable to delete calendar event [ID: {event_id}]: {str(e)}"
 
+    async def find_free_slots_tool(
+        duration_minutes: int = 60,
+        days: int = 7,
+        start_date_iso: str = "",
+        working_hours_start: str = "09:00",
+        working_hours_end: str = "18:00",
+        buffer_minutes: int = 0,
+        max_results: int = 5,
+    ) -> str:
+        """
+        Find free time slots in the user's Google Calendar.
+
+        Use this function when the user asks when they are free, wants to find
+        time for a meeting, or asks you to pick a time before scheduling an event.
+        Offer the returned slots to the user, then call schedule_event_tool with
+        the chosen start time.
+
+        Args:
+            duration_minutes: Length of the wanted slot in minutes. Default is 60.
+            days: Number of days to search, starting at start_date_iso. Default is 7, up to 31.
+            start_date_iso: Optional start of the search in ISO 8601 format
+                           (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS). Defaults to now.
+            working_hours_start: Start of the working day (HH:MM). Default is '09:00'.
+            working_hours_end: End of the working day (HH:MM). Default is '18:00'.
+            buffer_minutes: Free minutes required before and after the slot. Default is 0.
+            max_results: Maximum number of slots to return. Default is 5.
+
+        Returns:
+            A formatted list of free slots (Europe/Kiev time), or a message if
+            none were found.
+        """
+        try:
+            days = max(1, min(days, 31))
+            try:
+                hours_start = datetime.time.fromisoformat(working_hours_start)
+                hours_end = datetime.time.fromisoformat(working_hours_end)
+                if start_date_iso:
+                    range_start = datetime.datetime.fromisoformat(start_date_iso)
+                else:
+                    range_start = datetime.datetime.now(datetime.timezone.utc)
+            except ValueError as e:
+                return f"Invalid date or time format: {str(e)}. Please use ISO 8601."
+
+            calendar_service = GoogleCalendarService()
+            slots = await calendar_service.find_free_slots(
+                user_id=user_id,
+                db=db,
+                duration_minutes=max(5, min(duration_minutes, 480)),
+                range_start=range_start,
+                range_end=range_start + datetime.timedelta(days=days),
+                working_hours_start=hours_start,
+                working_hours_end=hours_end,
+                buffer_minutes=max(0, min(buffer_minutes, 120)),
+                max_results=max(1, min(max_results, 20)),
+            )
+
+            if not slots:
+                return (
+                    f"No free {duration_minutes}-minute slots found in the next "
+                    f"{days} days between {working_hours_start} and {working_hours_end}."
+                )
+
+            result = f"Free {duration_minutes}-minute slots:\n"
+            for i, slot in enumerate(slots, 1):
+                result += (
+                    f"{i}. {slot.start.strftime('%A, %Y-%m-%d %H:%M')}"
+                    f" - {slot.end.strftime('%H:%M')}\n"
+                )
+            return result.strip()
+
+        except Exception:
+            logger.exception("Failed to find free slots for user %s", user_id)
+            return "Unable to find free time slots."
+
     # ------------------------------------------------------------------ #
     # Email tools                                                        #
     # ------------------------------------------------------------------ #
 
-    async def check_emails(query: str = "is:unread", max_results: int = 5) -> str:
+    async def check_emails(
+        query: str = "is:unread", max_results: int = 5, detail_level: str = "snippet"
+    ) -> str:
         """
-        Search, retrieve, and read the authenticated user's email messages using Gmail search.
+        Search and list the authenticated user's email messages using Gmail search.
 
         Use this function when the user asks to check their email, find messages, search their inbox,
-        or read emails. You can use standard Gmail search operators in the query parameter.
+        or triage emails. You can use standard Gmail search operators in the query parameter.
+        To read the full text of a specific email, call read_email with its ID afterwards.
 
         Common query examples:
         - "is:unread" (default) -> finds all unread messages
@@ -347,20 +425,30 @@ def create_tools(
             query: Gmail search query string. Use search operators to filter results.
                    Default is "is:unread".
             max_results: Maximum number of emails to retrieve (1 to 10). Default is 5.
+            detail_level: How much of each email to fetch:
+                   "metadata" -> sender, subject and date only (cheapest, good for counting/listing);
+                   "snippet" (default) -> metadata plus a short preview;
+                   "full" -> also the body text (use only when the user wants to read several emails).
 
         Returns:
-            A formatted string containing the list of matching emails with their details
-            (Sender, Subject, Date, Snippet, and Body preview), or an error message if failed.
+            A formatted string containing the list of matching emails with their IDs [ID: ...]
+            and details (Sender, Subject, Date, plus Snippet/Body depending on detail_level),
+            or an error message if failed.
         """
         try:
             # Clamp max_results between 1 and 10 to protect token budget
             max_results = max(1, min(int(max_results), 10))
+            try:
+                level = EmailDetailLevel(detail_level)
+            except ValueError:
+                level = EmailDetailLevel.SNIPPET
             gmail_svc = GmailService()
             emails = await gmail_svc.get_emails(
                 user_id=user_id,
                 db=db,
                 query=query,
                 max_results=max_results,
+                detail_level=level,
             )
 
             if not emails:
@@ -369,13 +457,16 @@ def create_tools(
             result = f"Emails matching query '{query}':\n"
             for i, email in enumerate(emails, 1):
                 result += (
-                    f"--- Email {i} ---\n"
+                    f"--- Email {i} [ID: {email.id}] ---\n"
                     f"📧 From: {email.sender}\n"
                     f"📝 Subject: {email.subject}\n"
                     f"📅 Date: {email.date}\n"
-                    f"📌 Snippet: {email.snippet}\n"
-                    f"💬 Body:\n{email.body}\n\n"
                 )
+                if email.snippet:
+                    result += f"📌 Snippet: {email.snippet}\n"
+                if email.body:
+                    result += f"💬 Body:\n{email.body}\n"
+                result += "\n"
 
             return result.strip()
 
@@ -383,6 +474,38 @@ def create_tools(
             logger.exception("Gmail API tool error for user %s", user_id)
             return "Unable to fetch emails at this moment. Please ensure you have authorized Gmail access."
 
+    async def read_email(message_id: str) -> str:
+        """
+        Read the full content of a single email message by its ID.
+
+        Use this function when the user wants to read, summarize, or extract details
+        (dates, amounts, action items) from a specific email. Always obtain the
+        message_id first by calling check_emails.
+
+        Args:
+            message_id: The Gmail message ID shown as [ID: ...] in check_emails results.
+
+        Returns:
+            A formatted string with the sender, subject, date and body of the email,
+            or an error message if it could not be fetched.
+        """
+        try:
+            gmail_svc = GmailService()
+            email = await gmail_svc.get_email_by_id(
+                user_id=user_id,
+                db=db,
+                message_id=message_id,
+            )
+            return (
+                f"📧 From: {email.sender}\n"
+                f"📝 Subject: {email.subject}\n"
+                f"📅 Date: {email.date}\n"
+                f"💬 Body:\n{email.body}"
+            )
+        except Exception:
+            logger.exception("Failed to read email %s for user %s", message_id, user_id)
+            return f"Unable to read email [ID: {message_id}] at this moment."
+
     # ------------------------------------------------------------------ #
     # Knowledge base tool                                                 #
     # ------------------------------------------------------------------ #
@@ -479,8 +602,9 @@ def create_tools(
             schedule_event_tool,
             update_calendar_event_tool,
             delete_calendar_event_tool,
+            find_free_slots_tool,
         ],
-        "email": [check_emails],
+        "email": [check_emails, read_email],
         "knowledge": [consult_knowledge_base],
         "memory": [remember_user_fact, delete_user_fact],
     }
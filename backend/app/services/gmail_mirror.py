@@ -0,0 +1,453 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from googleapiclient.errors import HttpError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.crud_email_cache import cached_email as crud_cached_email
+from app.crud.crud_email_cache import gmail_sync_state as crud_sync_state
+from app.models.email_cache import CachedEmail
+from app.schemas.email_cache import CachedEmailCreate, GmailSyncStateCreate
+from app.schemas.gmail import EmailDetailLevel, EmailMessage
+
+if TYPE_CHECKING:
+    from app.services.gmail_service import GmailService
+
+logger = logging.getLogger(__name__)
+
+# Messages carrying any of these labels are not mirrored
+EXCLUDED_LABELS = frozenset({"SPAM", "TRASH", "DRAFT"})
+
+_HISTORY_RECORD_TYPES = (
+    "messagesAdded",
+    "messagesDeleted",
+    "labelsAdded",
+    "labelsRemoved",
+)
+
+# Per-user sync locks. Module level, because the agent tools build a new
+# GmailService (and so a new GmailMirror) for every call
+_sync_locks: dict[int, asyncio.Lock] = {}
+
+
+def _sync_lock(user_id: int) -> asyncio.Lock:
+    lock = _sync_locks.get(user_id)
+    if lock is None:
+        lock = _sync_locks[user_id] = asyncio.Lock()
+    return lock
+
+
+@dataclass(frozen=True)
+class MirrorQuery:
+    """A Gmail search query the local mirror can answer."""
+
+    unread_only: bool = False
+    label_id: str | None = None
+    newer_than_days: int | None = None
+
+
+def parse_mirror_query(query: str) -> MirrorQuery | None:
+    """
+    Parse the subset of Gmail search syntax served from the mirror.
+
+    Supports ``is:unread``, ``in:inbox`` and ``newer_than:<N>d``. Any other
+    token (or an empty query) returns None so the caller falls back to the
+    Gmail API.
+    """
+    tokens = query.lower().split()
+    if not tokens:
+        return None
+
+    unread_only = False
+    label_id = None
+    newer_than_days = None
+    for token in tokens:
+        if token == "is:unread":
+            unread_only = True
+        elif token == "in:inbox":
+            label_id = "INBOX"
+        elif token.startswith("newer_than:") and token.endswith("d"):
+            value = token[len("newer_than:") : -1]
+            if not value.isdigit():
+                return None
+            newer_than_days = int(value)
+        else:
+            return None
+
+    return MirrorQuery(
+        unread_only=unread_only, label_id=label_id, newer_than_days=newer_than_days
+    )
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite drops tzinfo on the way back; treat naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+@dataclass
+class _HistoryDelta:
+    history_id: str
+    # message_id -> current labelIds for added or relabelled messages
+    labels: dict[str, list[str]]
+    deleted: set[str]
+    added: set[str]
+
+
+class GmailMirror:
+    """
+    Local mirror of the recent Gmail inbox.
+
+    The first sync seeds ``cached_emails`` with message metadata for the last
+    ``GMAIL_CACHE_WINDOW_DAYS`` days (at most ``GMAIL_CACHE_MAX_MESSAGES``).
+    Later syncs replay ``users.history.list`` from the stored ``historyId`` so
+    only changed messages are fetched. Queries the mirror can answer are
+    served from the database; everything else falls back to the API.
+    """
+
+    def __init__(self, gmail: "GmailService") -> None:
+        self.gmail = gmail
+
+    def _to_cached(self, message_id: str, msg: dict[str, Any]) -> CachedEmailCreate:
+        parsed = self.gmail._parse_message(message_id, msg, EmailDetailLevel.SNIPPET)
+        internal_ms = int(msg.get("internalDate", 0))
+        return CachedEmailCreate(
+            message_id=message_id,
+            sender=parsed.sender,
+            subject=parsed.subject,
+            date=parsed.date,
+            snippet=parsed.snippet,
+            label_ids=msg.get("labelIds", []),
+            internal_date=datetime.fromtimestamp(internal_ms / 1000, tz=timezone.utc),
+        )
+
+    def _fetch_metadata_sync(
+        self, service: Any, message_ids: list[str]
+    ) -> list[CachedEmailCreate]:
+        if not message_ids:
+            return []
+        return self.gmail._batch_get_sync(
+            service, message_ids, EmailDetailLevel.SNIPPET, self._to_cached
+        )
+
+    def _fetch_bodies_sync(
+        self, service: Any, message_ids: list[str]
+    ) -> dict[str, str]:
+        messages = self.gmail._batch_get_messages_sync(
+            service, message_ids, EmailDetailLevel.FULL
+        )
+        return {m.id: m.body for m in messages}
+
+    def _seed_sync(self, service: Any) -> tuple[str, list[CachedEmailCreate]]:
+        """List the whole window and fetch its metadata."""
+        profile = service.users().getProfile(userId="me").execute()
+        cap = settings.GMAIL_CACHE_MAX_MESSAGES
+        message_ids: list[str] = []
+        page_token = None
+        while len(message_ids) < cap:
+            response = (
+                service.users()
+                .messages()
+                .list(
+                    userId="me",
+                    q=f"newer_than:{settings.GMAIL_CACHE_WINDOW_DAYS}d",
+                    maxResults=min(500, cap - len(message_ids)),
+                    pageToken=page_token,
+                )
+                .execute()
+            )
+            message_ids.extend(m["id"] for m in response.get("messages", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        messages = self._fetch_metadata_sync(service, message_ids[:cap])
+        return str(profile["historyId"]), messages
+
+    def _history_sync(self, service: Any, start_history_id: str) -> _HistoryDelta:
+        """Replay history records since ``start_history_id``."""
+        delta = _HistoryDelta(
+            history_id=start_history_id, labels={}, deleted=set(), added=set()
+        )
+        page_token = None
+        while True:
+            response = (
+                service.users()
+                .history()
+                .list(
+                    userId="me",
+                    startHistoryId=start_history_id,
+                    pageToken=page_token,
+                )
+                .execute()
+            )
+            for record in response.get("history", []):
+                for record_type in _HISTORY_RECORD_TYPES:
+                    for item in record.get(record_type, []):
+                        message = item.get("message", {})
+                        message_id = message.get("id")
+                        if not message_id:
+                            continue
+                        label_ids = message.get("labelIds", [])
+                        excluded = bool(EXCLUDED_LABELS & set(label_ids))
+                        if record_type == "messagesDeleted" or excluded:
+                            delta.deleted.add(message_id)
+                            delta.labels.pop(message_id, None)
+                            delta.added.discard(message_id)
+                            continue
+                        delta.deleted.discard(message_id)
+                        delta.labels[message_id] = label_ids
+                        if record_type == "messagesAdded":
+                            delta.added.add(message_id)
+            delta.history_id = str(response.get("historyId", delta.history_id))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return delta
+
+    async def _seed(self, user_id: int, db: AsyncSession, service: Any) -> None:
+        history_id, messages = await asyncio.to_thread(self._seed_sync, service)
+        now = _utcnow()
+        covered_since = now - timedelta(days=settings.GMAIL_CACHE_WINDOW_DAYS)
+        if len(messages) >= settings.GMAIL_CACHE_MAX_MESSAGES:
+            # The cap was hit, so older messages in the window are missing
+            covered_since = max(covered_since, min(m.internal_date for m in messages))
+
+        messages = [m for m in messages if not EXCLUDED_LABELS & set(m.label_ids)]
+        await crud_cached_email.clear(db, user_id=user_id)
+        await crud_cached_email.upsert_many(db, user_id=user_id, objs_in=messages)
+        await crud_sync_state.upsert(
+            db,
+            obj_in=GmailSyncStateCreate(
+                user_id=user_id,
+                history_id=history_id,
+                covered_since=covered_since,
+                last_synced_at=now,
+            ),
+        )
+        logger.info(
+            "Seeded Gmail mirror",
+            extra={"json_fields": {"user_id": user_id, "messages": len(messages)}},
+        )
+
+    async def _apply_history(
+        self,
+        user_id: int,
+        db: AsyncSession,
+        service: Any,
+        history_id: str,
+        covered_since: datetime,
+    ) -> None:
+        delta = await asyncio.to_thread(self._history_sync, service, history_id)
+        now = _utcnow()
+        window_start = now - timedelta(days=settings.GMAIL_CACHE_WINDOW_DAYS)
+
+        await crud_cached_email.remove_many(
+            db, user_id=user_id, message_ids=list(delta.deleted)
+        )
+        cached_ids = {
+            row.message_id
+            for row in await crud_cached_email.get_by_message_ids(
+                db, user_id=user_id, message_ids=list(delta.labels)
+            )
+        }
+        await crud_cached_email.update_labels(
+            db,
+            user_id=user_id,
+            labels={k: v for k, v in delta.labels.items() if k in cached_ids},
+        )
+
+        # New messages, and ones restored from spam/trash, need their metadata
+        missing = [
+            message_id for message_id in delta.labels if message_id not in cached_ids
+        ]
+        fetched = await asyncio.to_thread(self._fetch_metadata_sync, service, missing)
+        await crud_cached_email.upsert_many(
+            db,
+            user_id=user_id,
+            objs_in=[
+                m
+                for m in fetched
+                if _as_utc(m.internal_date) >= _as_utc(covered_since)
+                and not EXCLUDED_LABELS & set(m.label_ids)
+            ],
+        )
+
+        await crud_cached_email.remove_older_than(
+            db, user_id=user_id, before=window_start
+        )
+        await crud_sync_state.upsert(
+            db,
+            obj_in=GmailSyncStateCreate(
+                user_id=user_id,
+                history_id=delta.history_id,
+                covered_since=max(_as_utc(covered_since), window_start),
+                last_synced_at=now,
+            ),
+        )
+        logger.info(
+            "Applied Gmail history to mirror",
+            extra={
+                "json_fields": {
+                    "user_id": user_id,
+                    "added": len(delta.added),
+                    "fetched": len(fetched),
+                    "deleted": len(delta.deleted),
+                }
+            },
+        )
+
+    async def sync(
+        self, user_id: int, db: AsyncSession, service: Any, force: bool = False
+    ) -> None:
+        """
+        Bring the mirror up to date.
+
+        Skipped when the last sync is younger than
+        ``GMAIL_CACHE_SYNC_INTERVAL_SEC`` unless ``force`` is set. An expired
+        ``historyId`` (404 from ``history.list``) triggers a full reseed.
+        """
+        async with _sync_lock(user_id):
+            state = await crud_sync_state.get_by_user_id(db, user_id=user_id)
+            if state is None:
+                await self._seed(user_id, db, service)
+                return
+
+            age = _utcnow() - _as_utc(state.last_synced_at)
+            if (
+                not force
+                and age.total_seconds() < settings.GMAIL_CACHE_SYNC_INTERVAL_SEC
+            ):
+                return
+
+            try:
+                await self._apply_history(
+                    user_id, db, service, state.history_id, state.covered_since
+                )
+            except HttpError as e:
+                if e.resp.status != 404:
+                    raise
+                logger.info(
+                    "Gmail historyId expired, reseeding mirror",
+                    extra={"json_fields": {"user_id": user_id}},
+                )
+                await self._seed(user_id, db, service)
+
+    @staticmethod
+    def _to_email(row: CachedEmail, detail_level: EmailDetailLevel) -> EmailMessage:
+        return EmailMessage(
+            id=row.message_id,
+            sender=row.sender,
+            subject=row.subject,
+            date=row.date,
+            snippet="" if detail_level == EmailDetailLevel.METADATA else row.snippet,
+            body=(row.body or "") if detail_level == EmailDetailLevel.FULL else "",
+        )
+
+    async def _has_matches(
+        self, user_id: int, db: AsyncSession, mirror_query: MirrorQuery, count: int
+    ) -> bool:
+        """Whether the mirror, as last synced, holds ``count`` matches."""
+        state = await crud_sync_state.get_by_user_id(db, user_id=user_id)
+        if state is None:
+            return False
+        rows = await crud_cached_email.search(
+            db,
+            user_id=user_id,
+            since=_as_utc(state.covered_since),
+            unread_only=mirror_query.unread_only,
+            label_id=mirror_query.label_id,
+            limit=count,
+        )
+        return len(rows) >= count
+
+    async def get_emails(
+        self,
+        user_id: int,
+        db: AsyncSession,
+        service: Any,
+        query: str,
+        max_results: int,
+        detail_level: EmailDetailLevel,
+    ) -> list[EmailMessage] | None:
+        """
+        Answer ``query`` from the mirror.
+
+        Returns None when the query is outside what the mirror can answer
+        (unsupported syntax, a window older than the mirrored range, or too
+        few local matches to be sure nothing older exists) or when the
+        database fails. Gmail API errors propagate to the caller.
+
+        A query without ``newer_than`` is only answered when the mirror
+        holds ``max_results`` matches. That is checked before syncing as
+        well, so a query the mirror will not answer does not pay for a sync
+        on top of the API call.
+        """
+        mirror_query = parse_mirror_query(query)
+        if mirror_query is None:
+            return None
+
+        try:
+            if mirror_query.newer_than_days is None and not await self._has_matches(
+                user_id, db, mirror_query, max_results
+            ):
+                return None
+
+            await self.sync(user_id, db, service)
+            state = await crud_sync_state.get_by_user_id(db, user_id=user_id)
+            if state is None:
+                return None
+            covered_since = _as_utc(state.covered_since)
+
+            if mirror_query.newer_than_days is not None:
+                since = _utcnow() - timedelta(days=mirror_query.newer_than_days)
+                if since < covered_since:
+                    return None
+            else:
+                since = covered_since
+
+            rows = await crud_cached_email.search(
+                db,
+                user_id=user_id,
+                since=since,
+                unread_only=mirror_query.unread_only,
+                label_id=mirror_query.label_id,
+                limit=max_results,
+            )
+            if mirror_query.newer_than_days is None and len(rows) < max_results:
+                # Older matches may exist outside the mirrored window
+                return None
+
+            emails = [self._to_email(row, detail_level) for row in rows]
+            if detail_level == EmailDetailLevel.FULL:
+                missing = [row.message_id for row in rows if row.body is None]
+                if missing:
+                    bodies = await asyncio.to_thread(
+                        self._fetch_bodies_sync, service, missing
+                    )
+                    await crud_cached_email.set_bodies(
+                        db, user_id=user_id, bodies=bodies
+                    )
+                    emails = [
+                        e.model_copy(update={"body": bodies[e.id]})
+                        if e.id in bodies
+                        else e
+                        for e in emails
+                    ]
+            return emails
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(
+                "Gmail mirror query failed, falling back to the API",
+                extra={"json_fields": {"user_id": user_id, "error": str(e)}},
+            )
+            return None
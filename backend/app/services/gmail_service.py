@@ -2,28 +2,34 @@ import asyncio
 import base64
 import json
 import logging
-from typing import Any
+from typing import Any, Callable, TypeVar
 
-from bs4 import BeautifulSoup
 from google.auth.exceptions import RefreshError
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.crud.crud_user import user as crud_user
-from app.schemas.gmail import EmailMessage
+from app.schemas.gmail import EmailDetailLevel, EmailMessage
+from app.services.gmail_mirror import GmailMirror
+from app.services.google_clients import google_client_factory
+from app.services.html_text import html_to_text
+from app.services.registry import service_registry
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Headers requested for format="metadata" fetches
+METADATA_HEADERS = ["From", "Subject", "Date"]
+
 
 class GmailService:
     """Service for interacting with Google Gmail API."""
 
     def __init__(self) -> None:
         """Initialize the Gmail Service."""
-        self.token_uri = "https://oauth2.googleapis.com/token"
+        self.mirror = GmailMirror(self)
 
     async def _get_gmail_client(self, user_id: int, db: AsyncSession) -> Any:
         """
@@ -50,20 +56,15 @@ class GmailService:
             )
 
         try:
-            credentials = Credentials(
-                token=None,
-                refresh_token=user.google_refresh_token,
-                token_uri=self.token_uri,
-                client_id=settings.GOOGLE_CLIENT_ID,
-                client_secret=settings.GOOGLE_CLIENT_SECRET.get_secret_value(),
-            )
-        except Exception as e:
-            raise ValueError(f"Failed to create credentials: {str(e)}") from e
-
-        try:
-            return await asyncio.to_thread(
-                build, "gmail", "v1", credentials=credentials
+            return await google_client_factory.get_service(
+                user_id, user.google_refresh_token, "gmail", "v1"
             )
+        except RefreshError as e:
+            await self._handle_auth_error(user_id, db, e)
+            raise RefreshError(
+                f"Failed to refresh access token for user {user_id}. "
+                "Re-authorization required."
+            ) from e
         except Exception as e:
             raise ValueError(f"Failed to build Gmail service: {str(e)}") from e
 
@@ -113,7 +114,9 @@ class GmailService:
     def _extract_body(self, payload: dict[str, Any]) -> str:
         """
         Extract the plain text body from the Gmail message payload.
-        Strips HTML using BeautifulSoup if only HTML is available.
+        Falls back to the HTML part, extracted with the bounded streaming
+        ``html_to_text`` so only as much HTML is parsed as the truncation
+        limit needs.
         """
         text_plain, text_html = self._extract_body_parts(payload)
 
@@ -122,25 +125,150 @@ class GmailService:
 
         if text_html:
             try:
-                soup = BeautifulSoup(text_html, "html.parser")
-                # Decompose script and style blocks
-                for element in soup(["script", "style"]):
-                    element.decompose()
-                text = soup.get_text(separator="\n")
-                # Clean up excess whitespace
-                lines = [line.strip() for line in text.splitlines() if line.strip()]
-                return "\n".join(lines)
+                return html_to_text(text_html, limit=settings.GMAIL_BODY_TRUNCATE_LEN)
             except Exception as e:
-                logger.warning("BeautifulSoup parsing failed: %s", e)
+                logger.warning("HTML text extraction failed: %s", e)
                 return ""
 
         return ""
 
+    @staticmethod
+    def _get_request_params(detail_level: EmailDetailLevel) -> dict[str, Any]:
+        """Return ``messages.get`` parameters for the requested detail level."""
+        if detail_level == EmailDetailLevel.FULL:
+            return {"format": "full"}
+        return {"format": "metadata", "metadataHeaders": METADATA_HEADERS}
+
+    def _parse_message(
+        self,
+        message_id: str,
+        msg: dict[str, Any],
+        detail_level: EmailDetailLevel = EmailDetailLevel.FULL,
+    ) -> EmailMessage:
+        """
+        Convert a Gmail message resource into an EmailMessage.
+
+        Only ``FULL`` messages have their payload decoded and their body
+        extracted; lighter levels leave ``body`` empty.
+        """
+        payload = msg.get("payload", {})
+        headers = payload.get("headers", [])
+        snippet = msg.get("snippet", "")
+        if detail_level == EmailDetailLevel.METADATA:
+            snippet = ""
+
+        # Extract metadata headers
+        sender = "Unknown Sender"
+        subject = "No Subject"
+        date = "Unknown Date"
+
+        for header in headers:
+            name = header.get("name", "").lower()
+            if name == "from":
+                sender = header.get("value", sender)
+            elif name == "subject":
+                subject = header.get("value", subject)
+            elif name == "date":
+                date = header.get("value", date)
+
+        body = ""
+        if detail_level == EmailDetailLevel.FULL:
+            # Extract and clean body content
+            body = self._extract_body(payload)
+
+            # If no body was found, fall back to snippet
+            if not body:
+                body = snippet
+
+            # Truncate long bodies to save LLM context window
+            truncate_len = settings.GMAIL_BODY_TRUNCATE_LEN
+            if len(body) > truncate_len:
+                body = body[:truncate_len] + "\n... [truncated]"
+
+        return EmailMessage(
+            id=message_id,
+            sender=sender,
+            subject=subject,
+            date=date,
+            snippet=snippet,
+            body=body,
+        )
+
+    def _batch_get_sync(
+        self,
+        service: Any,
+        message_ids: list[str],
+        detail_level: EmailDetailLevel,
+        parse: Callable[[str, dict[str, Any]], T],
+    ) -> list[T]:
+        """
+        Fetch several messages through the Gmail batch endpoint.
+
+        Up to ``GMAIL_BATCH_SIZE`` ``messages.get`` calls are packed into a
+        single HTTP request. Each response is handed to ``parse`` in the batch
+        callback as it is demultiplexed. Messages that fail individually are
+        skipped with a warning; if every message fails, the first error is
+        raised so the caller's auth-error handling still applies.
+        """
+        parsed: dict[str, T] = {}
+        errors: list[Exception] = []
+
+        def _on_response(request_id: str, response: Any, exception: Any) -> None:
+            if exception is not None:
+                logger.warning(
+                    "Gmail batch get failed for message %s: %s", request_id, exception
+                )
+                errors.append(exception)
+                return
+            try:
+                parsed[request_id] = parse(request_id, response)
+            except Exception as e:
+                logger.warning("Failed parsing Gmail message %s: %s", request_id, e)
+                errors.append(e)
+
+        params = self._get_request_params(detail_level)
+        batch_size = max(1, settings.GMAIL_BATCH_SIZE)
+        for offset in range(0, len(message_ids), batch_size):
+            batch = service.new_batch_http_request(callback=_on_response)
+            for msg_id in message_ids[offset : offset + batch_size]:
+                batch.add(
+                    service.users().messages().get(userId="me", id=msg_id, **params),
+                    request_id=msg_id,
+                )
+            batch.execute()
+
+        if errors and not parsed:
+            raise errors[0]
+
+        # Preserve the order of message_ids (newest first for messages.list)
+        return [parsed[msg_id] for msg_id in message_ids if msg_id in parsed]
+
+    def _batch_get_messages_sync(
+        self,
+        service: Any,
+        message_ids: list[str],
+        detail_level: EmailDetailLevel = EmailDetailLevel.FULL,
+    ) -> list[EmailMessage]:
+        """Batch-fetch messages and parse them into EmailMessage models."""
+        return self._batch_get_sync(
+            service,
+            message_ids,
+            detail_level,
+            lambda msg_id, msg: self._parse_message(msg_id, msg, detail_level),
+        )
+
     def _get_messages_sync(
-        self, service: Any, query: str, max_results: int
+        self,
+        service: Any,
+        query: str,
+        max_results: int,
+        detail_level: EmailDetailLevel = EmailDetailLevel.FULL,
     ) -> list[EmailMessage]:
         """
         Synchronous helper to list and fetch messages from Gmail API.
+
+        Costs one ``messages.list`` call plus one batch request per
+        ``GMAIL_BATCH_SIZE`` messages.
         """
         try:
             # List messages matching the query
@@ -150,61 +278,11 @@ class GmailService:
                 .list(userId="me", q=query, maxResults=max_results)
                 .execute()
             )
-            message_summaries = results.get("messages", [])
-
-            emails = []
-            for msg_summary in message_summaries:
-                msg_id = msg_summary["id"]
-                # Fetch full message content
-                msg = (
-                    service.users()
-                    .messages()
-                    .get(userId="me", id=msg_id, format="full")
-                    .execute()
-                )
-
-                payload = msg.get("payload", {})
-                headers = payload.get("headers", [])
-                snippet = msg.get("snippet", "")
-
-                # Extract metadata headers
-                sender = "Unknown Sender"
-                subject = "No Subject"
-                date = "Unknown Date"
-
-                for header in headers:
-                    name = header.get("name", "").lower()
-                    if name == "from":
-                        sender = header.get("value", sender)
-                    elif name == "subject":
-                        subject = header.get("value", subject)
-                    elif name == "date":
-                        date = header.get("value", date)
-
-                # Extract and clean body content
-                body = self._extract_body(payload)
-
-                # If no body was found, fall back to snippet
-                if not body:
-                    body = snippet
-
-                # Truncate long bodies to save LLM context window
-                truncate_len = settings.GMAIL_BODY_TRUNCATE_LEN
-                if len(body) > truncate_len:
-                    body = body[:truncate_len] + "\n... [truncated]"
-
-                emails.append(
-                    EmailMessage(
-                        id=msg_id,
-                        sender=sender,
-                        subject=subject,
-                        date=date,
-                        snippet=snippet,
-                        body=body,
-                    )
-                )
+            message_ids = [m["id"] for m in results.get("messages", [])]
+            if not message_ids:
+                return []
 
-            return emails
+            return self._batch_get_messages_sync(service, message_ids, detail_level)
 
         except HttpError as e:
             logger.error("Google Gmail API HttpError: %s", e)
@@ -219,6 +297,7 @@ class GmailService:
         db: AsyncSession,
         query: str = "is:unread",
         max_results: int = 5,
+        detail_level: EmailDetailLevel = EmailDetailLevel.FULL,
     ) -> list[EmailMessage]:
         """
         Search and retrieve parsed user emails asynchronously.
@@ -228,14 +307,27 @@ class GmailService:
             db: Database session
             query: Gmail search query (e.g. "is:unread", "from:someone@gmail.com")
             max_results: Max messages to return
+            detail_level: ``metadata`` and ``snippet`` fetch headers only
+                (``format=metadata``); ``full`` downloads and parses bodies.
+                Use ``get_email_by_id`` to load a body on demand.
+
+        Queries the local mirror can answer (see ``GmailMirror``) are served
+        from the database after an incremental sync when
+        ``GMAIL_CACHE_ENABLED`` is set.
 
         Returns:
             List of EmailMessage models
         """
         service = await self._get_gmail_client(user_id, db)
         try:
+            if settings.GMAIL_CACHE_ENABLED:
+                emails = await self.mirror.get_emails(
+                    user_id, db, service, query, max_results, detail_level
+                )
+                if emails is not None:
+                    return emails
             return await asyncio.to_thread(
-                self._get_messages_sync, service, query, max_results
+                self._get_messages_sync, service, query, max_results, detail_level
             )
         except RefreshError as e:
             await self._handle_auth_error(user_id, db, e)
@@ -286,39 +378,7 @@ class GmailService:
                 .get(userId="me", id=message_id, format="full")
                 .execute()
             )
-            payload = msg.get("payload", {})
-            headers = payload.get("headers", [])
-            snippet = msg.get("snippet", "")
-
-            sender = "Unknown Sender"
-            subject = "No Subject"
-            date = "Unknown Date"
-
-            for header in headers:
-                name = header.get("name", "").lower()
-                if name == "from":
-                    sender = header.get("value", sender)
-                elif name == "subject":
-                    subject = header.get("value", subject)
-                elif name == "date":
-                    date = header.get("value", date)
-
-            body = self._extract_body(payload)
-            if not body:
-                body = snippet
-
-            truncate_len = settings.GMAIL_BODY_TRUNCATE_LEN
-            if len(body) > truncate_len:
-                body = body[:truncate_len] + "\n... [truncated]"
-
-            return EmailMessage(
-                id=message_id,
-                sender=sender,
-                subject=subject,
-                date=date,
-                snippet=snippet,
-                body=body,
-            )
+            return self._parse_message(message_id, msg)
         except HttpError as e:
             logger.error("Google Gmail API HttpError for message %s: %s", message_id, e)
             raise
@@ -381,7 +441,12 @@ class GmailService:
     async def _handle_auth_error(
         self, user_id: int, db: AsyncSession, exception: Exception
     ) -> None:
-        """Update google_token_status when an auth error is encountered."""
+        """
+        Update google_token_status when an auth error is encountered.
+
+        Cached API clients of the user are evicted so the next call starts
+        from fresh credentials.
+        """
         status_val = None
         if isinstance(exception, RefreshError):
             status_val = "expired"
@@ -417,6 +482,7 @@ class GmailService:
                 status_val = "expired"
 
         if status_val:
+            google_client_factory.invalidate(user_id)
             try:
                 user = await crud_user.get(db, id=user_id)
                 if user and user.google_token_status != status_val:
@@ -430,8 +496,4 @@ class GmailService:
                 )
 
 
-gmail_service_instance = GmailService()
-
-
-def gmail_service() -> GmailService:
-    return gmail_service_instance
+gmail_service = service_registry.register("gmail_service", GmailService)
@@ -6,8 +6,6 @@ from typing import Any
 
 import pytz
 from google.auth.exceptions import RefreshError
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,7 +15,14 @@ from app.schemas.calendar import (
     CalendarEvent,
     CalendarEventCreate,
     CalendarEventUpdate,
+    FreeSlot,
 )
+from app.services.calendar_listing import iter_event_pages
+from app.services.calendar_set import calendar_set_cache
+from app.services.calendar_store import calendar_event_store, merge_by_start
+from app.services.free_slots import find_free_slots
+from app.services.google_clients import google_client_factory
+from app.services.registry import service_registry
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +32,6 @@ class GoogleCalendarService:
 
     def __init__(self) -> None:
         """Initialize the Google Calendar Service."""
-        self.token_uri = "https://oauth2.googleapis.com/token"
         self.timezone = "Europe/Kiev"
 
     async def _fetch_events_raw(
@@ -40,6 +44,10 @@ class GoogleCalendarService:
         """
         Fetch raw events from Google Calendar API within a time range.
 
+        Every calendar in the user's calendar set (see ``calendar_set_cache``)
+        is fetched concurrently and the per-calendar results, each already
+        ordered by start, are k-way merged.
+
         Args:
             user_id: The ID of the user
             time_min: Start time of the range
@@ -68,24 +76,18 @@ class GoogleCalendarService:
         service = await self._get_calendar_service(user_id, db)
 
         try:
-            time_min_str = time_min.isoformat() + "Z"
-            time_max_str = time_max.isoformat() + "Z"
-
-            events_result = await asyncio.to_thread(
-                lambda: (
-                    service.events()
-                    .list(
-                        calendarId="primary",
-                        timeMin=time_min_str,
-                        timeMax=time_max_str,
-                        singleEvents=True,
-                        orderBy="startTime",
+            calendar_ids = await calendar_set_cache.get_calendar_ids(user_id, service)
+            results = await asyncio.gather(
+                *(
+                    self._fetch_calendar_events(
+                        user_id, service, calendar_id, time_min, time_max
                     )
-                    .execute()
+                    for calendar_id in calendar_ids
                 )
             )
-
-            return events_result.get("items", [])
+            if len(results) == 1:
+                return results[0]
+            return list(merge_by_start(results, pytz.timezone(self.timezone)))
 
         except RefreshError as e:
             await self._handle_auth_error(user_id, db, e)
@@ -104,6 +106,62 @@ class GoogleCalendarService:
         except Exception as e:
             raise Exception(f"Failed to fetch calendar events: {str(e)}") from e
 
+    async def _fetch_calendar_events(
+        self,
+        user_id: int,
+        service: Any,
+        calendar_id: str,
+        time_min: datetime,
+        time_max: datetime,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch one calendar's events in a time range, ordered by start.
+
+        Ranges covered by the local ``calendar_event_store`` are answered
+        from it after an incremental sync; others are paged through
+        ``events.list`` with a field mask. A secondary calendar that is no
+        longer readable is skipped and the calendar set is rediscovered on
+        the next read.
+        """
+        try:
+            if settings.CALENDAR_STORE_ENABLED:
+                events = await calendar_event_store.get_events(
+                    user_id, service, time_min, time_max, self.timezone, calendar_id
+                )
+                if events is not None:
+                    return events
+
+            time_min_str = time_min.isoformat() + "Z"
+            time_max_str = time_max.isoformat() + "Z"
+
+            events: list[dict[str, Any]] = []
+            async for page in iter_event_pages(
+                service,
+                calendar_id,
+                timeMin=time_min_str,
+                timeMax=time_max_str,
+                singleEvents=True,
+                orderBy="startTime",
+            ):
+                events.extend(page.items)
+            return events
+
+        except HttpError as e:
+            if calendar_id == "primary" or e.resp.status not in (403, 404):
+                raise
+            logger.warning(
+                "Skipping unreadable calendar",
+                extra={
+                    "json_fields": {
+                        "user_id": user_id,
+                        "calendar_id": calendar_id,
+                        "status": e.resp.status,
+                    }
+                },
+            )
+            calendar_set_cache.invalidate(user_id)
+            return []
+
     async def get_today_events(
         self, user_id: int, db: AsyncSession
     ) -> list["CalendarEvent"]:
@@ -196,20 +254,15 @@ class GoogleCalendarService:
             )
 
         try:
-            credentials = Credentials(
-                token=None,
-                refresh_token=user.google_refresh_token,
-                token_uri=self.token_uri,
-                client_id=settings.GOOGLE_CLIENT_ID,
-                client_secret=settings.GOOGLE_CLIENT_SECRET.get_secret_value(),
-            )
-        except Exception as e:
-            raise ValueError(f"Failed to create credentials: {str(e)}") from e
-
-        try:
-            return await asyncio.to_thread(
-                build, "calendar", "v3", credentials=credentials
+            return await google_client_factory.get_service(
+                user_id, user.google_refresh_token, "calendar", "v3"
             )
+        except RefreshError as e:
+            await self._handle_auth_error(user_id, db, e)
+            raise RefreshError(
+                f"Failed to refresh access token for user {user_id}. "
+                "Re-authorization required."
+            ) from e
         except Exception as e:
             raise ValueError(f"Failed to build calendar service: {str(e)}") from e
 
@@ -351,6 +404,7 @@ class GoogleCalendarService:
                     .execute()
                 )
             )
+            calendar_event_store.upsert(user_id, created_event)
 
             return {
                 "id": created_event.get("id"),
@@ -449,6 +503,7 @@ class GoogleCalendarService:
                     .execute()
                 )
             )
+            calendar_event_store.upsert(user_id, updated_event)
 
             return {
                 "id": updated_event.get("id"),
@@ -478,6 +533,142 @@ class GoogleCalendarService:
         except Exception as e:
             raise Exception(f"Failed to update calendar event: {str(e)}") from e
 
+    async def get_busy_intervals(
+        self,
+        user_id: int,
+        time_min: datetime,
+        time_max: datetime,
+        db: AsyncSession,
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        Get the user's busy intervals from ``freebusy.query``.
+
+        Args:
+            user_id: The ID of the user
+            time_min: Start of the range (naive values are in the service timezone)
+            time_max: End of the range
+            db: Database session
+
+        Returns:
+            Aware ``(start, end)`` busy intervals across the user's calendar set
+
+        Raises:
+            ValueError: If user not found or not authenticated
+            RefreshError: If token refresh fails
+            HttpError: If Google API call fails
+        """
+        service = await self._get_calendar_service(user_id, db)
+        calendar_ids = await calendar_set_cache.get_calendar_ids(user_id, service)
+        body = {
+            "timeMin": self._to_service_tz(time_min).isoformat(),
+            "timeMax": self._to_service_tz(time_max).isoformat(),
+            "timeZone": self.timezone,
+            "items": [{"id": calendar_id} for calendar_id in calendar_ids],
+        }
+
+        try:
+            response = await asyncio.to_thread(
+                lambda: service.freebusy().query(body=body).execute()
+            )
+        except RefreshError as e:
+            await self._handle_auth_error(user_id, db, e)
+            raise RefreshError(
+                f"Failed to refresh access token for user {user_id}."
+            ) from e
+        except HttpError as e:
+            await self._handle_auth_error(user_id, db, e)
+            raise HttpError(
+                resp=e.resp,
+                content=e.content,
+                uri=e.uri,
+            ) from e
+
+        calendars = response.get("calendars", {})
+        primary = calendars.get("primary", {})
+        if primary.get("errors"):
+            raise ValueError(f"Free/busy lookup failed: {primary['errors']}")
+
+        intervals = []
+        for calendar_id in calendar_ids:
+            calendar = calendars.get(calendar_id, {})
+            if calendar.get("errors"):
+                # Shared calendars may only expose free/busy to some users
+                logger.warning(
+                    "Skipping calendar in free/busy lookup",
+                    extra={
+                        "json_fields": {
+                            "user_id": user_id,
+                            "calendar_id": calendar_id,
+                            "errors": calendar["errors"],
+                        }
+                    },
+                )
+                continue
+            for busy in calendar.get("busy", []):
+                start = self._parse_datetime(busy.get("start"))
+                end = self._parse_datetime(busy.get("end"))
+                if start and end:
+                    intervals.append((start, end))
+        return intervals
+
+    async def find_free_slots(
+        self,
+        user_id: int,
+        db: AsyncSession,
+        duration_minutes: int,
+        range_start: datetime,
+        range_end: datetime,
+        working_hours_start: time = time(9, 0),
+        working_hours_end: time = time(18, 0),
+        buffer_minutes: int = 0,
+        max_results: int = 5,
+    ) -> list[FreeSlot]:
+        """
+        Find the earliest free slots for a meeting of the given length.
+
+        Busy time comes from one ``freebusy.query`` call; the slot search runs
+        locally (see ``app.services.free_slots.find_free_slots``).
+
+        Args:
+            user_id: The ID of the user
+            db: Database session
+            duration_minutes: Length of the wanted slot
+            range_start: Start of the search (naive values are in the service timezone)
+            range_end: End of the search
+            working_hours_start: Local start of the working day
+            working_hours_end: Local end of the working day
+            buffer_minutes: Free minutes required before and after the slot
+            max_results: Maximum number of slots to return
+
+        Returns:
+            List of FreeSlot objects, earliest first
+
+        Raises:
+            ValueError: If the range or working hours are invalid
+        """
+        if range_end <= range_start:
+            raise ValueError("range_end must be after range_start")
+        if working_hours_end <= working_hours_start:
+            raise ValueError("working_hours_end must be after working_hours_start")
+
+        start = self._to_service_tz(range_start)
+        end = self._to_service_tz(range_end)
+        busy = await self.get_busy_intervals(user_id, start, end, db)
+        slots = find_free_slots(
+            busy,
+            duration=timedelta(minutes=duration_minutes),
+            range_start=start,
+            range_end=end,
+            tz=pytz.timezone(self.timezone),
+            working_hours_start=working_hours_start,
+            working_hours_end=working_hours_end,
+            buffer=timedelta(minutes=buffer_minutes),
+            limit=max_results,
+        )
+        return [
+            FreeSlot(start=slot_start, end=slot_end) for slot_start, slot_end in slots
+        ]
+
     async def delete_event(self, user_id: int, event_id: str, db: AsyncSession) -> bool:
         """
         Delete a calendar event by ID.
@@ -500,6 +691,7 @@ class GoogleCalendarService:
                     .execute()
                 )
             )
+            calendar_event_store.remove(user_id, event_id)
             return True
         except RefreshError as e:
             await self._handle_auth_error(user_id, db, e)
@@ -519,7 +711,12 @@ class GoogleCalendarService:
     async def _handle_auth_error(
         self, user_id: int, db: AsyncSession, exception: Exception
     ) -> None:
-        """Update google_token_status when an auth error is encountered."""
+        """
+        Update google_token_status when an auth error is encountered.
+
+        Cached API clients of the user are evicted so the next call starts
+        from fresh credentials.
+        """
         status_val = None
         if isinstance(exception, RefreshError):
             status_val = "expired"
@@ -555,6 +752,9 @@ class GoogleCalendarService:
                 status_val = "expired"
 
         if status_val:
+            google_client_factory.invalidate(user_id)
+            calendar_event_store.invalidate(user_id)
+            calendar_set_cache.invalidate(user_id)
             try:
                 user = await crud_user.get(db, id=user_id)
                 if user and user.google_token_status != status_val:
@@ -568,8 +768,6 @@ class GoogleCalendarService:
                 )
 
 
-google_calendar_service_instance = GoogleCalendarService()
-
-
-def google_calendar_service() -> GoogleCalendarService:
-    return google_calendar_service_instance
+google_calendar_service = service_registry.register(
+    "google_calendar_service", GoogleCalendarService
+)
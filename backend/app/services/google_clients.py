@@ -0,0 +1,152 @@
+import asyncio
+import importlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2.credentials import Credentials
+
+from app.core.config import settings
+from app.services.google_tokens import google_token_cache
+
+if TYPE_CHECKING:
+    from googleapiclient.http import HttpRequest
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedClient:
+    service: Any
+    credentials: Credentials
+    created_at: float
+
+
+class GoogleClientFactory:
+    """
+    Per-user cache of authenticated Google API discovery clients.
+
+    The static discovery document of each API is parsed once per process.
+    Service objects are kept per ``(user_id, api, version)`` in an LRU with a
+    TTL. They are bound to the user's shared credentials from
+    ``google_token_cache``, so the access token is reused across calls and
+    APIs instead of forcing a token refresh round trip every time.
+
+    Cached services are shared between worker threads, so every request gets
+    its own ``httplib2.Http`` (which is not thread-safe) through a custom
+    request builder.
+    """
+
+    def __init__(self) -> None:
+        self._documents: dict[tuple[str, str], dict[str, Any]] = {}
+        self._clients: OrderedDict[tuple[int, str, str], _CachedClient] = OrderedDict()
+
+    @staticmethod
+    def _load_document(api: str, version: str) -> dict[str, Any]:
+        from googleapiclient.discovery_cache import get_static_doc
+
+        document = get_static_doc(api, version)
+        if document is None:
+            raise ValueError(f"No static discovery document for {api} {version}")
+        return json.loads(document)
+
+    async def _get_document(self, api: str, version: str) -> dict[str, Any]:
+        key = (api, version)
+        document = self._documents.get(key)
+        if document is None:
+            document = await asyncio.to_thread(self._load_document, api, version)
+            self._documents[key] = document
+        return document
+
+    async def preload_documents(self, *apis: tuple[str, str]) -> None:
+        """Parse the discovery documents of ``(api, version)`` pairs ahead of use."""
+        await asyncio.gather(
+            *(self._get_document(api, version) for api, version in apis)
+        )
+        # Imports the discovery module for the first ``get_service``
+        await asyncio.to_thread(importlib.import_module, "googleapiclient.discovery")
+
+    @staticmethod
+    def _build_service(document: dict[str, Any], credentials: Credentials) -> Any:
+        # googleapiclient.discovery is slow to import; only load it once a
+        # Google API is actually used
+        from googleapiclient.discovery import build_from_document
+        from googleapiclient.http import HttpRequest
+
+        def _request_builder(http: Any, *args: Any, **kwargs: Any) -> "HttpRequest":
+            # A fresh transport per request keeps shared services thread-safe
+            http = google_auth_httplib2.AuthorizedHttp(
+                credentials, http=httplib2.Http()
+            )
+            return HttpRequest(http, *args, **kwargs)
+
+        return build_from_document(
+            document, credentials=credentials, requestBuilder=_request_builder
+        )
+
+    async def get_service(
+        self, user_id: int, refresh_token: str, api: str, version: str
+    ) -> Any:
+        """
+        Return an authenticated service resource for the user.
+
+        Args:
+            user_id: The ID of the user
+            refresh_token: The user's stored Google refresh token
+            api: Discovery API name, e.g. ``"gmail"``
+            version: API version, e.g. ``"v1"``
+
+        Returns:
+            A cached or freshly built Google API service resource
+
+        Raises:
+            RefreshError: If the access token could not be refreshed
+        """
+        credentials = await google_token_cache.get_credentials(user_id, refresh_token)
+
+        key = (user_id, api, version)
+        cached = self._clients.get(key)
+        now = time.monotonic()
+        if (
+            cached is not None
+            and cached.credentials is credentials
+            and now - cached.created_at < settings.GOOGLE_CLIENT_CACHE_TTL_SEC
+        ):
+            self._clients.move_to_end(key)
+            return cached.service
+
+        document = await self._get_document(api, version)
+        service = await asyncio.to_thread(self._build_service, document, credentials)
+
+        self._clients[key] = _CachedClient(
+            service=service, credentials=credentials, created_at=now
+        )
+        self._clients.move_to_end(key)
+        while len(self._clients) > settings.GOOGLE_CLIENT_CACHE_MAX_SIZE:
+            self._clients.popitem(last=False)
+        return service
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop every cached client and the access token of the user, e.g. after
+        a ``RefreshError`` or a revoked grant.
+        """
+        google_token_cache.drop(user_id)
+        for key in [key for key in self._clients if key[0] == user_id]:
+            del self._clients[key]
+        logger.info(
+            "Evicted cached Google clients",
+            extra={"json_fields": {"user_id": user_id}},
+        )
+
+    def clear(self) -> None:
+        self._clients.clear()
+        google_token_cache.clear()
+
+
+google_client_factory = GoogleClientFactory()
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2.credentials import Credentials
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+
+class GoogleTokenCache:
+    """
+    Per-user OAuth access-token cache shared by every Google API client.
+
+    One ``Credentials`` object is kept per user, so Calendar and Gmail calls
+    of the same turn share a single access token. Tokens are refreshed in
+    ``get_credentials`` shortly before they expire (``GOOGLE_TOKEN_REFRESH_
+    MARGIN_SEC``), which keeps the transports from refreshing on their own;
+    concurrent callers for the same user wait on the one in-flight refresh.
+    """
+
+    def __init__(self) -> None:
+        self._credentials: dict[int, Credentials] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    def _get_lock(self, user_id: int) -> asyncio.Lock:
+        lock = self._locks.get(user_id)
+        if lock is None:
+            lock = self._locks[user_id] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    def _needs_refresh(credentials: Credentials) -> bool:
+        if not credentials.token or credentials.expiry is None:
+            return True
+        # google-auth keeps ``expiry`` as a naive UTC datetime
+        margin = timedelta(seconds=settings.GOOGLE_TOKEN_REFRESH_MARGIN_SEC)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return credentials.expiry - margin <= now
+
+    @staticmethod
+    def _refresh(credentials: Credentials) -> None:
+        credentials.refresh(google_auth_httplib2.Request(httplib2.Http()))
+
+    async def get_credentials(self, user_id: int, refresh_token: str) -> Credentials:
+        """
+        Return the user's credentials holding a token that is not about to expire.
+
+        Args:
+            user_id: The ID of the user
+            refresh_token: The user's stored Google refresh token
+
+        Returns:
+            Shared Credentials object for the user
+
+        Raises:
+            RefreshError: If the refresh token was rejected; the cached
+                credentials are dropped first
+        """
+        credentials = self._credentials.get(user_id)
+        if (
+            credentials is not None
+            and credentials.refresh_token == refresh_token
+            and not self._needs_refresh(credentials)
+        ):
+            return credentials
+
+        async with self._get_lock(user_id):
+            # Another caller may have refreshed while we waited for the lock
+            credentials = self._credentials.get(user_id)
+            if credentials is None or credentials.refresh_token != refresh_token:
+                credentials = Credentials(
+                    token=None,
+                    refresh_token=refresh_token,
+                    token_uri=TOKEN_URI,
+                    client_id=settings.GOOGLE_CLIENT_ID,
+                    client_secret=settings.GOOGLE_CLIENT_SECRET.get_secret_value(),
+                )
+                self._credentials[user_id] = credentials
+
+            if self._needs_refresh(credentials):
+                try:
+                    await asyncio.to_thread(self._refresh, credentials)
+                except Exception:
+                    self.drop(user_id)
+                    raise
+                logger.info(
+                    "Refreshed Google access token",
+                    extra={
+                        "json_fields": {
+                            "user_id": user_id,
+                            "expiry": credentials.expiry.isoformat()
+                            if credentials.expiry
+                            else None,
+                        }
+                    },
+                )
+            return credentials
+
+    def drop(self, user_id: int) -> None:
+        """Forget the user's token, e.g. once it was found expired or revoked."""
+        self._credentials.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._credentials.clear()
+
+
+google_token_cache = GoogleTokenCache()
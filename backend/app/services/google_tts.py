@@ -3,16 +3,26 @@
 import asyncio
 import logging
 import re
+from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
-from google.api_core.exceptions import GoogleAPIError
-from google.cloud import texttospeech
-from google.oauth2 import service_account
 
 from app.core.config import settings
+from app.services.ogg_opus import concat_ogg_opus
+from app.services.tts_cache import make_cache_key, tts_audio_cache
+from app.services.registry import service_registry
 
-# Maximum text length allowed by Google TTS API
-MAX_TEXT_LENGTH = 5000
+if TYPE_CHECKING:
+    from google.cloud import texttospeech
+
+# Maximum text length accepted for one synthesis; longer texts are split
+# into chunks below the API limit
+MAX_TEXT_LENGTH = 20000
+
+# Google TTS rejects requests whose input exceeds 5000 bytes
+API_MAX_INPUT_BYTES = 5000
+
+SENTENCE_END_RE = re.compile(r"(?<=[.!?…])\s+")
 
 # Default language and voice style for Wavenet-B
 DEFAULT_LANGUAGE_CODE = "uk-UA"
@@ -30,24 +40,32 @@ class GoogleTTSService:
 
     This service can be used:
     - Via FastAPI Depends() injection in endpoints (use ``google_tts_service`` factory).
-    - By direct import from other backend services (use ``google_tts_service_instance``).
+    - By direct import from other backend services (use ``get_google_tts_service_instance``).
     """
 
     def __init__(self) -> None:
         """
-        Initialize the Google TTS client with service account credentials.
+        Load the service account credentials for the Google TTS clients.
 
-        Requires ``GOOGLE_APPLICATION_CREDENTIALS`` to be set in settings
-        with the path to the GCP service account JSON key file.
+        Uses the JSON key file at ``GOOGLE_APPLICATION_CREDENTIALS`` when set,
+        otherwise Application Default Credentials.
         """
-        if settings.GOOGLE_APPLICATION_CREDENTIALS:
-            self.client = texttospeech.TextToSpeechClient(
-                credentials=service_account.Credentials.from_service_account_file(
-                    settings.GOOGLE_APPLICATION_CREDENTIALS
-                )
+        # The TTS SDK takes seconds to import, so it is loaded with the
+        # service rather than with this module
+        from google.cloud import texttospeech
+        from google.oauth2 import service_account
+
+        self._credentials = (
+            service_account.Credentials.from_service_account_file(
+                settings.GOOGLE_APPLICATION_CREDENTIALS
             )
-        else:
-            self.client = texttospeech.TextToSpeechClient()
+            if settings.GOOGLE_APPLICATION_CREDENTIALS
+            else None
+        )
+        # gRPC channels bind to the running event loop, so the client pool
+        # is opened on first use (see ``_get_client``)
+        self._clients: list["texttospeech.TextToSpeechAsyncClient"] = []
+        self._next_client = 0
         self.logger = logging.getLogger(self.__class__.__name__)
 
         # Audio config is the same for all languages
@@ -55,9 +73,35 @@ class GoogleTTSService:
             audio_encoding=texttospeech.AudioEncoding.OGG_OPUS,
             speaking_rate=0.75,
         )
+        self._audio_config_key = texttospeech.AudioConfig.to_json(self.audio_config)
 
         self.logger.info("GoogleTTSService initialized successfully")
 
+    def _get_client(self) -> "texttospeech.TextToSpeechAsyncClient":
+        """
+        Return the next client of the pool, round-robin.
+
+        Each of the ``TTS_GRPC_POOL_SIZE`` clients owns its own gRPC channel,
+        so concurrent chunk requests are spread over several HTTP/2
+        connections instead of queueing on one.
+        """
+        from google.cloud import texttospeech
+
+        if not self._clients:
+            self._clients = [
+                texttospeech.TextToSpeechAsyncClient(credentials=self._credentials)
+                for _ in range(max(settings.TTS_GRPC_POOL_SIZE, 1))
+            ]
+        client = self._clients[self._next_client % len(self._clients)]
+        self._next_client += 1
+        return client
+
+    async def close(self) -> None:
+        """Close the gRPC channels of the client pool."""
+        clients, self._clients = self._clients, []
+        for client in clients:
+            await client.transport.close()
+
     @staticmethod
     def _clean_text(text: str) -> str:
         """
@@ -138,10 +182,59 @@ class GoogleTTSService:
             return "uk-UA"
         return "en-US"
 
+    @staticmethod
+    def _split_into_chunks(text: str, max_bytes: int) -> list[str]:
+        """
+        Split text into chunks of at most ``max_bytes`` UTF-8 bytes.
+
+        Chunks are filled with whole sentences; a sentence longer than the
+        limit is split between words, and a single overlong word between
+        characters.
+
+        Args:
+            text: Cleaned text to split.
+            max_bytes: Maximum encoded size of a chunk.
+
+        Returns:
+            Non-empty chunks in reading order.
+        """
+
+        def _size(value: str) -> int:
+            return len(value.encode("utf-8"))
+
+        def _pieces(sentence: str) -> list[str]:
+            if _size(sentence) <= max_bytes:
+                return [sentence]
+            pieces: list[str] = []
+            for word in sentence.split(" "):
+                while _size(word) > max_bytes:
+                    cut = max_bytes
+                    while _size(word[:cut]) > max_bytes:
+                        cut -= 1
+                    pieces.append(word[:cut])
+                    word = word[cut:]
+                if word:
+                    pieces.append(word)
+            return pieces
+
+        chunks: list[str] = []
+        current = ""
+        for sentence in SENTENCE_END_RE.split(text):
+            for piece in _pieces(sentence):
+                candidate = f"{current} {piece}" if current else piece
+                if _size(candidate) <= max_bytes:
+                    current = candidate
+                else:
+                    chunks.append(current)
+                    current = piece
+        if current:
+            chunks.append(current)
+        return chunks
+
     def _build_voice(
         self,
         language_code: str,
-    ) -> texttospeech.VoiceSelectionParams:
+    ) -> "texttospeech.VoiceSelectionParams":
         """
         Build VoiceSelectionParams for the given language.
 
@@ -154,12 +247,59 @@ class GoogleTTSService:
         Returns:
             VoiceSelectionParams configured for the requested language.
         """
+        from google.cloud import texttospeech
+
         voice_name = f"{language_code}-{VOICE_STYLE}"
         return texttospeech.VoiceSelectionParams(
             language_code=language_code,
             name=voice_name,
         )
 
+    async def _synthesize_chunk(
+        self,
+        text: str,
+        language_code: str,
+        voice: "texttospeech.VoiceSelectionParams",
+        semaphore: asyncio.Semaphore,
+    ) -> bytes:
+        """
+        Synthesize one chunk, serving it from ``tts_audio_cache`` when possible.
+
+        ``semaphore`` bounds the number of concurrent API calls of a single
+        ``synthesize`` call.
+        """
+        from google.cloud import texttospeech
+
+        cache_key = None
+        if settings.TTS_CACHE_ENABLED:
+            cache_key = make_cache_key(
+                text, language_code, voice.name, self._audio_config_key
+            )
+            cached_audio = await tts_audio_cache.get(cache_key)
+            if cached_audio is not None:
+                self.logger.info(
+                    "Speech served from cache",
+                    extra={
+                        "json_fields": {
+                            "audio_size_bytes": len(cached_audio),
+                            **tts_audio_cache.stats.as_dict(),
+                        }
+                    },
+                )
+                return cached_audio
+
+        async with semaphore:
+            response = await self._get_client().synthesize_speech(
+                input=texttospeech.SynthesisInput(text=text),
+                voice=voice,
+                audio_config=self.audio_config,
+            )
+
+        audio_bytes: bytes = response.audio_content
+        if cache_key is not None:
+            await tts_audio_cache.put(cache_key, audio_bytes)
+        return audio_bytes
+
     async def synthesize(
         self,
         text: str,
@@ -167,9 +307,13 @@ class GoogleTTSService:
         """
         Convert text to speech audio in OGG/OPUS format.
 
-        The text is first sanitized (Markdown/emojis removed), then sent
-        to the Google Cloud TTS API via ``asyncio.to_thread`` to avoid
-        blocking the event loop.
+        The text is first sanitized (Markdown/emojis removed) and split on
+        sentence boundaries into chunks of at most ``TTS_CHUNK_MAX_BYTES``.
+        The chunks are sent to the Google Cloud TTS API concurrently (at most
+        ``TTS_MAX_CONCURRENT_CHUNKS`` at a time) through the async gRPC
+        client pool, and the resulting Ogg/Opus streams are joined into one file. Chunks
+        already synthesized with the same voice and audio config are served
+        from ``tts_audio_cache`` without an API call.
 
         Language is auto-detected from the text if not explicitly provided.
 
@@ -183,6 +327,8 @@ class GoogleTTSService:
             HTTPException(400): If text is empty or exceeds the character limit.
             HTTPException(502): If the Google TTS API call fails.
         """
+        from google.api_core.exceptions import GoogleAPIError
+
         if not text or not text.strip():
             raise HTTPException(
                 status_code=400, detail="Text is required for synthesis"
@@ -211,8 +357,10 @@ class GoogleTTSService:
         # Auto-detect language if not provided
         resolved_language = self._detect_language(cleaned_text)
 
-        synthesis_input = texttospeech.SynthesisInput(text=cleaned_text)
         voice = self._build_voice(resolved_language)
+        max_bytes = min(settings.TTS_CHUNK_MAX_BYTES, API_MAX_INPUT_BYTES)
+        chunks = self._split_into_chunks(cleaned_text, max_bytes)
+        semaphore = asyncio.Semaphore(settings.TTS_MAX_CONCURRENT_CHUNKS)
 
         try:
             self.logger.info(
@@ -220,6 +368,7 @@ class GoogleTTSService:
                 extra={
                     "json_fields": {
                         "text_length": len(cleaned_text),
+                        "chunks": len(chunks),
                         "language_code": resolved_language,
                         "voice": voice.name,
                         "encoding": "OGG_OPUS",
@@ -227,14 +376,20 @@ class GoogleTTSService:
                 },
             )
 
-            response = await asyncio.to_thread(
-                self.client.synthesize_speech,
-                input=synthesis_input,
-                voice=voice,
-                audio_config=self.audio_config,
+            # Repeated chunks (e.g. a refrain) are synthesized once
+            unique_chunks = list(dict.fromkeys(chunks))
+            unique_audio = await asyncio.gather(
+                *(
+                    self._synthesize_chunk(chunk, resolved_language, voice, semaphore)
+                    for chunk in unique_chunks
+                )
             )
-
-            audio_bytes: bytes = response.audio_content
+            audio_by_chunk = dict(zip(unique_chunks, unique_audio))
+            audio_chunks = [audio_by_chunk[chunk] for chunk in chunks]
+            if len(audio_chunks) == 1:
+                audio_bytes = audio_chunks[0]
+            else:
+                audio_bytes = await asyncio.to_thread(concat_ogg_opus, audio_chunks)
 
             self.logger.info(
                 "Speech synthesized successfully",
@@ -269,23 +424,11 @@ class GoogleTTSService:
             ) from e
 
 
-# Singleton instance — created lazily on first use to avoid import-time
-# credential errors (e.g., in CI where GOOGLE_APPLICATION_CREDENTIALS is empty).
-_google_tts_service_instance: GoogleTTSService | None = None
-
-
-def google_tts_service() -> GoogleTTSService:
-    """
-    Factory for FastAPI Depends() injection and direct service imports.
-
-    The singleton is created on first call so that importing this module
-    (e.g., during test collection) does not immediately attempt to open
-    the GCP credentials file.
-    """
-    global _google_tts_service_instance
-    if _google_tts_service_instance is None:
-        _google_tts_service_instance = GoogleTTSService()
-    return _google_tts_service_instance
+# Built on first use (or by the startup warm-up) so that importing this
+# module, e.g. during test collection, does not open the credentials file
+google_tts_service = service_registry.register(
+    "google_tts_service", GoogleTTSService, close=GoogleTTSService.close
+)
 
 
 # Convenience alias for direct imports from other backend services
@@ -4,6 +4,7 @@ import httpx
 
 from app.core.config import settings
 from app.services.base import BaseHomeService
+from app.services.registry import service_registry
 
 
 class HomeAssistantService(BaseHomeService):
@@ -63,3 +64,8 @@ class HomeAssistantService(BaseHomeService):
     async def close(self):
         """Close the HTTP client session."""
         await self.client.aclose()
+
+
+home_service = service_registry.register(
+    "home_service", HomeAssistantService, close=HomeAssistantService.close
+)
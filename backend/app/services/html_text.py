@@ -0,0 +1,144 @@
+"""
+Bounded, streaming HTML-to-text extraction for email bodies.
+
+``html_to_text`` walks the document once with the stdlib ``HTMLParser`` and
+stops feeding it as soon as enough visible text has been produced, so a
+300 KB newsletter costs about as much as its first few kilobytes. Output
+follows ``BeautifulSoup.get_text(separator="\\n")`` with blank lines removed:
+every text node becomes one or more stripped, non-empty lines.
+"""
+
+import re
+from html.parser import HTMLParser
+
+# Elements whose content is never visible
+SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+# Elements without an end tag; they never open a scope
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+# Characters fed to the parser per step; bounds the work done past the limit
+FEED_CHUNK_SIZE = 4096
+
+HIDDEN_STYLE_RE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.I)
+
+
+def _is_hidden(tag: str, attrs: list[tuple[str, str | None]]) -> bool:
+    if tag in SKIPPED_TAGS:
+        return True
+    for name, value in attrs:
+        if name == "hidden":
+            return True
+        if name == "style" and value and HIDDEN_STYLE_RE.search(value):
+            return True
+    return False
+
+
+class _TextExtractor(HTMLParser):
+    """Collects visible text lines until ``limit`` characters are reached."""
+
+    def __init__(self, limit: int | None) -> None:
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.lines: list[str] = []
+        self.length = 0
+        self.done = False
+        # Open elements as (tag, hidden); hidden_depth counts hidden entries
+        self._stack: list[tuple[str, bool]] = []
+        self._hidden_depth = 0
+        self._pending: list[str] = []
+
+    def _flush(self) -> None:
+        """Turn the buffered text node into output lines."""
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            self.lines.append(line)
+            # Account for the newline that will join this line to the previous
+            self.length += len(line) + (1 if len(self.lines) > 1 else 0)
+            if self.limit is not None and self.length > self.limit:
+                self.done = True
+                return
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush()
+        if tag in VOID_TAGS:
+            return
+        hidden = _is_hidden(tag, attrs)
+        self._stack.append((tag, hidden))
+        if hidden:
+            self._hidden_depth += 1
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush()
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        # Tolerate unclosed children and stray end tags, like browsers do
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                for _, hidden in self._stack[index:]:
+                    if hidden:
+                        self._hidden_depth -= 1
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        if not self._hidden_depth and not self.done:
+            self._pending.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+
+def html_to_text(html: str, limit: int | None = None) -> str:
+    """
+    Extract visible text from ``html``.
+
+    Skips ``script``/``style``/``noscript``/``template`` content and elements
+    hidden with the ``hidden`` attribute or an inline ``display:none`` /
+    ``visibility:hidden`` style (email preheaders, tracking blocks).
+
+    Args:
+        html: The HTML document
+        limit: Stop once the output is longer than this many characters.
+            The result may exceed ``limit`` by at most one line so callers
+            can still tell that truncation is needed.
+
+    Returns:
+        Text lines joined with newlines
+    """
+    parser = _TextExtractor(limit)
+    for offset in range(0, len(html), FEED_CHUNK_SIZE):
+        parser.feed(html[offset : offset + FEED_CHUNK_SIZE])
+        if parser.done:
+            break
+    else:
+        parser.close()
+    return "\n".join(parser.lines)
@@ -0,0 +1,357 @@
+"""
+Durable background job queue.
+
+Background work (session summaries, chat jobs, knowledge syncs, morning
+digests) is stored in the ``background_job`` table instead of running as
+FastAPI ``BackgroundTasks``, so it survives instance shutdown, is retried
+with exponential backoff, and can be picked up by any instance. Jobs are
+claimed with a visibility timeout: a job whose instance died is claimable
+again once its lock expires.
+
+Handlers are registered per job kind with ``job_handler`` and receive a
+database session from the worker plus the job's JSON payload. A handler
+that raises is retried until ``max_attempts``; handlers must therefore be
+safe to run more than once.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.crud.crud_job import background_job as crud_job
+from app.models.job import BackgroundJob
+from app.schemas.enums import JobStatus
+from app.services.registry import service_registry
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[AsyncSession, dict[str, Any]], Awaitable[None]]
+
+
+class ActiveTurns:
+    """Number of chat turns currently running on this instance."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    @contextmanager
+    def running(self) -> Iterator[None]:
+        self.count += 1
+        try:
+            yield
+        finally:
+            self.count -= 1
+
+
+# Background job kinds yield to running chat turns
+active_turns = ActiveTurns()
+
+
+@dataclass(frozen=True)
+class JobType:
+    kind: str
+    handler: JobHandler
+    # Higher runs first
+    priority: int = 0
+    # Defaults to JOB_MAX_ATTEMPTS
+    max_attempts: int | None = None
+    # Per worker; None for no limit beyond the worker's concurrency
+    max_concurrency: int | None = None
+    # Deferred while chat turns run on this instance, for up to
+    # JOB_BACKGROUND_MAX_DEFER_SEC
+    background: bool = False
+
+
+job_types: dict[str, JobType] = {}
+
+
+def job_handler(
+    kind: str,
+    *,
+    priority: int = 0,
+    max_attempts: int | None = None,
+    max_concurrency: int | None = None,
+    background: bool = False,
+) -> Callable[[JobHandler], JobHandler]:
+    """Register the decorated coroutine as the handler for ``kind`` jobs."""
+
+    def decorator(handler: JobHandler) -> JobHandler:
+        job_types[kind] = JobType(
+            kind=kind,
+            handler=handler,
+            priority=priority,
+            max_attempts=max_attempts,
+            max_concurrency=max_concurrency,
+            background=background,
+        )
+        return handler
+
+    return decorator
+
+
+async def enqueue(
+    db: AsyncSession,
+    kind: str,
+    payload: dict[str, Any],
+    *,
+    delay: float = 0.0,
+    dedupe_key: str | None = None,
+) -> tuple[BackgroundJob, bool]:
+    """
+    Queue a ``kind`` job to run after ``delay`` seconds.
+
+    A queued job with the same ``dedupe_key`` is reused instead: it takes
+    the new payload and is postponed to the new run time if that is later,
+    so repeated requests debounce into one run. Commits ``db``.
+
+    Returns:
+        The job and whether it was newly created
+    """
+    job_type = job_types[kind]
+    job, created = await crud_job.enqueue(
+        db,
+        kind=kind,
+        payload=payload,
+        run_after=datetime.now(timezone.utc) + timedelta(seconds=delay),
+        priority=job_type.priority,
+        max_attempts=job_type.max_attempts or settings.JOB_MAX_ATTEMPTS,
+        dedupe_key=dedupe_key,
+    )
+    if not delay and service_registry.is_created("job_worker"):
+        job_worker().notify()
+    return job, created
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after the ``attempts``-th failed attempt."""
+    seconds = settings.JOB_RETRY_BASE_DELAY_SEC * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.JOB_RETRY_MAX_DELAY_SEC))
+
+
+class JobWorker:
+    """
+    Claims and runs queued jobs on this instance.
+
+    ``start`` runs a polling loop in the background (woken early when this
+    instance enqueues a job); ``drain`` runs due jobs to completion, for
+    the cron endpoint and tests. At most ``concurrency`` jobs run at once.
+    While a job runs its lock is extended periodically, so only jobs of a
+    dead instance become claimable again.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        concurrency: int | None = None,
+    ) -> None:
+        if session_factory is None:
+            from app.db.session import AsyncSessionLocal
+
+            session_factory = AsyncSessionLocal
+        self._session_factory = session_factory
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self._running: dict[int, tuple[BackgroundJob, asyncio.Task[None]]] = {}
+        self._loop_task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._chat_busy_since: float | None = None
+
+    @property
+    def lock_for(self) -> timedelta:
+        return timedelta(seconds=settings.JOB_VISIBILITY_TIMEOUT_SEC)
+
+    def start(self) -> None:
+        if self._loop_task is None:
+            self._wakeup = asyncio.Event()
+            self._loop_task = asyncio.create_task(self._loop())
+
+    def notify(self) -> None:
+        """Poll now instead of at the next interval."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("Job queue poll failed")
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), settings.JOB_POLL_INTERVAL_SEC
+                )
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _defer_background(self) -> bool:
+        if not active_turns.count:
+            self._chat_busy_since = None
+            return False
+        now = time.monotonic()
+        if self._chat_busy_since is None:
+            self._chat_busy_since = now
+        return now - self._chat_busy_since < settings.JOB_BACKGROUND_MAX_DEFER_SEC
+
+    def _claimable_kinds(self) -> list[str]:
+        running = Counter(job.kind for job, _ in self._running.values())
+        defer_background = self._defer_background()
+        return [
+            kind
+            for kind, job_type in job_types.items()
+            if not (defer_background and job_type.background)
+            and (
+                job_type.max_concurrency is None
+                or running[kind] < job_type.max_concurrency
+            )
+        ]
+
+    async def poll(self) -> int:
+        """Claim and start jobs while there are free slots; returns how many."""
+        started = 0
+        while len(self._running) < self.concurrency:
+            kinds = self._claimable_kinds()
+            if not kinds:
+                break
+            # One at a time, so per-kind limits see every started job
+            async with self._session_factory() as db:
+                jobs = await crud_job.claim(
+                    db, limit=1, lock_for=self.lock_for, kinds=kinds
+                )
+            if not jobs:
+                break
+            job = jobs[0]
+            task = asyncio.create_task(self._execute(job))
+            self._running[job.id] = (job, task)
+            task.add_done_callback(lambda _, job_id=job.id: self._running.pop(job_id))
+            started += 1
+        return started
+
+    async def drain(self, timeout: float | None = None) -> int:
+        """
+        Run due jobs until none are left or ``timeout`` seconds pass.
+
+        Returns the number of jobs started; jobs still running at the
+        timeout carry on in the background.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        started = 0
+        while True:
+            started += await self.poll()
+            if not self._running:
+                break
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                break
+            await asyncio.wait(
+                [task for _, task in self._running.values()],
+                timeout=remaining,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        return started
+
+    async def _heartbeat(self, job: BackgroundJob, handler: asyncio.Task) -> None:
+        """
+        Extend the job's lock until the handler finishes. A failed extension
+        is retried on the next beat, as the lock outlives two of them. A job
+        whose lock was lost has been claimed again elsewhere, so its
+        handler is cancelled instead of running twice.
+        """
+        log_fields = {"job_id": job.id, "kind": job.kind, "attempt": job.attempts}
+        while True:
+            await asyncio.sleep(settings.JOB_VISIBILITY_TIMEOUT_SEC / 3)
+            try:
+                async with self._session_factory() as db:
+                    owned = await crud_job.extend_lock(
+                        db, job=job, lock_for=self.lock_for
+                    )
+            except Exception:
+                logger.warning(
+                    "Failed to extend background job lock",
+                    exc_info=True,
+                    extra={"json_fields": log_fields},
+                )
+                continue
+            if not owned:
+                logger.error(
+                    "Background job lost its lock; cancelling it",
+                    extra={"json_fields": log_fields},
+                )
+                handler.cancel()
+                return
+
+    async def _execute(self, job: BackgroundJob) -> None:
+        log_fields = {"job_id": job.id, "kind": job.kind, "attempt": job.attempts}
+        if job.attempts > job.max_attempts:
+            # Every attempt lost its lock, e.g. the instance kept crashing
+            await self._finish(job, error="Lock expired on every attempt")
+            return
+
+        started = time.perf_counter()
+        heartbeat = asyncio.create_task(self._heartbeat(job, asyncio.current_task()))
+        try:
+            async with self._session_factory() as db:
+                await job_types[job.kind].handler(db, job.payload)
+        except asyncio.CancelledError:
+            heartbeat.cancel()
+            async with self._session_factory() as db:
+                await crud_job.release(db, job=job)
+            raise
+        except Exception as e:
+            heartbeat.cancel()
+            logger.warning(
+                "Background job failed",
+                exc_info=True,
+                extra={"json_fields": log_fields},
+            )
+            await self._finish(job, error=f"{type(e).__name__}: {e}")
+            return
+        heartbeat.cancel()
+
+        async with self._session_factory() as db:
+            await crud_job.complete(db, job=job)
+        logger.info(
+            "Background job done",
+            extra={
+                "json_fields": {
+                    **log_fields,
+                    "duration_sec": round(time.perf_counter() - started, 3),
+                }
+            },
+        )
+
+    async def _finish(self, job: BackgroundJob, error: str) -> None:
+        async with self._session_factory() as db:
+            status = await crud_job.retry_or_fail(
+                db, job=job, error=error, delay=retry_delay(job.attempts)
+            )
+        if status == JobStatus.FAILED:
+            logger.error(
+                "Background job ran out of attempts",
+                extra={
+                    "json_fields": {"job_id": job.id, "kind": job.kind, "error": error}
+                },
+            )
+
+    async def close(self) -> None:
+        """Stop polling and hand running jobs back to the queue."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+        tasks = [task for _, task in self._running.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+job_worker = service_registry.register("job_worker", JobWorker, close=JobWorker.close)
@@ -1,30 +1,47 @@
+import asyncio
+import functools
 import io
 import logging
 import os
 import re
 import tempfile
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
-
-import google.auth
-from google.auth.transport.requests import Request
-from google.oauth2 import service_account
-from google import genai
-from google.genai import types
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from app.core.config import settings
+from app.crud.crud_job import background_job as crud_job
+from app.crud.crud_knowledge import knowledge_sync as crud_knowledge_sync
+from app.schemas.enums import JobStatus
+from app.schemas.knowledge import KnowledgeSyncState, KnowledgeSyncStatus
+from app.services.job_queue import job_handler
+from app.services.registry import service_registry
+
+if TYPE_CHECKING:
+    from google import genai
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class KnowledgeService:
     """Service for managing the RAG knowledge base using Gemini File Search API."""
 
+    def __init__(self) -> None:
+        self._store_name: str | None = None
+        self._drive_executor: ThreadPoolExecutor | None = None
+        self._sync_locks: dict[str, asyncio.Lock] = {}
+        self._sync_status: dict[str, KnowledgeSyncStatus] = {}
+
     def _build_drive_service(self) -> Any:
         """Build Google Drive API service using ADC or service account key."""
+        import google.auth
+        from google.auth.transport.requests import Request
+        from google.oauth2 import service_account
+        from googleapiclient.discovery import build
+
         if settings.GOOGLE_APPLICATION_CREDENTIALS and os.path.isfile(
             settings.GOOGLE_APPLICATION_CREDENTIALS
         ):
@@ -65,6 +82,8 @@ class KnowledgeService:
         self, service: Any, file_id: str, file_name: str, mime_type: str
     ) -> tuple[bytes, str] | None:
         """Download a single file's bytes from Google Drive."""
+        from googleapiclient.http import MediaIoBaseDownload
+
         try:
             # If it's a Google Doc, export it as PDF
             if mime_type.startswith("application/vnd.google-apps."):
@@ -113,42 +132,227 @@ class KnowledgeService:
         except ValueError:
             return datetime.min.replace(tzinfo=timezone.utc)
 
-    def _get_or_create_store(self, client: genai.Client) -> Any:
-        """Get the File Search Store by name, or create it if not found."""
-        if hasattr(self, "_store_name") and self._store_name:
-            # Create a mock object or just return if we already have it.
-            # But wait, we need an object with a .name property.
-            class StoreMock:
-                name = self._store_name
+    def _get_drive_executor(self) -> ThreadPoolExecutor:
+        """Return the bounded executor reserved for blocking Drive client calls."""
+        if self._drive_executor is None:
+            self._drive_executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.KNOWLEDGE_SYNC_DRIVE_WORKERS),
+                thread_name_prefix="knowledge-drive",
+            )
+        return self._drive_executor
 
-            return StoreMock()
+    async def _run_drive(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking Drive call in the dedicated executor.
 
-        store_display_name = getattr(
-            settings, "FILE_SEARCH_STORE_DISPLAY_NAME", "vesta-knowledge-base"
+        The googleapiclient Drive client is synchronous. Running it in its own
+        small pool (instead of the default executor / Starlette threadpool)
+        keeps a long sync from eating into request-handling capacity.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_drive_executor(), functools.partial(func, *args)
         )
-        for store in client.file_search_stores.list():
+
+    @staticmethod
+    def _write_temp_file(file_bytes: bytes, suffix: str) -> str:
+        """Write downloaded bytes to a named temp file and return its path."""
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            tmp.write(file_bytes)
+            return tmp.name
+
+    async def _get_or_create_store(self, client: "genai.Client") -> str:
+        """Return the File Search Store name, creating the store if not found."""
+        if self._store_name:
+            return self._store_name
+
+        store_display_name = settings.FILE_SEARCH_STORE_DISPLAY_NAME
+        async for store in await client.aio.file_search_stores.list():
             if store.display_name == store_display_name:
                 self._store_name = store.name
-                return store
+                return store.name
 
         logger.info(f"Creating new File Search Store: {store_display_name}")
-        new_store = client.file_search_stores.create(
+        new_store = await client.aio.file_search_stores.create(
             config={"display_name": store_display_name}
         )
         self._store_name = new_store.name
-        return new_store
+        return new_store.name
+
+    def _get_sync_lock(self, store: str) -> asyncio.Lock:
+        lock = self._sync_locks.get(store)
+        if lock is None:
+            lock = self._sync_locks[store] = asyncio.Lock()
+        return lock
+
+    async def get_sync_status(self, db: "AsyncSession") -> KnowledgeSyncStatus:
+        """
+        Return the status of the latest sync for the configured store.
+
+        Read from the database, so every instance reports the same status: a
+        queued or running ``knowledge_sync`` job takes precedence over the
+        recorded outcome of the last sync.
+        """
+        store = settings.FILE_SEARCH_STORE_DISPLAY_NAME
+        record = await crud_knowledge_sync.get_by_store(db, store=store)
+        status = (
+            KnowledgeSyncStatus.model_validate(record, from_attributes=True)
+            if record is not None
+            else KnowledgeSyncStatus(store=store)
+        )
+        # The newest job of each status
+        jobs = {
+            job.status: job
+            for job in await crud_job.get_by_dedupe_key(db, dedupe_key="knowledge_sync")
+        }
+
+        if (job := jobs.get(JobStatus.RUNNING)) is not None:
+            if status.state != KnowledgeSyncState.RUNNING:
+                status = KnowledgeSyncStatus(
+                    store=store, state=KnowledgeSyncState.RUNNING
+                )
+            status.attempts = job.attempts
+        elif (job := jobs.get(JobStatus.QUEUED)) is not None:
+            # A requeued job carries the error of its previous attempt
+            status = KnowledgeSyncStatus(
+                store=store,
+                state=KnowledgeSyncState.QUEUED,
+                attempts=job.attempts,
+                error=job.last_error,
+            )
+        elif status.state == KnowledgeSyncState.RUNNING or (
+            record is None and JobStatus.FAILED in jobs
+        ):
+            # No job is left to run it: the last attempt failed or was cut off
+            job = jobs.get(JobStatus.FAILED)
+            status.state = KnowledgeSyncState.FAILED
+            if job is not None:
+                status.attempts = job.attempts
+                status.error = job.last_error
+            else:
+                status.error = "Sync was interrupted"
+        return status
+
+    async def _upload_drive_file(
+        self,
+        genai_client: "genai.Client",
+        drive_service: Any,
+        store_name: str,
+        file_id: str,
+        d_file: dict[str, Any],
+    ) -> bool:
+        """Download a Drive file and upload it to the File Search Store."""
+        file_name = d_file["name"]
+        logger.info(f"Downloading {file_name} from Drive...")
+        download_res = await self._run_drive(
+            self._download_single_file,
+            drive_service,
+            file_id,
+            file_name,
+            d_file["mimeType"],
+        )
+        if not download_res:
+            return False
+        file_bytes, effective_file_name = download_res
+
+        ext = os.path.splitext(effective_file_name)[1]
+        tmp_path = await self._run_drive(self._write_temp_file, file_bytes, ext)
 
-    def sync_with_drive(self) -> None:
+        try:
+            logger.info(f"Uploading {effective_file_name} to File Search Store...")
+            display_name = f"{effective_file_name} [{file_id}]"
+
+            operation = (
+                await genai_client.aio.file_search_stores.upload_to_file_search_store(
+                    file=tmp_path,
+                    file_search_store_name=store_name,
+                    config={"display_name": display_name},
+                )
+            )
+
+            # Poll until complete without holding a thread
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + settings.KNOWLEDGE_SYNC_UPLOAD_TIMEOUT_SEC
+            while not getattr(operation, "done", True):
+                if loop.time() > deadline:
+                    raise TimeoutError("Upload operation timed out")
+                await asyncio.sleep(settings.KNOWLEDGE_SYNC_POLL_INTERVAL_SEC)
+                operation = await genai_client.aio.operations.get(operation)
+
+            if getattr(operation, "error", None):
+                raise Exception(f"Upload operation failed: {operation.error}")
+
+            logger.info(f"Successfully processed and indexed {effective_file_name}")
+            return True
+        except Exception as e:
+            logger.error(
+                f"Failed to upload {effective_file_name}: {e}",
+                exc_info=True,
+            )
+            return False
+        finally:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    async def sync_with_drive(
+        self, db: "AsyncSession | None" = None
+    ) -> KnowledgeSyncStatus:
         """
         Incrementally sync files from Drive to Gemini File Search Store.
-        This is typically called by a background cron job.
+
+        Runs as a ``knowledge_sync`` job on the job queue, on the event loop:
+        Gemini calls use ``genai_client.aio`` and Drive calls go through a
+        dedicated bounded executor. If a sync for the store
+        is already in progress, this returns its status without starting
+        another one. With ``db``, the status is recorded when the sync starts
+        and when it finishes, for ``get_sync_status``.
         """
+        store_display_name = settings.FILE_SEARCH_STORE_DISPLAY_NAME
+        lock = self._get_sync_lock(store_display_name)
+        if lock.locked():
+            logger.info("Drive sync already in progress, skipping.")
+            return self._sync_status[store_display_name].model_copy()
+
+        async with lock:
+            status = KnowledgeSyncStatus(
+                store=store_display_name,
+                state=KnowledgeSyncState.RUNNING,
+                started_at=datetime.now(timezone.utc),
+            )
+            self._sync_status[store_display_name] = status
+            if db is not None:
+                await crud_knowledge_sync.save(db, status=status)
+            try:
+                await self._sync_with_drive(status)
+                status.state = KnowledgeSyncState.SUCCEEDED
+            except Exception as e:
+                status.state = KnowledgeSyncState.FAILED
+                status.error = str(e)
+                logger.error(
+                    "Drive sync failed",
+                    extra={
+                        "json_fields": {
+                            "event": "knowledge_sync_error",
+                            "error": str(e),
+                        }
+                    },
+                    exc_info=True,
+                )
+            finally:
+                status.finished_at = datetime.now(timezone.utc)
+            if db is not None:
+                await crud_knowledge_sync.save(db, status=status)
+            return status.model_copy()
+
+    async def _sync_with_drive(self, status: KnowledgeSyncStatus) -> None:
+        from google import genai
+
         if not settings.GOOGLE_DRIVE_FOLDER_ID:
-            logger.error("GOOGLE_DRIVE_FOLDER_ID is not set.")
-            return
+            raise ValueError("GOOGLE_DRIVE_FOLDER_ID is not set.")
         if not settings.GOOGLE_API_KEY:
-            logger.error("GOOGLE_API_KEY is not set.")
-            return
+            raise ValueError("GOOGLE_API_KEY is not set.")
 
         logger.info(
             "Starting Drive sync",
@@ -160,136 +364,82 @@ class KnowledgeService:
             },
         )
 
-        try:
-            drive_service = self._build_drive_service()
-            genai_client = genai.Client(api_key=settings.GOOGLE_API_KEY)
-
-            store = self._get_or_create_store(genai_client)
-
-            # Get Drive files
-            drive_files = self._list_drive_files(drive_service)
-            drive_files_dict = {
-                f["id"]: f
-                for f in drive_files
-                if f["mimeType"] != "application/vnd.google-apps.folder"
-            }
-
-            # Get Gemini files
-            gemini_files = list(genai_client.files.list())
-
-            # Match Gemini files to Drive files via display_name format "filename [drive_id]"
-            pattern = re.compile(r"^(.*) \[(.*)\]$")
-            gemini_files_by_drive_id = {}
-            for g_file in gemini_files:
-                if not g_file.display_name:
+        drive_service = await self._run_drive(self._build_drive_service)
+        genai_client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+
+        store_name = await self._get_or_create_store(genai_client)
+
+        # Get Drive files
+        drive_files = await self._run_drive(self._list_drive_files, drive_service)
+        drive_files_dict = {
+            f["id"]: f
+            for f in drive_files
+            if f["mimeType"] != "application/vnd.google-apps.folder"
+        }
+
+        # Get Gemini files
+        gemini_files = [f async for f in await genai_client.aio.files.list()]
+
+        # Match Gemini files to Drive files via display_name format "filename [drive_id]"
+        pattern = re.compile(r"^(.*) \[(.*)\]$")
+        gemini_files_by_drive_id = {}
+        for g_file in gemini_files:
+            if not g_file.display_name:
+                continue
+            match = pattern.match(g_file.display_name)
+            if match:
+                drive_id = match.group(2)
+                gemini_files_by_drive_id[drive_id] = g_file
+
+        # 1. Delete files from Gemini that are no longer on Drive
+        for drive_id, g_file in gemini_files_by_drive_id.items():
+            if drive_id not in drive_files_dict:
+                logger.info(f"Deleting removed file from Gemini: {g_file.display_name}")
+                await genai_client.aio.files.delete(name=g_file.name)
+                status.deleted_count += 1
+
+        # 2. Upload new or modified files
+        for file_id, d_file in drive_files_dict.items():
+            d_mod_time = self._parse_time(d_file.get("modifiedTime", ""))
+
+            g_file = gemini_files_by_drive_id.get(file_id)
+            if g_file:
+                g_update_time = self._parse_time(getattr(g_file, "update_time", ""))
+                if d_mod_time <= g_update_time:
                     continue
-                match = pattern.match(g_file.display_name)
-                if match:
-                    drive_id = match.group(2)
-                    gemini_files_by_drive_id[drive_id] = g_file
-
-            # 1. Delete files from Gemini that are no longer on Drive
-            for drive_id, g_file in gemini_files_by_drive_id.items():
-                if drive_id not in drive_files_dict:
-                    logger.info(
-                        f"Deleting removed file from Gemini: {g_file.display_name}"
-                    )
-                    genai_client.files.delete(name=g_file.name)
-
-            # 2. Upload new or modified files
-            uploaded_count = 0
-            for file_id, d_file in drive_files_dict.items():
-                file_name = d_file["name"]
-                mime_type = d_file["mimeType"]
-                d_mod_time = self._parse_time(d_file.get("modifiedTime", ""))
+                logger.info(f"File modified on Drive, updating: {d_file['name']}")
+                await genai_client.aio.files.delete(name=g_file.name)
 
-                g_file = gemini_files_by_drive_id.get(file_id)
-                needs_upload = False
-
-                if not g_file:
-                    needs_upload = True
-                else:
-                    g_update_time = self._parse_time(getattr(g_file, "update_time", ""))
-                    # Add a small buffer since Gemini update time might differ slightly
-                    if d_mod_time > g_update_time:
-                        logger.info(f"File modified on Drive, updating: {file_name}")
-                        genai_client.files.delete(name=g_file.name)
-                        needs_upload = True
-
-                if needs_upload:
-                    logger.info(f"Downloading {file_name} from Drive...")
-                    download_res = self._download_single_file(
-                        drive_service, file_id, file_name, mime_type
-                    )
-                    if not download_res:
-                        continue
-                    file_bytes, effective_file_name = download_res
-
-                    # Create temp file and upload
-                    ext = os.path.splitext(effective_file_name)[1]
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-                        tmp.write(file_bytes)
-                        tmp_path = tmp.name
-
-                    try:
-                        logger.info(
-                            f"Uploading {effective_file_name} to File Search Store..."
-                        )
-                        display_name = f"{effective_file_name} [{file_id}]"
-
-                        # Upload directly to the store
-                        operation = (
-                            genai_client.file_search_stores.upload_to_file_search_store(
-                                file=tmp_path,
-                                file_search_store_name=store.name,
-                                config={"display_name": display_name},
-                            )
-                        )
-
-                        # Poll until complete
-                        deadline = time.time() + 300  # 5 minutes
-                        while not getattr(operation, "done", True):
-                            if time.time() > deadline:
-                                raise TimeoutError("Upload operation timed out")
-                            time.sleep(3)
-                            operation = genai_client.operations.get(operation=operation)
-
-                        if getattr(operation, "error", None):
-                            raise Exception(
-                                f"Upload operation failed: {operation.error}"
-                            )
+            if await self._upload_drive_file(
+                genai_client, drive_service, store_name, file_id, d_file
+            ):
+                status.uploaded_count += 1
+            else:
+                status.failed_count += 1
 
-                        uploaded_count += 1
-                        logger.info(
-                            f"Successfully processed and indexed {effective_file_name}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to upload {effective_file_name}: {e}",
-                            exc_info=True,
-                        )
-                    finally:
-                        try:
-                            os.unlink(tmp_path)
-                        except OSError:
-                            pass
-
-            logger.info(
-                f"Drive sync complete. Uploaded/updated {uploaded_count} files.",
-                extra={"json_fields": {"event": "knowledge_sync_done"}},
-            )
+        logger.info(
+            f"Drive sync complete. Uploaded/updated {status.uploaded_count} files.",
+            extra={
+                "json_fields": {
+                    "event": "knowledge_sync_done",
+                    "uploaded": status.uploaded_count,
+                    "deleted": status.deleted_count,
+                    "failed": status.failed_count,
+                }
+            },
+        )
 
-        except Exception as e:
-            logger.error(
-                "Drive sync failed",
-                extra={
-                    "json_fields": {"event": "knowledge_sync_error", "error": str(e)}
-                },
-                exc_info=True,
-            )
+    def close(self) -> None:
+        """Shut down the Drive executor without waiting for queued work."""
+        if self._drive_executor is not None:
+            self._drive_executor.shutdown(wait=False, cancel_futures=True)
+            self._drive_executor = None
 
     async def query(self, text: str) -> str:
         """Query the Gemini File Search API directly for an answer."""
+        from google import genai
+        from google.genai import types
+
         if not settings.GOOGLE_API_KEY:
             raise ValueError("GOOGLE_API_KEY is not set.")
         if not settings.GOOGLE_MODEL_NAME:
@@ -297,7 +447,7 @@ class KnowledgeService:
 
         try:
             client = genai.Client(api_key=settings.GOOGLE_API_KEY)
-            store = self._get_or_create_store(client)
+            store_name = await self._get_or_create_store(client)
 
             logger.debug(
                 "RAG retrieval via Gemini File Search",
@@ -305,7 +455,7 @@ class KnowledgeService:
                     "json_fields": {
                         "event": "rag_retrieval",
                         "query": text,
-                        "store_name": store.name,
+                        "store_name": store_name,
                     }
                 },
             )
@@ -327,7 +477,7 @@ class KnowledgeService:
                     tools=[
                         types.Tool(
                             file_search=types.FileSearch(
-                                file_search_store_names=[store.name]
+                                file_search_store_names=[store_name]
                             )
                         )
                     ]
@@ -350,8 +500,14 @@ class KnowledgeService:
             return "I couldn't search the knowledge base right now."
 
 
-knowledge_service_instance = KnowledgeService()
+knowledge_service = service_registry.register(
+    "knowledge_service", KnowledgeService, close=KnowledgeService.close
+)
 
 
-def knowledge_service() -> KnowledgeService:
-    return knowledge_service_instance
+@job_handler("knowledge_sync", max_attempts=3)
+async def _run_knowledge_sync_job(db: "AsyncSession", payload: dict[str, Any]) -> None:
+    knowledge = await knowledge_service.aget()
+    status = await knowledge.sync_with_drive(db)
+    if status.state == KnowledgeSyncState.FAILED:
+        raise RuntimeError(f"Drive sync failed: {status.error}")
@@ -3,8 +3,6 @@ import logging
 from typing import TYPE_CHECKING
 
 import pytz
-from google import genai
-from google.genai import types
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -14,6 +12,8 @@ from app.services.knowledge import KnowledgeService
 from app.services.open_meteo_service import OpenMeteoService
 
 if TYPE_CHECKING:
+    from google.genai import types
+
     from app.models.chat import ChatHistory
 
 logger = logging.getLogger(__name__)
@@ -34,6 +34,8 @@ class LLMService:
         if not settings.GOOGLE_MODEL_NAME:
             raise ValueError("GOOGLE_MODEL_NAME is not set")
 
+        from google import genai
+
         self.client = genai.Client(api_key=settings.GOOGLE_API_KEY)
         self.model = settings.GOOGLE_MODEL_NAME
 
@@ -260,6 +262,8 @@ class LLMService:
                 )
                 return f"Unable to create calendar event. Error: {str(e)}"
 
+        from google.genai import types
+
         try:
             mapped_history = self._map_history_to_gemini(history_records)
 
@@ -308,7 +312,7 @@ class LLMService:
         self,
         tools: list,
         session_summary: str | None = None,
-    ) -> types.GenerateContentConfig:
+    ) -> "types.GenerateContentConfig":
         """
         Build GenerateContentConfig with dynamic tools and system instruction.
 
@@ -319,6 +323,8 @@ class LLMService:
         Returns:
             GenerateContentConfig with automatic function calling enabled
         """
+        from google.genai import types
+
         tz = pytz.timezone("Europe/Kiev")
         now = datetime.datetime.now(tz)
         current_time_str = now.strftime("%Y-%m-%d %H:%M (%A)")
@@ -350,7 +356,7 @@ class LLMService:
 
     def _map_history_to_gemini(
         self, history_records: list["ChatHistory"]
-    ) -> list[types.Content]:
+    ) -> list["types.Content"]:
         """
         Convert DB chat history to Gemini Content format.
 
@@ -364,6 +370,8 @@ class LLMService:
         Returns:
             List of Gemini Content objects
         """
+        from google.genai import types
+
         mapped_history = []
         for record in history_records:
             mapped_history.append(
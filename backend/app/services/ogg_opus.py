@@ -0,0 +1,160 @@
+"""Minimal Ogg page reader/writer for joining Ogg/Opus streams."""
+
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+CAPTURE_PATTERN = b"OggS"
+# Capture pattern, version, header type, granule, serial, sequence, CRC, segments
+_HEADER = struct.Struct("<4sBBqIIIB")
+
+FLAG_CONTINUED = 0x01
+FLAG_BOS = 0x02
+FLAG_EOS = 0x04
+
+# Identification (OpusHead) and comment (OpusTags) packets
+OPUS_HEADER_PACKETS = 2
+NO_GRANULE = -1
+
+
+def _crc_table() -> list[int]:
+    table = []
+    for byte in range(256):
+        crc = byte << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else crc << 1
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+
+_CRC_TABLE = _crc_table()
+
+
+def ogg_crc(data: bytes) -> int:
+    """Ogg's CRC-32 (polynomial 0x04C11DB7, unreflected, zero init)."""
+    crc = 0
+    table = _CRC_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ table[(crc >> 24) ^ byte]
+    return crc
+
+
+@dataclass
+class OggPage:
+    header_type: int
+    granule: int
+    serial: int
+    sequence: int
+    segments: bytes
+    body: bytes
+
+    @property
+    def completed_packets(self) -> int:
+        """Number of packets that end on this page (lacing value < 255)."""
+        return sum(1 for lacing in self.segments if lacing < 255)
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(
+            CAPTURE_PATTERN,
+            0,
+            self.header_type,
+            self.granule,
+            self.serial,
+            self.sequence,
+            0,
+            len(self.segments),
+        )
+        page = bytearray(header + self.segments + self.body)
+        struct.pack_into("<I", page, 22, ogg_crc(page))
+        return bytes(page)
+
+
+def iter_pages(data: bytes) -> Iterator[OggPage]:
+    """
+    Parse an Ogg stream into pages.
+
+    Raises:
+        ValueError: If the data is not a well-formed Ogg stream
+    """
+    offset = 0
+    while offset < len(data):
+        if len(data) - offset < _HEADER.size:
+            raise ValueError("Truncated Ogg page header")
+        (
+            pattern,
+            version,
+            header_type,
+            granule,
+            serial,
+            sequence,
+            _crc,
+            segment_count,
+        ) = _HEADER.unpack_from(data, offset)
+        if pattern != CAPTURE_PATTERN or version != 0:
+            raise ValueError(f"No Ogg page at offset {offset}")
+        offset += _HEADER.size
+        segments = data[offset : offset + segment_count]
+        offset += segment_count
+        body_length = sum(segments)
+        body = data[offset : offset + body_length]
+        if len(segments) != segment_count or len(body) != body_length:
+            raise ValueError("Truncated Ogg page")
+        offset += body_length
+        yield OggPage(header_type, granule, serial, sequence, segments, body)
+
+
+def concat_ogg_opus(streams: list[bytes]) -> bytes:
+    """
+    Join Ogg/Opus files into a single logical stream.
+
+    The headers of the first stream are kept; the header pages of later
+    streams are dropped and their audio pages are renumbered into the first
+    stream's serial number, with granule positions shifted by the audio
+    already written. All streams must share the channel count and sample
+    rate, as they do when they come from the same TTS voice and audio
+    config. Each later stream adds its encoder pre-skip (a few ms of
+    silence) at the joint.
+
+    Raises:
+        ValueError: If a stream is not valid Ogg
+    """
+    if len(streams) == 1:
+        return streams[0]
+
+    output = bytearray()
+    serial = 0
+    sequence = 0
+    granule_offset = 0
+    last_page: OggPage | None = None
+
+    for index, stream in enumerate(streams):
+        packets_seen = 0
+        stream_granule = 0
+        for page in iter_pages(stream):
+            is_header = packets_seen < OPUS_HEADER_PACKETS
+            packets_seen += page.completed_packets
+            if index == 0 and sequence == 0:
+                serial = page.serial
+            elif index > 0 and is_header:
+                continue
+
+            header_type = page.header_type & ~FLAG_EOS
+            if sequence > 0:
+                header_type &= ~FLAG_BOS
+            granule = page.granule
+            if granule != NO_GRANULE and not is_header:
+                stream_granule = granule
+                granule += granule_offset
+
+            if last_page is not None:
+                output += last_page.to_bytes()
+            last_page = OggPage(
+                header_type, granule, serial, sequence, page.segments, page.body
+            )
+            sequence += 1
+        granule_offset += stream_granule
+
+    if last_page is not None:
+        last_page.header_type |= FLAG_EOS
+        output += last_page.to_bytes()
+    return bytes(output)
@@ -4,6 +4,7 @@ import httpx
 from fastapi import HTTPException
 
 from app.schemas.open_meteo import DailyForecast, OpenMeteoResponse
+from app.services.registry import service_registry
 
 logger = logging.getLogger(__name__)
 
@@ -186,8 +187,6 @@ class OpenMeteoService:
         await self.client.aclose()
 
 
-open_meteo_service_instance = OpenMeteoService()
-
-
-def open_meteo_service() -> OpenMeteoService:
-    return open_meteo_service_instance
+open_meteo_service = service_registry.register(
+    "open_meteo_service", OpenMeteoService, close=OpenMeteoService.close
+)
@@ -0,0 +1,152 @@
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
+
+@dataclass
+class _Entry:
+    factory: Callable[[], Any]
+    close: Callable[[Any], Awaitable[None] | None] | None
+    # Held while the service is built, so only users of this service wait
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ServiceGetter(Protocol[T_co]):
+    """Returned by ``ServiceRegistry.register``."""
+
+    __name__: str
+
+    def __call__(self) -> T_co: ...
+
+    async def aget(self) -> T_co: ...
+
+
+class ServiceRegistry:
+    """
+    Lazily created service singletons.
+
+    Modules register a factory instead of instantiating their service at
+    import time, so importing the app opens no HTTP clients and loads no
+    credentials. Each service is built on first use, or ahead of time by
+    ``warm_up`` running in the background after startup. Build times are
+    kept in ``timings`` (seconds) for the startup benchmark.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _Entry] = {}
+        self._instances: dict[str, Any] = {}
+        self.timings: dict[str, float] = {}
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], T],
+        close: Callable[[T], Awaitable[None] | None] | None = None,
+    ) -> ServiceGetter[T]:
+        """
+        Register ``factory`` under ``name``.
+
+        Returns a getter that builds the service on first call and returns
+        the same instance afterwards; it doubles as a FastAPI dependency,
+        which FastAPI calls in its threadpool. Coroutines await
+        ``getter.aget()`` instead, so the event loop never waits for a
+        build.
+        """
+        self._entries[name] = _Entry(factory, close)
+
+        def get() -> T:
+            return self.get(name)
+
+        async def aget() -> T:
+            return await self.aget(name)
+
+        get.__name__ = name
+        get.aget = aget
+        return get
+
+    def get(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        entry = self._entries[name]
+        with entry.lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                started = time.perf_counter()
+                instance = entry.factory()
+                self.timings[name] = time.perf_counter() - started
+                self._instances[name] = instance
+        return instance
+
+    async def aget(self, name: str) -> Any:
+        """
+        ``get`` for coroutines: a service that is not built yet is built,
+        or waited for, in a worker thread.
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        return await asyncio.to_thread(self.get, name)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._entries)
+
+    def is_created(self, name: str) -> bool:
+        return name in self._instances
+
+    async def warm_up(self, names: list[str] | None = None) -> dict[str, float]:
+        """
+        Build the named services (default: all) off the event loop.
+
+        Failures are logged and left for the first real use to report.
+        Returns the build time of every service that is now created.
+        """
+        for name in names or self.names:
+            if self.is_created(name):
+                continue
+            try:
+                await self.aget(name)
+            except Exception:
+                logger.warning(
+                    "Service warm-up failed",
+                    exc_info=True,
+                    extra={"json_fields": {"service": name}},
+                )
+        logger.info(
+            "Service warm-up finished",
+            extra={"json_fields": {"timings": self.timings}},
+        )
+        return dict(self.timings)
+
+    async def close_all(self) -> None:
+        """Close every created service and forget it."""
+        instances, self._instances = self._instances, {}
+        for name, instance in instances.items():
+            close = self._entries[name].close
+            if close is None:
+                continue
+            try:
+                result = close(instance)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.warning(
+                    "Service close failed",
+                    exc_info=True,
+                    extra={"json_fields": {"service": name}},
+                )
+        self.timings.clear()
+
+
+service_registry = ServiceRegistry()
@@ -0,0 +1,136 @@
+import logging
+import re
+
+import httpx
+
+from app.core.config import settings
+from app.services.registry import service_registry
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_API_URL = "https://api.telegram.org"
+# Telegram rejects longer sendMessage texts
+MESSAGE_MAX_LENGTH = 4096
+
+_TAG = re.compile(r"<(/?)([a-zA-Z][\w-]*)[^>]*>")
+# Longest entity worth keeping whole, e.g. ``&#128512;``
+_ENTITY_MAX_LENGTH = 10
+
+
+def _cut_position(text: str, budget: int) -> int:
+    """
+    Where to end a chunk of at most ``budget`` characters: after a paragraph
+    break, a newline or a space if one falls in the second half, but never
+    inside a tag or an entity.
+    """
+    cut = budget
+    for separator in ("\n\n", "\n", " "):
+        position = text.rfind(separator, 0, budget)
+        if position >= budget // 2:
+            cut = position + len(separator)
+            break
+
+    tag_start = text.rfind("<", 0, cut)
+    if tag_start > text.rfind(">", 0, cut):
+        cut = tag_start
+    entity_start = text.rfind("&", 0, cut)
+    if entity_start != -1 and ";" not in text[entity_start:cut]:
+        entity_end = text.find(";", entity_start)
+        if entity_end != -1 and entity_end - entity_start <= _ENTITY_MAX_LENGTH:
+            cut = entity_start
+    # A single tag longer than the budget cannot be kept whole
+    return cut or budget
+
+
+def _open_tags(html: str) -> list[tuple[str, str]]:
+    """The tags still open at the end of ``html``, as (name, opening tag)."""
+    stack: list[tuple[str, str]] = []
+    for match in _TAG.finditer(html):
+        closing, name = match.group(1), match.group(2).lower()
+        if not closing:
+            stack.append((name, match.group(0)))
+            continue
+        for index in range(len(stack) - 1, -1, -1):
+            if stack[index][0] == name:
+                del stack[index:]
+                break
+    return stack
+
+
+def split_html_message(text: str, limit: int = MESSAGE_MAX_LENGTH) -> list[str]:
+    """
+    Split Telegram HTML into messages of at most ``limit`` characters.
+
+    Cuts fall on paragraph breaks, then newlines, then spaces, and never
+    inside a tag or an entity. Tags open at a cut are closed at the end of
+    the chunk and reopened at the start of the next, so every chunk parses
+    on its own.
+    """
+    chunks: list[str] = []
+    reopen = ""
+    while text:
+        if len(reopen) + len(text) <= limit:
+            chunks.append(reopen + text)
+            break
+        budget = limit - len(reopen)
+        while True:
+            cut = _cut_position(text, budget)
+            open_tags = _open_tags(reopen + text[:cut])
+            close = "".join(f"</{name}>" for name, _ in reversed(open_tags))
+            if len(reopen) + cut + len(close) <= limit or budget <= 1:
+                break
+            budget = limit - len(reopen) - len(close)
+        chunks.append(reopen + text[:cut] + close)
+        reopen = "".join(tag for _, tag in open_tags)
+        text = text[cut:]
+    return chunks
+
+
+class TelegramClient:
+    """Minimal Telegram Bot API client for pushing replies to users."""
+
+    def __init__(self, token: str | None = None, timeout: float = 30.0):
+        token = token or settings.TELEGRAM_BOT_TOKEN
+        self._client = httpx.AsyncClient(
+            base_url=f"{TELEGRAM_API_URL}/bot{token}", timeout=timeout
+        )
+
+    async def send_message(self, chat_id: int, text: str) -> None:
+        """
+        Send ``text`` as HTML, split into Telegram-sized messages (see
+        ``split_html_message``).
+
+        A chunk Telegram cannot parse as HTML (the model left a tag unclosed)
+        is resent as plain text rather than dropped.
+        """
+        for chunk in split_html_message(text):
+            response = await self._client.post(
+                "/sendMessage",
+                data={"chat_id": chat_id, "text": chunk, "parse_mode": "HTML"},
+            )
+            if response.status_code == httpx.codes.BAD_REQUEST:
+                logger.warning(
+                    "Telegram rejected HTML message; resending as plain text",
+                    extra={"json_fields": {"chat_id": chat_id}},
+                )
+                response = await self._client.post(
+                    "/sendMessage", data={"chat_id": chat_id, "text": chunk}
+                )
+            response.raise_for_status()
+
+    async def send_voice(self, chat_id: int, audio: bytes) -> None:
+        """Send Ogg/Opus ``audio`` as a voice message."""
+        response = await self._client.post(
+            "/sendVoice",
+            data={"chat_id": chat_id},
+            files={"voice": ("speech.ogg", audio, "audio/ogg")},
+        )
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+telegram_client = service_registry.register(
+    "telegram_client", TelegramClient, close=TelegramClient.close
+)
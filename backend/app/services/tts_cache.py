@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+AUDIO_SUFFIX = ".ogg"
+
+
+def make_cache_key(
+    text: str, language_code: str, voice_name: str, audio_config: str
+) -> str:
+    """sha256 over everything that determines the synthesized audio."""
+    payload = json.dumps(
+        [text, language_code, voice_name, audio_config], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class TTSCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        hits = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+class TTSAudioCache:
+    """
+    Two-tier cache of synthesized audio keyed by ``make_cache_key``.
+
+    Recently used clips live in an in-memory LRU bounded by
+    ``TTS_CACHE_MEMORY_MAX_BYTES``. If ``TTS_CACHE_DIR`` is set, every clip
+    is also written there (one file per key), which survives restarts of the
+    process and is trimmed least-recently-used first once it exceeds
+    ``TTS_CACHE_DISK_MAX_BYTES``; by default the cache is in memory only.
+    Disk errors are logged and treated as misses; the cache never fails a
+    synthesis.
+    """
+
+    def __init__(self) -> None:
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        # key -> file size, least recently used first
+        self._disk: OrderedDict[str, int] | None = None
+        self._disk_bytes = 0
+        # Disk reads and writes run in worker threads
+        self._disk_lock = threading.Lock()
+        self.stats = TTSCacheStats()
+
+    @staticmethod
+    def _disk_dir() -> Path | None:
+        return Path(settings.TTS_CACHE_DIR) if settings.TTS_CACHE_DIR else None
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        if len(audio) > settings.TTS_CACHE_MEMORY_MAX_BYTES:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > settings.TTS_CACHE_MEMORY_MAX_BYTES:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _load_disk_index(self, directory: Path) -> OrderedDict[str, int]:
+        """Index existing files, oldest modification first."""
+        if self._disk is not None:
+            return self._disk
+        directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in directory.glob(f"*{AUDIO_SUFFIX}"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        entries.sort()
+        self._disk = OrderedDict((key, size) for _, key, size in entries)
+        self._disk_bytes = sum(self._disk.values())
+        return self._disk
+
+    def _read_disk(self, key: str) -> bytes | None:
+        directory = self._disk_dir()
+        if directory is None:
+            return None
+        with self._disk_lock:
+            index = self._load_disk_index(directory)
+            if key not in index:
+                return None
+            try:
+                audio = (directory / f"{key}{AUDIO_SUFFIX}").read_bytes()
+            except FileNotFoundError:
+                self._disk_bytes -= index.pop(key)
+                return None
+            index.move_to_end(key)
+            return audio
+
+    def _write_disk(self, key: str, audio: bytes) -> None:
+        directory = self._disk_dir()
+        if directory is None or len(audio) > settings.TTS_CACHE_DISK_MAX_BYTES:
+            return
+        with self._disk_lock:
+            index = self._load_disk_index(directory)
+            path = directory / f"{key}{AUDIO_SUFFIX}"
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, path)
+
+            self._disk_bytes += len(audio) - index.pop(key, 0)
+            index[key] = len(audio)
+            while self._disk_bytes > settings.TTS_CACHE_DISK_MAX_BYTES:
+                evicted, size = index.popitem(last=False)
+                self._disk_bytes -= size
+                (directory / f"{evicted}{AUDIO_SUFFIX}").unlink(missing_ok=True)
+
+    async def get(self, key: str) -> bytes | None:
+        """Return cached audio for ``key`` and record the hit or miss."""
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+        else:
+            try:
+                audio = await asyncio.to_thread(self._read_disk, key)
+            except OSError:
+                logger.warning("TTS disk cache read failed", exc_info=True)
+                audio = None
+            if audio is None:
+                self.stats.misses += 1
+                return None
+            self.stats.disk_hits += 1
+            self._remember(key, audio)
+
+        self.stats.bytes_saved += len(audio)
+        return audio
+
+    async def put(self, key: str, audio: bytes) -> None:
+        """Store freshly synthesized audio in both tiers."""
+        self._remember(key, audio)
+        try:
+            await asyncio.to_thread(self._write_disk, key, audio)
+        except OSError:
+            logger.warning("TTS disk cache write failed", exc_info=True)
+
+    def clear(self) -> None:
+        """Forget the memory tier, the disk index and the counters."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        with self._disk_lock:
+            self._disk = None
+            self._disk_bytes = 0
+        self.stats = TTSCacheStats()
+
+
+tts_audio_cache = TTSAudioCache()
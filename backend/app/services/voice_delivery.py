@@ -0,0 +1,79 @@
+"""Streaming ``multipart/mixed`` delivery of chat replies with voice audio."""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+from app.schemas.chat import ChatResponse
+
+logger = logging.getLogger(__name__)
+
+CRLF = b"\r\n"
+
+
+async def await_voice(voice_task: asyncio.Task[bytes] | None) -> bytes | None:
+    """Return the synthesized audio, or None if there is none or TTS failed."""
+    if voice_task is None:
+        return None
+    try:
+        return await voice_task
+    except Exception as tts_error:
+        logger.warning(
+            "TTS synthesis failed; returning text-only response",
+            extra={"json_fields": {"error": str(tts_error)}},
+        )
+        return None
+
+
+async def _iter_parts(
+    boundary: bytes, chat_response: ChatResponse, voice_task: asyncio.Task[bytes] | None
+) -> AsyncIterator[bytes]:
+    delimiter = b"--" + boundary
+    try:
+        yield (
+            delimiter
+            + CRLF
+            + b"Content-Type: application/json"
+            + CRLF * 2
+            + chat_response.model_dump_json().encode("utf-8")
+            + CRLF
+        )
+        voice_bytes = await await_voice(voice_task)
+        if voice_bytes:
+            yield (
+                delimiter
+                + CRLF
+                + b"Content-Type: audio/ogg"
+                + CRLF
+                + b'Content-Disposition: inline; filename="speech.ogg"'
+                + CRLF
+                + f"Content-Length: {len(voice_bytes)}".encode("ascii")
+                + CRLF * 2
+                + voice_bytes
+                + CRLF
+            )
+        yield delimiter + b"--" + CRLF
+    finally:
+        # The client went away before the audio was ready
+        if voice_task is not None and not voice_task.done():
+            voice_task.cancel()
+
+
+def multipart_chat_response(
+    chat_response: ChatResponse, voice_task: asyncio.Task[bytes] | None
+) -> StreamingResponse:
+    """
+    Stream the chat reply as ``multipart/mixed``.
+
+    The JSON part is flushed immediately, so the client can show the text
+    while speech is still being synthesized; the raw ``audio/ogg`` part
+    follows once ``voice_task`` finishes and is omitted if it fails.
+    """
+    boundary = uuid.uuid4().hex
+    return StreamingResponse(
+        _iter_parts(boundary.encode("ascii"), chat_response, voice_task),
+        media_type=f"multipart/mixed; boundary={boundary}",
+    )
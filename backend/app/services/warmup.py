@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.schemas.warmup import WarmupReport, WarmupStep
+from app.services.google_clients import google_client_factory
+from app.services.registry import service_registry
+
+logger = logging.getLogger(__name__)
+
+# Discovery APIs used through ``google_client_factory``
+DISCOVERY_APIS = (("calendar", "v3"), ("gmail", "v1"))
+
+
+class SkipStep(Exception):
+    """Raised by a step that does not apply to this configuration."""
+
+
+async def _open_db_pool() -> None:
+    from app.db.session import engine
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def _build_agents() -> None:
+    from app.services.adk_service import ADKService
+
+    try:
+        adk = ADKService()
+    except ValueError as e:
+        raise SkipStep(str(e)) from e
+    await asyncio.to_thread(adk.warm_up)
+
+
+async def _connect_gemini() -> None:
+    from app.services.adk_service import gemini_model
+
+    if not settings.GOOGLE_API_KEY or not settings.GOOGLE_MODEL_NAME:
+        raise SkipStep("GOOGLE_API_KEY or GOOGLE_MODEL_NAME is not set")
+    # The client is cached per event loop, so this has to run on the loop
+    # that serves chat turns for their requests to reuse the connection
+    model = await gemini_model.aget()
+    await model.api_client.aio.models.get(model=settings.GOOGLE_MODEL_NAME)
+
+
+async def _load_discovery_documents() -> None:
+    await google_client_factory.preload_documents(*DISCOVERY_APIS)
+
+
+async def _build_services() -> None:
+    await service_registry.warm_up()
+
+
+# (name, step, required): a failed required step keeps the instance unready
+STEPS: list[tuple[str, Callable[[], Awaitable[None]], bool]] = [
+    ("db_pool", _open_db_pool, True),
+    ("services", _build_services, False),
+    ("discovery_documents", _load_discovery_documents, False),
+    ("agents", _build_agents, False),
+    ("gemini_connect", _connect_gemini, False),
+]
+
+
+async def _run_step(name: str, step: Callable[[], Awaitable[None]]) -> WarmupStep:
+    started = time.perf_counter()
+    ok, skipped, error = True, False, None
+    try:
+        await step()
+    except SkipStep as e:
+        skipped, error = True, str(e)
+    except Exception as e:
+        ok, error = False, f"{type(e).__name__}: {e}"
+        logger.warning(
+            "Warm-up step failed",
+            exc_info=True,
+            extra={"json_fields": {"step": name}},
+        )
+    return WarmupStep(
+        name=name,
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        ok=ok,
+        skipped=skipped,
+        error=error,
+    )
+
+
+class InstanceWarmup:
+    """
+    One-time warm-up of this instance, shared by the lifespan hook and
+    ``GET /warmup``.
+
+    The steps run concurrently: opening the DB pool, building the lazy
+    service singletons, parsing the Google discovery documents, importing
+    ADK and building the agent tree, and a first Gemini round trip on the
+    client that the agents share. The
+    instance is ready once every required step has succeeded; the report
+    is then cached, so a Cloud Run startup probe on ``/warmup`` is cheap
+    after the first success. A failed warm-up is retried on the next call.
+    """
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task[WarmupReport] | None = None
+        self._report: WarmupReport | None = None
+
+    async def _run(self) -> WarmupReport:
+        started = time.perf_counter()
+        steps = await asyncio.gather(
+            *(_run_step(name, step) for name, step, _ in STEPS)
+        )
+        required = {name for name, _, is_required in STEPS if is_required}
+        report = WarmupReport(
+            ready=all(step.ok for step in steps if step.name in required),
+            total_ms=round((time.perf_counter() - started) * 1000, 1),
+            steps=steps,
+        )
+        logger.info(
+            "Instance warm-up finished",
+            extra={"json_fields": report.model_dump()},
+        )
+        return report
+
+    async def run(self) -> WarmupReport:
+        if self._report is not None:
+            return self._report
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        try:
+            report = await asyncio.shield(self._task)
+        finally:
+            if self._task is not None and self._task.done():
+                self._task = None
+        if report.ready:
+            self._report = report
+        return report
+
+    def reset(self) -> None:
+        self._task = None
+        self._report = None
+
+
+instance_warmup = InstanceWarmup()
@@ -3,6 +3,7 @@ from fastapi import HTTPException
 
 from app.core.config import settings
 from app.schemas.weather import WeatherData
+from app.services.registry import service_registry
 
 
 class WeatherService:
@@ -99,8 +100,6 @@ class WeatherService:
         await self.client.aclose()
 
 
-weather_service_instance = WeatherService()
-
-
-def weather_service() -> WeatherService:
-    return weather_service_instance
+weather_service = service_registry.register(
+    "weather_service", WeatherService, close=WeatherService.close
+)
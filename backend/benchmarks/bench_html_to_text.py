@@ -0,0 +1,79 @@
+"""
+Compare the streaming ``html_to_text`` extractor with the BeautifulSoup path.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_html_to_text [--limit 1500] [--repeat 20]
+
+For every email in the corpus it reports input size, mean extraction time of
+both engines, the speed-up, and output parity: whether the streaming output
+(with hidden blocks removed from both sides) is a prefix of the BeautifulSoup
+output, which is what the Gmail body truncation consumes.
+"""
+
+import argparse
+import statistics
+import timeit
+
+from bs4 import BeautifulSoup
+
+from app.services.html_text import HIDDEN_STYLE_RE, SKIPPED_TAGS, html_to_text
+from benchmarks.html_emails import build_corpus
+
+
+def bs4_to_text(html: str) -> str:
+    """The previous ``GmailService._extract_body`` HTML path."""
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(["script", "style"]):
+        element.decompose()
+    text = soup.get_text(separator="\n")
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return "\n".join(lines)
+
+
+def bs4_visible_text(html: str) -> str:
+    """BeautifulSoup text with the same hidden-block rules as ``html_to_text``."""
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(list(SKIPPED_TAGS)):
+        element.decompose()
+    for element in soup.find_all(
+        lambda tag: (
+            tag.has_attr("hidden") or bool(HIDDEN_STYLE_RE.search(tag.get("style", "")))
+        )
+    ):
+        element.decompose()
+    text = soup.get_text(separator="\n")
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def _mean_ms(func, repeat: int) -> float:
+    runs = timeit.repeat(func, number=1, repeat=repeat)
+    return statistics.mean(runs) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    header = f"{'email':<22}{'size KB':>9}{'bs4 ms':>10}{'stream ms':>11}{'speedup':>9}  parity"
+    print(header)
+    print("-" * len(header))
+    for name, html in build_corpus().items():
+        bs4_ms = _mean_ms(lambda: bs4_to_text(html)[: args.limit], args.repeat)
+        stream_ms = _mean_ms(lambda: html_to_text(html, args.limit), args.repeat)
+
+        streamed = html_to_text(html, args.limit)
+        reference = bs4_visible_text(html)
+        # The last streamed line may be cut by the limit
+        parity = reference.startswith(streamed.rsplit("\n", 1)[0])
+
+        print(
+            f"{name:<22}{len(html) / 1024:>9.1f}{bs4_ms:>10.2f}{stream_ms:>11.2f}"
+            f"{bs4_ms / stream_ms:>8.1f}x  {'ok' if parity else 'DIFF'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
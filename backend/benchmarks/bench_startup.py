@@ -0,0 +1,77 @@
+"""
+Measure backend cold start: importing ``app.main`` and warming up services.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_startup [--runs 5] [--budget 3.0]
+
+Every run is a fresh interpreter, as on a Cloud Run cold start. It reports
+the time to import the app, which services were built during the import
+(there should be none; see ``app.services.registry``) and how long the
+background warm-up takes to build each one. With ``--budget`` it exits
+non-zero if even the fastest import took longer than that many seconds.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+import app.main
+import_sec = time.perf_counter() - started
+from app.services.registry import service_registry as registry
+created = [name for name in registry.names if registry.is_created(name)]
+started = time.perf_counter()
+timings = asyncio.run(registry.warm_up())
+warm_up_sec = time.perf_counter() - started
+print(json.dumps({"import_sec": import_sec, "created_on_import": created,
+                  "warm_up_sec": warm_up_sec, "services": timings}))
+"""
+
+
+def run_once() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="fail if the fastest import of app.main takes longer (seconds)",
+    )
+    args = parser.parse_args()
+
+    reports = [run_once() for _ in range(args.runs)]
+
+    import_ms = [report["import_sec"] * 1000 for report in reports]
+    warm_up_ms = [report["warm_up_sec"] * 1000 for report in reports]
+    print(f"import app.main  mean {statistics.mean(import_ms):8.1f} ms")
+    print(f"                 min  {min(import_ms):8.1f} ms")
+    print(f"service warm-up  mean {statistics.mean(warm_up_ms):8.1f} ms")
+
+    created = sorted({name for r in reports for name in r["created_on_import"]})
+    print(f"built on import: {', '.join(created) or 'none'}")
+
+    names = sorted({name for report in reports for name in report["services"]})
+    for name in names:
+        runs = [r["services"][name] * 1000 for r in reports if name in r["services"]]
+        print(f"  {name:<26}{statistics.mean(runs):8.2f} ms")
+
+    if args.budget is not None and min(import_ms) > args.budget * 1000:
+        sys.exit(
+            f"import app.main took {min(import_ms) / 1000:.2f}s "
+            f"(budget {args.budget:.2f}s); import heavy SDKs lazily"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Synthetic corpus of real-world-shaped HTML emails.
+
+Each builder reproduces the structure of a common email family (table-based
+newsletters with inline CSS, transactional receipts, threaded replies,
+notification digests, broken markup) with deterministic filler text, so the
+corpus can be regenerated anywhere without shipping third-party mail.
+"""
+
+import random
+from collections.abc import Callable
+
+_WORDS = (
+    "account update order delivery weekly summary offer limited exclusive "
+    "members invoice payment receipt shipping tracking meeting agenda project "
+    "release notes security alert password review calendar invitation team "
+    "report quarter growth customer support ticket resolved pending schedule"
+).split()
+
+_HEAD = """<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN"
+ "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml"><head>
+<meta http-equiv="Content-Type" content="text/html; charset=UTF-8" />
+<meta name="viewport" content="width=device-width, initial-scale=1.0" />
+<title>{title}</title>
+<style type="text/css">
+body {{ margin: 0; padding: 0; }} table {{ border-collapse: collapse; }}
+@media only screen and (max-width: 600px) {{ .col {{ width: 100% !important; }} }}
+{extra_css}
+</style>
+<!--[if mso]><style>.fallback {{ font-family: Arial; }}</style><![endif]-->
+</head>"""
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text.capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng, rng.randint(6, 16)) for _ in range(sentences))
+
+
+def _preheader(rng: random.Random) -> str:
+    return (
+        '<div style="display:none;max-height:0;overflow:hidden;mso-hide:all">'
+        f"{_sentence(rng)}&zwnj;&nbsp;&zwnj;&nbsp;</div>"
+    )
+
+
+def _tracking_pixel(n: int) -> str:
+    return (
+        f'<img src="https://t.example.com/o/{n}.gif" width="1" height="1" '
+        'alt="" style="display:block" />'
+    )
+
+
+def newsletter(rng: random.Random, sections: int = 12) -> str:
+    """Nested-table marketing newsletter with heavy inline CSS."""
+    css = "\n".join(
+        f".s{i} {{ color: #{rng.randrange(0xFFFFFF):06x}; padding: {i}px; }}"
+        for i in range(200)
+    )
+    parts = [_HEAD.format(title="Weekly picks", extra_css=css)]
+    parts.append('<body style="margin:0;padding:0;background:#f4f4f4">')
+    parts.append(_preheader(rng))
+    parts.append(
+        '<table role="presentation" width="100%" cellpadding="0" cellspacing="0">'
+    )
+    for i in range(sections):
+        cells = "".join(
+            '<td class="col" width="50%" valign="top" '
+            'style="padding:12px;font-family:Helvetica,Arial,sans-serif;'
+            'font-size:14px;line-height:20px;color:#333333">'
+            f'<a href="https://example.com/p/{i}/{j}?utm_source=newsletter" '
+            'style="color:#1a73e8;text-decoration:none">'
+            f"<strong>{_sentence(rng, 5)}</strong></a><br />"
+            f'<span style="font-size:12px">{_paragraph(rng, 2)}</span>'
+            "</td>"
+            for j in range(2)
+        )
+        parts.append(
+            f'<tr><td><table role="presentation" width="600" align="center">'
+            f"<tr>{cells}</tr></table></td></tr>"
+        )
+    parts.append(
+        '<tr><td style="font-size:11px;color:#999999">'
+        "You are receiving this email because you subscribed. "
+        '<a href="https://example.com/unsubscribe">Unsubscribe</a> &middot; '
+        '<a href="https://example.com/prefs">Preferences</a></td></tr>'
+    )
+    parts.append("</table>")
+    parts.append(_tracking_pixel(rng.randrange(10**6)))
+    parts.append(
+        '<script type="application/ld+json">{"@context":"http://schema.org"}</script>'
+    )
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def receipt(rng: random.Random) -> str:
+    """Transactional receipt with a line-item table and totals."""
+    rows = "".join(
+        f'<tr><td>{_sentence(rng, 3)}</td><td align="right">{rng.randint(1, 5)}</td>'
+        f'<td align="right">${rng.randint(1, 500)}.{rng.randint(0, 99):02d}</td></tr>'
+        for _ in range(rng.randint(3, 12))
+    )
+    return (
+        _HEAD.format(title="Your receipt", extra_css="")
+        + "<body>"
+        + _preheader(rng)
+        + f"<h1>Thanks for your order #{rng.randint(10000, 99999)}</h1>"
+        + f"<p>{_paragraph(rng, 2)}</p>"
+        + '<table width="100%"><tr><th>Item</th><th>Qty</th><th>Price</th></tr>'
+        + rows
+        + '<tr><td colspan="2"><b>Total</b></td><td>$123.45</td></tr></table>'
+        + f"<p>{_paragraph(rng, 1)}</p>"
+        + "</body></html>"
+    )
+
+
+def reply_thread(rng: random.Random, depth: int = 6) -> str:
+    """Threaded reply with nested quoted blocks, as produced by Gmail/Outlook."""
+    body = f'<div dir="ltr">{_paragraph(rng, 2)}</div>'
+    for level in range(depth):
+        body = (
+            f'<div dir="ltr">{_paragraph(rng, 2)}</div><br>'
+            '<div class="gmail_quote"><div dir="ltr" class="gmail_attr">'
+            f"On Mon, Jan {level + 1}, 2024 at 10:0{level} AM Someone "
+            "&lt;someone@example.com&gt; wrote:<br></div>"
+            '<blockquote class="gmail_quote" style="margin:0 0 0 .8ex;'
+            f'border-left:1px #ccc solid;padding-left:1ex">{body}</blockquote></div>'
+        )
+    return f"<html><body>{body}</body></html>"
+
+
+def notification_digest(rng: random.Random, items: int = 80) -> str:
+    """Long notification digest (issue trackers, social networks)."""
+    entries = "".join(
+        '<tr><td style="padding:8px 0;border-bottom:1px solid #eee">'
+        f'<a href="https://example.com/n/{i}">{_sentence(rng, 6)}</a>'
+        f'<p style="margin:4px 0;color:#555">{_paragraph(rng, 1)}</p>'
+        '<p style="display:none">tracking-{i}</p>'
+        "</td></tr>"
+        for i in range(items)
+    )
+    return (
+        _HEAD.format(title="Digest", extra_css="")
+        + f'<body><table width="100%">{entries}</table></body></html>'
+    )
+
+
+def malformed(rng: random.Random) -> str:
+    """Broken markup: unclosed tags, stray end tags, uppercase, entities."""
+    chunks = []
+    for _ in range(40):
+        chunks.append(
+            f"<P><FONT face=Arial>{_sentence(rng)} &amp; more &#8212; "
+            f"<B>{_sentence(rng, 4)}</FONT></span><td>{_sentence(rng, 5)}"
+        )
+    return "<HTML><BODY>" + "".join(chunks) + "</BODY>"
+
+
+def huge_newsletter(rng: random.Random) -> str:
+    """Several-hundred-KB promotional email."""
+    return newsletter(rng, sections=400)
+
+
+BUILDERS: dict[str, Callable[[random.Random], str]] = {
+    "newsletter": newsletter,
+    "receipt": receipt,
+    "reply_thread": reply_thread,
+    "notification_digest": notification_digest,
+    "malformed": malformed,
+    "huge_newsletter": huge_newsletter,
+}
+
+
+def build_corpus(seed: int = 1234) -> dict[str, str]:
+    """Return ``{name: html}`` for every email family, deterministically."""
+    rng = random.Random(seed)
+    return {name: builder(rng) for name, builder in BUILDERS.items()}
@@ -6,6 +6,7 @@ from app.core.config import settings
 from app.db.base import Base
 from app.models.chat import ChatHistory
 from app.models.device import SmartDevice
+from app.models.email_cache import CachedEmail, GmailSyncState
 from app.models.news import NewsSubscription
 from app.models.user import User
 from app.models.user_facts import UserFact
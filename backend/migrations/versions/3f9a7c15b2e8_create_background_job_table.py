@@ -0,0 +1,67 @@
+"""create_background_job_table
+
+Revision ID: 3f9a7c15b2e8
+Revises: e61b2d9c4a07
+Create Date: 2026-10-19 17:48:03.552914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a7c15b2e8"
+down_revision: Union[str, Sequence[str], None] = "e61b2d9c4a07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+job_status = sa.Enum("queued", "running", "failed", name="jobstatus")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "background_job",
+        sa.Column("kind", sa.String(length=64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", job_status, nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_after", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("dedupe_key", sa.String(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_background_job_claim",
+        "background_job",
+        ["status", "run_after"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_background_job_dedupe_key"),
+        "background_job",
+        ["dedupe_key"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_background_job_dedupe_key"), table_name="background_job")
+    op.drop_index("ix_background_job_claim", table_name="background_job")
+    op.drop_table("background_job")
+    job_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,62 @@
+"""create_knowledge_sync_status_table
+
+Revision ID: 8d5e2f7a1c46
+Revises: 3f9a7c15b2e8
+Create Date: 2026-10-19 19:12:40.118305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d5e2f7a1c46"
+down_revision: Union[str, Sequence[str], None] = "3f9a7c15b2e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+knowledge_sync_state = sa.Enum(
+    "idle", "queued", "running", "succeeded", "failed", name="knowledgesyncstate"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "knowledge_sync_status",
+        sa.Column("store", sa.String(), nullable=False),
+        sa.Column("state", knowledge_sync_state, nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("uploaded_count", sa.Integer(), nullable=False),
+        sa.Column("deleted_count", sa.Integer(), nullable=False),
+        sa.Column("failed_count", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_knowledge_sync_status_store"),
+        "knowledge_sync_status",
+        ["store"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_knowledge_sync_status_store"), table_name="knowledge_sync_status"
+    )
+    op.drop_table("knowledge_sync_status")
+    knowledge_sync_state.drop(op.get_bind(), checkfirst=True)
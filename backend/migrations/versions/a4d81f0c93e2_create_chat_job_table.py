@@ -0,0 +1,60 @@
+"""create_chat_job_table
+
+Revision ID: a4d81f0c93e2
+Revises: 7c3e9a41d2f5
+Create Date: 2026-10-19 14:05:17.604211
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d81f0c93e2"
+down_revision: Union[str, Sequence[str], None] = "7c3e9a41d2f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+chat_job_status = sa.Enum("queued", "running", "done", "failed", name="chatjobstatus")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "chat_job",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("session_id", sa.Integer(), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("want_voice", sa.Boolean(), nullable=False),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("status", chat_job_status, nullable=False),
+        sa.Column("assistant_message_id", sa.Integer(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["session_id"], ["chat_session.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["assistant_message_id"], ["chat_history.id"], ondelete="SET NULL"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_chat_job_user_id"), "chat_job", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_chat_job_user_id"), table_name="chat_job")
+    op.drop_table("chat_job")
+    chat_job_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,32 @@
+"""add_summarized_through_message_id
+
+Revision ID: e61b2d9c4a07
+Revises: a4d81f0c93e2
+Create Date: 2026-10-19 15:32:48.117902
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e61b2d9c4a07"
+down_revision: Union[str, Sequence[str], None] = "a4d81f0c93e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "chat_session",
+        sa.Column("summarized_through_message_id", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("chat_session", "summarized_through_message_id")
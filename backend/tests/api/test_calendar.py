@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.crud.crud_user import user as crud_user
 from app.main import app
-from app.schemas.calendar import CalendarEvent
+from app.schemas.calendar import CalendarEvent, FreeSlot
 from app.services.google_calendar import google_calendar_service
 
 
@@ -265,7 +265,7 @@ async def test_get_upcoming_events_default_days(
         db_session, db_obj=user, obj_in={"google_refresh_token": "test_refresh_token"}
     )
 
-    with patch("app.services.google_calendar.build") as mock_build:
+    with patch("googleapiclient.discovery.build_from_document") as mock_build:
         mock_service = MagicMock()
         mock_events_list = MagicMock()
         mock_events_list.execute.return_value = {"items": []}
@@ -327,7 +327,7 @@ async def test_get_events_in_range_success(
         },
     ]
 
-    with patch("app.services.google_calendar.build") as mock_build:
+    with patch("googleapiclient.discovery.build_from_document") as mock_build:
         mock_service = MagicMock()
         mock_events_list = MagicMock()
         mock_events_list.execute.return_value = {"items": mock_events}
@@ -469,7 +469,7 @@ async def test_empty_events_list(
     )
 
     # Mock empty events response
-    with patch("app.services.google_calendar.build") as mock_build:
+    with patch("googleapiclient.discovery.build_from_document") as mock_build:
         mock_service = MagicMock()
         mock_events_list = MagicMock()
         mock_events_list.execute.return_value = {"items": []}
@@ -567,3 +567,108 @@ async def test_delete_calendar_event_endpoint(
         assert mock_service.delete_event.call_args.args[1] == "event123"
     finally:
         app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_free_slots_endpoint(
+    client: AsyncClient, db_session: AsyncSession, auth_user: dict
+) -> None:
+    """Test GET /calendar/free-slots returns slots found by the service."""
+    user = auth_user["user"]
+    headers = auth_user["headers"]
+
+    mock_service = AsyncMock()
+    mock_service.find_free_slots.return_value = [
+        FreeSlot(
+            start=datetime(2026, 2, 2, 9, 0, tzinfo=timezone.utc),
+            end=datetime(2026, 2, 2, 9, 30, tzinfo=timezone.utc),
+        )
+    ]
+
+    async def override_calendar_service():
+        return mock_service
+
+    app.dependency_overrides[google_calendar_service] = override_calendar_service
+
+    try:
+        response = await client.get(
+            f"{settings.API_V1_STR}/calendar/free-slots",
+            params={
+                "user_id": user.id,
+                "duration_minutes": 30,
+                "start": "2026-02-02T00:00:00Z",
+                "end": "2026-02-06T00:00:00Z",
+                "working_hours_start": "10:00",
+                "buffer_minutes": 15,
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 1
+        assert data["slots"][0]["start"].startswith("2026-02-02T09:00:00")
+        kwargs = mock_service.find_free_slots.call_args.kwargs
+        assert kwargs["duration_minutes"] == 30
+        assert kwargs["buffer_minutes"] == 15
+        assert kwargs["working_hours_start"].hour == 10
+        assert kwargs["max_results"] == 5
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_free_slots_exceeds_max_range(
+    client: AsyncClient, auth_user: dict
+) -> None:
+    """Test that the free-slot search range cannot exceed 31 days."""
+    response = await client.get(
+        f"{settings.API_V1_STR}/calendar/free-slots",
+        params={
+            "user_id": auth_user["user"].id,
+            "start": "2026-01-01T00:00:00Z",
+            "end": "2026-03-01T00:00:00Z",
+        },
+        headers=auth_user["headers"],
+    )
+
+    assert response.status_code == 400
+    assert "31" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_get_free_slots_invalid_range(
+    client: AsyncClient, auth_user: dict
+) -> None:
+    """Test that the free-slot search end must be after its start."""
+    response = await client.get(
+        f"{settings.API_V1_STR}/calendar/free-slots",
+        params={
+            "user_id": auth_user["user"].id,
+            "start": "2026-02-07T00:00:00Z",
+            "end": "2026-02-01T00:00:00Z",
+        },
+        headers=auth_user["headers"],
+    )
+
+    assert response.status_code == 400
+    assert "after" in response.json()["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_get_free_slots_mixed_timezones(
+    client: AsyncClient, auth_user: dict
+) -> None:
+    """Test that a naive end with the aware default start is a 400, not a 500."""
+    for params in (
+        {"end": "2026-02-06T00:00:00"},
+        {"start": "2026-02-02T00:00:00", "end": "2026-02-06T00:00:00Z"},
+    ):
+        response = await client.get(
+            f"{settings.API_V1_STR}/calendar/free-slots",
+            params={"user_id": auth_user["user"].id, **params},
+            headers=auth_user["headers"],
+        )
+
+        assert response.status_code == 400
+        assert "UTC offset" in response.json()["detail"]
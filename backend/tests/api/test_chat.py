@@ -1,13 +1,18 @@
-from unittest.mock import AsyncMock
+import base64
+import json
+from email import message_from_bytes
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.crud.crud_chat import chat as crud_chat
 from app.crud.crud_session import chat_session as crud_session
 from app.crud.crud_user import user as crud_user
+from app.models.job import BackgroundJob
 from app.schemas.chat import ChatHistoryCreate, ChatSessionCreate
 from app.schemas.enums import ChatRole
 from app.schemas.user import UserCreate
@@ -452,58 +457,65 @@ async def test_process_chat_message_background_task(
     db_session: AsyncSession,
     mock_adk_service: AsyncMock,
     auth_user: dict,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test that background task is added when total messages reach SUMMARY_MESSAGE_WINDOW."""
-    # Setup mock
-    mock_adk_service.process_chat.return_value = "Response with context"
+    """Test that a summary is requested once unsummarized messages reach the token threshold."""
+    # 40 characters is about 10 tokens
+    monkeypatch.setattr(settings, "SUMMARY_TOKEN_THRESHOLD", 10)
+    mock_adk_service.process_chat.return_value = "Answer"
 
-    # Use authenticated user
     user = auth_user["user"]
     headers = auth_user["headers"]
 
-    # Create a session
     session_in = ChatSessionCreate(user_id=user.id, title="History Session")
     session = await crud_session.create(db_session, obj_in=session_in)
 
-    # We need SUMMARY_MESSAGE_WINDOW messages in total to trigger the task.
-    # SUMMARY_MESSAGE_WINDOW is 6. The process endpoint creates 2 messages
-    # (1 user, 1 assistant). So we pre-populate 4 messages.
-    history_messages = [
-        (ChatRole.USER, "1"),
-        (ChatRole.MODEL, "2"),
-        (ChatRole.USER, "3"),
-        (ChatRole.MODEL, "4"),
-    ]
-
-    for role, content in history_messages:
-        chat_in = ChatHistoryCreate(
+    # Everything before the cursor is already summarized and does not count
+    summarized = await crud_chat.create(
+        db_session,
+        obj_in=ChatHistoryCreate(
             user_id=user.id,
-            role=role,
-            content=content,
+            role=ChatRole.USER,
+            content="x" * 100,
             session_id=session.id,
-        )
-        await crud_chat.create(db_session, obj_in=chat_in)
-
-    # Send new message with authentication
-    chat_request = {
-        "user_id": user.id,
-        "message": "5",
-        "session_id": session.id,
-    }
-
-    # We patch BackgroundTasks.add_task to verify it's called
-    from unittest.mock import patch
+        ),
+    )
+    await crud_session.update(
+        db_session,
+        db_obj=session,
+        obj_in={"summarized_through_message_id": summarized.id},
+    )
 
-    with patch("fastapi.BackgroundTasks.add_task") as mock_add_task:
-        response = await client.post(
-            f"{settings.API_V1_STR}/chat/process",
-            json=chat_request,
-            headers=headers,
+    async def summary_jobs() -> list[BackgroundJob]:
+        result = await db_session.execute(
+            select(BackgroundJob).where(BackgroundJob.kind == "session_summary")
         )
+        return list(result.scalars().all())
 
-        assert response.status_code == 200
-        # Check that add_task was called (since 4 + 2 = 6, which is % 6 == 0)
-        mock_add_task.assert_called_once()
+    # 6 + 6 characters since the cursor: below the threshold
+    response = await client.post(
+        f"{settings.API_V1_STR}/chat/process",
+        json={"user_id": user.id, "message": "Short?", "session_id": session.id},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert await summary_jobs() == []
+
+    # Another 22 + 6 characters: 40 in total
+    response = await client.post(
+        f"{settings.API_V1_STR}/chat/process",
+        json={
+            "user_id": user.id,
+            "message": "A slightly longer one?",
+            "session_id": session.id,
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    jobs = await summary_jobs()
+    assert len(jobs) == 1
+    assert jobs[0].payload == {"session_id": session.id}
+    assert jobs[0].dedupe_key == f"session_summary:{session.id}"
 
 
 @pytest.mark.asyncio
@@ -544,3 +556,211 @@ async def test_process_chat_message_with_session(
     assert content["user_message_id"] == 1
     assert content["assistant_message_id"] == 2
     assert content["session_id"] == session.id
+
+
+def _parse_multipart(response) -> list[tuple[str, bytes]]:
+    raw = (
+        f"Content-Type: {response.headers['content-type']}\r\n\r\n".encode()
+        + response.content
+    )
+    message = message_from_bytes(raw)
+    assert message.is_multipart()
+    return [
+        (part.get_content_type(), part.get_payload(decode=True))
+        for part in message.get_payload()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_chat_message_voice_base64(
+    client: AsyncClient,
+    mock_adk_service: AsyncMock,
+    auth_user: dict,
+) -> None:
+    """By default the voice reply is embedded in the JSON as base64."""
+    mock_adk_service.process_chat.return_value = "Spoken reply"
+    user = auth_user["user"]
+
+    response = await client.post(
+        f"{settings.API_V1_STR}/chat/process",
+        json={"user_id": user.id, "message": "Hi", "want_voice": True},
+        headers=auth_user["headers"],
+    )
+
+    assert response.status_code == 200
+    content = response.json()
+    assert base64.b64decode(content["voice_audio"]) == b"fake-ogg-audio"
+
+
+@pytest.mark.asyncio
+async def test_process_chat_message_voice_multipart(
+    client: AsyncClient,
+    mock_adk_service: AsyncMock,
+    auth_user: dict,
+) -> None:
+    """Multipart delivery sends the JSON reply first and raw audio after it."""
+    mock_adk_service.process_chat.return_value = "Spoken reply"
+    user = auth_user["user"]
+
+    response = await client.post(
+        f"{settings.API_V1_STR}/chat/process",
+        json={
+            "user_id": user.id,
+            "message": "Hi",
+            "want_voice": True,
+            "voice_delivery": "multipart",
+        },
+        headers=auth_user["headers"],
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("multipart/mixed")
+    parts = _parse_multipart(response)
+    assert [content_type for content_type, _ in parts] == [
+        "application/json",
+        "audio/ogg",
+    ]
+    content = json.loads(parts[0][1])
+    assert content["response"] == "Spoken reply"
+    assert content["voice_audio"] is None
+    assert parts[1][1] == b"fake-ogg-audio"
+
+
+@pytest.mark.asyncio
+async def test_process_chat_message_voice_multipart_tts_failure(
+    client: AsyncClient,
+    mock_adk_service: AsyncMock,
+    mock_tts_service: MagicMock,
+    auth_user: dict,
+) -> None:
+    """A TTS failure drops the audio part but keeps the text reply."""
+    mock_adk_service.process_chat.return_value = "Spoken reply"
+    mock_tts_service.synthesize.side_effect = RuntimeError("TTS down")
+    user = auth_user["user"]
+
+    response = await client.post(
+        f"{settings.API_V1_STR}/chat/process",
+        json={
+            "user_id": user.id,
+            "message": "Hi",
+            "want_voice": True,
+            "voice_delivery": "multipart",
+        },
+        headers=auth_user["headers"],
+    )
+
+    assert response.status_code == 200
+    parts = _parse_multipart(response)
+    assert [content_type for content_type, _ in parts] == ["application/json"]
+    assert json.loads(parts[0][1])["response"] == "Spoken reply"
+
+
+@pytest.mark.asyncio
+async def test_process_chat_message_tts_overlaps_persistence(
+    client: AsyncClient,
+    mock_adk_service: AsyncMock,
+    mock_tts_service: MagicMock,
+    auth_user: dict,
+) -> None:
+    """TTS starts before the assistant message has been saved."""
+    mock_adk_service.process_chat.return_value = "Spoken reply"
+    events = []
+
+    async def synthesize(text: str) -> bytes:
+        events.append("tts_start")
+        return b"fake-ogg-audio"
+
+    mock_tts_service.synthesize.side_effect = synthesize
+    original_create = crud_chat.create
+
+    async def create(db, *, obj_in):
+        db_obj = await original_create(db, obj_in=obj_in)
+        if obj_in.role == ChatRole.MODEL:
+            events.append("assistant_saved")
+        return db_obj
+
+    user = auth_user["user"]
+    with patch.object(crud_chat, "create", side_effect=create):
+        response = await client.post(
+            f"{settings.API_V1_STR}/chat/process",
+            json={"user_id": user.id, "message": "Hi", "want_voice": True},
+            headers=auth_user["headers"],
+        )
+
+    assert response.status_code == 200
+    assert events == ["tts_start", "assistant_saved"]
+    assert base64.b64decode(response.json()["voice_audio"]) == b"fake-ogg-audio"
+
+
+@pytest.mark.asyncio
+async def test_process_chat_message_telegram_delivery_accepts_job(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    mock_adk_service: AsyncMock,
+    auth_user: dict,
+) -> None:
+    """Telegram delivery answers 202 with a job and queues the turn."""
+    user = auth_user["user"]
+
+    response = await client.post(
+        f"{settings.API_V1_STR}/chat/process",
+        json={
+            "user_id": user.id,
+            "message": "Slow question",
+            "delivery": "telegram",
+        },
+        headers=auth_user["headers"],
+    )
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["session_id"]
+    assert job["session_title"] == "New Chat"
+    result = await db_session.execute(select(BackgroundJob))
+    queued = result.scalars().one()
+    assert queued.kind == "chat_turn"
+    assert queued.payload == {"chat_job_id": job["id"]}
+    mock_adk_service.process_chat.assert_not_called()
+
+    response = await client.get(
+        f"{settings.API_V1_STR}/chat/jobs/{job['id']}",
+        headers=auth_user["headers"],
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "queued"
+
+
+@pytest.mark.asyncio
+async def test_process_chat_message_telegram_delivery_rejects_other_chat(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    mock_adk_service: AsyncMock,
+    auth_user: dict,
+) -> None:
+    """Replies are only delivered to the user's own Telegram chat."""
+    user = auth_user["user"]
+
+    response = await client.post(
+        f"{settings.API_V1_STR}/chat/process",
+        json={
+            "user_id": user.id,
+            "message": "Reply elsewhere",
+            "delivery": "telegram",
+            "chat_id": user.telegram_id + 1,
+        },
+        headers=auth_user["headers"],
+    )
+
+    assert response.status_code == 400
+    result = await db_session.execute(select(BackgroundJob))
+    assert result.scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_read_chat_job_not_found(client: AsyncClient, auth_user: dict) -> None:
+    response = await client.get(
+        f"{settings.API_V1_STR}/chat/jobs/999",
+        headers=auth_user["headers"],
+    )
+    assert response.status_code == 404
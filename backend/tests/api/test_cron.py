@@ -1,13 +1,17 @@
 import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import settings
 from app.models.user import User
 from app.models.device import SmartDevice
+from app.models.job import BackgroundJob
+from app.schemas.gmail import EmailDetailLevel
 from app.schemas.open_meteo import OpenMeteoResponse, DailyForecast
+from app.services.job_queue import JobWorker
 
 
 @pytest.fixture
@@ -20,22 +24,23 @@ def mock_llm_service():
 
 @pytest.fixture
 def mock_calendar_service():
-    with patch(
-        "app.api.v1.endpoints.cron.google_calendar_service_instance"
-    ) as mock_service:
-        yield mock_service
+    with patch("app.api.v1.endpoints.cron.google_calendar_service") as mock_getter:
+        mock_getter.aget = AsyncMock(return_value=mock_getter.return_value)
+        yield mock_getter.return_value
 
 
 @pytest.fixture
 def mock_weather_service():
-    with patch("app.api.v1.endpoints.cron.open_meteo_service_instance") as mock_service:
-        yield mock_service
+    with patch("app.api.v1.endpoints.cron.open_meteo_service") as mock_getter:
+        mock_getter.aget = AsyncMock(return_value=mock_getter.return_value)
+        yield mock_getter.return_value
 
 
 @pytest.fixture
 def mock_gmail_service():
-    with patch("app.api.v1.endpoints.cron.gmail_service_instance") as mock_service:
-        yield mock_service
+    with patch("app.api.v1.endpoints.cron.gmail_service") as mock_getter:
+        mock_getter.aget = AsyncMock(return_value=mock_getter.return_value)
+        yield mock_getter.return_value
 
 
 @pytest.fixture
@@ -48,6 +53,28 @@ def mock_httpx_client():
         yield mock_client
 
 
+@pytest.fixture
+def test_job_worker(db_session: AsyncSession):
+    """The job worker behind /cron/run-jobs, on the test database."""
+    worker = JobWorker(
+        session_factory=async_sessionmaker(db_session.bind, expire_on_commit=False)
+    )
+    with patch(
+        "app.api.v1.endpoints.cron.job_worker",
+        MagicMock(aget=AsyncMock(return_value=worker)),
+    ):
+        yield worker
+
+
+async def run_jobs(client: AsyncClient) -> int:
+    response = await client.post(
+        f"{settings.API_V1_STR}/cron/run-jobs",
+        headers={"X-Cron-Secret": settings.CRON_SECRET_KEY},
+    )
+    assert response.status_code == 200
+    return response.json()["started_jobs_count"]
+
+
 @pytest.fixture
 def mock_home_service():
     with patch("app.api.v1.endpoints.cron.HomeAssistantService") as mock_home_cls:
@@ -73,6 +100,11 @@ async def test_cron_endpoints_require_cron_secret(client: AsyncClient) -> None:
     assert response.status_code == 403
     assert response.json()["detail"] == "Forbidden: Invalid cron secret"
 
+    # Test run jobs endpoint fails without secret
+    response = await client.post(f"{settings.API_V1_STR}/cron/run-jobs")
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Forbidden: Invalid cron secret"
+
     # Test morning digest endpoint fails with wrong secret
     response = await client.post(
         f"{settings.API_V1_STR}/cron/morning-digest",
@@ -91,6 +123,7 @@ async def test_morning_digest_success(
     mock_weather_service,
     mock_gmail_service,
     mock_httpx_client,
+    test_job_worker,
 ) -> None:
     # Create test user in DB
     user = User(
@@ -143,10 +176,11 @@ async def test_morning_digest_success(
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "success"
-    assert data["sent_digests_count"] == 1
+    assert data["queued_digests_count"] == 1
+    assert await run_jobs(client) == 1
 
     # Verify calendar call
-    mock_calendar_service.get_today_events.assert_called_once_with(user.id, db_session)
+    mock_calendar_service.get_today_events.assert_called_once_with(user.id, ANY)
 
     # Verify LLM call
     mock_llm_service.chat.assert_called_once()
@@ -167,6 +201,7 @@ async def test_morning_digest_no_events(
     mock_weather_service,
     mock_gmail_service,
     mock_httpx_client,
+    test_job_worker,
 ) -> None:
     # Create test user in DB
     user = User(
@@ -216,10 +251,11 @@ async def test_morning_digest_no_events(
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "success"
-    assert data["sent_digests_count"] == 1
+    assert data["queued_digests_count"] == 1
+    assert await run_jobs(client) == 1
 
     # Verify calendar call
-    mock_calendar_service.get_today_events.assert_called_once_with(user.id, db_session)
+    mock_calendar_service.get_today_events.assert_called_once_with(user.id, ANY)
 
     # Verify LLM call
     mock_llm_service.chat.assert_called_once()
@@ -245,6 +281,7 @@ async def test_morning_digest_with_emails(
     mock_weather_service,
     mock_gmail_service,
     mock_httpx_client,
+    test_job_worker,
 ) -> None:
     # Create test user in DB
     user = User(
@@ -309,14 +346,19 @@ async def test_morning_digest_with_emails(
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "success"
-    assert data["sent_digests_count"] == 1
+    assert data["queued_digests_count"] == 1
+    assert await run_jobs(client) == 1
 
     # Verify calendar call
-    mock_calendar_service.get_today_events.assert_called_once_with(user.id, db_session)
+    mock_calendar_service.get_today_events.assert_called_once_with(user.id, ANY)
 
     # Verify gmail call
     mock_gmail_service.get_emails.assert_called_once_with(
-        user_id=user.id, db=db_session, query="newer_than:1d", max_results=5
+        user_id=user.id,
+        db=ANY,
+        query="newer_than:1d",
+        max_results=5,
+        detail_level=EmailDetailLevel.METADATA,
     )
 
     # Verify LLM call
@@ -338,6 +380,7 @@ async def test_morning_digest_weather_failure(
     mock_weather_service,
     mock_gmail_service,
     mock_httpx_client,
+    test_job_worker,
 ) -> None:
     # Create test user in DB
     user = User(
@@ -382,7 +425,8 @@ async def test_morning_digest_weather_failure(
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "success"
-    assert data["sent_digests_count"] == 1
+    assert data["queued_digests_count"] == 1
+    assert await run_jobs(client) == 1
 
     # Verify weather call was attempted
     mock_weather_service.get_weather.assert_called_once_with(
@@ -537,25 +581,100 @@ async def test_check_power_status_partial_failure(
 
 
 @pytest.mark.asyncio
-async def test_sync_knowledge_success(client: AsyncClient) -> None:
+async def test_sync_knowledge_queues_one_sync(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    response = await client.post(
+        f"{settings.API_V1_STR}/cron/sync-knowledge",
+        headers={"X-Cron-Secret": settings.CRON_SECRET_KEY},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "success"
+    assert "sync queued" in data["message"].lower()
+
+    # A second request while the sync is still queued is coalesced
+    response = await client.post(
+        f"{settings.API_V1_STR}/cron/sync-knowledge",
+        headers={"X-Cron-Secret": settings.CRON_SECRET_KEY},
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "already_queued"
+
+    result = await db_session.execute(select(BackgroundJob))
+    assert [job.kind for job in result.scalars().all()] == ["knowledge_sync"]
+
+
+@pytest.mark.asyncio
+async def test_morning_digest_failure_is_retried(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    mock_llm_service,
+    mock_calendar_service,
+    mock_weather_service,
+    mock_gmail_service,
+    mock_httpx_client,
+    test_job_worker,
+) -> None:
+    user = User(
+        email="cron-digest-retry@example.com",
+        hashed_password="hashedpassword",
+        telegram_id=98765,
+        is_daily_summary_enabled=True,
+        google_refresh_token="valid-refresh-token",
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    mock_gmail_service.get_emails = AsyncMock(return_value=[])
+    mock_calendar_service.get_today_events = AsyncMock(return_value=[])
+    mock_weather_service.get_weather = AsyncMock(return_value=None)
+    mock_llm_service.chat.side_effect = RuntimeError("Gemini unavailable")
+
+    response = await client.post(
+        f"{settings.API_V1_STR}/cron/morning-digest",
+        headers={"X-Cron-Secret": settings.CRON_SECRET_KEY},
+    )
+    assert response.json()["queued_digests_count"] == 1
+    assert await run_jobs(client) == 1
+
+    # Requeued with a backoff instead of being dropped
+    result = await db_session.execute(select(BackgroundJob))
+    job = result.scalars().one()
+    await db_session.refresh(job)
+    assert job.kind == "daily_digest"
+    assert job.status == "queued"
+    assert job.attempts == 1
+    assert "Gemini unavailable" in job.last_error
+    mock_httpx_client.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_knowledge_status(client: AsyncClient) -> None:
+    from app.schemas.knowledge import KnowledgeSyncState, KnowledgeSyncStatus
     from app.services.knowledge import knowledge_service
     from app.main import app
 
     mock_kb = MagicMock()
-    mock_kb.sync_with_drive = MagicMock()
+    mock_kb.get_sync_status = AsyncMock(
+        return_value=KnowledgeSyncStatus(
+            store="vesta-knowledge-base",
+            state=KnowledgeSyncState.RUNNING,
+            uploaded_count=2,
+        )
+    )
 
     app.dependency_overrides[knowledge_service] = lambda: mock_kb
 
     try:
-        response = await client.post(
-            f"{settings.API_V1_STR}/cron/sync-knowledge",
+        response = await client.get(
+            f"{settings.API_V1_STR}/cron/sync-knowledge/status",
             headers={"X-Cron-Secret": settings.CRON_SECRET_KEY},
         )
         assert response.status_code == 200
         data = response.json()
-        assert data["status"] == "success"
-        assert "sync started" in data["message"].lower()
-        mock_kb.sync_with_drive.assert_called_once()
+        assert data["state"] == "running"
+        assert data["uploaded_count"] == 2
     finally:
         if knowledge_service in app.dependency_overrides:
             del app.dependency_overrides[knowledge_service]
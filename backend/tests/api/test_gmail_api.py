@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.crud.crud_user import user as crud_user
 from app.main import app
-from app.schemas.gmail import EmailMessage
+from app.schemas.gmail import EmailDetailLevel, EmailMessage
 from app.services.gmail_service import gmail_service
 
 
@@ -65,7 +65,11 @@ async def test_get_emails_success(
         assert data["emails"][0]["id"] == "msg1"
         assert data["emails"][0]["subject"] == "Invoice details"
         mock_service.get_emails.assert_called_with(
-            user_id=user.id, db=db_session, query="invoice", max_results=5
+            user_id=user.id,
+            db=db_session,
+            query="invoice",
+            max_results=5,
+            detail_level=EmailDetailLevel.FULL,
         )
     finally:
         app.dependency_overrides.clear()
@@ -70,7 +70,7 @@ async def test_google_login_missing_credentials() -> None:
 
     # Temporarily clear credentials
     original_client_id = settings.GOOGLE_CLIENT_ID
-    original_client_secret = settings.GOOGLE_CLIENT_SECRET.get_secret_value()
+    original_client_secret = settings.GOOGLE_CLIENT_SECRET
 
     try:
         settings.GOOGLE_CLIENT_ID = ""
@@ -1,3 +1,5 @@
+import struct
+from datetime import datetime, timedelta, timezone
 from typing import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -6,13 +8,20 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from app.core.config import settings
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
 from app.main import app
 from app.services.adk_service import ADKService
 from app.services.adk_service import adk_service as adk_service_dep
+from app.services.calendar_set import calendar_set_cache
+from app.services.calendar_store import calendar_event_store
+from app.services.google_clients import google_client_factory
+from app.services.google_tokens import GoogleTokenCache
 from app.services.google_tts import GoogleTTSService, google_tts_service
+from app.services.tts_cache import tts_audio_cache
 from app.services.llm import LLMService
+from app.services.ogg_opus import FLAG_BOS, FLAG_EOS, OggPage
 from app.services.llm import llm_service as llm_service_dep
 
 # Mock create_superuser in app.main to prevent DB calls on lifespan startup during tests
@@ -43,6 +52,41 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def clear_google_clients(monkeypatch):
+    """
+    Cached Google API clients, tokens and calendar stores are keyed by user
+    id, which tests reuse. Token refreshes are faked so tests never call the OAuth endpoint.
+    """
+
+    def _fake_refresh(credentials):
+        credentials.token = "test-access-token"
+        credentials.expiry = datetime.now(timezone.utc).replace(
+            tzinfo=None
+        ) + timedelta(hours=1)
+
+    monkeypatch.setattr(GoogleTokenCache, "_refresh", staticmethod(_fake_refresh))
+    # Mocked Calendar services only answer ``events.list``; multi-calendar
+    # tests opt back in
+    monkeypatch.setattr(settings, "CALENDAR_MULTI_ENABLED", False)
+    google_client_factory.clear()
+    calendar_event_store.clear()
+    calendar_set_cache.clear()
+    yield
+    google_client_factory.clear()
+    calendar_event_store.clear()
+    calendar_set_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_tts_cache(monkeypatch, tmp_path):
+    """Give every test an empty TTS cache with its own disk directory."""
+    monkeypatch.setattr(settings, "TTS_CACHE_DIR", str(tmp_path / "tts-cache"))
+    tts_audio_cache.clear()
+    yield
+    tts_audio_cache.clear()
+
+
 @pytest.fixture
 async def init_db() -> AsyncGenerator[None, None]:
     """Create tables before test and drop them after."""
@@ -81,6 +125,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
     app.dependency_overrides[google_tts_service] = lambda: _tts_mock
 
     async with AsyncClient(
@@ -196,3 +241,32 @@ async def auth_superuser(db_session: AsyncSession) -> dict:
         "token": access_token,
         "headers": {"Authorization": f"Bearer {access_token}"},
     }
+
+
+@pytest.fixture
+def make_ogg_opus():
+    """
+    Build a minimal mono Ogg/Opus file: OpusHead and OpusTags pages followed
+    by one page per audio packet (960 samples each, 312 samples pre-skip).
+    """
+
+    def _lacing(packet: bytes) -> bytes:
+        return bytes([255] * (len(packet) // 255) + [len(packet) % 255])
+
+    def _build(serial: int, packets: list[bytes]) -> bytes:
+        head = b"OpusHead" + struct.pack("<BBHIhB", 1, 1, 312, 48000, 0, 0)
+        vendor = b"test"
+        tags = b"OpusTags" + struct.pack("<I", len(vendor)) + vendor + b"\0" * 4
+        pages = [
+            OggPage(FLAG_BOS, 0, serial, 0, _lacing(head), head),
+            OggPage(0, 0, serial, 1, _lacing(tags), tags),
+        ]
+        for index, packet in enumerate(packets):
+            flags = FLAG_EOS if index == len(packets) - 1 else 0
+            granule = 312 + (index + 1) * 960
+            pages.append(
+                OggPage(flags, granule, serial, index + 2, _lacing(packet), packet)
+            )
+        return b"".join(page.to_bytes() for page in pages)
+
+    return _build
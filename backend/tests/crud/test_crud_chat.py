@@ -239,3 +239,57 @@ async def test_get_recent_by_session_id_ordering(db_session: AsyncSession) -> No
     assert ordered[0].content == "Single message"
     assert ordered[1].content == "Message 2"
     assert ordered[-1].content == "Message 6"
+
+
+@pytest.mark.asyncio
+async def test_unsummarized_messages_after_cursor(db_session: AsyncSession) -> None:
+    user_in = UserCreate(
+        telegram_id=777888999, full_name="Cursor Test User", username="cursortest"
+    )
+    user = await crud_user.create(db_session, obj_in=user_in)
+    session = await crud_session.create(
+        db_session, obj_in=ChatSessionCreate(user_id=user.id, title="Cursor Session")
+    )
+    messages = []
+    for content in ("one", "three", "fifteen"):
+        chat_in = ChatHistoryCreate(
+            user_id=user.id, role=ChatRole.USER, content=content, session_id=session.id
+        )
+        messages.append(await crud_chat.create(db_session, obj_in=chat_in))
+
+    after_first = await crud_chat.get_after_id(
+        db_session, session_id=session.id, after_id=messages[0].id
+    )
+    assert [m.content for m in after_first] == ["three", "fifteen"]
+    assert await crud_chat.get_after_id(
+        db_session, session_id=session.id, after_id=None, limit=1
+    ) == [messages[0]]
+    assert (
+        await crud_chat.get_content_length_by_session_id(
+            db_session,
+            session_id=session.id,
+            after_id=messages[0].id,
+            up_to_id=messages[1].id,
+        )
+        == 5
+    )
+
+    assert await crud_session.advance_summary(
+        db_session,
+        id=session.id,
+        expected_through_id=None,
+        through_id=messages[1].id,
+        summary="Counted to three.",
+    )
+    # A run that read the old cursor loses
+    assert not await crud_session.advance_summary(
+        db_session,
+        id=session.id,
+        expected_through_id=None,
+        through_id=messages[2].id,
+        summary="Stale.",
+    )
+    await db_session.commit()
+    await db_session.refresh(session)
+    assert session.summary == "Counted to three."
+    assert session.summarized_through_message_id == messages[1].id
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.crud_job import background_job as crud_job
+from app.schemas.enums import JobStatus
+
+LOCK = timedelta(minutes=5)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+async def _enqueue(db: AsyncSession, kind: str = "test", **kwargs):
+    kwargs.setdefault("payload", {})
+    kwargs.setdefault("run_after", _now())
+    kwargs.setdefault("priority", 0)
+    kwargs.setdefault("max_attempts", 3)
+    return await crud_job.enqueue(db, kind=kind, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_coalesces_queued_job_with_same_key(
+    db_session: AsyncSession,
+) -> None:
+    first, created = await _enqueue(
+        db_session, payload={"n": 1}, run_after=_now(), dedupe_key="k"
+    )
+    assert created
+
+    later = _now() + timedelta(seconds=30)
+    second, created = await _enqueue(
+        db_session, payload={"n": 2}, run_after=later, dedupe_key="k"
+    )
+
+    assert not created
+    assert second.id == first.id
+    assert second.payload == {"n": 2}
+    # Postponed to the later run time, so nothing is due yet
+    assert await crud_job.claim(db_session, limit=10, lock_for=LOCK) == []
+
+
+@pytest.mark.asyncio
+async def test_claim_orders_by_priority_and_filters_kinds(
+    db_session: AsyncSession,
+) -> None:
+    low, _ = await _enqueue(db_session, kind="a", priority=-10)
+    high, _ = await _enqueue(db_session, kind="b", priority=10)
+    other, _ = await _enqueue(db_session, kind="c", priority=20)
+
+    jobs = await crud_job.claim(db_session, limit=10, lock_for=LOCK, kinds=["a", "b"])
+
+    assert [job.id for job in jobs] == [high.id, low.id]
+    assert all(job.status == JobStatus.RUNNING for job in jobs)
+    assert all(job.attempts == 1 for job in jobs)
+    # Claimed jobs are not handed out twice
+    assert [
+        job.id for job in await crud_job.claim(db_session, limit=10, lock_for=LOCK)
+    ] == [other.id]
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_job_whose_key_is_running(db_session: AsyncSession) -> None:
+    await _enqueue(db_session, dedupe_key="k")
+    [running] = await crud_job.claim(db_session, limit=1, lock_for=LOCK)
+
+    # Only queued jobs coalesce, so this is a second job with the same key
+    queued, created = await _enqueue(db_session, dedupe_key="k")
+    assert created
+    assert await crud_job.claim(db_session, limit=1, lock_for=LOCK) == []
+
+    await crud_job.complete(db_session, job=running)
+    [claimed] = await crud_job.claim(db_session, limit=1, lock_for=LOCK)
+    assert claimed.id == queued.id
+
+
+@pytest.mark.asyncio
+async def test_expired_lock_is_reclaimed_and_stale_owner_ignored(
+    db_session: AsyncSession,
+) -> None:
+    await _enqueue(db_session)
+    [stale] = await crud_job.claim(db_session, limit=1, lock_for=timedelta(seconds=-1))
+    stale_attempts = stale.attempts
+
+    [reclaimed] = await crud_job.claim(db_session, limit=1, lock_for=LOCK)
+    assert reclaimed.id == stale.id
+    assert reclaimed.attempts == stale_attempts + 1
+
+    # The first owner no longer holds the job
+    stale.attempts = stale_attempts
+    await crud_job.complete(db_session, job=stale)
+    assert await crud_job.get(db_session, id=reclaimed.id) is not None
+
+    await crud_job.complete(db_session, job=reclaimed)
+    assert await crud_job.get(db_session, id=reclaimed.id) is None
+
+
+@pytest.mark.asyncio
+async def test_retry_or_fail_requeues_until_out_of_attempts(
+    db_session: AsyncSession,
+) -> None:
+    job, _ = await _enqueue(db_session, max_attempts=2)
+
+    [job] = await crud_job.claim(db_session, limit=1, lock_for=LOCK)
+    status = await crud_job.retry_or_fail(
+        db_session, job=job, error="boom", delay=timedelta(0)
+    )
+    assert status == JobStatus.QUEUED
+
+    [job] = await crud_job.claim(db_session, limit=1, lock_for=LOCK)
+    status = await crud_job.retry_or_fail(
+        db_session, job=job, error="boom again", delay=timedelta(0)
+    )
+    assert status == JobStatus.FAILED
+
+    job = await crud_job.get(db_session, id=job.id)
+    assert job.status == JobStatus.FAILED
+    assert job.last_error == "boom again"
+    assert await crud_job.claim(db_session, limit=1, lock_for=LOCK) == []
+
+
+@pytest.mark.asyncio
+async def test_release_requeues_without_using_an_attempt(
+    db_session: AsyncSession,
+) -> None:
+    await _enqueue(db_session)
+    [job] = await crud_job.claim(db_session, limit=1, lock_for=LOCK)
+
+    await crud_job.release(db_session, job=job)
+
+    [job] = await crud_job.claim(db_session, limit=1, lock_for=LOCK)
+    assert job.attempts == 1
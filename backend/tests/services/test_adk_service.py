@@ -81,7 +81,7 @@ class TestProcessChat:
                 "app.services.adk_service.build_personalized_prompt",
                 new_callable=AsyncMock,
             ),
-            patch("app.services.adk_service.InMemoryRunner", return_value=mock_runner),
+            patch("google.adk.runners.InMemoryRunner", return_value=mock_runner),
         ):
             mock_create_tools.return_value = {
                 "weather": [AsyncMock()],
@@ -124,7 +124,7 @@ class TestProcessChat:
                 "app.services.adk_service.build_personalized_prompt",
                 new_callable=AsyncMock,
             ),
-            patch("app.services.adk_service.InMemoryRunner", return_value=mock_runner),
+            patch("google.adk.runners.InMemoryRunner", return_value=mock_runner),
         ):
             mock_ct.return_value = {
                 "weather": [],
@@ -184,7 +184,7 @@ class TestProcessChat:
                 "app.services.adk_service.build_personalized_prompt",
                 new_callable=AsyncMock,
             ),
-            patch("app.services.adk_service.InMemoryRunner", return_value=mock_runner),
+            patch("google.adk.runners.InMemoryRunner", return_value=mock_runner),
             patch.object(adk_svc, "_log_function_call") as mock_log_fc,
             patch.object(adk_svc, "_log_agent_delegation") as mock_log_del,
         ):
@@ -243,7 +243,7 @@ class TestGenerateSessionSummary:
 
         with (
             patch("app.services.adk_service.create_summary_agent"),
-            patch("app.services.adk_service.InMemoryRunner", return_value=mock_runner),
+            patch("google.adk.runners.InMemoryRunner", return_value=mock_runner),
         ):
             result = await adk_svc.generate_session_summary(
                 current_summary=None,
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.services.calendar_listing import (
+    EVENT_LIST_FIELDS,
+    iter_event_pages,
+    list_events,
+)
+from app.services.google_calendar import GoogleCalendarService
+
+
+def _paged_service(pages):
+    """A Calendar service serving ``pages`` keyed by the requested pageToken."""
+    service = MagicMock()
+    service.list_calls = []
+
+    def _list(**params):
+        service.list_calls.append(params)
+        request = MagicMock()
+        request.execute.return_value = pages[params["pageToken"]]
+        return request
+
+    service.events().list.side_effect = _list
+    return service
+
+
+PAGES = {
+    None: {"items": [{"id": "a"}, {"id": "b"}], "nextPageToken": "p2"},
+    "p2": {"items": [{"id": "c"}], "nextPageToken": "p3"},
+    "p3": {"items": [{"id": "d"}], "nextSyncToken": "sync-1"},
+}
+
+
+@pytest.mark.asyncio
+async def test_iter_event_pages_streams_every_page(monkeypatch):
+    monkeypatch.setattr(settings, "CALENDAR_LIST_PAGE_SIZE", 2)
+    service = _paged_service(PAGES)
+
+    pages = [page async for page in iter_event_pages(service, timeMin="t")]
+
+    assert [[e["id"] for e in page.items] for page in pages] == [
+        ["a", "b"],
+        ["c"],
+        ["d"],
+    ]
+    assert [page.next_sync_token for page in pages] == [None, None, "sync-1"]
+    for params in service.list_calls:
+        assert params["fields"] == EVENT_LIST_FIELDS
+        assert params["maxResults"] == 2
+        assert params["calendarId"] == "primary"
+        assert params["timeMin"] == "t"
+
+
+@pytest.mark.asyncio
+async def test_list_events_collects_pages_and_sync_token():
+    items, sync_token = await list_events(_paged_service(PAGES))
+    assert [e["id"] for e in items] == ["a", "b", "c", "d"]
+    assert sync_token == "sync-1"
+
+
+@pytest.mark.asyncio
+async def test_fetch_events_raw_returns_events_beyond_first_page(monkeypatch):
+    monkeypatch.setattr(settings, "CALENDAR_STORE_ENABLED", False)
+    service = _paged_service(PAGES)
+    calendar = GoogleCalendarService()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    with (
+        patch.object(
+            calendar, "_get_calendar_service", AsyncMock(return_value=service)
+        ),
+        patch(
+            "app.services.google_calendar.crud_user.get",
+            AsyncMock(return_value=MagicMock(google_refresh_token="rt")),
+        ),
+    ):
+        events = await calendar._fetch_events_raw(
+            1, now, now + timedelta(days=30), AsyncMock()
+        )
+
+    assert [e["id"] for e in events] == ["a", "b", "c", "d"]
+    assert service.list_calls[0]["orderBy"] == "startTime"
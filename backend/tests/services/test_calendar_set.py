@@ -0,0 +1,164 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytz
+from googleapiclient.errors import HttpError
+
+from app.core.config import settings
+from app.services.calendar_listing import list_calendar_ids
+from app.services.calendar_set import CalendarSetCache
+from app.services.calendar_store import merge_by_start
+from app.services.google_calendar import GoogleCalendarService
+
+CALENDAR_LIST = {
+    None: {
+        "items": [
+            {"id": "me@example.com", "primary": True, "selected": True},
+            {"id": "family", "selected": True},
+            {"id": "holidays"},
+        ],
+        "nextPageToken": "p2",
+    },
+    "p2": {"items": [{"id": "work", "selected": True}]},
+}
+
+
+def _event(event_id, start_hour):
+    start = datetime(2026, 3, 10, start_hour, tzinfo=timezone.utc)
+    return {
+        "id": event_id,
+        "summary": event_id,
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+    }
+
+
+def _multi_calendar_service(events_by_calendar, barrier=None):
+    """A Calendar service with ``calendarList`` and per-calendar ``events.list``."""
+    service = MagicMock()
+    service.list_calls = []
+
+    def _calendar_list(**params):
+        request = MagicMock()
+        request.execute.return_value = CALENDAR_LIST[params["pageToken"]]
+        return request
+
+    def _events_list(**params):
+        service.list_calls.append(params)
+        response = events_by_calendar[params["calendarId"]]
+
+        def _execute():
+            if barrier is not None:
+                barrier.wait()
+            if isinstance(response, Exception):
+                raise response
+            return {"items": response}
+
+        request = MagicMock()
+        request.execute.side_effect = _execute
+        return request
+
+    service.calendarList().list.side_effect = _calendar_list
+    service.events().list.side_effect = _events_list
+    return service
+
+
+@pytest.mark.asyncio
+async def test_list_calendar_ids_keeps_selected_calendars():
+    service = _multi_calendar_service({})
+    assert await list_calendar_ids(service) == ["primary", "family", "work"]
+
+
+@pytest.mark.asyncio
+async def test_calendar_set_cache_caps_and_falls_back(monkeypatch):
+    monkeypatch.setattr(settings, "CALENDAR_MULTI_ENABLED", True)
+    monkeypatch.setattr(settings, "CALENDAR_MAX_CALENDARS", 2)
+    cache = CalendarSetCache()
+    service = _multi_calendar_service({})
+
+    assert await cache.get_calendar_ids(1, service) == ["primary", "family"]
+    service.calendarList().list.side_effect = RuntimeError("boom")
+    # Cached within the TTL
+    assert await cache.get_calendar_ids(1, service) == ["primary", "family"]
+    cache.invalidate(1)
+    assert await cache.get_calendar_ids(1, service) == ["primary"]
+
+
+def test_merge_by_start_interleaves_and_dedupes():
+    primary = [_event("a", 8), _event("shared", 10), _event("c", 12)]
+    family = [_event("b", 9), _event("shared", 10), _event("d", 13)]
+
+    merged = merge_by_start([primary, family, []], pytz.timezone("Europe/Kiev"))
+
+    assert [e["id"] for e in merged] == ["a", "b", "shared", "c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_events_raw_fetches_calendars_concurrently(monkeypatch):
+    monkeypatch.setattr(settings, "CALENDAR_MULTI_ENABLED", True)
+    monkeypatch.setattr(settings, "CALENDAR_STORE_ENABLED", False)
+    # Every events.list waits for the other two, so a sequential fetch times out
+    barrier = threading.Barrier(3, timeout=5)
+    service = _multi_calendar_service(
+        {
+            "primary": [_event("p1", 8), _event("p2", 11)],
+            "family": [_event("f1", 9)],
+            "work": [_event("w1", 10)],
+        },
+        barrier=barrier,
+    )
+    calendar = GoogleCalendarService()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    with (
+        patch.object(
+            calendar, "_get_calendar_service", AsyncMock(return_value=service)
+        ),
+        patch(
+            "app.services.google_calendar.crud_user.get",
+            AsyncMock(return_value=MagicMock(google_refresh_token="rt")),
+        ),
+    ):
+        events = await calendar._fetch_events_raw(
+            1, now, now + timedelta(days=1), AsyncMock()
+        )
+
+    assert [e["id"] for e in events] == ["p1", "f1", "w1", "p2"]
+    assert {params["calendarId"] for params in service.list_calls} == {
+        "primary",
+        "family",
+        "work",
+    }
+
+
+@pytest.mark.asyncio
+async def test_unreadable_secondary_calendar_is_skipped(monkeypatch):
+    monkeypatch.setattr(settings, "CALENDAR_MULTI_ENABLED", True)
+    service = _multi_calendar_service(
+        {
+            "primary": [],
+            "family": HttpError(MagicMock(status=404), b"Not Found"),
+            "work": [_event("w1", 10)],
+        }
+    )
+    calendar = GoogleCalendarService()
+
+    with (
+        patch.object(
+            calendar, "_get_calendar_service", AsyncMock(return_value=service)
+        ),
+        patch(
+            "app.services.google_calendar.crud_user.get",
+            AsyncMock(return_value=MagicMock(google_refresh_token="rt")),
+        ),
+    ):
+        events = await calendar.get_events_in_range(
+            1,
+            datetime(2026, 3, 10),
+            datetime(2026, 3, 11),
+            AsyncMock(),
+        )
+
+    assert [e.id for e in events] == ["w1"]
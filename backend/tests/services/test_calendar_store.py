@@ -0,0 +1,187 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytz
+from googleapiclient.errors import HttpError
+
+from app.core.config import settings
+from app.schemas.calendar import CalendarEventCreate
+from app.services.calendar_store import (
+    CalendarEventStore,
+    IntervalIndex,
+    event_bounds,
+)
+from app.services.google_calendar import GoogleCalendarService
+
+TZ = "Europe/Kiev"
+
+
+def _at(hours: float) -> datetime:
+    base = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    return base + timedelta(hours=hours)
+
+
+def _event(event_id, start_hours, end_hours, **extra):
+    return {
+        "id": event_id,
+        "summary": event_id,
+        "start": {"dateTime": _at(start_hours).isoformat()},
+        "end": {"dateTime": _at(end_hours).isoformat()},
+        **extra,
+    }
+
+
+def _fake_service(*responses):
+    """A Calendar service whose ``events.list`` returns ``responses`` in order."""
+    service = MagicMock()
+    service.list_calls = []
+    queue = list(responses)
+
+    def _list(**params):
+        service.list_calls.append(params)
+        request = MagicMock()
+        response = queue.pop(0)
+        if isinstance(response, Exception):
+            request.execute.side_effect = response
+        else:
+            request.execute.return_value = response
+        return request
+
+    service.events().list.side_effect = _list
+    return service
+
+
+def test_interval_index_overlapping():
+    t = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    h = timedelta(hours=1)
+    index = IntervalIndex(
+        [
+            (t, t + 48 * h, "long"),
+            (t + 10 * h, t + 11 * h, "a"),
+            (t + 12 * h, t + 12 * h, "point"),
+            (t + 11 * h, t + 13 * h, "b"),
+            (t + 30 * h, t + 31 * h, "later"),
+        ]
+    )
+
+    assert index.overlapping(t + 10 * h, t + 12 * h) == ["long", "a", "b"]
+    assert index.overlapping(t + 12 * h, t + 14 * h) == ["long", "b", "point"]
+    # Touching intervals do not overlap a half-open range
+    assert index.overlapping(t + 31 * h, t + 32 * h) == ["long"]
+    assert IntervalIndex([]).overlapping(t, t + h) == []
+
+
+def test_event_bounds_all_day_uses_calendar_timezone():
+    tz = pytz.timezone(TZ)
+    start, end = event_bounds(
+        {"start": {"date": "2026-03-10"}, "end": {"date": "2026-03-11"}}, tz
+    )
+    assert start == tz.localize(datetime(2026, 3, 10))
+    assert end - start == timedelta(days=1)
+    assert event_bounds({"start": {}}, tz) is None
+
+
+@pytest.mark.asyncio
+async def test_full_sync_then_local_reads():
+    store = CalendarEventStore()
+    service = _fake_service(
+        {"items": [_event("e1", 1, 2)], "nextPageToken": "p2"},
+        {"items": [_event("e2", 30, 31)], "nextSyncToken": "s1"},
+    )
+
+    today = await store.get_events(1, service, _at(0), _at(24), TZ)
+    later = await store.get_events(1, service, _at(24), _at(48), TZ)
+
+    assert [e["id"] for e in today] == ["e1"]
+    assert [e["id"] for e in later] == ["e2"]
+    # Two pages of one full sync; the second read was local
+    assert len(service.list_calls) == 2
+    assert service.list_calls[1]["pageToken"] == "p2"
+    assert "timeMin" in service.list_calls[0]
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_applies_changes(monkeypatch):
+    store = CalendarEventStore()
+    service = _fake_service(
+        {"items": [_event("e1", 1, 2), _event("e2", 3, 4)], "nextSyncToken": "s1"},
+        {
+            "items": [
+                {"id": "e1", "status": "cancelled"},
+                _event("e3", 5, 6),
+            ],
+            "nextSyncToken": "s2",
+        },
+    )
+    await store.get_events(1, service, _at(0), _at(24), TZ)
+
+    monkeypatch.setattr(settings, "CALENDAR_SYNC_INTERVAL_SEC", 0)
+    events = await store.get_events(1, service, _at(0), _at(24), TZ)
+
+    assert [e["id"] for e in events] == ["e2", "e3"]
+    assert service.list_calls[1]["syncToken"] == "s1"
+    assert "timeMin" not in service.list_calls[1]
+
+
+@pytest.mark.asyncio
+async def test_expired_sync_token_triggers_full_sync(monkeypatch):
+    store = CalendarEventStore()
+    service = _fake_service(
+        {"items": [_event("e1", 1, 2)], "nextSyncToken": "s1"},
+        HttpError(MagicMock(status=410), b"Gone"),
+        {"items": [_event("e9", 1, 2)], "nextSyncToken": "s9"},
+    )
+    await store.get_events(1, service, _at(0), _at(24), TZ)
+
+    monkeypatch.setattr(settings, "CALENDAR_SYNC_INTERVAL_SEC", 0)
+    events = await store.get_events(1, service, _at(0), _at(24), TZ)
+
+    assert [e["id"] for e in events] == ["e9"]
+    assert "timeMin" in service.list_calls[2]
+
+
+@pytest.mark.asyncio
+async def test_range_outside_store_window_is_not_answered():
+    store = CalendarEventStore()
+    service = _fake_service({"items": [], "nextSyncToken": "s1"})
+    far_future = _at(24 * (settings.CALENDAR_STORE_FUTURE_DAYS + 1))
+
+    assert (
+        await store.get_events(
+            1, service, far_future, far_future + timedelta(days=1), TZ
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_and_delete_write_through():
+    service = _fake_service({"items": [], "nextSyncToken": "s1"})
+    created = _event("new", 2, 3, htmlLink="https://calendar/new")
+    service.events().insert().execute.return_value = created
+    calendar = GoogleCalendarService()
+
+    with (
+        patch.object(
+            calendar, "_get_calendar_service", AsyncMock(return_value=service)
+        ),
+        patch(
+            "app.services.google_calendar.crud_user.get",
+            AsyncMock(return_value=MagicMock(google_refresh_token="rt")),
+        ),
+    ):
+        assert await calendar.get_events_in_range(1, _at(0), _at(24), AsyncMock()) == []
+        await calendar.create_event(
+            1,
+            CalendarEventCreate(summary="new", start_time=_at(2), end_time=_at(3)),
+            AsyncMock(),
+        )
+        events = await calendar.get_events_in_range(1, _at(0), _at(24), AsyncMock())
+        assert [e.id for e in events] == ["new"]
+
+        await calendar.delete_event(1, "new", AsyncMock())
+        assert await calendar.get_events_in_range(1, _at(0), _at(24), AsyncMock()) == []
+
+    # Only the initial full sync hit events.list
+    assert len(service.list_calls) == 1
@@ -0,0 +1,177 @@
+"""Tests for the chat job background worker."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud.crud_chat import chat as crud_chat
+from app.crud.crud_chat_job import chat_job as crud_chat_job
+from app.crud.crud_session import chat_session as crud_session
+from app.crud.crud_user import user as crud_user
+from app.schemas.chat import ChatJobCreate, ChatSessionCreate
+from app.schemas.enums import ChatJobStatus, ChatRole
+from app.models.job import BackgroundJob
+from app.schemas.user import UserCreate
+from app.services.chat_jobs import FAILURE_MESSAGE, enqueue_chat_job, run_chat_job
+from app.services.job_queue import JobWorker
+
+
+@pytest.fixture
+async def queued_job(db_session: AsyncSession):
+    async def create(want_voice: bool = False):
+        user = await crud_user.create(
+            db_session,
+            obj_in=UserCreate(telegram_id=555, full_name="Job User", password="pw"),
+        )
+        session = await crud_session.create(
+            db_session, obj_in=ChatSessionCreate(user_id=user.id)
+        )
+        return await crud_chat_job.create(
+            db_session,
+            obj_in=ChatJobCreate(
+                user_id=user.id,
+                session_id=session.id,
+                message="What is on today?",
+                want_voice=want_voice,
+                chat_id=555,
+            ),
+        )
+
+    return create
+
+
+@pytest.fixture
+def telegram():
+    client = MagicMock()
+    client.send_message = AsyncMock()
+    client.send_voice = AsyncMock()
+    with patch(
+        "app.services.chat_jobs.telegram_client",
+        MagicMock(aget=AsyncMock(return_value=client)),
+    ):
+        yield client
+
+
+@pytest.fixture
+def adk(db_session: AsyncSession):
+    adk = MagicMock()
+    adk.process_chat = AsyncMock(return_value="Two meetings.")
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    with (
+        patch("app.services.chat_jobs.AsyncSessionLocal", session_factory),
+        patch("app.services.chat_jobs.ADKService", return_value=adk),
+    ):
+        yield adk
+
+
+@pytest.mark.asyncio
+async def test_run_chat_job_stores_and_delivers_reply(
+    db_session: AsyncSession, queued_job, adk, telegram
+) -> None:
+    tts = MagicMock()
+    tts.synthesize = AsyncMock(return_value=b"ogg")
+    job = await queued_job(want_voice=True)
+
+    with patch(
+        "app.services.chat_jobs.google_tts_service",
+        MagicMock(aget=AsyncMock(return_value=tts)),
+    ):
+        await run_chat_job(job.id)
+
+    await db_session.refresh(job)
+    assert job.status == ChatJobStatus.DONE
+    assert job.error is None
+    messages = await crud_chat.get_recent_by_session_id(
+        db_session, session_id=job.session_id, limit=10
+    )
+    assert [(m.role, m.content) for m in messages] == [
+        (ChatRole.USER, "What is on today?"),
+        (ChatRole.MODEL, "Two meetings."),
+    ]
+    assert job.assistant_message_id == messages[1].id
+    telegram.send_message.assert_awaited_once_with(555, "Two meetings.")
+    telegram.send_voice.assert_awaited_once_with(555, b"ogg")
+
+
+@pytest.mark.asyncio
+async def test_run_chat_job_failure_is_recorded_and_reported(
+    db_session: AsyncSession, queued_job, adk, telegram
+) -> None:
+    adk.process_chat.side_effect = RuntimeError("quota exceeded")
+    job = await queued_job()
+
+    await run_chat_job(job.id)
+
+    await db_session.refresh(job)
+    assert job.status == ChatJobStatus.FAILED
+    assert job.error == "quota exceeded"
+    telegram.send_message.assert_awaited_once_with(555, FAILURE_MESSAGE)
+
+
+@pytest.mark.asyncio
+async def test_run_chat_job_runs_only_once(
+    db_session: AsyncSession, queued_job, adk, telegram
+) -> None:
+    job = await queued_job()
+
+    await run_chat_job(job.id)
+    await run_chat_job(job.id)
+
+    adk.process_chat.assert_awaited_once()
+    telegram.send_message.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_chat_job_cut_short_by_shutdown_is_failed_and_reported(
+    db_session: AsyncSession, queued_job, adk, telegram
+) -> None:
+    started = asyncio.Event()
+
+    async def hang(**kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    adk.process_chat.side_effect = hang
+    job = await queued_job()
+    await enqueue_chat_job(db_session, job.id)
+    worker = JobWorker(
+        session_factory=async_sessionmaker(db_session.bind, expire_on_commit=False),
+        concurrency=1,
+    )
+
+    # Sessions share the one in-memory SQLite connection, which a query
+    # cancelled mid-flight would close, so the turn's side query is faked
+    with patch("app.services.chat_turn._unsummarized_chars", AsyncMock(return_value=0)):
+        assert await worker.poll() == 1
+        await started.wait()
+        await worker.close()
+
+    await db_session.refresh(job)
+    assert job.status == ChatJobStatus.FAILED
+    assert job.error == "Interrupted"
+    telegram.send_message.assert_awaited_once_with(555, FAILURE_MESSAGE)
+
+    # The released queue job is picked up again but does not rerun the turn
+    assert await worker.drain() == 1
+    adk.process_chat.assert_awaited_once()
+    telegram.send_message.assert_awaited_once()
+    assert (await db_session.execute(select(BackgroundJob))).first() is None
+
+
+@pytest.mark.asyncio
+async def test_chat_job_orphaned_by_dead_instance_is_failed_and_reported(
+    db_session: AsyncSession, queued_job, adk, telegram
+) -> None:
+    job = await queued_job()
+    # Claimed by an instance that died before finishing the turn
+    assert await crud_chat_job.claim(db_session, id=job.id)
+
+    await run_chat_job(job.id)
+
+    await db_session.refresh(job)
+    assert job.status == ChatJobStatus.FAILED
+    adk.process_chat.assert_not_awaited()
+    telegram.send_message.assert_awaited_once_with(555, FAILURE_MESSAGE)
@@ -1,147 +1,178 @@
-"""Tests for the chat_manager background task worker."""
+"""Tests for chat session summaries."""
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.services.chat_manager import update_session_summary_task
+from app.core.config import settings
+from app.services.chat_manager import (
+    SummaryNotGenerated,
+    summarize_session,
+    summary_is_due,
+)
 
 
 @pytest.fixture
 def mock_db():
-    """A mock async context manager simulating AsyncSessionLocal()."""
+    """A mock async database session."""
     db = AsyncMock()
-    db.__aenter__ = AsyncMock(return_value=db)
-    db.__aexit__ = AsyncMock(return_value=False)
     db.commit = AsyncMock()
     db.rollback = AsyncMock()
     return db
 
 
+@pytest.fixture
+def mock_adk():
+    adk = MagicMock()
+    adk.generate_session_summary = AsyncMock(return_value="New concise summary.")
+    return adk
+
+
+def _patch_session(session):
+    return patch(
+        "app.services.chat_manager.crud_session.get",
+        new_callable=AsyncMock,
+        return_value=session,
+    )
+
+
+def _patch_messages(messages):
+    return patch(
+        "app.services.chat_manager.crud_chat.get_after_id",
+        new_callable=AsyncMock,
+        return_value=messages,
+    )
+
+
+def _patch_advance(stored=True):
+    return patch(
+        "app.services.chat_manager.crud_session.advance_summary",
+        new_callable=AsyncMock,
+        return_value=stored,
+    )
+
+
 @pytest.mark.asyncio
-async def test_update_session_summary_task_happy_path(mock_db):
-    """Summary task fetches session + messages, calls ADKService, updates and commits."""
+async def test_summarize_session_happy_path(mock_db, mock_adk):
+    """Fetches session + messages, calls ADKService, advances and commits."""
     mock_session = MagicMock()
     mock_session.summary = "Old summary."
+    mock_session.summarized_through_message_id = 10
 
     mock_messages = [
-        MagicMock(role="user", content="Hello"),
-        MagicMock(role="model", content="Hi there"),
+        MagicMock(id=11, role="user", content="Hello"),
+        MagicMock(id=12, role="model", content="Hi there"),
     ]
 
     with (
-        patch("app.services.chat_manager.AsyncSessionLocal", return_value=mock_db),
-        patch(
-            "app.services.chat_manager.crud_session.get",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ),
-        patch(
-            "app.services.chat_manager.crud_chat.get_recent_by_session_id",
-            new_callable=AsyncMock,
-            return_value=mock_messages,
-        ),
-        patch(
-            "app.services.chat_manager.crud_session.update",
-            new_callable=AsyncMock,
-        ) as mock_update,
-        patch("app.services.chat_manager.ADKService") as MockADK,
+        _patch_session(mock_session),
+        _patch_messages(mock_messages) as mock_get_after_id,
+        _patch_advance() as mock_advance,
     ):
-        mock_adk_instance = MagicMock()
-        mock_adk_instance.generate_session_summary = AsyncMock(
-            return_value="New concise summary."
-        )
-        MockADK.return_value = mock_adk_instance
+        await summarize_session(mock_db, 42, mock_adk)
 
-        await update_session_summary_task(session_id=42)
+    mock_adk.generate_session_summary.assert_awaited_once_with(
+        current_summary="Old summary.",
+        recent_messages=mock_messages,
+    )
 
-        # Verify ADKService was called with the right args
-        mock_adk_instance.generate_session_summary.assert_awaited_once_with(
-            current_summary="Old summary.",
-            recent_messages=mock_messages,
-        )
+    # Only the messages after the cursor are folded in
+    assert mock_get_after_id.await_args.kwargs["after_id"] == 10
 
-        # Verify summary was persisted
-        mock_update.assert_awaited_once_with(
-            mock_db,
-            db_obj=mock_session,
-            obj_in={"summary": "New concise summary."},
-        )
-        mock_db.commit.assert_awaited_once()
+    # Verify summary was persisted and the cursor advanced
+    mock_advance.assert_awaited_once_with(
+        mock_db,
+        id=42,
+        expected_through_id=10,
+        through_id=12,
+        summary="New concise summary.",
+    )
+    mock_db.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_update_session_summary_task_session_not_found(mock_db):
-    """Task should exit gracefully when session doesn't exist."""
-    with (
-        patch("app.services.chat_manager.AsyncSessionLocal", return_value=mock_db),
-        patch(
-            "app.services.chat_manager.crud_session.get",
-            new_callable=AsyncMock,
-            return_value=None,
-        ),
-        patch("app.services.chat_manager.ADKService") as MockADK,
-    ):
-        await update_session_summary_task(session_id=999)
+async def test_summarize_session_session_not_found(mock_db, mock_adk):
+    """Exits quietly when the session doesn't exist."""
+    with _patch_session(None):
+        await summarize_session(mock_db, 999, mock_adk)
 
-        # ADKService should never be instantiated
-        MockADK.assert_not_called()
-        mock_db.commit.assert_not_awaited()
+    mock_adk.generate_session_summary.assert_not_awaited()
+    mock_db.commit.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_update_session_summary_task_no_messages(mock_db):
-    """Task should exit gracefully when there are no messages to summarise."""
+async def test_summarize_session_no_messages(mock_db, mock_adk):
+    """Exits quietly when there are no messages to summarise."""
     mock_session = MagicMock()
     mock_session.summary = None
 
+    with _patch_session(mock_session), _patch_messages([]):
+        await summarize_session(mock_db, 42, mock_adk)
+
+    mock_adk.generate_session_summary.assert_not_awaited()
+    mock_db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_summarize_session_llm_error_propagates(mock_db, mock_adk):
+    """ADKService failures raise, so the summary job is retried."""
+    mock_session = MagicMock()
+    mock_session.summary = "Existing."
+    mock_adk.generate_session_summary.side_effect = Exception("ADK down")
+
     with (
-        patch("app.services.chat_manager.AsyncSessionLocal", return_value=mock_db),
-        patch(
-            "app.services.chat_manager.crud_session.get",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ),
-        patch(
-            "app.services.chat_manager.crud_chat.get_recent_by_session_id",
-            new_callable=AsyncMock,
-            return_value=[],
-        ),
-        patch("app.services.chat_manager.ADKService") as MockADK,
+        _patch_session(mock_session),
+        _patch_messages([MagicMock(id=1, role="user", content="Hi")]),
+        pytest.raises(Exception, match="ADK down"),
     ):
-        await update_session_summary_task(session_id=42)
+        await summarize_session(mock_db, 42, mock_adk)
 
-        MockADK.assert_not_called()
-        mock_db.commit.assert_not_awaited()
+    mock_db.commit.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_update_session_summary_task_llm_error_rolls_back(mock_db):
-    """On ADKService failure, the DB transaction should be rolled back."""
+@pytest.mark.parametrize("fallback", ["", "Existing."])
+async def test_summarize_session_keeps_cursor_on_fallback_summary(
+    mock_db, mock_adk, fallback
+):
+    """An empty or unchanged summary does not advance the cursor."""
     mock_session = MagicMock()
     mock_session.summary = "Existing."
+    mock_session.summarized_through_message_id = None
+    mock_adk.generate_session_summary.return_value = fallback
+
+    with (
+        _patch_session(mock_session),
+        _patch_messages([MagicMock(id=1, role="user", content="Hi")]),
+        _patch_advance() as mock_advance,
+        pytest.raises(SummaryNotGenerated),
+    ):
+        await summarize_session(mock_db, 42, mock_adk)
+
+    mock_advance.assert_not_awaited()
+    mock_db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_summarize_session_discards_superseded_summary(mock_db, mock_adk):
+    """If another run moved the cursor first, nothing is committed."""
+    mock_session = MagicMock()
+    mock_session.summary = None
+    mock_session.summarized_through_message_id = None
 
     with (
-        patch("app.services.chat_manager.AsyncSessionLocal", return_value=mock_db),
-        patch(
-            "app.services.chat_manager.crud_session.get",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ),
-        patch(
-            "app.services.chat_manager.crud_chat.get_recent_by_session_id",
-            new_callable=AsyncMock,
-            return_value=[MagicMock(role="user", content="Hi")],
-        ),
-        patch("app.services.chat_manager.ADKService") as MockADK,
+        _patch_session(mock_session),
+        _patch_messages([MagicMock(id=1, role="user", content="Hi")]),
+        _patch_advance(stored=False),
     ):
-        mock_adk_instance = MagicMock()
-        mock_adk_instance.generate_session_summary = AsyncMock(
-            side_effect=Exception("ADK down")
-        )
-        MockADK.return_value = mock_adk_instance
+        await summarize_session(mock_db, 42, mock_adk)
+
+    mock_db.commit.assert_not_awaited()
+    mock_db.rollback.assert_awaited_once()
+
 
-        await update_session_summary_task(session_id=42)
+def test_summary_is_due_on_token_threshold(monkeypatch):
+    monkeypatch.setattr(settings, "SUMMARY_TOKEN_THRESHOLD", 100)
 
-        mock_db.commit.assert_not_awaited()
-        mock_db.rollback.assert_awaited_once()
+    assert not summary_is_due(399)
+    assert summary_is_due(400)
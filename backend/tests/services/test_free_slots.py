@@ -0,0 +1,165 @@
+from datetime import datetime, time, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytz
+
+from app.services.free_slots import find_free_slots
+from app.services.google_calendar import GoogleCalendarService
+
+TZ = pytz.timezone("Europe/Kiev")
+
+
+def _local(day: int, hour: int, minute: int = 0) -> datetime:
+    return TZ.localize(datetime(2026, 3, day, hour, minute))
+
+
+def test_slots_skip_busy_intervals():
+    busy = [
+        (_local(10, 9), _local(10, 10)),
+        (_local(10, 10, 30), _local(10, 12)),
+    ]
+
+    slots = find_free_slots(
+        busy, timedelta(minutes=60), _local(10, 0), _local(11, 0), TZ, limit=3
+    )
+
+    assert slots == [
+        (_local(10, 12), _local(10, 13)),
+        (_local(10, 13), _local(10, 14)),
+        (_local(10, 14), _local(10, 15)),
+    ]
+
+
+def test_gap_shorter_than_duration_is_skipped():
+    busy = [
+        (_local(10, 9), _local(10, 10)),
+        (_local(10, 10, 30), _local(10, 18)),
+    ]
+
+    slots = find_free_slots(
+        busy, timedelta(minutes=45), _local(10, 0), _local(12, 0), TZ, limit=1
+    )
+
+    assert slots == [(_local(11, 9), _local(11, 9, 45))]
+
+
+def test_buffer_is_kept_around_busy_time():
+    busy = [(_local(10, 9), _local(10, 10, 5))]
+
+    slots = find_free_slots(
+        busy,
+        timedelta(minutes=30),
+        _local(10, 0),
+        _local(11, 0),
+        TZ,
+        buffer=timedelta(minutes=10),
+        limit=1,
+    )
+
+    # 10:05 + 10 min buffer, rounded up to the 15-minute grid
+    assert slots == [(_local(10, 10, 15), _local(10, 10, 45))]
+
+
+def test_working_hours_and_range_bounds():
+    slots = find_free_slots(
+        [],
+        timedelta(minutes=60),
+        _local(10, 16, 20),
+        _local(11, 11, 0),
+        TZ,
+        working_hours_start=time(10, 0),
+        working_hours_end=time(18, 0),
+        limit=10,
+    )
+
+    assert slots == [
+        (_local(10, 16, 30), _local(10, 17, 30)),
+        (_local(11, 10), _local(11, 11)),
+    ]
+
+
+def test_overlapping_busy_intervals_and_limits():
+    busy = [
+        (_local(10, 8), _local(10, 11)),
+        (_local(10, 9), _local(10, 10)),
+        (_local(10, 10, 45), _local(10, 17, 30)),
+    ]
+
+    slots = find_free_slots(
+        busy, timedelta(minutes=30), _local(10, 0), _local(11, 0), TZ
+    )
+
+    assert slots == [(_local(10, 17, 30), _local(10, 18))]
+    assert find_free_slots([], timedelta(0), _local(10, 0), _local(11, 0), TZ) == []
+    assert (
+        find_free_slots([], timedelta(minutes=30), _local(11, 0), _local(10, 0), TZ)
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_uses_freebusy_response():
+    service = MagicMock()
+    service.freebusy().query().execute.return_value = {
+        "calendars": {
+            "primary": {
+                "busy": [
+                    {"start": "2026-03-10T07:00:00Z", "end": "2026-03-10T09:00:00Z"},
+                ]
+            }
+        }
+    }
+    calendar = GoogleCalendarService()
+
+    with patch.object(
+        calendar, "_get_calendar_service", AsyncMock(return_value=service)
+    ):
+        slots = await calendar.find_free_slots(
+            1,
+            AsyncMock(),
+            duration_minutes=60,
+            range_start=datetime(2026, 3, 10, 0, 0),
+            range_end=datetime(2026, 3, 11, 0, 0),
+            max_results=2,
+        )
+
+    # Busy 09:00-11:00 Kyiv time
+    assert [(slot.start, slot.end) for slot in slots] == [
+        (_local(10, 11), _local(10, 12)),
+        (_local(10, 12), _local(10, 13)),
+    ]
+    body = service.freebusy().query.call_args.kwargs["body"]
+    assert body["items"] == [{"id": "primary"}]
+    assert body["timeMin"] == "2026-03-10T00:00:00+02:00"
+
+
+@pytest.mark.asyncio
+async def test_service_rejects_freebusy_errors_and_bad_hours():
+    service = MagicMock()
+    service.freebusy().query().execute.return_value = {
+        "calendars": {"primary": {"errors": [{"reason": "notFound"}]}}
+    }
+    calendar = GoogleCalendarService()
+
+    with patch.object(
+        calendar, "_get_calendar_service", AsyncMock(return_value=service)
+    ):
+        with pytest.raises(ValueError, match="Free/busy"):
+            await calendar.find_free_slots(
+                1,
+                AsyncMock(),
+                duration_minutes=30,
+                range_start=datetime(2026, 3, 10),
+                range_end=datetime(2026, 3, 11),
+            )
+        with pytest.raises(ValueError, match="working_hours_end"):
+            await calendar.find_free_slots(
+                1,
+                AsyncMock(),
+                duration_minutes=30,
+                range_start=datetime(2026, 3, 10),
+                range_end=datetime(2026, 3, 11),
+                working_hours_start=time(18, 0),
+                working_hours_end=time(9, 0),
+            )
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.schemas.calendar import CalendarEventCreate
+from app.schemas.calendar import CalendarEventCreate, FreeSlot
 from app.services.gemini_tools import build_system_instruction, create_tools
 
 
@@ -225,6 +225,50 @@ class TestDeleteCalendarEventTool:
             assert "Unable to delete calendar event" in result
 
 
+class TestFindFreeSlotsTool:
+    @pytest.mark.asyncio
+    async def test_success(self, tools):
+        tool_groups, db = tools
+        slots_tool = tool_groups["calendar"][4]  # find_free_slots_tool
+
+        with patch("app.services.gemini_tools.GoogleCalendarService") as MockCal:
+            mock_cal = MockCal.return_value
+            mock_cal.find_free_slots = AsyncMock(
+                return_value=[
+                    FreeSlot(
+                        start=datetime.datetime(2026, 3, 10, 11, 0),
+                        end=datetime.datetime(2026, 3, 10, 12, 0),
+                    )
+                ]
+            )
+
+            result = await slots_tool(
+                duration_minutes=60,
+                days=2,
+                start_date_iso="2026-03-10",
+                working_hours_start="10:00",
+            )
+            assert "2026-03-10 11:00 - 12:00" in result
+            kwargs = mock_cal.find_free_slots.call_args.kwargs
+            assert kwargs["db"] is db
+            assert kwargs["range_start"] == datetime.datetime(2026, 3, 10)
+            assert kwargs["range_end"] == datetime.datetime(2026, 3, 12)
+            assert kwargs["working_hours_start"] == datetime.time(10, 0)
+
+    @pytest.mark.asyncio
+    async def test_no_slots_and_invalid_input(self, tools):
+        tool_groups, _ = tools
+        slots_tool = tool_groups["calendar"][4]
+
+        with patch("app.services.gemini_tools.GoogleCalendarService") as MockCal:
+            MockCal.return_value.find_free_slots = AsyncMock(return_value=[])
+
+            assert "No free 30-minute slots" in await slots_tool(duration_minutes=30)
+            assert "Invalid date or time format" in await slots_tool(
+                working_hours_start="nine"
+            )
+
+
 # ------------------------------------------------------------------ #
 # Knowledge base tool                                                 #
 # ------------------------------------------------------------------ #
@@ -0,0 +1,297 @@
+import asyncio
+import base64
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.crud_email_cache import cached_email as crud_cached_email
+from app.crud.crud_email_cache import gmail_sync_state as crud_sync_state
+from app.crud.crud_user import user as crud_user
+from app.schemas.gmail import EmailDetailLevel
+from app.schemas.user import UserCreate
+from app.services.gmail_mirror import MirrorQuery, parse_mirror_query
+from app.services.gmail_service import GmailService
+
+HOUR_MS = 3600 * 1000
+
+
+class _FakeBatch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+
+def _message(message_id, labels, age_hours=1, body=None):
+    msg = {
+        "id": message_id,
+        "labelIds": labels,
+        "snippet": f"snippet {message_id}",
+        "internalDate": str(int(time.time() * 1000) - age_hours * HOUR_MS),
+        "payload": {"headers": [{"name": "Subject", "value": f"subject {message_id}"}]},
+    }
+    if body is not None:
+        msg["payload"]["mimeType"] = "text/plain"
+        msg["payload"]["body"] = {
+            "data": base64.urlsafe_b64encode(body.encode()).decode()
+        }
+    return msg
+
+
+def _fake_service(mailbox, history_id="100"):
+    """A Gmail service mock serving ``mailbox`` (id -> message resource)."""
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: _FakeBatch(callback)
+    service.users().getProfile().execute.return_value = {"historyId": history_id}
+    service.users().messages().list().execute.side_effect = lambda: {
+        "messages": [{"id": i} for i in mailbox]
+    }
+    service.gets = []
+
+    def _get(userId, id, **params):
+        service.gets.append((id, params["format"]))
+        request = MagicMock()
+        request.execute.return_value = mailbox[id]
+        return request
+
+    service.users().messages().get.side_effect = _get
+    return service
+
+
+@pytest.fixture
+def gmail():
+    return GmailService()
+
+
+@pytest.fixture
+async def user_id(db_session: AsyncSession) -> int:
+    user = await crud_user.create(
+        db_session,
+        obj_in=UserCreate(telegram_id=515151, full_name="Mirror", username="mirror"),
+    )
+    return user.id
+
+
+def test_parse_mirror_query():
+    assert parse_mirror_query("is:unread") == MirrorQuery(unread_only=True)
+    assert parse_mirror_query("in:inbox newer_than:2d") == MirrorQuery(
+        label_id="INBOX", newer_than_days=2
+    )
+    assert parse_mirror_query("") is None
+    assert parse_mirror_query("from:boss@example.com is:unread") is None
+    assert parse_mirror_query("newer_than:1m") is None
+
+
+@pytest.mark.asyncio
+async def test_get_emails_served_from_mirror(gmail, db_session, user_id):
+    mailbox = {
+        "m1": _message("m1", ["INBOX", "UNREAD"], age_hours=1),
+        "m2": _message("m2", ["INBOX"], age_hours=2),
+        "m3": _message("m3", ["INBOX", "UNREAD"], age_hours=3),
+    }
+    service = _fake_service(mailbox)
+
+    with patch.object(gmail, "_get_gmail_client", AsyncMock(return_value=service)):
+        emails = await gmail.get_emails(
+            user_id, db_session, "is:unread newer_than:1d", 5, EmailDetailLevel.SNIPPET
+        )
+        assert [e.id for e in emails] == ["m1", "m3"]
+        assert emails[0].snippet == "snippet m1"
+
+        # Within the sync interval the second call does not touch the API
+        service.users().messages().list().execute.reset_mock()
+        emails = await gmail.get_emails(
+            user_id, db_session, "in:inbox", 2, EmailDetailLevel.METADATA
+        )
+
+    assert [e.id for e in emails] == ["m1", "m2"]
+    assert emails[0].snippet == ""
+    service.users().messages().list().execute.assert_not_called()
+    service.users().history().list().execute.assert_not_called()
+    # Seeding only ever fetched metadata
+    assert {fmt for _, fmt in service.gets} == {"metadata"}
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_applies_history(gmail, db_session, user_id):
+    mailbox = {
+        "m1": _message("m1", ["INBOX", "UNREAD"]),
+        "m2": _message("m2", ["INBOX", "UNREAD"]),
+    }
+    service = _fake_service(mailbox)
+    await gmail.mirror.sync(user_id, db_session, service)
+
+    mailbox["m3"] = _message("m3", ["INBOX", "UNREAD"], age_hours=0)
+    service.gets.clear()
+    service.users().history().list().execute.return_value = {
+        "historyId": "105",
+        "history": [
+            {"messagesAdded": [{"message": {"id": "m3", "labelIds": ["INBOX"]}}]},
+            {
+                "labelsRemoved": [
+                    {
+                        "message": {"id": "m1", "labelIds": ["INBOX"]},
+                        "labelIds": ["UNREAD"],
+                    }
+                ]
+            },
+            {
+                "labelsAdded": [
+                    {
+                        "message": {"id": "m2", "labelIds": ["TRASH"]},
+                        "labelIds": ["TRASH"],
+                    }
+                ]
+            },
+        ],
+    }
+    await gmail.mirror.sync(user_id, db_session, service, force=True)
+
+    rows = await crud_cached_email.get_by_message_ids(
+        db_session, user_id=user_id, message_ids=["m1", "m2", "m3"]
+    )
+    by_id = {row.message_id: row for row in rows}
+    assert set(by_id) == {"m1", "m3"}
+    assert by_id["m1"].is_unread is False
+    assert by_id["m3"].is_unread is True
+    # Only the new message was fetched
+    assert service.gets == [("m3", "metadata")]
+    state = await crud_sync_state.get_by_user_id(db_session, user_id=user_id)
+    assert state.history_id == "105"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_syncs_share_a_lock_across_services(db_session, user_id):
+    service = _fake_service({"m1": _message("m1", ["INBOX"])})
+
+    # The agent tools build a GmailService per call
+    await asyncio.gather(
+        GmailService().mirror.sync(user_id, db_session, service),
+        GmailService().mirror.sync(user_id, db_session, service),
+    )
+
+    assert service.gets == [("m1", "metadata")]
+
+
+@pytest.mark.asyncio
+async def test_expired_history_id_reseeds(gmail, db_session, user_id):
+    mailbox = {"m1": _message("m1", ["INBOX"])}
+    service = _fake_service(mailbox)
+    await gmail.mirror.sync(user_id, db_session, service)
+
+    mailbox["m2"] = _message("m2", ["INBOX"])
+    service.users().getProfile().execute.return_value = {"historyId": "900"}
+    service.users().history().list().execute.side_effect = HttpError(
+        MagicMock(status=404), b"Not Found"
+    )
+    await gmail.mirror.sync(user_id, db_session, service, force=True)
+
+    rows = await crud_cached_email.get_by_message_ids(
+        db_session, user_id=user_id, message_ids=["m1", "m2"]
+    )
+    assert {row.message_id for row in rows} == {"m1", "m2"}
+    state = await crud_sync_state.get_by_user_id(db_session, user_id=user_id)
+    assert state.history_id == "900"
+
+
+@pytest.mark.asyncio
+async def test_mirror_declines_queries_it_cannot_answer(gmail, db_session, user_id):
+    service = _fake_service({"m1": _message("m1", ["INBOX", "UNREAD"])})
+    mirror = gmail.mirror
+
+    # Unsupported syntax
+    assert (
+        await mirror.get_emails(
+            user_id, db_session, service, "from:a@b.c", 5, EmailDetailLevel.FULL
+        )
+        is None
+    )
+    # Older than the mirrored window
+    window = settings.GMAIL_CACHE_WINDOW_DAYS
+    assert (
+        await mirror.get_emails(
+            user_id,
+            db_session,
+            service,
+            f"newer_than:{window + 1}d",
+            5,
+            EmailDetailLevel.FULL,
+        )
+        is None
+    )
+    # Unbounded query with fewer local matches than requested
+    assert (
+        await mirror.get_emails(
+            user_id, db_session, service, "is:unread", 5, EmailDetailLevel.FULL
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_unbounded_query_skips_sync_when_mirror_cannot_answer(
+    gmail, db_session, user_id
+):
+    mailbox = {
+        "m1": _message("m1", ["INBOX", "UNREAD"]),
+        "m2": _message("m2", ["INBOX", "UNREAD"], age_hours=2),
+    }
+    service = _fake_service(mailbox)
+    mirror = gmail.mirror
+
+    # Not seeded yet: nothing local could fill the result
+    with patch.object(mirror, "sync", AsyncMock()) as sync:
+        assert (
+            await mirror.get_emails(
+                user_id, db_session, service, "is:unread", 2, EmailDetailLevel.SNIPPET
+            )
+            is None
+        )
+        sync.assert_not_awaited()
+
+    await mirror.sync(user_id, db_session, service)
+    with patch.object(mirror, "sync", AsyncMock()) as sync:
+        # Two local matches cannot fill five results
+        assert (
+            await mirror.get_emails(
+                user_id, db_session, service, "is:unread", 5, EmailDetailLevel.SNIPPET
+            )
+            is None
+        )
+        sync.assert_not_awaited()
+
+        emails = await mirror.get_emails(
+            user_id, db_session, service, "is:unread", 2, EmailDetailLevel.SNIPPET
+        )
+        sync.assert_awaited_once()
+    assert [e.id for e in emails] == ["m1", "m2"]
+
+
+@pytest.mark.asyncio
+async def test_full_detail_loads_body_once(gmail, db_session, user_id):
+    mailbox = {"m1": _message("m1", ["INBOX"], body="Hello body")}
+    service = _fake_service(mailbox)
+    mirror = gmail.mirror
+
+    emails = await mirror.get_emails(
+        user_id, db_session, service, "newer_than:1d", 5, EmailDetailLevel.FULL
+    )
+    assert emails[0].body == "Hello body"
+    assert ("m1", "full") in service.gets
+
+    service.gets.clear()
+    emails = await mirror.get_emails(
+        user_id, db_session, service, "newer_than:1d", 5, EmailDetailLevel.FULL
+    )
+    assert emails[0].body == "Hello body"
+    assert service.gets == []
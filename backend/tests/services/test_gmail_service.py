@@ -3,10 +3,51 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from google.auth.exceptions import RefreshError
+from googleapiclient.errors import HttpError
 
+from app.core.config import settings
+from app.schemas.gmail import EmailDetailLevel
 from app.services.gmail_service import GmailService
 
 
+class _FakeBatch:
+    """Executes queued requests one by one and feeds them to the batch callback."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response = request.execute()
+            except Exception as e:
+                self.callback(request_id, None, e)
+            else:
+                self.callback(request_id, response, None)
+
+
+def _install_fake_batch(mock_service):
+    batches = []
+
+    def _new_batch(callback):
+        batch = _FakeBatch(callback)
+        batches.append(batch)
+        return batch
+
+    mock_service.new_batch_http_request.side_effect = _new_batch
+    return batches
+
+
+@pytest.fixture(autouse=True)
+def _disable_mirror(monkeypatch):
+    # These tests drive the API path with a mocked db session
+    monkeypatch.setattr(settings, "GMAIL_CACHE_ENABLED", False)
+
+
 @pytest.fixture
 def gmail_service():
     return GmailService()
@@ -24,7 +65,7 @@ def test_extract_body_plain_text(gmail_service):
 
 
 def test_extract_body_html_only(gmail_service):
-    # Simple HTML body, parsed with BeautifulSoup
+    # Simple HTML body, extracted by the streaming html_to_text
     html_content = (
         "<html><body><h1>Hello World</h1><style>p {color: red;}</style></body></html>"
     )
@@ -71,6 +112,7 @@ async def test_get_emails_success(gmail_service):
 
     # Mock Gmail client resource build
     mock_service = MagicMock()
+    batches = _install_fake_batch(mock_service)
 
     # Mock search messages list
     mock_service.users().messages().list().execute.return_value = {
@@ -110,6 +152,9 @@ async def test_get_emails_success(gmail_service):
             assert email.sender == "sender@example.com"
             assert email.subject == "Test Subject"
             assert email.body == "Hello user, here is your update."
+            # All message gets go through a single batch request
+            assert len(batches) == 1
+            assert [rid for rid, _ in batches[0].requests] == ["msg123"]
 
 
 @pytest.mark.asyncio
@@ -121,6 +166,7 @@ async def test_get_emails_truncation(gmail_service):
     user_mock.google_refresh_token = "valid_refresh_token"
 
     mock_service = MagicMock()
+    _install_fake_batch(mock_service)
     mock_service.users().messages().list().execute.return_value = {
         "messages": [{"id": "msg123"}]
     }
@@ -162,6 +208,7 @@ async def test_get_emails_fallback_to_snippet(gmail_service):
     user_mock.google_refresh_token = "valid_refresh_token"
 
     mock_service = MagicMock()
+    _install_fake_batch(mock_service)
     mock_service.users().messages().list().execute.return_value = {
         "messages": [{"id": "msg123"}]
     }
@@ -187,6 +234,114 @@ async def test_get_emails_fallback_to_snippet(gmail_service):
             assert email.body == "Fallback Snippet Here"
 
 
+@pytest.mark.asyncio
+async def test_get_emails_batches_in_chunks_and_keeps_order(gmail_service, monkeypatch):
+    monkeypatch.setattr(settings, "GMAIL_BATCH_SIZE", 2)
+    db_mock = AsyncMock()
+
+    mock_service = MagicMock()
+    batches = _install_fake_batch(mock_service)
+    mock_service.users().messages().list().execute.return_value = {
+        "messages": [{"id": "m1"}, {"id": "m2"}, {"id": "m3"}]
+    }
+
+    def _get(userId, id, format):
+        request = MagicMock()
+        if id == "m2":
+            request.execute.side_effect = HttpError(MagicMock(status=404), b"Not Found")
+        else:
+            request.execute.return_value = {
+                "id": id,
+                "snippet": f"snippet {id}",
+                "payload": {"headers": [{"name": "Subject", "value": id}]},
+            }
+        return request
+
+    mock_service.users().messages().get.side_effect = _get
+
+    with patch.object(
+        gmail_service, "_get_gmail_client", AsyncMock(return_value=mock_service)
+    ):
+        emails = await gmail_service.get_emails(user_id=42, db=db_mock, max_results=3)
+
+    # 3 ids with a batch size of 2 -> two batch HTTP calls
+    assert [len(b.requests) for b in batches] == [2, 1]
+    # The failed item is skipped, the rest keep the list order
+    assert [e.id for e in emails] == ["m1", "m3"]
+    assert emails[0].body == "snippet m1"
+
+
+@pytest.mark.asyncio
+async def test_get_emails_batch_all_failed_raises(gmail_service):
+    db_mock = AsyncMock()
+
+    mock_service = MagicMock()
+    _install_fake_batch(mock_service)
+    mock_service.users().messages().list().execute.return_value = {
+        "messages": [{"id": "m1"}]
+    }
+    mock_service.users().messages().get().execute.side_effect = HttpError(
+        MagicMock(status=401), b"Unauthorized"
+    )
+
+    with (
+        patch.object(
+            gmail_service, "_get_gmail_client", AsyncMock(return_value=mock_service)
+        ),
+        patch("app.services.gmail_service.crud_user.get", AsyncMock(return_value=None)),
+    ):
+        with pytest.raises(HttpError):
+            await gmail_service.get_emails(user_id=42, db=db_mock)
+
+
+@pytest.mark.asyncio
+async def test_get_emails_metadata_level_skips_body(gmail_service):
+    db_mock = AsyncMock()
+
+    mock_service = MagicMock()
+    _install_fake_batch(mock_service)
+    mock_service.users().messages().list().execute.return_value = {
+        "messages": [{"id": "msg123"}]
+    }
+    mock_service.users().messages().get.return_value.execute.return_value = {
+        "id": "msg123",
+        "snippet": "Preview text",
+        "payload": {
+            "headers": [
+                {"name": "From", "value": "sender@example.com"},
+                {"name": "Subject", "value": "Hello"},
+            ],
+        },
+    }
+
+    with (
+        patch.object(
+            gmail_service, "_get_gmail_client", AsyncMock(return_value=mock_service)
+        ),
+        patch.object(gmail_service, "_extract_body") as mock_extract,
+    ):
+        emails = await gmail_service.get_emails(
+            user_id=42, db=db_mock, detail_level=EmailDetailLevel.METADATA
+        )
+        snippets = await gmail_service.get_emails(
+            user_id=42, db=db_mock, detail_level=EmailDetailLevel.SNIPPET
+        )
+
+    mock_extract.assert_not_called()
+    mock_service.users().messages().get.assert_called_with(
+        userId="me",
+        id="msg123",
+        format="metadata",
+        metadataHeaders=["From", "Subject", "Date"],
+    )
+    assert emails[0].sender == "sender@example.com"
+    assert emails[0].subject == "Hello"
+    assert emails[0].snippet == ""
+    assert emails[0].body == ""
+    assert snippets[0].snippet == "Preview text"
+    assert snippets[0].body == ""
+
+
 @pytest.mark.asyncio
 async def test_get_email_by_id_success(gmail_service):
     db_mock = AsyncMock()
@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.schemas.gmail import EmailMessage
+from app.schemas.gmail import EmailDetailLevel, EmailMessage
 from app.services.gemini_tools import create_tools
 
 
@@ -41,6 +41,7 @@ async def test_check_emails_tool_success(tools):
             db=tools[1],
             query="is:unread",
             max_results=5,
+            detail_level=EmailDetailLevel.SNIPPET,
         )
 
 
@@ -68,3 +69,89 @@ async def test_check_emails_tool_error(tools):
 
         result = await email_tool()
         assert "Unable to fetch emails" in result
+
+
+@pytest.mark.asyncio
+async def test_check_emails_tool_metadata_level(tools):
+    tool_groups, _ = tools
+    email_tool = tool_groups["email"][0]
+
+    with patch("app.services.gemini_tools.GmailService") as MockGmailService:
+        mock_svc = MockGmailService.return_value
+        mock_svc.get_emails = AsyncMock(
+            return_value=[
+                EmailMessage(
+                    id="msg1",
+                    sender="news@shop.com",
+                    subject="Sale",
+                    date="Today",
+                )
+            ]
+        )
+
+        result = await email_tool(query="newer_than:1d", detail_level="metadata")
+
+        assert "[ID: msg1]" in result
+        assert "Sale" in result
+        assert "Body" not in result
+        assert "Snippet" not in result
+        assert (
+            mock_svc.get_emails.call_args.kwargs["detail_level"]
+            == EmailDetailLevel.METADATA
+        )
+
+
+@pytest.mark.asyncio
+async def test_check_emails_tool_invalid_level_falls_back_to_snippet(tools):
+    tool_groups, _ = tools
+    email_tool = tool_groups["email"][0]
+
+    with patch("app.services.gemini_tools.GmailService") as MockGmailService:
+        mock_svc = MockGmailService.return_value
+        mock_svc.get_emails = AsyncMock(return_value=[])
+
+        await email_tool(detail_level="everything")
+
+        assert (
+            mock_svc.get_emails.call_args.kwargs["detail_level"]
+            == EmailDetailLevel.SNIPPET
+        )
+
+
+@pytest.mark.asyncio
+async def test_read_email_tool_success(tools):
+    tool_groups, db = tools
+    read_tool = tool_groups["email"][1]  # read_email
+
+    with patch("app.services.gemini_tools.GmailService") as MockGmailService:
+        mock_svc = MockGmailService.return_value
+        mock_svc.get_email_by_id = AsyncMock(
+            return_value=EmailMessage(
+                id="msg123",
+                sender="boss@work.com",
+                subject="Urgent Meeting",
+                date="Today",
+                snippet="We need to meet...",
+                body="Full meeting details here.",
+            )
+        )
+
+        result = await read_tool(message_id="msg123")
+
+        assert "Full meeting details here." in result
+        mock_svc.get_email_by_id.assert_called_once_with(
+            user_id=42, db=db, message_id="msg123"
+        )
+
+
+@pytest.mark.asyncio
+async def test_read_email_tool_error(tools):
+    tool_groups, _ = tools
+    read_tool = tool_groups["email"][1]
+
+    with patch("app.services.gemini_tools.GmailService") as MockGmailService:
+        mock_svc = MockGmailService.return_value
+        mock_svc.get_email_by_id = AsyncMock(side_effect=Exception("404"))
+
+        result = await read_tool(message_id="missing")
+        assert "Unable to read email [ID: missing]" in result
@@ -0,0 +1,82 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from google.auth.exceptions import RefreshError
+
+from app.core.config import settings
+from app.services.gmail_service import GmailService
+from app.services.google_clients import GoogleClientFactory, google_client_factory
+
+
+@pytest.fixture
+def factory():
+    return GoogleClientFactory()
+
+
+@pytest.mark.asyncio
+async def test_get_service_caches_per_user_and_api(factory):
+    with patch.object(
+        GoogleClientFactory, "_load_document", wraps=factory._load_document
+    ) as load_document:
+        gmail = await factory.get_service(1, "rt", "gmail", "v1")
+        assert await factory.get_service(1, "rt", "gmail", "v1") is gmail
+        assert await factory.get_service(2, "rt2", "gmail", "v1") is not gmail
+        calendar = await factory.get_service(1, "rt", "calendar", "v3")
+
+    assert calendar is not gmail
+    # One discovery parse per API, regardless of the number of users
+    assert load_document.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_service_uses_a_transport_per_request(factory):
+    service = await factory.get_service(1, "rt", "gmail", "v1")
+    first = service.users().messages().get(userId="me", id="a")
+    second = service.users().messages().get(userId="me", id="b")
+    assert first.http is not second.http
+    assert first.http.credentials is second.http.credentials
+
+
+@pytest.mark.asyncio
+async def test_get_service_rebuilds_on_new_refresh_token_or_ttl(factory, monkeypatch):
+    service = await factory.get_service(1, "old", "gmail", "v1")
+    rotated = await factory.get_service(1, "new", "gmail", "v1")
+    assert rotated is not service
+
+    monkeypatch.setattr(settings, "GOOGLE_CLIENT_CACHE_TTL_SEC", 0)
+    assert await factory.get_service(1, "new", "gmail", "v1") is not rotated
+
+
+@pytest.mark.asyncio
+async def test_get_service_evicts_least_recently_used(factory, monkeypatch):
+    monkeypatch.setattr(settings, "GOOGLE_CLIENT_CACHE_MAX_SIZE", 2)
+    first = await factory.get_service(1, "rt", "gmail", "v1")
+    await factory.get_service(2, "rt", "gmail", "v1")
+    # Touch user 1 so user 2 becomes the eviction candidate
+    assert await factory.get_service(1, "rt", "gmail", "v1") is first
+    await factory.get_service(3, "rt", "gmail", "v1")
+
+    assert {key[0] for key in factory._clients} == {1, 3}
+
+
+@pytest.mark.asyncio
+async def test_refresh_error_evicts_cached_clients():
+    gmail = GmailService()
+    await google_client_factory.get_service(7, "rt", "gmail", "v1")
+    await google_client_factory.get_service(7, "rt", "calendar", "v3")
+
+    with patch(
+        "app.services.gmail_service.crud_user.get", AsyncMock(return_value=None)
+    ):
+        await gmail._handle_auth_error(7, AsyncMock(), RefreshError("revoked"))
+
+    assert not [key for key in google_client_factory._clients if key[0] == 7]
+
+
+@pytest.mark.asyncio
+async def test_apis_of_one_user_share_credentials(factory):
+    gmail = await factory.get_service(1, "rt", "gmail", "v1")
+    calendar = await factory.get_service(1, "rt", "calendar", "v3")
+    gmail_request = gmail.users().messages().get(userId="me", id="a")
+    calendar_request = calendar.events().list(calendarId="primary")
+    assert gmail_request.http.credentials is calendar_request.http.credentials
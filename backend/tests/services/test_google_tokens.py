@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from google.auth.exceptions import RefreshError
+
+from app.core.config import settings
+from app.services.google_tokens import GoogleTokenCache
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    """Record refresh calls; each one issues a numbered one-hour token."""
+    calls = []
+    lock = threading.Lock()
+
+    def _refresh(credentials):
+        time.sleep(0.05)
+        with lock:
+            calls.append(credentials.refresh_token)
+            credentials.token = f"token-{len(calls)}"
+        credentials.expiry = datetime.now(timezone.utc).replace(
+            tzinfo=None
+        ) + timedelta(hours=1)
+
+    monkeypatch.setattr(GoogleTokenCache, "_refresh", staticmethod(_refresh))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_refresh(refreshes):
+    cache = GoogleTokenCache()
+    results = await asyncio.gather(
+        *(cache.get_credentials(1, "rt") for _ in range(5)),
+        cache.get_credentials(2, "rt2"),
+    )
+
+    # One refresh per user, and every caller for user 1 got the same object
+    assert sorted(refreshes) == ["rt", "rt2"]
+    assert all(creds is results[0] for creds in results[:5])
+    assert results[0].token != results[5].token
+
+
+@pytest.mark.asyncio
+async def test_token_reused_until_close_to_expiry(refreshes, monkeypatch):
+    cache = GoogleTokenCache()
+    creds = await cache.get_credentials(1, "rt")
+    assert await cache.get_credentials(1, "rt") is creds
+    assert len(refreshes) == 1
+
+    # Inside the refresh margin the token is renewed proactively
+    monkeypatch.setattr(settings, "GOOGLE_TOKEN_REFRESH_MARGIN_SEC", 3600)
+    renewed = await cache.get_credentials(1, "rt")
+    assert renewed is creds
+    assert len(refreshes) == 2
+    assert renewed.token == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_new_refresh_token_replaces_credentials(refreshes):
+    cache = GoogleTokenCache()
+    old = await cache.get_credentials(1, "old")
+    new = await cache.get_credentials(1, "new")
+    assert new is not old
+    assert new.refresh_token == "new"
+
+
+@pytest.mark.asyncio
+async def test_refresh_error_drops_credentials(monkeypatch):
+    cache = GoogleTokenCache()
+
+    def _refresh(credentials):
+        raise RefreshError("invalid_grant")
+
+    monkeypatch.setattr(GoogleTokenCache, "_refresh", staticmethod(_refresh))
+    with pytest.raises(RefreshError):
+        await cache.get_credentials(1, "rt")
+    assert 1 not in cache._credentials
@@ -1,24 +1,25 @@
 """Unit tests for GoogleTTSService."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
 from google.api_core.exceptions import GoogleAPIError
 
-from app.services.google_tts import GoogleTTSService
+from app.services.google_tts import MAX_TEXT_LENGTH, GoogleTTSService
+from app.services.ogg_opus import iter_pages
 
 
 @pytest.fixture
 def mock_tts_client():
-    """Mock the TextToSpeechClient and service account credentials."""
+    """Mock the TextToSpeechAsyncClient and service account credentials."""
     with (
-        patch("app.services.google_tts.texttospeech.TextToSpeechClient") as mock_cls,
-        patch(
-            "app.services.google_tts.service_account.Credentials.from_service_account_file"
-        ),
+        patch("google.cloud.texttospeech.TextToSpeechAsyncClient") as mock_cls,
+        patch("google.oauth2.service_account.Credentials.from_service_account_file"),
     ):
         mock_client = MagicMock()
+        mock_client.synthesize_speech = AsyncMock()
+        mock_client.transport.close = AsyncMock()
         mock_cls.return_value = mock_client
         yield mock_client
 
@@ -28,6 +29,10 @@ def mock_settings():
     """Mock settings to provide test credentials path."""
     with patch("app.services.google_tts.settings") as mock:
         mock.GOOGLE_APPLICATION_CREDENTIALS = "test-credentials.json"
+        mock.TTS_CACHE_ENABLED = True
+        mock.TTS_CHUNK_MAX_BYTES = 2000
+        mock.TTS_MAX_CONCURRENT_CHUNKS = 4
+        mock.TTS_GRPC_POOL_SIZE = 2
         yield mock
 
 
@@ -73,8 +78,8 @@ async def test_synthesize_whitespace_only(service: GoogleTTSService):
 
 @pytest.mark.asyncio
 async def test_synthesize_text_too_long(service: GoogleTTSService):
-    """Test that text exceeding 5000 chars raises HTTP 400."""
-    long_text = "a" * 5001
+    """Test that text exceeding MAX_TEXT_LENGTH chars raises HTTP 400."""
+    long_text = "a" * (MAX_TEXT_LENGTH + 1)
     with pytest.raises(HTTPException) as exc:
         await service.synthesize(long_text)
     assert exc.value.status_code == 400
@@ -82,14 +87,19 @@ async def test_synthesize_text_too_long(service: GoogleTTSService):
 
 
 @pytest.mark.asyncio
-async def test_synthesize_text_at_limit(service: GoogleTTSService, mock_tts_client):
-    """Test that text at exactly 5000 chars is accepted."""
+async def test_synthesize_text_at_limit(
+    service: GoogleTTSService, mock_tts_client, make_ogg_opus
+):
+    """Test that text at exactly MAX_TEXT_LENGTH chars is accepted."""
     mock_response = MagicMock()
-    mock_response.audio_content = b"audio"
+    mock_response.audio_content = make_ogg_opus(1, [b"audio"])
     mock_tts_client.synthesize_speech.return_value = mock_response
 
-    result = await service.synthesize("a" * 5000)
-    assert result == b"audio"
+    result = await service.synthesize("a" * MAX_TEXT_LENGTH)
+    assert result.startswith(b"OggS")
+    # One overlong word is split into ten identical API-sized chunks
+    assert mock_tts_client.synthesize_speech.call_count == 1
+    assert len(list(iter_pages(result))) == 2 + 10
 
 
 @pytest.mark.asyncio
@@ -216,3 +226,91 @@ def test_detect_language_mixed_mostly_cyrillic(service: GoogleTTSService):
 def test_detect_language_no_alpha(service: GoogleTTSService):
     """Test that text with no alphabetic characters defaults to Ukrainian."""
     assert service._detect_language("123 456!") == "uk-UA"
+
+
+@pytest.mark.asyncio
+async def test_synthesize_repeated_text_uses_cache(
+    service: GoogleTTSService, mock_tts_client
+):
+    """Test that identical cleaned text is synthesized only once."""
+    mock_response = MagicMock()
+    mock_response.audio_content = b"cached-audio"
+    mock_tts_client.synthesize_speech.return_value = mock_response
+
+    first = await service.synthesize("**Готово!** Подію створено.")
+    second = await service.synthesize("Готово! Подію створено.")
+    other = await service.synthesize("Подію видалено.")
+
+    assert first == second == other == b"cached-audio"
+    assert mock_tts_client.synthesize_speech.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_synthesize_long_text_in_concurrent_chunks(
+    service: GoogleTTSService, mock_tts_client, mock_settings, make_ogg_opus
+):
+    """Test that long text is synthesized per chunk and joined into one stream."""
+    mock_settings.TTS_CHUNK_MAX_BYTES = 60
+
+    def _synthesize(input, voice, audio_config):
+        response = MagicMock()
+        response.audio_content = make_ogg_opus(7, [input.text.encode()])
+        return response
+
+    mock_tts_client.synthesize_speech.side_effect = _synthesize
+    sentences = [f"Sentence number {i} is here." for i in range(6)]
+
+    result = await service.synthesize(" ".join(sentences))
+
+    texts = [
+        call.kwargs["input"].text
+        for call in mock_tts_client.synthesize_speech.call_args_list
+    ]
+    assert len(texts) == 3
+    assert all(len(text.encode()) <= 60 for text in texts)
+    audio_pages = list(iter_pages(result))[2:]
+    # Chunks are joined in reading order regardless of completion order
+    assert b" ".join(page.body for page in audio_pages) == " ".join(sentences).encode()
+
+
+def test_split_into_chunks_keeps_sentences_together(service: GoogleTTSService):
+    """Test sentence-boundary splitting under a byte budget."""
+    text = "Перше речення. Друге речення! Третє? Останнє речення тут."
+    chunks = service._split_into_chunks(text, 60)
+
+    assert " ".join(chunks) == text
+    assert all(len(chunk.encode()) <= 60 for chunk in chunks)
+    assert chunks[0] == "Перше речення. Друге речення!"
+
+
+def test_split_into_chunks_breaks_overlong_sentence(service: GoogleTTSService):
+    """Test that a sentence above the budget is split between words."""
+    chunks = service._split_into_chunks("word " * 20 + "x" * 25, 22)
+
+    assert all(len(chunk.encode()) <= 22 for chunk in chunks)
+    assert "".join(chunks).replace(" ", "") == "word" * 20 + "x" * 25
+
+
+@pytest.mark.asyncio
+async def test_client_pool_is_round_robin_and_closable(
+    service: GoogleTTSService, mock_tts_client
+):
+    """Test that the gRPC client pool opens lazily and rotates clients."""
+    with patch(
+        "google.cloud.texttospeech.TextToSpeechAsyncClient",
+        side_effect=lambda credentials: MagicMock(
+            transport=MagicMock(close=AsyncMock())
+        ),
+    ) as mock_cls:
+        first = service._get_client()
+        second = service._get_client()
+        third = service._get_client()
+
+        assert mock_cls.call_count == 2
+        assert first is not second
+        assert third is first
+
+        await service.close()
+        first.transport.close.assert_awaited_once()
+        second.transport.close.assert_awaited_once()
+        assert service._clients == []
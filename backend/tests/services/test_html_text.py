@@ -0,0 +1,51 @@
+import pytest
+
+from app.services import html_text
+from app.services.html_text import html_to_text
+from benchmarks.bench_html_to_text import bs4_visible_text
+from benchmarks.html_emails import build_corpus
+
+
+def test_html_to_text_lines_and_entities():
+    html = "<p>Hello <b>world</b> &amp; friends</p><p>\n  Second   </p>"
+    assert html_to_text(html) == "Hello\nworld\n& friends\nSecond"
+
+
+def test_html_to_text_skips_hidden_blocks():
+    html = (
+        "<head><style>p { color: red; }</style></head>"
+        '<body><div style="display: none">preheader</div>'
+        "<script>var x = 1;</script>"
+        "<p hidden>secret</p>"
+        '<span style="VISIBILITY:hidden"><b>nested</b></span>'
+        "<p>Visible</p></body>"
+    )
+    assert html_to_text(html) == "Visible"
+
+
+def test_html_to_text_tolerates_unclosed_tags():
+    html = '<div style="display:none"><p>hidden<br>still hidden</div><p>shown'
+    assert html_to_text(html) == "shown"
+
+
+def test_html_to_text_stops_at_limit(monkeypatch):
+    fed = []
+    original_feed = html_text._TextExtractor.feed
+
+    def _feed(self, data):
+        fed.append(len(data))
+        return original_feed(self, data)
+
+    monkeypatch.setattr(html_text._TextExtractor, "feed", _feed)
+    html = "<p>" + "word " * 20 + "</p>"
+    text = html_to_text(html * 5000, limit=200)
+
+    # Exceeds the limit by at most one line so callers know to truncate
+    assert 200 < len(text) <= 200 + len(html)
+    # Only the first chunks of the ~500 KB document were parsed
+    assert len(fed) <= 2
+
+
+@pytest.mark.parametrize("name,html", build_corpus().items())
+def test_html_to_text_matches_beautifulsoup(name, html):
+    assert html_to_text(html) == bs4_visible_text(html)
@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+
+# SDKs that must only be imported on first use. The import time itself is
+# checked by ``python -m benchmarks.bench_startup --budget``, not here:
+# wall-clock limits fail on busy machines
+LAZY_MODULES = [
+    "bs4",
+    "google.adk",
+    "google.api_core",
+    "google.cloud.logging",
+    "google.cloud.texttospeech",
+    "google.genai",
+    "googleapiclient.discovery",
+]
+
+_PROBE = (
+    "import json, sys\n"
+    "import app.main\n"
+    f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))\n"
+)
+
+
+def _import_app() -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_app_import_does_not_load_heavy_sdks() -> None:
+    result = _import_app()
+
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
@@ -0,0 +1,242 @@
+"""Tests for the durable background job queue worker."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.models.job import BackgroundJob
+from app.schemas.enums import JobStatus
+from app.services import job_queue
+from app.crud.crud_job import background_job as crud_job
+from app.services.job_queue import (
+    JobWorker,
+    active_turns,
+    enqueue,
+    job_handler,
+    retry_delay,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_types(monkeypatch):
+    """Handlers registered by a test only exist for that test."""
+    monkeypatch.setattr(job_queue, "job_types", {})
+    monkeypatch.setattr(settings, "JOB_RETRY_BASE_DELAY_SEC", 0.0)
+
+
+@pytest.fixture
+def session_factory(db_session: AsyncSession) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(db_session.bind, expire_on_commit=False)
+
+
+@pytest.fixture
+def worker(session_factory) -> JobWorker:
+    # Sessions share the one in-memory SQLite connection, so jobs that touch
+    # the database must not overlap
+    return JobWorker(session_factory=session_factory, concurrency=1)
+
+
+async def _jobs(db: AsyncSession) -> list[BackgroundJob]:
+    result = await db.execute(
+        select(BackgroundJob).execution_options(populate_existing=True)
+    )
+    return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_drain_runs_jobs_and_deletes_them(
+    db_session: AsyncSession, worker: JobWorker
+) -> None:
+    seen = []
+
+    @job_handler("echo")
+    async def echo(db, payload):
+        seen.append(payload["n"])
+
+    await enqueue(db_session, "echo", {"n": 1})
+    await enqueue(db_session, "echo", {"n": 2})
+
+    assert await worker.drain() == 2
+    assert sorted(seen) == [1, 2]
+    assert await _jobs(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_failing_job_is_retried_then_marked_failed(
+    db_session: AsyncSession, worker: JobWorker
+) -> None:
+    calls = 0
+
+    @job_handler("flaky", max_attempts=3)
+    async def flaky(db, payload):
+        nonlocal calls
+        calls += 1
+        raise RuntimeError(f"failure {calls}")
+
+    await enqueue(db_session, "flaky", {})
+
+    # With no backoff every retry is due at once
+    assert await worker.drain() == 3
+    [job] = await _jobs(db_session)
+    assert job.status == JobStatus.FAILED
+    assert job.attempts == 3
+    assert job.last_error == "RuntimeError: failure 3"
+
+
+def test_retry_delay_backs_off_exponentially(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "JOB_RETRY_BASE_DELAY_SEC", 10.0)
+    monkeypatch.setattr(settings, "JOB_RETRY_MAX_DELAY_SEC", 60.0)
+
+    assert [retry_delay(n).total_seconds() for n in range(1, 6)] == [
+        10.0,
+        20.0,
+        40.0,
+        60.0,
+        60.0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_per_kind_concurrency_limit(
+    db_session: AsyncSession, session_factory
+) -> None:
+    worker = JobWorker(session_factory=session_factory, concurrency=3)
+    running = 0
+    peak = 0
+
+    @job_handler("limited", max_concurrency=1)
+    async def limited(db, payload):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    for n in range(3):
+        await enqueue(db_session, "limited", {"n": n})
+
+    assert await worker.drain() == 3
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_background_kinds_wait_for_chat_turns(
+    db_session: AsyncSession, worker: JobWorker
+) -> None:
+    ran = []
+
+    @job_handler("summary", background=True)
+    async def summary(db, payload):
+        ran.append("summary")
+
+    @job_handler("turn")
+    async def turn(db, payload):
+        ran.append("turn")
+
+    await enqueue(db_session, "summary", {})
+    await enqueue(db_session, "turn", {})
+
+    with active_turns.running():
+        assert await worker.drain() == 1
+    assert ran == ["turn"]
+
+    assert await worker.drain() == 1
+    assert ran == ["turn", "summary"]
+
+
+@pytest.mark.asyncio
+async def test_close_hands_running_job_back_to_queue(
+    db_session: AsyncSession, worker: JobWorker
+) -> None:
+    started = asyncio.Event()
+
+    @job_handler("slow")
+    async def slow(db, payload):
+        started.set()
+        await asyncio.Event().wait()
+
+    await enqueue(db_session, "slow", {})
+    assert await worker.poll() == 1
+    await started.wait()
+
+    await worker.close()
+
+    [job] = await _jobs(db_session)
+    assert job.status == JobStatus.QUEUED
+    assert job.attempts == 0
+
+
+@pytest.mark.asyncio
+async def test_started_worker_is_woken_by_enqueue(
+    db_session: AsyncSession, worker: JobWorker, monkeypatch
+) -> None:
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL_SEC", 60.0)
+    done = asyncio.Event()
+
+    @job_handler("wake")
+    async def wake(db, payload):
+        done.set()
+
+    monkeypatch.setattr(job_queue, "job_worker", lambda: worker)
+    monkeypatch.setattr(
+        job_queue.service_registry, "is_created", lambda name: name == "job_worker"
+    )
+    worker.start()
+    try:
+        # Let the first poll find the queue empty
+        await asyncio.sleep(0.05)
+        await enqueue(db_session, "wake", {})
+        await asyncio.wait_for(done.wait(), timeout=5)
+        while worker._running:
+            await asyncio.sleep(0.01)
+    finally:
+        await worker.close()
+    assert await _jobs(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_survives_a_failed_lock_extension(
+    db_session: AsyncSession, worker: JobWorker, monkeypatch
+) -> None:
+    monkeypatch.setattr(settings, "JOB_VISIBILITY_TIMEOUT_SEC", 0.03)
+    extend_lock = AsyncMock(side_effect=[RuntimeError("db blip")] + [True] * 100)
+    monkeypatch.setattr(crud_job, "extend_lock", extend_lock)
+
+    @job_handler("long")
+    async def long(db, payload):
+        await asyncio.sleep(0.1)
+
+    await enqueue(db_session, "long", {})
+
+    assert await worker.drain() == 1
+    assert extend_lock.await_count > 1
+    assert await _jobs(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_job_that_lost_its_lock_is_cancelled(
+    db_session: AsyncSession, worker: JobWorker, monkeypatch
+) -> None:
+    monkeypatch.setattr(settings, "JOB_VISIBILITY_TIMEOUT_SEC", 0.03)
+    # Another instance claimed the job after its lock expired
+    monkeypatch.setattr(crud_job, "extend_lock", AsyncMock(return_value=False))
+    cancelled = asyncio.Event()
+
+    @job_handler("taken")
+    async def taken(db, payload):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    await enqueue(db_session, "taken", {})
+    assert await worker.poll() == 1
+
+    await asyncio.wait_for(cancelled.wait(), timeout=5)
+    while worker._running:
+        await asyncio.sleep(0.01)
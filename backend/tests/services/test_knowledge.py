@@ -1,8 +1,11 @@
+import asyncio
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.core.config import settings
+from app.schemas.knowledge import KnowledgeSyncState
 from app.services.knowledge import KnowledgeService
 
 
@@ -21,9 +24,26 @@ def mock_settings(monkeypatch):
     )
 
 
+class _AsyncPager:
+    """Minimal stand-in for ``google.genai.pagers.AsyncPager``."""
+
+    def __init__(self, items):
+        self._items = list(items)
+
+    def __aiter__(self):
+        self._iter = iter(self._items)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
 @pytest.fixture
 def mock_genai_client():
-    with patch("app.services.knowledge.genai.Client") as mock_client_cls:
+    with patch("google.genai.Client") as mock_client_cls:
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
 
@@ -32,7 +52,9 @@ def mock_genai_client():
         mock_store.display_name = settings.FILE_SEARCH_STORE_DISPLAY_NAME
         mock_store.name = "stores/test-store"
 
-        mock_client.file_search_stores.list.return_value = [mock_store]
+        mock_client.aio.file_search_stores.list = AsyncMock(
+            return_value=_AsyncPager([mock_store])
+        )
 
         # Mock files
         mock_file1 = MagicMock()
@@ -40,14 +62,17 @@ def mock_genai_client():
         mock_file1.name = "files/file1"
         mock_file1.update_time = "2024-01-01T10:00:00Z"
 
-        mock_client.files.list.return_value = [mock_file1]
+        mock_client.aio.files.list = AsyncMock(return_value=_AsyncPager([mock_file1]))
+        mock_client.aio.files.delete = AsyncMock()
 
         # Mock operations
         mock_op = MagicMock()
         mock_op.done = True
-        mock_client.file_search_stores.upload_to_file_search_store.return_value = (
-            mock_op
+        mock_op.error = None
+        mock_client.aio.file_search_stores.upload_to_file_search_store = AsyncMock(
+            return_value=mock_op
         )
+        mock_client.aio.operations.get = AsyncMock(return_value=mock_op)
 
         # Mock aio.models
         mock_aio_models = AsyncMock()
@@ -96,7 +121,7 @@ async def test_query_no_api_key(knowledge_service, monkeypatch):
         await knowledge_service.query("test query")
 
 
-def test_sync_with_drive_incremental(
+async def test_sync_with_drive_incremental(
     knowledge_service, mock_settings, mock_genai_client, mock_drive_service
 ):
     """Test incremental sync logic (upload new, skip old, delete removed)."""
@@ -123,19 +148,22 @@ def test_sync_with_drive_incremental(
 
         mock_download.return_value = (b"content", "new.txt")
 
-        knowledge_service.sync_with_drive()
+        status = await knowledge_service.sync_with_drive()
 
         # Should NOT delete drive_id_1 because it's still on Drive
-        mock_genai_client.files.delete.assert_not_called()
+        mock_genai_client.aio.files.delete.assert_not_called()
 
         # Should upload drive_id_2
-        mock_genai_client.file_search_stores.upload_to_file_search_store.assert_called_once()
-        kwargs = mock_genai_client.file_search_stores.upload_to_file_search_store.call_args.kwargs
+        mock_genai_client.aio.file_search_stores.upload_to_file_search_store.assert_called_once()
+        kwargs = mock_genai_client.aio.file_search_stores.upload_to_file_search_store.call_args.kwargs
         assert kwargs["file_search_store_name"] == "stores/test-store"
         assert kwargs["config"]["display_name"] == "new.txt [drive_id_2]"
+        assert status.state == KnowledgeSyncState.SUCCEEDED
+        assert status.uploaded_count == 1
+        assert status.deleted_count == 0
 
 
-def test_sync_with_drive_delete_removed(
+async def test_sync_with_drive_delete_removed(
     knowledge_service, mock_settings, mock_genai_client, mock_drive_service
 ):
     """Test sync deletes files from Gemini that are no longer on Drive."""
@@ -145,14 +173,15 @@ def test_sync_with_drive_delete_removed(
         # Drive is empty, but Gemini has drive_id_1
         mock_list.return_value = []
 
-        knowledge_service.sync_with_drive()
+        status = await knowledge_service.sync_with_drive()
 
         # Should delete file1 (which maps to drive_id_1)
-        mock_genai_client.files.delete.assert_called_once_with(name="files/file1")
-        mock_genai_client.file_search_stores.upload_to_file_search_store.assert_not_called()
+        mock_genai_client.aio.files.delete.assert_awaited_once_with(name="files/file1")
+        mock_genai_client.aio.file_search_stores.upload_to_file_search_store.assert_not_called()
+        assert status.deleted_count == 1
 
 
-def test_sync_with_drive_update_modified(
+async def test_sync_with_drive_update_modified(
     knowledge_service, mock_settings, mock_genai_client, mock_drive_service
 ):
     """Test sync updates files if Drive modifiedTime is newer."""
@@ -172,10 +201,124 @@ def test_sync_with_drive_update_modified(
         ]
         mock_download.return_value = (b"content", "test.txt")
 
-        knowledge_service.sync_with_drive()
+        status = await knowledge_service.sync_with_drive()
 
         # Should delete the old one
-        mock_genai_client.files.delete.assert_called_once_with(name="files/file1")
+        mock_genai_client.aio.files.delete.assert_awaited_once_with(name="files/file1")
 
         # Should upload the new one
-        mock_genai_client.file_search_stores.upload_to_file_search_store.assert_called_once()
+        mock_genai_client.aio.file_search_stores.upload_to_file_search_store.assert_called_once()
+        assert status.uploaded_count == 1
+
+
+async def test_sync_with_drive_polls_operation_asynchronously(
+    knowledge_service, mock_settings, mock_genai_client, mock_drive_service, monkeypatch
+):
+    """Test pending upload operations are polled via the async client."""
+    monkeypatch.setattr(settings, "KNOWLEDGE_SYNC_POLL_INTERVAL_SEC", 0)
+    pending_op = MagicMock(done=False, error=None)
+    done_op = MagicMock(done=True, error=None)
+    mock_genai_client.aio.file_search_stores.upload_to_file_search_store.return_value = pending_op
+    mock_genai_client.aio.operations.get = AsyncMock(return_value=done_op)
+
+    with (
+        patch("app.services.knowledge.KnowledgeService._list_drive_files") as mock_list,
+        patch(
+            "app.services.knowledge.KnowledgeService._download_single_file"
+        ) as mock_download,
+    ):
+        mock_list.return_value = [
+            {
+                "id": "drive_id_2",
+                "name": "new.txt",
+                "mimeType": "text/plain",
+                "modifiedTime": "2024-01-01T10:00:00Z",
+            },
+        ]
+        mock_download.return_value = (b"content", "new.txt")
+
+        status = await knowledge_service.sync_with_drive()
+
+    mock_genai_client.aio.operations.get.assert_awaited_once_with(pending_op)
+    assert status.uploaded_count == 1
+
+
+async def test_sync_with_drive_missing_folder_marks_failed(
+    knowledge_service, mock_settings, monkeypatch
+):
+    """Test configuration errors are surfaced through the sync status."""
+    monkeypatch.setattr(settings, "GOOGLE_DRIVE_FOLDER_ID", "")
+
+    status = await knowledge_service.sync_with_drive()
+
+    assert status.state == KnowledgeSyncState.FAILED
+    assert "GOOGLE_DRIVE_FOLDER_ID" in status.error
+
+
+async def test_sync_with_drive_allows_one_sync_per_store(
+    knowledge_service, mock_settings
+):
+    """Test a second sync is skipped while the first is still running."""
+    release = asyncio.Event()
+
+    async def slow_sync(status):
+        await release.wait()
+
+    with patch.object(knowledge_service, "_sync_with_drive", side_effect=slow_sync):
+        first = asyncio.create_task(knowledge_service.sync_with_drive())
+        await asyncio.sleep(0)
+        second = await knowledge_service.sync_with_drive()
+        assert second.state == KnowledgeSyncState.RUNNING
+
+        release.set()
+        assert (await first).state == KnowledgeSyncState.SUCCEEDED
+
+
+async def test_sync_status_follows_the_queued_job(db_session, mock_settings):
+    """Test any instance reports a sync queued elsewhere from the job row."""
+    from app.crud.crud_job import background_job as crud_job
+    from app.services.job_queue import enqueue
+
+    await enqueue(db_session, "knowledge_sync", {}, dedupe_key="knowledge_sync")
+
+    status = await KnowledgeService().get_sync_status(db_session)
+    assert status.state == KnowledgeSyncState.QUEUED
+    assert status.attempts == 0
+
+    await crud_job.claim(db_session, limit=1, lock_for=timedelta(minutes=1))
+
+    status = await KnowledgeService().get_sync_status(db_session)
+    assert status.state == KnowledgeSyncState.RUNNING
+    assert status.attempts == 1
+
+
+async def test_sync_with_drive_records_its_outcome(
+    knowledge_service, db_session, mock_settings, monkeypatch
+):
+    """Test the outcome of a sync is readable through another instance."""
+    monkeypatch.setattr(settings, "GOOGLE_DRIVE_FOLDER_ID", "")
+
+    await knowledge_service.sync_with_drive(db_session)
+
+    status = await KnowledgeService().get_sync_status(db_session)
+    assert status.state == KnowledgeSyncState.FAILED
+    assert "GOOGLE_DRIVE_FOLDER_ID" in status.error
+    assert status.finished_at is not None
+
+
+async def test_knowledge_sync_job_raises_on_failed_sync(
+    knowledge_service, mock_settings, monkeypatch
+):
+    """Test a failed sync fails its job, so the queue retries it."""
+    from app.services.knowledge import _run_knowledge_sync_job
+
+    monkeypatch.setattr(settings, "GOOGLE_DRIVE_FOLDER_ID", "")
+
+    with (
+        patch(
+            "app.services.knowledge.knowledge_service",
+            MagicMock(aget=AsyncMock(return_value=knowledge_service)),
+        ),
+        pytest.raises(RuntimeError, match="GOOGLE_DRIVE_FOLDER_ID"),
+    ):
+        await _run_knowledge_sync_job(None, {})
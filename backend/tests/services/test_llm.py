@@ -10,7 +10,7 @@ from app.services.llm import LLMService
 
 @pytest.fixture
 def mock_genai_client():
-    with patch("app.services.llm.genai.Client") as mock_client_cls:
+    with patch("google.genai.Client") as mock_client_cls:
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
         # Mock the aio property which handles async calls
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.migrations import (
+    current_revisions,
+    head_revisions,
+    schema_is_current,
+)
+
+
+def _write_revision(directory: Path, revision: str, down_revision: str) -> None:
+    (directory / f"{revision}_step.py").write_text(
+        f'revision: str = "{revision}"\n'
+        f"down_revision: Union[str, Sequence[str], None] = {down_revision}\n"
+    )
+
+
+def test_head_revisions_of_repo_migrations() -> None:
+    heads = head_revisions()
+
+    assert len(heads) == 1
+
+
+def test_head_revisions_follow_merges(tmp_path: Path) -> None:
+    _write_revision(tmp_path, "base", "None")
+    _write_revision(tmp_path, "left", '"base"')
+    _write_revision(tmp_path, "right", '"base"')
+    assert head_revisions(tmp_path) == {"left", "right"}
+
+    _write_revision(tmp_path, "merge", '("left", "right")')
+    assert head_revisions(tmp_path) == {"merge"}
+
+
+@pytest.mark.asyncio
+async def test_current_revisions_without_version_table(
+    db_session: AsyncSession,
+) -> None:
+    async with db_session.bind.connect() as connection:
+        assert await current_revisions(connection) == set()
+
+
+@pytest.mark.asyncio
+async def test_schema_is_current_compares_with_head(
+    db_session: AsyncSession, tmp_path: Path
+) -> None:
+    engine = db_session.bind
+    _write_revision(tmp_path, "first", "None")
+    _write_revision(tmp_path, "second", '"first"')
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("CREATE TABLE alembic_version (version_num VARCHAR(32))")
+        )
+        await connection.execute(text("INSERT INTO alembic_version VALUES ('first')"))
+
+    try:
+        assert not await schema_is_current(engine, tmp_path)
+
+        async with engine.begin() as connection:
+            await connection.execute(
+                text("UPDATE alembic_version SET version_num = 'second'")
+            )
+        assert await schema_is_current(engine, tmp_path)
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text("DROP TABLE alembic_version"))
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.registry import ServiceRegistry
+
+
+def test_getter_builds_once_on_first_use() -> None:
+    registry = ServiceRegistry()
+    factory = MagicMock(side_effect=lambda: object())
+    get = registry.register("svc", factory)
+
+    assert not registry.is_created("svc")
+    first = get()
+
+    assert get() is first
+    factory.assert_called_once()
+    assert "svc" in registry.timings
+
+
+def test_concurrent_first_use_builds_once() -> None:
+    registry = ServiceRegistry()
+    factory = MagicMock(side_effect=lambda: object())
+    get = registry.register("svc", factory)
+    barrier = threading.Barrier(4)
+    results = []
+
+    def use() -> None:
+        barrier.wait()
+        results.append(get())
+
+    threads = [threading.Thread(target=use) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    factory.assert_called_once()
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_aget_does_not_block_the_loop_on_a_build() -> None:
+    registry = ServiceRegistry()
+    release = threading.Event()
+    get_slow = registry.register("slow", lambda: release.wait(5) and object())
+    get_fast = registry.register("fast", object)
+
+    slow = asyncio.create_task(get_slow.aget())
+    await asyncio.sleep(0.01)
+    # Another service is not held up by the build in progress, and the
+    # event loop keeps running while ``slow`` waits for its build
+    assert await get_fast.aget() is get_fast()
+    assert not slow.done()
+    release.set()
+
+    assert await slow is get_slow()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_builds_all_and_survives_failures() -> None:
+    registry = ServiceRegistry()
+    registry.register("ok", object)
+    registry.register("broken", MagicMock(side_effect=RuntimeError("no creds")))
+
+    timings = await registry.warm_up()
+
+    assert registry.is_created("ok")
+    assert not registry.is_created("broken")
+    assert set(timings) == {"ok"}
+
+
+@pytest.mark.asyncio
+async def test_close_all_closes_created_services_only() -> None:
+    registry = ServiceRegistry()
+    async_close = AsyncMock()
+    sync_close = MagicMock()
+    unused_close = MagicMock()
+    get_async = registry.register("async", object, close=async_close)
+    get_sync = registry.register("sync", object, close=sync_close)
+    registry.register("unused", object, close=unused_close)
+    async_instance, sync_instance = get_async(), get_sync()
+
+    await registry.close_all()
+
+    async_close.assert_awaited_once_with(async_instance)
+    sync_close.assert_called_once_with(sync_instance)
+    unused_close.assert_not_called()
+    assert not registry.is_created("async")
+
+
+def test_importing_app_builds_no_services() -> None:
+    """Cold start: importing the app must not build any registered service."""
+    script = (
+        "import json\n"
+        "import app.main\n"
+        "from app.services.registry import service_registry as r\n"
+        "print(json.dumps({'registered': r.names,"
+        " 'created': [n for n in r.names if r.is_created(n)]}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert "google_tts_service" in report["registered"]
+    assert report["created"] == []
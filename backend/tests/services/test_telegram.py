@@ -0,0 +1,65 @@
+"""Tests for the Telegram Bot API client."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.services.telegram import (
+    MESSAGE_MAX_LENGTH,
+    TelegramClient,
+    split_html_message,
+)
+
+
+def test_split_keeps_short_text_whole() -> None:
+    assert split_html_message("<b>Hi</b> &amp; bye") == ["<b>Hi</b> &amp; bye"]
+
+
+def test_split_prefers_paragraph_breaks() -> None:
+    text = "a" * 60 + "\n\n" + "b" * 30 + "\n" + "c" * 30
+
+    assert split_html_message(text, limit=100) == [
+        "a" * 60 + "\n\n",
+        "b" * 30 + "\n" + "c" * 30,
+    ]
+
+
+def test_split_never_cuts_inside_a_tag_or_entity() -> None:
+    text = "x" * 95 + '<a href="https://example.com">link</a>' + "y" * 10
+
+    chunks = split_html_message(text, limit=100)
+    assert chunks[0] == "x" * 95
+    assert "".join(chunks) == text
+
+    text = "x" * 97 + "&amp;" + "y" * 10
+    assert split_html_message(text, limit=100) == ["x" * 97, "&amp;" + "y" * 10]
+
+
+def test_split_closes_and_reopens_tags_across_chunks() -> None:
+    text = "a" * (MESSAGE_MAX_LENGTH - 20) + " <b>bold " + "b" * 20 + "</b> end"
+
+    chunks = split_html_message(text)
+
+    assert len(chunks) == 2
+    assert all(len(chunk) <= MESSAGE_MAX_LENGTH for chunk in chunks)
+    assert chunks[0].endswith("<b>bold </b>")
+    assert chunks[1] == "<b>" + "b" * 20 + "</b> end"
+
+
+@pytest.mark.asyncio
+async def test_send_message_sends_each_chunk_as_html() -> None:
+    client = TelegramClient(token="test")
+    client._client = MagicMock()
+    client._client.post = AsyncMock(
+        return_value=httpx.Response(
+            200, request=httpx.Request("POST", "https://test/sendMessage")
+        )
+    )
+    text = "a" * (MESSAGE_MAX_LENGTH - 5) + " <b>crosses the limit</b>"
+
+    await client.send_message(1, text)
+
+    sent = [call.kwargs["data"] for call in client._client.post.await_args_list]
+    assert [data["parse_mode"] for data in sent] == ["HTML", "HTML"]
+    assert sent[1]["text"] == "<b>crosses the limit</b>"
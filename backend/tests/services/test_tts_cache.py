@@ -0,0 +1,65 @@
+import pytest
+
+from app.core.config import settings
+from app.services.tts_cache import TTSAudioCache, make_cache_key
+
+
+def test_cache_key_covers_voice_and_config():
+    key = make_cache_key("Привіт", "uk-UA", "uk-UA-Wavenet-B", "cfg")
+    assert key == make_cache_key("Привіт", "uk-UA", "uk-UA-Wavenet-B", "cfg")
+    assert key != make_cache_key("Привіт", "uk-UA", "uk-UA-Wavenet-A", "cfg")
+    assert key != make_cache_key("Привіт", "uk-UA", "uk-UA-Wavenet-B", "cfg2")
+    assert len(key) == 64
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_is_lru_bounded_by_bytes(monkeypatch):
+    monkeypatch.setattr(settings, "TTS_CACHE_DIR", "")
+    monkeypatch.setattr(settings, "TTS_CACHE_MEMORY_MAX_BYTES", 10)
+    cache = TTSAudioCache()
+
+    await cache.put("a", b"aaaa")
+    await cache.put("b", b"bbbb")
+    assert await cache.get("a") == b"aaaa"
+    await cache.put("c", b"cccc")
+
+    # "b" was least recently used
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"aaaa"
+    assert await cache.get("c") == b"cccc"
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart_and_reports_stats():
+    cache = TTSAudioCache()
+    await cache.put("k", b"ogg-bytes")
+
+    restarted = TTSAudioCache()
+    assert await restarted.get("k") == b"ogg-bytes"
+    assert await restarted.get("k") == b"ogg-bytes"
+    assert await restarted.get("missing") is None
+
+    stats = restarted.stats.as_dict()
+    assert stats["disk_hits"] == 1
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["bytes_saved"] == 2 * len(b"ogg-bytes")
+    assert stats["hit_ratio"] == pytest.approx(2 / 3, abs=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_evicts_least_recently_used(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "TTS_CACHE_DISK_MAX_BYTES", 10)
+    cache = TTSAudioCache()
+
+    await cache.put("a", b"aaaa")
+    await cache.put("b", b"bbbb")
+    cache._memory.clear()
+    assert await cache.get("a") == b"aaaa"
+    await cache.put("c", b"cccc")
+    cache._memory.clear()
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"aaaa"
+    files = sorted(p.name for p in (tmp_path / "tts-cache").iterdir())
+    assert files == [f"{key}.ogg" for key in ("a", "c")]
@@ -0,0 +1,93 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.services import adk_service, warmup
+from app.services.warmup import InstanceWarmup, SkipStep, instance_warmup
+
+
+@pytest.fixture
+def steps(monkeypatch) -> dict[str, AsyncMock]:
+    mocks = {
+        "db_pool": AsyncMock(),
+        "services": AsyncMock(),
+        "agents": AsyncMock(side_effect=SkipStep("not configured")),
+        "gemini_connect": AsyncMock(side_effect=RuntimeError("boom")),
+    }
+    monkeypatch.setattr(
+        warmup,
+        "STEPS",
+        [(name, mock, name == "db_pool") for name, mock in mocks.items()],
+    )
+    instance_warmup.reset()
+    yield mocks
+    instance_warmup.reset()
+
+
+@pytest.mark.asyncio
+async def test_report_has_a_timing_per_step(steps: dict[str, AsyncMock]) -> None:
+    report = await InstanceWarmup().run()
+
+    assert report.ready is True
+    by_name = {step.name: step for step in report.steps}
+    assert list(by_name) == list(steps)
+    assert by_name["agents"].skipped and by_name["agents"].ok
+    assert not by_name["gemini_connect"].ok
+    assert by_name["gemini_connect"].error == "RuntimeError: boom"
+    assert all(step.duration_ms >= 0 for step in report.steps)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_run_and_cache_success(
+    steps: dict[str, AsyncMock],
+) -> None:
+    instance = InstanceWarmup()
+
+    first, second = await asyncio.gather(instance.run(), instance.run())
+    third = await instance.run()
+
+    assert first is second is third
+    steps["db_pool"].assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_required_step_is_retried(steps: dict[str, AsyncMock]) -> None:
+    steps["db_pool"].side_effect = [ConnectionError("db down"), None]
+    instance = InstanceWarmup()
+
+    assert (await instance.run()).ready is False
+    assert (await instance.run()).ready is True
+    assert steps["db_pool"].await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_warmup_endpoint(
+    client: AsyncClient, steps: dict[str, AsyncMock]
+) -> None:
+    steps["db_pool"].side_effect = [ConnectionError("db down"), None]
+
+    response = await client.get("/warmup")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+    response = await client.get("/warmup")
+    assert response.status_code == 200
+    assert [step["name"] for step in response.json()["steps"]] == list(steps)
+
+
+@pytest.mark.asyncio
+async def test_gemini_step_warms_the_client_the_agents_share(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "GOOGLE_MODEL_NAME", "gemini-test")
+    model = MagicMock()
+    model.api_client.aio.models.get = AsyncMock()
+    monkeypatch.setattr(
+        adk_service, "gemini_model", MagicMock(aget=AsyncMock(return_value=model))
+    )
+
+    await warmup._connect_gemini()
+
+    model.api_client.aio.models.get.assert_awaited_once_with(model="gemini-test")
@@ -19,6 +19,7 @@ from tgbot.middlewares.settings import ConfigMiddleware
 from tgbot.middlewares.throttling import ThrottlingMiddleware
 from tgbot.services.admins_notify import on_startup_notify
 from tgbot.services.setting_commands import set_default_commands
+from tgbot.services.stt import close_stt_service, warm_up_stt_service
 from tgbot.services.user_cache import UserCache
 
 
@@ -52,6 +53,8 @@ def register_global_middlewares(dp: Dispatcher, config: Settings):
 
 
 async def on_startup(bot: Bot, dispatcher: Dispatcher) -> None:
+    # Build the STT client in the background instead of at import time
+    dispatcher["stt_warm_up"] = asyncio.create_task(warm_up_stt_service())
     register_all_handlers()
     register_global_middlewares(dispatcher, config)
     await register_all_commands(bot)
@@ -71,6 +74,8 @@ async def on_startup(bot: Bot, dispatcher: Dispatcher) -> None:
 async def on_shutdown(bot: Bot, dispatcher: Dispatcher) -> None:
     await dispatcher.storage.close()
     logging.info("Storage closed.")
+    dispatcher["stt_warm_up"].cancel()
+    await close_stt_service()
     logging.info("Bot stopped.")
 
 
@@ -16,6 +16,16 @@ class Settings(BaseSettings):
     GCP_PROJECT_ID: str = ""
     GCP_LOG_NAME: str = "vesta-bot"
     GOOGLE_APPLICATION_CREDENTIALS: str = ""
+    STT_GRPC_POOL_SIZE: int = 2
+    # Recognize voice messages with streaming_recognize while they download
+    STT_STREAMING_ENABLED: bool = True
+    STT_INTERIM_UPDATE_SEC: float = 1.5
+
+    # Submit chat turns as backend jobs; the backend sends the reply to the
+    # chat itself, so slow turns are not lost to the request timeout. Voice
+    # replies are then sent by the backend too: the multipart text-then-audio
+    # stream (LLMService.process_prompt) is only used with this disabled
+    CHAT_JOBS_ENABLED: bool = True
 
     # Webhook Settings
     WEBHOOK_DOMAIN: str = ""
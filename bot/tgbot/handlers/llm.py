@@ -1,21 +1,27 @@
-import base64
+import time
+from collections.abc import AsyncIterator
+from contextlib import suppress
 
-from aiogram import F, Router
+from aiogram import Bot, F, Router
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram.types import BufferedInputFile, Message
+from aiogram.types import BufferedInputFile, Message, Voice
 from aiogram.utils.markdown import hbold
 from loader import dp
 
+from tgbot.config import config
 from tgbot.filters.approved_user import IsApprovedUserFilter
 from tgbot.infrastructure.llm_service import llm_service
-from tgbot.services.stt import stt_service
+from tgbot.services.stt import aget_stt_service
 from tgbot.states.states import ChatMessage
 
 router = Router()
 router.message.filter(IsApprovedUserFilter())
 dp.include_router(router)
 
+CONTINUE_HINT = "Continue typing to chat, or /chats to switch sessions, /reset to end."
+
 
 @router.message(Command("reset"))
 async def reset_state_handler(message: Message, state: FSMContext):
@@ -38,11 +44,58 @@ async def new_message_command(message: Message, state: FSMContext):
     await state.set_state(ChatMessage.message)
 
 
+async def _download_voice_chunks(bot: Bot, voice: Voice) -> AsyncIterator[bytes]:
+    """Yield the voice file from Telegram chunk by chunk as it downloads."""
+    file = await bot.get_file(voice.file_id)
+    url = bot.session.api.file_url(bot.token, file.file_path)
+    async for chunk in bot.session.stream_content(
+        url=url, timeout=60, chunk_size=64 * 1024, raise_for_status=True
+    ):
+        yield chunk
+
+
+async def _recognize_streaming(message: Message) -> str | None:
+    """
+    Recognize a voice message while it downloads, showing the interim
+    transcript in a status message that is edited at most every
+    STT_INTERIM_UPDATE_SEC.
+    """
+    status_message: Message | None = None
+    last_update = 0.0
+
+    async def show_interim(transcript: str) -> None:
+        nonlocal status_message, last_update
+        now = time.monotonic()
+        if now - last_update < config.STT_INTERIM_UPDATE_SEC:
+            return
+        last_update = now
+        with suppress(TelegramBadRequest):
+            if status_message is None:
+                status_message = await message.answer(f"🎙 {transcript}…")
+            else:
+                await status_message.edit_text(f"🎙 {transcript}…")
+
+    stt_service = await aget_stt_service()
+    text = await stt_service.recognize_stream(
+        _download_voice_chunks(message.bot, message.voice), on_interim=show_interim
+    )
+    if status_message is not None:
+        with suppress(TelegramBadRequest):
+            if text:
+                await status_message.edit_text(f"🎙 {text}")
+            else:
+                await status_message.delete()
+    return text
+
+
 @router.message(ChatMessage.message, F.voice)
 async def voice_message_handler(message: Message, state: FSMContext, user_db_id: int):
-    audio_file = message.voice
-    audio_bytes = await message.bot.download(audio_file)
-    text = await stt_service.recognize(audio_bytes.getvalue())
+    if config.STT_STREAMING_ENABLED:
+        text = await _recognize_streaming(message)
+    else:
+        audio_bytes = await message.bot.download(message.voice)
+        stt_service = await aget_stt_service()
+        text = await stt_service.recognize(audio_bytes.getvalue())
     if not text:
         return await message.answer(
             "Could not recognize speech from the voice message."
@@ -72,31 +125,52 @@ async def _process_llm_request(
 
     await message.bot.send_chat_action(chat_id=message.chat.id, action="typing")
 
+    if config.CHAT_JOBS_ENABLED:
+        job = await llm_service.submit_prompt(
+            prompt=text,
+            user_id=user_db_id,
+            chat_id=message.chat.id,
+            session_id=session_id,
+            want_voice=want_voice,
+        )
+        if not job:
+            return await message.answer("Something went wrong")
+        # The backend sends the reply to this chat when it is ready
+        await state.update_data(
+            session_title=session_title or job.get("session_title"),
+            session_id=session_id or job.get("session_id"),
+        )
+        await state.set_state(ChatMessage.message)
+        return await message.answer(CONTINUE_HINT)
+
+    async def answer_text(reply: dict) -> None:
+        if llm_response := reply.get("response"):
+            await message.answer(llm_response)
+            if want_voice:
+                await message.bot.send_chat_action(
+                    chat_id=message.chat.id, action="record_voice"
+                )
+
     response = await llm_service.process_prompt(
         prompt=text,
         user_id=user_db_id,
         session_id=session_id,
         want_voice=want_voice,
+        on_response=answer_text,
     )
     if not response:
         return await message.answer("Something went wrong")
 
-    llm_response = response.get("response")
-    if not llm_response:
+    if not response.get("response"):
         return await message.answer("Received an empty response from the assistant.")
 
-    if audio_b64 := response.get("voice_audio"):
-        voice_audio = base64.b64decode(audio_b64)
+    if voice_audio := response.get("voice_audio"):
         voice = BufferedInputFile(voice_audio, filename="speech.ogg")
         await message.answer_voice(voice)
 
-    await message.answer(llm_response)
-
     session_title = session_title or response.get("session_title")
     session_id = session_id or response.get("session_id")
     await state.update_data(session_title=session_title)
     await state.update_data(session_id=session_id)
     await state.set_state(ChatMessage.message)
-    return await message.answer(
-        "Continue typing to chat, or /chats to switch sessions, /reset to end."
-    )
+    return await message.answer(CONTINUE_HINT)
@@ -1,7 +1,13 @@
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import aiohttp
+from aiohttp import ClientError, ClientTimeout
+
 from tgbot.infrastructure.base_service import BaseAPIService
 
+OnResponse = Callable[[dict[str, Any]], Awaitable[None]]
+
 
 class LLMService(BaseAPIService):
     """Service for LLM operations."""
@@ -15,31 +21,126 @@ class LLMService(BaseAPIService):
         user_id: int,
         session_id: int | None = None,
         want_voice: bool = False,
+        on_response: OnResponse | None = None,
     ) -> dict[str, Any]:
         """
-
         Process prompt.
 
+        ``on_response`` is awaited with the reply as soon as its text is
+        available. With ``want_voice`` the backend streams the text first and
+        the raw Ogg audio after it; the returned dict then carries the audio
+        bytes under ``voice_audio``. Only used when ``CHAT_JOBS_ENABLED`` is
+        off; see ``submit_prompt``.
         """
 
         endpoint = "/chat/process"
+        payload = {
+            "user_id": user_id,
+            "session_id": session_id,
+            "message": prompt,
+            "want_voice": want_voice,
+        }
+
+        if want_voice:
+            payload["voice_delivery"] = "multipart"
+            return await self._post_multipart(
+                endpoint, payload, on_response, timeout=90
+            )
 
-        status, data = await self._post(
-            endpoint,
-            {
-                "user_id": user_id,
-                "session_id": session_id,
-                "message": prompt,
-                "want_voice": want_voice,
-            },
-            timeout=60,
-        )
+        status, data = await self._post(endpoint, payload, timeout=60)
 
         if status == 200:
+            if on_response:
+                await on_response(data)
             return data
         else:
             return {}
 
+    async def submit_prompt(
+        self,
+        prompt: str,
+        user_id: int,
+        chat_id: int,
+        session_id: int | None = None,
+        want_voice: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Submit prompt as a backend chat job.
+
+        Returns the accepted job (with ``id``, ``session_id`` and
+        ``session_title``) or an empty dict. The backend delivers the reply, and the voice message if
+        requested, straight to ``chat_id``.
+        """
+
+        endpoint = "/chat/process"
+        payload = {
+            "user_id": user_id,
+            "session_id": session_id,
+            "message": prompt,
+            "want_voice": want_voice,
+            "delivery": "telegram",
+            "chat_id": chat_id,
+        }
+
+        status, data = await self._post(endpoint, payload)
+
+        if status == 202:
+            return data
+        else:
+            return {}
+
+    async def _post_multipart(
+        self,
+        endpoint: str,
+        json_data: dict,
+        on_response: OnResponse | None,
+        timeout: int,
+    ) -> dict[str, Any]:
+        """
+        POST and read a ``multipart/mixed`` reply part by part.
+
+        Not retried: the backend has already stored the messages by the time
+        the first part arrives. Returns whatever was received before an error.
+        """
+        url = f"{self.base_url}{self.API_PREFIX}{endpoint}"
+        data: dict[str, Any] = {}
+
+        session = await self._get_session()
+        try:
+            async with session.post(
+                url,
+                json=json_data,
+                headers=self._get_headers(),
+                timeout=ClientTimeout(total=timeout),
+            ) as response:
+                if response.status != 200:
+                    self.logger.error(
+                        f"POST {url} failed with status {response.status}"
+                    )
+                    return {}
+
+                if response.content_type == "application/json":
+                    data = await response.json()
+                    if on_response:
+                        await on_response(data)
+                    return data
+
+                reader = aiohttp.MultipartReader(response.headers, response.content)
+                while (part := await reader.next()) is not None:
+                    content_type = part.headers.get(aiohttp.hdrs.CONTENT_TYPE, "")
+                    if content_type.startswith("application/json"):
+                        data = await part.json()
+                        if on_response:
+                            await on_response(data)
+                    elif content_type.startswith("audio/"):
+                        data["voice_audio"] = bytes(await part.read())
+        except TimeoutError:
+            self.logger.error(f"Timeout error during POST request to {url}")
+        except ClientError as e:
+            self.logger.error(f"Connection error to {url}: {e}")
+
+        return data
+
     async def get_sessions_by_user_id(self, user_id: int) -> list[dict]:
         """
         Get list of sessions for user.
@@ -1,20 +1,28 @@
 import asyncio
 import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Optional
 
 from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import GoogleAPIError
-from google.cloud.speech_v2 import SpeechClient
+from google.cloud.speech_v2 import SpeechAsyncClient
 from google.cloud.speech_v2.types.cloud_speech import (
     AutoDetectDecodingConfig,
     RecognitionConfig,
     RecognizeRequest,
     RecognizeResponse,
+    StreamingRecognitionConfig,
+    StreamingRecognitionFeatures,
+    StreamingRecognizeRequest,
 )
 from google.oauth2 import service_account
 
 from tgbot.config import config
 
+# Upper bound for the audio carried by one StreamingRecognizeRequest
+STREAM_MAX_AUDIO_BYTES = 15 * 1024
+
 
 class GoogleSTTService:
     """
@@ -34,6 +42,7 @@ class GoogleSTTService:
         import json
         import google.auth
 
+        self.logger = logging.getLogger(self.__class__.__name__)
         self.location_code = "us"
         credentials = None
         self.project_id = config.GCP_PROJECT_ID
@@ -62,13 +71,11 @@ class GoogleSTTService:
             except Exception as e:
                 self.logger.warning("Could not automatically determine GCP project ID", exc_info=e)
 
-        self.client = SpeechClient(
-            credentials=credentials,
-            client_options=ClientOptions(
-                api_endpoint=f"{self.location_code}-speech.googleapis.com"
-            ),
-        )
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self._credentials = credentials
+        # gRPC channels bind to the running event loop, so the client pool
+        # is opened on first use (see _get_client)
+        self._clients: list[SpeechAsyncClient] = []
+        self._next_client = 0
         self.config = RecognitionConfig(
             auto_decoding_config=AutoDetectDecodingConfig(),
             language_codes=["en-US", "uk-UA"],
@@ -76,6 +83,38 @@ class GoogleSTTService:
         )
         self.logger.info(f"GoogleSTTService initialized successfully with project: {self.project_id}")
 
+    @property
+    def recognizer(self) -> str:
+        return f"projects/{self.project_id}/locations/{self.location_code}/recognizers/_"
+
+    def _get_client(self) -> SpeechAsyncClient:
+        """
+        Return the next client of the pool, round-robin.
+
+        Each of the STT_GRPC_POOL_SIZE clients owns its own gRPC channel, so
+        concurrent voice messages are spread over several connections and no
+        longer occupy threads of the default executor.
+        """
+        if not self._clients:
+            self._clients = [
+                SpeechAsyncClient(
+                    credentials=self._credentials,
+                    client_options=ClientOptions(
+                        api_endpoint=f"{self.location_code}-speech.googleapis.com"
+                    ),
+                )
+                for _ in range(max(config.STT_GRPC_POOL_SIZE, 1))
+            ]
+        client = self._clients[self._next_client % len(self._clients)]
+        self._next_client += 1
+        return client
+
+    async def close(self) -> None:
+        """Close the gRPC channels of the client pool."""
+        clients, self._clients = self._clients, []
+        for client in clients:
+            await client.transport.close()
+
     async def recognize(self, audio_bytes: bytes) -> Optional[str]:
         """
         Recognize speech from audio bytes.
@@ -95,15 +134,15 @@ class GoogleSTTService:
 
         try:
             request = RecognizeRequest(
-                recognizer=f"projects/{self.project_id}/locations/{self.location_code}/recognizers/_",
+                recognizer=self.recognizer,
                 config=self.config,
                 content=audio_bytes,
             )
 
             # Perform synchronous recognition
             self.logger.debug("Starting speech recognition...")
-            response: RecognizeResponse = await asyncio.to_thread(
-                self.client.recognize, request=request
+            response: RecognizeResponse = await self._get_client().recognize(
+                request=request
             )
 
             # Extract the best result
@@ -134,5 +173,122 @@ class GoogleSTTService:
             self.logger.error("Unexpected error during speech recognition", exc_info=e)
             return None
 
+    async def _streaming_requests(
+        self, chunks: AsyncIterator[bytes]
+    ) -> AsyncIterator[StreamingRecognizeRequest]:
+        yield StreamingRecognizeRequest(
+            recognizer=self.recognizer,
+            streaming_config=StreamingRecognitionConfig(
+                config=self.config,
+                streaming_features=StreamingRecognitionFeatures(interim_results=True),
+            ),
+        )
+        async for chunk in chunks:
+            for offset in range(0, len(chunk), STREAM_MAX_AUDIO_BYTES):
+                yield StreamingRecognizeRequest(
+                    audio=chunk[offset : offset + STREAM_MAX_AUDIO_BYTES]
+                )
+
+    async def recognize_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        on_interim: Callable[[str], Awaitable[None]] | None = None,
+    ) -> Optional[str]:
+        """
+        Recognize speech while the audio is still arriving.
+
+        Audio chunks are forwarded to ``streaming_recognize`` as soon as they
+        are read, so recognition runs alongside the download and finishes
+        shortly after the last chunk. Unlike ``recognize`` this also handles
+        voice messages longer than a minute (up to the five-minute limit of
+        a single stream).
+
+        Args:
+            chunks: Audio data (OGG/OPUS from Telegram) in arrival order.
+            on_interim: Awaited with the transcript so far whenever an
+                interim result arrives.
+
+        Returns:
+            The final transcript, or None if recognition failed or nothing was recognized.
+
+        Raises:
+            No exceptions are raised; errors are logged and None is returned.
+        """
+        final_parts: list[str] = []
+        try:
+            self.logger.debug("Starting streaming speech recognition...")
+            responses = await self._get_client().streaming_recognize(
+                requests=self._streaming_requests(chunks)
+            )
+            async for response in responses:
+                interim = ""
+                for result in response.results:
+                    if not result.alternatives:
+                        continue
+                    transcript = result.alternatives[0].transcript.strip()
+                    if result.is_final:
+                        final_parts.append(transcript)
+                    else:
+                        interim = f"{interim} {transcript}".strip()
+                if interim and on_interim:
+                    await on_interim(" ".join([*final_parts, interim]))
+
+        except GoogleAPIError as e:
+            self.logger.error(
+                "Google API error during streaming speech recognition", exc_info=e
+            )
+            return None
+        except Exception as e:
+            self.logger.error(
+                "Unexpected error during streaming speech recognition", exc_info=e
+            )
+            return None
+
+        transcript = " ".join(part for part in final_parts if part)
+        if not transcript:
+            self.logger.info("No speech recognized in the audio stream")
+            return None
+        self.logger.debug(f"Streaming speech recognized: {transcript[:50]}...")
+        return transcript
+
+
+# Built on first use or by warm_up_stt_service, so that importing the bot
+# does not load credentials or call google.auth.default()
+_stt_service: GoogleSTTService | None = None
+_stt_service_lock = threading.Lock()
+
+
+def get_stt_service() -> GoogleSTTService:
+    """Return the STT service, building it once; blocks while it is built."""
+    global _stt_service
+    if _stt_service is None:
+        with _stt_service_lock:
+            if _stt_service is None:
+                _stt_service = GoogleSTTService()
+    return _stt_service
+
+
+async def aget_stt_service() -> GoogleSTTService:
+    """
+    Return the STT service without blocking the event loop: it is built in a
+    worker thread, or awaited there if another caller is already building it.
+    """
+    if _stt_service is not None:
+        return _stt_service
+    return await asyncio.to_thread(get_stt_service)
+
+
+async def warm_up_stt_service() -> None:
+    """Build the STT service off the event loop; errors surface on first use."""
+    try:
+        await aget_stt_service()
+    except Exception as e:
+        logging.getLogger(GoogleSTTService.__name__).warning(
+            "STT service warm-up failed", exc_info=e
+        )
+
 
-stt_service = GoogleSTTService()
+async def close_stt_service() -> None:
+    """Close the STT client pool if the service was ever created."""
+    if _stt_service is not None:
+        await _stt_service.close()
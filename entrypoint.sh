@@ -1,9 +1,38 @@
 #!/bin/bash
 set -e
 
-echo "Running Alembic migrations..."
-alembic upgrade head
+# One-off migration job: `docker run <image> migrate`
+if [ "$1" = "migrate" ]; then
+    echo "Running Alembic migrations..."
+    exec alembic upgrade head
+fi
+
+# MIGRATION_MODE on service start:
+#   check   - skip Alembic when alembic_version already matches the head
+#             revision, otherwise migrate (default)
+#   upgrade - always run `alembic upgrade head`
+#   skip    - never touch the schema; migrations run as a separate job
+case "${MIGRATION_MODE:-check}" in
+    check)
+        if python -m app.db.migrations check; then
+            echo "Database schema is up to date, skipping migrations."
+        else
+            echo "Running Alembic migrations..."
+            alembic upgrade head
+        fi
+        ;;
+    upgrade)
+        echo "Running Alembic migrations..."
+        alembic upgrade head
+        ;;
+    skip)
+        echo "Skipping migrations (MIGRATION_MODE=skip)."
+        ;;
+    *)
+        echo "Unknown MIGRATION_MODE: ${MIGRATION_MODE}" >&2
+        exit 1
+        ;;
+esac
 
 echo "Starting application..."
 exec "$@"
-